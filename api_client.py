@@ -1,9 +1,10 @@
 import os
-import time
 import requests
 from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 
+from app.services.http_client import http_client, run_sync
+
 # Çevre değişkenlerini yükle
 load_dotenv()
 
@@ -17,29 +18,23 @@ class FutbolAPI:
             "x-rapidapi-host": os.getenv("RAPIDAPI_HOST"),
         }
         self.rate_limit_remaining = 100  # Varsayılan değer
-        self.last_request_time = 0
-
-    def _bekle(self):
-        """Rate limit kontrolü yap ve gerekirse bekle"""
-        simdiki_zaman = time.time()
-        gecen_sure = simdiki_zaman - self.last_request_time
-
-        # Saniyede 10 istek sınırı için bekleme
-        if gecen_sure < 0.1:  # 100ms'den az süre geçmişse bekle
-            time.sleep(0.1 - gecen_sure)
-
-        self.last_request_time = time.time()
+        # Saniyede 10 istek sınırına paylaşılan istemcinin hız sınırlayıcısı uyar
+        self.http = http_client
 
     def _istek_yap(
         self, endpoint: str, params: Optional[Dict] = None
     ) -> Optional[Dict]:
-        """API'ye istek yap ve sonucu döndür"""
-        self._bekle()
+        """API'ye istek yap ve sonucu döndür (`_istek_yap_async` sarmalayıcısı)"""
+        return run_sync(self._istek_yap_async(endpoint, params))
+
+    async def _istek_yap_async(
+        self, endpoint: str, params: Optional[Dict] = None
+    ) -> Optional[Dict]:
+        """API'ye paylaşılan asenkron HTTP istemcisiyle istek yap"""
         url = f"{self.base_url}/{endpoint}"
 
         try:
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
+            response = await self.http.get(url, headers=self.headers, params=params)
 
             # Rate limit bilgilerini güncelle
             self.rate_limit_remaining = int(
@@ -41,6 +41,31 @@ def create_app(config_class=Config):
 
         init_models()
 
+        # Yeni sonuçlar kaydedildiğinde tahmin önbelleğini geçersiz kıl
+        from app.services.prediction_cache import register_match_listeners
+
+        register_match_listeners()
+
+        # Maç sonuçlarını takım istatistiklerine artımlı olarak yansıt
+        from app.services.team_statistics import register_statistics_listeners
+
+        register_statistics_listeners()
+
+        # Kaydedilen sonuçları H2H indeksine ekle
+        from app.services.head_to_head_index import register_head_to_head_listeners
+
+        register_head_to_head_listeners()
+
+        # Kaydedilen sonuçları takım form indeksine ekle
+        from app.services.team_form_index import register_team_form_listeners
+
+        register_team_form_listeners()
+
+        # Tamamlanan maçları takım bazlı maç kaydına yaz
+        from app.services.team_match_log import register_match_log_listeners
+
+        register_match_log_listeners()
+
     # Admin panelini başlat
     from .admin import init_app as init_admin
 
@@ -9,6 +9,9 @@ from .team import Team
 from .match import Match
 from .prediction import Prediction
 from .league import League
+from .team_statistics import TeamStatistics
+from .team_match_log import TeamMatchLog
+from .ingestion_state import IngestionState
 
 # Tüm modelleri dışa aktar
 __all__ = [
@@ -24,6 +27,9 @@ __all__ = [
     "Match",
     "Prediction",
     "League",
+    "TeamStatistics",
+    "TeamMatchLog",
+    "IngestionState",
     "MatchCard",
     "MatchGoal",
     "Prediction",
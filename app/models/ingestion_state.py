@@ -0,0 +1,23 @@
+from ..extensions import db
+from .base import BaseModel
+
+class IngestionState(BaseModel):
+    """Yarışma bazında maç aktarımı ilerlemesi (bkz. app.services.match_ingest).
+
+    high_water_mark öncesindeki maçların tümü kesinleşmiştir; artımlı
+    çalıştırmalar bu tarihten başlar. Yarım kalan bir çalıştırmanın aralığı
+    (run_from, run_to) ve bir sonraki pencerenin başlangıcı (cursor) saklanır.
+    """
+    __tablename__ = 'ingestion_states'
+
+    competition_code = db.Column(db.String(10), nullable=False, unique=True)
+    high_water_mark = db.Column(db.DateTime)
+    run_from = db.Column(db.DateTime)
+    run_to = db.Column(db.DateTime)
+    cursor = db.Column(db.DateTime)
+    # Yarım kalan çalıştırmada görülen en erken kesinleşmemiş maç tarihi
+    open_from = db.Column(db.DateTime)
+    last_run_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f'<IngestionState {self.competition_code} {self.high_water_mark}>'
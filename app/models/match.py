@@ -6,14 +6,27 @@ from .enums import MatchStatus
 class Match(BaseModel):
     """Futbol maçlarını temsil eden model."""
     __tablename__ = 'matches'
+    __table_args__ = (
+        # Takım çifti (H2H) sorguları için
+        db.Index('ix_matches_home_away_date', 'home_team_id', 'away_team_id', 'match_date'),
+        # Takımın son maçları (UNION ALL'un her tarafı) için kapsayan indeksler;
+        # rakip ve goller anahtarın sonunda tutulur
+        db.Index('idx_matches_home_team_status_date', 'home_team_id', 'status', 'match_date',
+                 'away_team_id', 'home_goals', 'away_goals'),
+        db.Index('idx_matches_away_team_status_date', 'away_team_id', 'status', 'match_date',
+                 'home_team_id', 'home_goals', 'away_goals'),
+    )
     
-    home_team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
-    away_team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
+    api_id = db.Column(db.Integer, unique=True)  # football-data.org maç ID'si
+    # Sonuç alanları değişirken eski değer, süresi dolmuş (expire) örneklerde
+    # de yüklenir; flush dinleyicileri eski sonucu bu değerle geri alır
+    home_team_id = db.column_property(db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False), active_history=True)
+    away_team_id = db.column_property(db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False), active_history=True)
     league_id = db.Column(db.Integer, db.ForeignKey('leagues.id'))
-    match_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
-    status = db.Column(db.Enum(MatchStatus), default=MatchStatus.SCHEDULED)
-    home_goals = db.Column(db.Integer, default=0)
-    away_goals = db.Column(db.Integer, default=0)
+    match_date = db.column_property(db.Column(db.DateTime, nullable=False, default=datetime.utcnow), active_history=True)
+    status = db.column_property(db.Column(db.Enum(MatchStatus), default=MatchStatus.SCHEDULED), active_history=True)
+    home_goals = db.column_property(db.Column(db.Integer, default=0), active_history=True)
+    away_goals = db.column_property(db.Column(db.Integer, default=0), active_history=True)
     half_time_home_goals = db.Column(db.Integer, default=0)
     half_time_away_goals = db.Column(db.Integer, default=0)
     
@@ -6,6 +6,7 @@ class Team(BaseModel):
     """Futbol takımlarını temsil eden model."""
     __tablename__ = 'teams'
     
+    api_id = db.Column(db.Integer, unique=True)  # football-data.org takım ID'si
     name = db.Column(db.String(100), nullable=False, unique=True)
     short_name = db.Column(db.String(10))
     country = db.Column(db.String(50))
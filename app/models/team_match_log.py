@@ -0,0 +1,28 @@
+from ..extensions import db
+from .base import BaseModel
+
+class TeamMatchLog(BaseModel):
+    """Tamamlanmış maçların takım bakış açısıyla kaydı (maç başına iki satır).
+
+    Match'ten türetilir (bkz. app.services.team_match_log); takım bazlı form,
+    ortalama ve seri sorguları (team_id, match_date) indeksinde tek bir
+    aralık taramasıdır.
+    """
+    __tablename__ = 'team_match_log'
+    __table_args__ = (
+        db.UniqueConstraint('match_id', 'team_id', name='uq_team_match_log_match_team'),
+        db.Index('idx_team_match_log_team_date', 'team_id', 'match_date'),
+    )
+
+    match_id = db.Column(db.Integer, db.ForeignKey('matches.id', ondelete='CASCADE'), nullable=False)
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
+    opponent_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False)
+    league_id = db.Column(db.Integer, db.ForeignKey('leagues.id'))
+    match_date = db.Column(db.DateTime, nullable=False)
+    is_home = db.Column(db.Boolean, nullable=False)
+    goals_for = db.Column(db.Integer, nullable=False)
+    goals_against = db.Column(db.Integer, nullable=False)
+    result = db.Column(db.String(1), nullable=False)  # W, D, L
+
+    def __repr__(self):
+        return f'<TeamMatchLog {self.team_id} - {self.match_id} {self.result}>'
@@ -0,0 +1,59 @@
+from ..extensions import db
+from .base import BaseModel
+
+class TeamStatistics(BaseModel):
+    """Takımın sezonluk istatistikleri.
+
+    Maç sonuçları kaydedildikçe artımlı olarak güncellenir (bkz.
+    app.services.team_statistics); okuma tek satırlık bir sorgudur.
+    """
+    __tablename__ = 'team_statistics'
+    __table_args__ = (
+        db.UniqueConstraint('team_id', 'season', name='uq_team_statistics_team_season'),
+    )
+
+    team_id = db.Column(db.Integer, db.ForeignKey('teams.id'), nullable=False, index=True)
+    season = db.Column(db.String(9), nullable=False)  # Örn: 2024/2025
+
+    # Sonuçlardan türetilen sayaçlar
+    matches_played = db.Column(db.Integer, nullable=False, default=0)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    draws = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+    goals_for = db.Column(db.Integer, nullable=False, default=0)
+    goals_against = db.Column(db.Integer, nullable=False, default=0)
+    clean_sheets = db.Column(db.Integer, nullable=False, default=0)
+    failed_to_score = db.Column(db.Integer, nullable=False, default=0)
+
+    home_matches = db.Column(db.Integer, nullable=False, default=0)
+    home_wins = db.Column(db.Integer, nullable=False, default=0)
+    home_draws = db.Column(db.Integer, nullable=False, default=0)
+    home_losses = db.Column(db.Integer, nullable=False, default=0)
+    home_goals_for = db.Column(db.Integer, nullable=False, default=0)
+    home_goals_against = db.Column(db.Integer, nullable=False, default=0)
+
+    away_matches = db.Column(db.Integer, nullable=False, default=0)
+    away_wins = db.Column(db.Integer, nullable=False, default=0)
+    away_draws = db.Column(db.Integer, nullable=False, default=0)
+    away_losses = db.Column(db.Integer, nullable=False, default=0)
+    away_goals_for = db.Column(db.Integer, nullable=False, default=0)
+    away_goals_against = db.Column(db.Integer, nullable=False, default=0)
+
+    average_goals_per_match = db.Column(db.Float, nullable=False, default=0.0)
+    average_goals_conceded = db.Column(db.Float, nullable=False, default=0.0)
+
+    # Sağlayıcıdan gelen maç başı ortalamalar (sonuçlardan türetilmez)
+    avg_possession = db.Column(db.Float)
+    shots_per_game = db.Column(db.Float)
+    shots_on_target_per_game = db.Column(db.Float)
+    pass_accuracy = db.Column(db.Float)
+    aerials_won = db.Column(db.Float)
+    tackles_per_game = db.Column(db.Float)
+    interceptions_per_game = db.Column(db.Float)
+    fouls_per_game = db.Column(db.Float)
+    corners_per_game = db.Column(db.Float)
+
+    team = db.relationship('Team', backref=db.backref('statistics', lazy='dynamic'))
+
+    def __repr__(self):
+        return f'<TeamStatistics {self.team_id} - {self.season}>'
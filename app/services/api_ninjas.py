@@ -2,6 +2,7 @@ import os
 import requests
 from typing import Dict, Any, List, Optional
 from .api_provider import BaseFootballAPI
+from .http_client import http_client, run_sync
 
 class APINinjasAPI(BaseFootballAPI):
     """API-Ninjas Football API implementasyonu"""
@@ -16,15 +17,18 @@ class APINinjasAPI(BaseFootballAPI):
         self.headers = {"X-Api-Key": self.api_key}
     
     def _make_request(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """API'ye istek gönderir"""
+        """API'ye istek gönderir (`_make_request_async` sarmalayıcısı)"""
+        return run_sync(self._make_request_async(params))
+    
+    async def _make_request_async(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """API'ye paylaşılan asenkron HTTP istemcisiyle istek gönderir"""
         try:
-            response = requests.get(
+            response = await http_client.get(
                 self.BASE_URL,
                 headers=self.headers,
                 params=params,
                 timeout=10
             )
-            response.raise_for_status()
             return response.json() or []
         except requests.exceptions.RequestException as e:
             print(f"API Error: {e}")
@@ -0,0 +1,143 @@
+"""
+Toplu Upsert Modülü
+
+Dış kaynaklardan gelen kayıtları tek tek sorgulayıp eklemek/güncellemek
+yerine:
+    1. Mevcut kayıtları doğal anahtarla (ör. api_id) tek bir IN sorgusuyla
+       okur,
+    2. Gelen satırları eklenecek / güncellenecek / değişmemiş olarak ayırır,
+    3. Yalnızca eklenecek ve güncellenecek satırları veritabanına uygun
+       `INSERT ... ON CONFLICT DO UPDATE` (SQLite, PostgreSQL) veya
+       `INSERT ... ON DUPLICATE KEY UPDATE` (MySQL/MariaDB) ile parçalar
+       halinde yazar.
+
+Çakışma hedefi olan sütunlarda benzersiz bir indeks bulunmalıdır.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+
+logger = logging.getLogger(__name__)
+
+# Bir IN sorgusundaki / INSERT ifadesindeki en fazla satır
+DEFAULT_CHUNK_SIZE = 500
+
+
+def fetch_existing(
+    session,
+    table,
+    key_column: str,
+    keys: Iterable[Any],
+    columns: Sequence[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[Any, Dict[str, Any]]:
+    """Anahtarları verilen mevcut kayıtları {anahtar: {sütun: değer}} olarak döndürür"""
+    keys = list(dict.fromkeys(keys))
+    selected = [table.c[key_column], *(table.c[column] for column in columns)]
+
+    existing = {}
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start : start + chunk_size]
+        for row in session.execute(
+            select(*selected).where(table.c[key_column].in_(chunk))
+        ):
+            values = row._mapping
+            existing[values[key_column]] = {
+                column: values[column] for column in columns
+            }
+    return existing
+
+
+def classify_rows(
+    rows: Iterable[Dict[str, Any]],
+    existing: Dict[Any, Dict[str, Any]],
+    key_column: str,
+    compare_columns: Sequence[str],
+) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """Satırları (eklenecek, güncellenecek, değişmemiş) olarak ayırır"""
+    added, updated, unchanged = [], [], []
+    for row in rows:
+        current = existing.get(row[key_column])
+        if current is None:
+            added.append(row)
+        elif any(row[column] != current.get(column) for column in compare_columns):
+            updated.append(row)
+        else:
+            unchanged.append(row)
+    return added, updated, unchanged
+
+
+def _upsert_statement(
+    dialect: str,
+    table,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+):
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        statement = insert(table).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={column: statement.excluded[column] for column in update_columns},
+        )
+
+    if dialect in ("mysql", "mariadb"):
+        from sqlalchemy.dialects.mysql import insert
+
+        statement = insert(table).values(rows)
+        return statement.on_duplicate_key_update(
+            {column: statement.inserted[column] for column in update_columns}
+        )
+
+    raise NotImplementedError(f"{dialect} veritabanı için upsert desteklenmiyor")
+
+
+def upsert_rows(
+    session,
+    table,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Satırları veritabanına uygun upsert ifadesiyle parçalar halinde yazar
+
+    Args:
+        session: SQLAlchemy veritabanı oturumu
+        table: Hedef tablo
+        rows: Aynı anahtarlara sahip satır sözlükleri
+        conflict_columns: Benzersiz indeksli çakışma sütunları
+        update_columns: Çakışmada güncellenecek sütunlar (varsayılan: çakışma
+            sütunları dışındaki tüm satır sütunları)
+        chunk_size: Bir INSERT ifadesindeki en fazla satır
+
+    Returns:
+        int: Yazılan satır sayısı
+    """
+    if not rows:
+        return 0
+    if update_columns is None:
+        update_columns = [
+            column for column in rows[0] if column not in conflict_columns
+        ]
+
+    dialect = session.get_bind().dialect.name
+    for start in range(0, len(rows), chunk_size):
+        session.execute(
+            _upsert_statement(
+                dialect,
+                table,
+                rows[start : start + chunk_size],
+                conflict_columns,
+                update_columns,
+            )
+        )
+    logger.debug(f"{table.name}: {len(rows)} satır upsert edildi ({dialect})")
+    return len(rows)
@@ -0,0 +1,274 @@
+"""
+Derlenmiş Model Modülü
+
+Eğitilmiş scaler ve ağaç topluluğunu düz NumPy düğüm dizilerine aktarır ve
+tahmini, tüm ağaçlarda aynı anda ilerleyen vektörize bir gezinmeyle yapar.
+Tek satırlık ve küçük toplu tahminlerde sklearn'ün girdi doğrulaması,
+MultiOutputRegressor dağıtımı ve ağaç başına predict çağrıları atlanır;
+maliyet yalnızca (satır x ağaç) boyutlu birkaç indeksleme işlemidir.
+
+Desteklenen modeller: MultiOutputRegressor içindeki GradientBoostingRegressor
+ve HistGradientBoostingRegressor (kategorik özelliksiz). Diğer modeller için
+`compile_model` None döndürür ve normal sklearn yolu kullanılır.
+
+Bellek: derlenmiş diziler düğüm başına ~41 bayt tutar (200 ağaçlık iki çıktılı
+bir gbr modeli için birkaç MB). Süreç içinde derlenen diziler her gunicorn
+işçisinde ayrı (özel) bellekte durur. `load_or_compile` ise derlenmiş
+nesneyi modelin yanına (`*.compiled.joblib`) kaydeder ve bellek eşlemesiyle
+açar; böylece model dosyaları gibi işçiler arasında paylaşılır.
+"""
+
+import logging
+import os
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor
+from sklearn.multioutput import MultiOutputRegressor
+
+from .model_artifacts import load_artifact, save_artifact
+
+logger = logging.getLogger(__name__)
+
+
+class CompiledEnsemble:
+    """Düz dizilere aktarılmış, scaler dahil ağaç topluluğu
+
+    Tüm çıktıların tüm ağaçları tek bir düğüm dizisinde tutulur. Yaprak
+    düğümler kendilerine işaret eder; böylece her satır en derin ağacın
+    derinliği kadar adımda kendi yaprağına ulaşır.
+    """
+
+    def __init__(
+        self,
+        mean: np.ndarray,
+        scale: np.ndarray,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        left: np.ndarray,
+        right: np.ndarray,
+        missing_left: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        tree_outputs: np.ndarray,
+        baseline: np.ndarray,
+        depth: int,
+        float32_inputs: bool,
+    ):
+        self.mean = mean
+        self.scale = scale
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.missing_left = missing_left
+        self.value = value
+        self.roots = roots
+        self.baseline = baseline
+        self.depth = depth
+        self.float32_inputs = float32_inputs
+        self.n_features = len(mean)
+        # Derlendiği (model, scaler) dosyalarının mtime değerleri
+        self.source_mtimes: Optional[Tuple[float, float]] = None
+        # Ağaç -> çıktı toplama matrisi (ağaç sayısı x çıktı sayısı)
+        self.output_matrix = np.zeros((len(roots), len(baseline)))
+        self.output_matrix[np.arange(len(roots)), tree_outputs] = 1.0
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Ölçeklenmemiş özellik matrisi için (n, çıktı) tahmin döndürür"""
+        X = np.asarray(X, dtype=np.float64).reshape(-1, self.n_features)
+        X = (X - self.mean) / self.scale
+        if self.float32_inputs:
+            # sklearn DecisionTree girdiyi float32'ye çevirerek karşılaştırır
+            X = X.astype(np.float32)
+
+        rows = np.arange(len(X))[:, None]
+        nodes = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.depth):
+            x = X[rows, self.feature[nodes]]
+            go_left = np.where(
+                np.isnan(x), self.missing_left[nodes], x <= self.threshold[nodes]
+            )
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+
+        return self.value[nodes] @ self.output_matrix + self.baseline
+
+
+def _scaler_arrays(scaler: Any, n_features: int):
+    """StandardScaler'ın ortalama ve ölçek dizilerini döndürür"""
+    mean = getattr(scaler, "mean_", None)
+    scale = getattr(scaler, "scale_", None)
+    mean = np.zeros(n_features) if mean is None else np.asarray(mean, dtype=float)
+    scale = np.ones(n_features) if scale is None else np.asarray(scale, dtype=float)
+    return mean, scale
+
+
+def _gbr_trees(estimator: GradientBoostingRegressor):
+    """GradientBoosting ağaçlarını (düğüm dizileri, taban değer) olarak çıkarır"""
+    if estimator.init_ == "zero":
+        baseline = 0.0
+    else:
+        baseline = float(np.ravel(estimator.init_.constant_)[0])
+
+    trees = []
+    for tree in estimator.estimators_[:, 0]:
+        tree = tree.tree_
+        is_leaf = tree.children_left == -1
+        trees.append(
+            {
+                "feature": np.where(is_leaf, 0, tree.feature),
+                "threshold": tree.threshold,
+                "left": tree.children_left,
+                "right": tree.children_right,
+                "missing_left": np.zeros(tree.node_count, dtype=bool),
+                "value": tree.value[:, 0, 0] * estimator.learning_rate,
+                "is_leaf": is_leaf,
+                "depth": tree.max_depth,
+            }
+        )
+    return trees, baseline
+
+
+def _hist_trees(estimator: HistGradientBoostingRegressor):
+    """HistGradientBoosting ağaçlarını (düğüm dizileri, taban değer) olarak çıkarır"""
+    baseline = float(np.ravel(estimator._baseline_prediction)[0])
+
+    trees = []
+    for (predictor,) in estimator._predictors:
+        nodes = predictor.nodes
+        if nodes["is_categorical"].any():
+            raise ValueError("Kategorik özellikli ağaçlar derlenemez")
+        is_leaf = nodes["is_leaf"].astype(bool)
+        trees.append(
+            {
+                "feature": np.where(is_leaf, 0, nodes["feature_idx"]),
+                "threshold": nodes["num_threshold"],
+                "left": nodes["left"],
+                "right": nodes["right"],
+                "missing_left": nodes["missing_go_to_left"].astype(bool),
+                # Yaprak değerleri öğrenme oranıyla önceden çarpılmıştır
+                "value": nodes["value"],
+                "is_leaf": is_leaf,
+                "depth": int(nodes["depth"].max()),
+            }
+        )
+    return trees, baseline
+
+
+def compile_model(model: Any, scaler: Any) -> Optional[CompiledEnsemble]:
+    """Eğitilmiş modeli ve scaler'ı düz dizilere derler
+
+    Args:
+        model: Eğitilmiş çok çıktılı skor modeli
+        scaler: Modelin eğitildiği StandardScaler
+
+    Returns:
+        Optional[CompiledEnsemble]: Desteklenmeyen veya eğitilmemiş modellerde None
+    """
+    if not isinstance(model, MultiOutputRegressor) or not hasattr(model, "estimators_"):
+        return None
+
+    per_output: List[tuple] = []
+    float32_inputs = False
+    for estimator in model.estimators_:
+        if isinstance(estimator, GradientBoostingRegressor):
+            per_output.append(_gbr_trees(estimator))
+            float32_inputs = True
+        elif isinstance(estimator, HistGradientBoostingRegressor):
+            per_output.append(_hist_trees(estimator))
+        else:
+            return None
+
+    columns = {
+        key: []
+        for key in ["feature", "threshold", "left", "right", "missing_left", "value"]
+    }
+    roots, tree_outputs, depth, offset = [], [], 0, 0
+    for output, (trees, _) in enumerate(per_output):
+        for tree in trees:
+            n_nodes = len(tree["value"])
+            own = np.arange(offset, offset + n_nodes)
+            columns["feature"].append(np.asarray(tree["feature"], dtype=np.intp))
+            columns["threshold"].append(np.asarray(tree["threshold"], dtype=float))
+            columns["missing_left"].append(tree["missing_left"])
+            columns["value"].append(np.asarray(tree["value"], dtype=float))
+            # Yapraklar kendilerine işaret eder
+            columns["left"].append(
+                np.where(tree["is_leaf"], own, tree["left"] + offset)
+            )
+            columns["right"].append(
+                np.where(tree["is_leaf"], own, tree["right"] + offset)
+            )
+            roots.append(offset)
+            tree_outputs.append(output)
+            depth = max(depth, tree["depth"])
+            offset += n_nodes
+
+    n_features = int(model.estimators_[0].n_features_in_)
+    mean, scale = _scaler_arrays(scaler, n_features)
+    compiled = CompiledEnsemble(
+        mean=mean,
+        scale=scale,
+        **{key: np.concatenate(arrays) for key, arrays in columns.items()},
+        roots=np.asarray(roots, dtype=np.intp),
+        tree_outputs=np.asarray(tree_outputs, dtype=np.intp),
+        baseline=np.array([baseline for _, baseline in per_output]),
+        depth=depth,
+        float32_inputs=float32_inputs,
+    )
+    logger.info(
+        f"Model derlendi: {compiled.n_trees} ağaç, {offset} düğüm, derinlik {depth}"
+    )
+    return compiled
+
+
+def compiled_path(model_path: str) -> str:
+    """Modelin derlenmiş dizilerinin kaydedildiği dosyanın yolu"""
+    return f"{os.path.splitext(model_path)[0]}.compiled.joblib"
+
+
+def load_or_compile(
+    model: Any,
+    scaler: Any,
+    model_path: str,
+    source_mtimes: Tuple[float, float],
+    mmap: bool = True,
+) -> Optional[CompiledEnsemble]:
+    """Modelin derlenmiş dizilerini dosyadan açar; yoksa derleyip kaydeder
+
+    Dosya, model ve scaler dosyalarının güncel mtime değerleriyle derlenmişse
+    yeniden derleme yapılmaz. Kaydedilemezse süreç içinde derlenen nesne
+    döndürülür.
+
+    Args:
+        model: Eğitilmiş çok çıktılı skor modeli
+        scaler: Modelin eğitildiği StandardScaler
+        model_path: Model dosyasının yolu
+        source_mtimes: (model mtime, scaler mtime)
+        mmap: Derlenmiş dizileri bellek eşlemesiyle aç
+    """
+    path = compiled_path(model_path)
+    try:
+        compiled = load_artifact(path, mmap=mmap)
+        if (
+            isinstance(compiled, CompiledEnsemble)
+            and compiled.source_mtimes == source_mtimes
+        ):
+            return compiled
+    except (OSError, EOFError, ValueError):
+        pass
+
+    compiled = compile_model(model, scaler)
+    if compiled is None:
+        return None
+    compiled.source_mtimes = source_mtimes
+    try:
+        save_artifact(compiled, path)
+        return load_artifact(path, mmap=mmap)
+    except OSError as e:
+        logger.warning(f"Derlenmiş model kaydedilemedi ({path}): {e}")
+        return compiled
@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple, Union
+from collections.abc import Mapping
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import logging
 from functools import wraps
@@ -21,6 +22,8 @@ def handle_errors(func):
                 return pd.DataFrame()
             elif func.__name__ == 'calculate_team_form':
                 return {'form': 0.0, 'goals_scored': 0.0, 'goals_conceded': 0.0, 'clean_sheets': 0.0}
+            elif func.__name__ == 'calculate_league_form':
+                return pd.DataFrame()
             else:
                 return {}
     return wrapper
@@ -34,18 +37,113 @@ class DataProcessor:
     gibi işlemleri gerçekleştirir.
     """
 
+    # Sıkıştırılmış sütun tipleri için sütun grupları
+    GOAL_COLUMNS = ['home_goals', 'away_goals']
+    TEAM_COLUMNS = ['home_team', 'away_team']
+    REQUIRED_MATCH_COLUMNS = ['date', 'home_team', 'away_team', 'home_goals', 'away_goals']
+
+    @staticmethod
+    def _iter_match_chunks(matches: Any, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Farklı maç kaynaklarını ham DataFrame parçalarına çevirir.
+        
+        Desteklenen kaynaklar: sözlük listesi, sütun sözlüğü (NumPy dizileri,
+        listeler veya pandas Serileri), pyarrow Table/RecordBatch, pandas
+        DataFrame ve DB-API imleci / SQLAlchemy Result (`fetchmany` ile parça parça).
+        """
+        if isinstance(matches, pd.DataFrame):
+            # Çağıranın çerçevesi değiştirilmez: parça işlenirken yalnızca
+            # sütun atanıp çıkarıldığından sığ kopya yeterlidir
+            yield matches.copy(deep=False)
+        elif isinstance(matches, list):
+            yield pd.DataFrame(matches)
+        elif hasattr(matches, 'column_names') and hasattr(matches, 'column'):
+            # pyarrow Table/RecordBatch: sütunlar doğrudan NumPy'a aktarılır
+            yield pd.DataFrame({
+                name: matches.column(name).to_numpy() for name in matches.column_names
+            })
+        elif isinstance(matches, Mapping):
+            yield pd.DataFrame(dict(matches))
+        elif hasattr(matches, 'fetchmany'):
+            description = getattr(matches, 'description', None)
+            names = [column[0] for column in description] if description else list(matches.keys())
+            while True:
+                rows = matches.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield pd.DataFrame.from_records(rows, columns=names)
+        else:
+            raise TypeError(f"Desteklenmeyen maç kaynağı: {type(matches).__name__}")
+
+    @staticmethod
+    def _compact_match_chunk(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
+        """Ham maç parçasına özellikleri ekler ve sütunları küçük tiplere çevirir.
+        
+        Returns:
+            Tuple[pd.DataFrame, int]: Sıkıştırılmış parça ve doldurulan eksik değer sayısı
+        """
+        for col in DataProcessor.REQUIRED_MATCH_COLUMNS:
+            if col not in df.columns:
+                raise ValueError(f"Gerekli sütun eksik: {col}")
+        
+        home_goals = pd.to_numeric(df['home_goals'], errors='coerce')
+        away_goals = pd.to_numeric(df['away_goals'], errors='coerce')
+        known = home_goals.notna() & away_goals.notna()
+        filled = int((~known).sum())
+        
+        # Temel özellikler (eksik skorlarda sonuç 0 sayılır); ham 'date'
+        # sütunu çağıranlar için olduğu gibi korunur
+        df['match_date'] = pd.to_datetime(df['date'], errors='coerce')
+        df['home_win'] = (home_goals > away_goals).astype(np.int8)
+        df['draw'] = (home_goals == away_goals).astype(np.int8)
+        df['away_win'] = (home_goals < away_goals).astype(np.int8)
+        
+        # Gol farkı ve toplam gol (eksik skorlarda 0)
+        # (int16: int8 127 üzerindeki hatalı/uç değerlerde taşar)
+        df['goal_difference'] = (home_goals - away_goals).where(known, 0).astype(np.int16)
+        df['total_goals'] = (home_goals + away_goals).where(known, 0).astype(np.int16)
+        df['home_goals'] = home_goals.fillna(0).astype(np.int16)
+        df['away_goals'] = away_goals.fillna(0).astype(np.int16)
+        
+        # Zaman bazlı özellikler (geçersiz tarihlerde 0)
+        df['day_of_week'] = df['match_date'].dt.dayofweek.fillna(0).astype(np.int8)
+        df['month'] = df['match_date'].dt.month.fillna(0).astype(np.int8)
+        
+        # Takım adları: iki sütun aynı kategorileri paylaşır (karşılaştırılabilir)
+        teams = pd.Index(pd.unique(df[DataProcessor.TEAM_COLUMNS].to_numpy().ravel())).dropna()
+        for col in DataProcessor.TEAM_COLUMNS:
+            df[col] = pd.Categorical(df[col], categories=teams)
+        
+        # Eksiksiz tam sayı ID sütunları en küçük tam sayı tipine
+        for col in df.columns:
+            if col.endswith('_id') and pd.api.types.is_integer_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        return df, filled
+
     @staticmethod
     @handle_errors
-    def preprocess_matches(matches: List[Dict]) -> pd.DataFrame:
+    def preprocess_matches(matches: Any, chunk_size: int = 100000) -> pd.DataFrame:
         """Ham maç verilerini ön işlemeden geçirir.
         
+        Veri sütunsal olarak ve parça parça işlenir; skorlar int16, tarih
+        datetime64 olarak tutulur. Takım adları (home_team, away_team) ortak
+        kategorilere sahip kategorik sütunlardır: metinle karşılaştırma ve
+        gruplama aynı çalışır, düz metin gerekirse `.astype(str)` kullanılmalıdır.
+        Eksik değerler yalnızca ilgili sütunlarda doldurulur. Bellek kullanımı (işleme öncesi/sonrası)
+        loglanır ve `df.attrs['memory_report']` içinde döndürülür.
+        
         Args:
-            matches (List[Dict]): İşlenecek maç verileri listesi. Her sözlük bir maçı temsil eder.
-                Örnek: [{'home_team': 'Takım A', 'away_team': 'Takım B', 'home_goals': 2, ...}]
+            matches: İşlenecek maç verileri. Sözlük listesi
+                (örnek: [{'home_team': 'Takım A', 'away_team': 'Takım B', 'home_goals': 2, ...}]),
+                sütun sözlüğü (NumPy/Arrow dizileri), pyarrow Table, DataFrame
+                veya `fetchmany` destekleyen bir SQL imleci olabilir.
+            chunk_size (int, optional): SQL imlecinden bir seferde okunacak satır sayısı.
+                Varsayılan: 100000
                 
         Returns:
-            pd.DataFrame: İşlenmiş veri çerçevesi. Aşağıdaki sütunları içerir:
-                - match_date: Maç tarihi (datetime)
+            pd.DataFrame: İşlenmiş veri çerçevesi. Girdi sütunlarına ('date'
+                olduğu gibi korunur) ek olarak aşağıdaki sütunları içerir:
+                - match_date: Maç tarihi (datetime64)
                 - home_win: Ev sahibi kazanırsa 1, değilse 0
                 - draw: Beraberlikse 1, değilse 0
                 - away_win: Deplasman kazanırsa 1, değilse 0
@@ -54,64 +152,164 @@ class DataProcessor:
                 - day_of_week: Haftanın günü (0: Pazartesi, 6: Pazar)
                 - month: Ay (1-12)
         """
-        if not matches:
+        if matches is None or (isinstance(matches, list) and not matches):
             logger.warning("Boş maç listesi alındı.")
             return pd.DataFrame()
             
         try:
-            df = pd.DataFrame(matches)
+            chunks = []
+            input_bytes = 0
+            filled = 0
+            for raw in DataProcessor._iter_match_chunks(matches, chunk_size):
+                input_bytes += int(raw.memory_usage(deep=True).sum())
+                chunk, chunk_filled = DataProcessor._compact_match_chunk(raw)
+                chunks.append(chunk)
+                filled += chunk_filled
             
-            # Zorunlu sütunları kontrol et
-            required_columns = ['date', 'home_team', 'away_team', 'home_goals', 'away_goals']
-            for col in required_columns:
-                if col not in df.columns:
-                    raise ValueError(f"Gerekli sütun eksik: {col}")
+            if not chunks or not sum(len(chunk) for chunk in chunks):
+                logger.warning("Boş maç listesi alındı.")
+                return pd.DataFrame()
             
-            # Temel özellikler
-            df['match_date'] = pd.to_datetime(df['date'], errors='coerce')
-            df['home_win'] = (df['home_goals'] > df['away_goals']).astype(int)
-            df['draw'] = (df['home_goals'] == df['away_goals']).astype(int)
-            df['away_win'] = (df['home_goals'] < df['away_goals']).astype(int)
-            
-            # Gol farkı ve toplam gol
-            df['goal_difference'] = df['home_goals'] - df['away_goals']
-            df['total_goals'] = df['home_goals'] + df['away_goals']
-            
-            # Zaman bazlı özellikler
-            df['day_of_week'] = df['match_date'].dt.dayofweek
-            df['month'] = df['match_date'].dt.month
-            
-            # Eksik değer kontrolü
-            if df.isnull().values.any():
-                logger.warning("Eksik değerler tespit edildi. Dolduruluyor...")
-                df = df.fillna(0)
-                
-            logger.info(f"{len(df)} maç başarıyla işlendi.")
+            # Parçaları ortak takım kategorileriyle birleştir (kategorik tip korunur)
+            if len(chunks) > 1:
+                teams = chunks[0]['home_team'].cat.categories
+                for chunk in chunks[1:]:
+                    teams = teams.union(chunk['home_team'].cat.categories)
+                for chunk in chunks:
+                    for col in DataProcessor.TEAM_COLUMNS:
+                        chunk[col] = chunk[col].cat.set_categories(teams)
+            df = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+            
+            if filled:
+                logger.warning(f"{filled} maçta eksik skor 0 ile dolduruldu.")
+            
+            output_bytes = int(df.memory_usage(deep=True).sum())
+            df.attrs['memory_report'] = {
+                'rows': len(df),
+                'chunks': len(chunks),
+                'input_bytes': input_bytes,
+                'output_bytes': output_bytes
+            }
+            logger.info(
+                f"{len(df)} maç başarıyla işlendi. Bellek: {input_bytes / 1024 ** 2:.1f} MB -> "
+                f"{output_bytes / 1024 ** 2:.1f} MB"
+            )
             return df
             
         except Exception as e:
             logger.error(f"Maç verileri işlenirken hata oluştu: {str(e)}")
             return pd.DataFrame()
-        if not matches:
-            return pd.DataFrame()
+
+    @staticmethod
+    def _form_stats(total_matches: int, points: float, goals_scored: float,
+                    goals_conceded: float, clean_sheets: float, wins: float,
+                    draws: float, losses: float) -> Dict[str, float]:
+        """Toplam değerlerden calculate_team_form çıktısını oluşturur."""
+        return {
+            'form': round(points / total_matches, 2),
+            'goals_scored': round(float(goals_scored / total_matches), 2),
+            'goals_conceded': round(float(goals_conceded / total_matches), 2),
+            'clean_sheets': round(clean_sheets / total_matches, 2),
+            'win_rate': round(wins / total_matches, 2),
+            'draw_rate': round(draws / total_matches, 2),
+            'loss_rate': round(losses / total_matches, 2)
+        }
+    
+    @staticmethod
+    def _rolling_form(team_rows: pd.DataFrame, num_matches: int) -> Dict[Any, Dict[str, float]]:
+        """Takım satırlarından her takımın son maç formunu tek geçişte hesaplar.
+        
+        Args:
+            team_rows (pd.DataFrame): 'team', 'match_date', 'team_goals' ve
+                'opponent_goals' sütunlarını içeren, takım başına bir satır/maç tablosu
+            num_matches (int): Değerlendirilecek son maç sayısı
             
-        df = pd.DataFrame(matches)
+        Returns:
+            Dict[Any, Dict[str, float]]: Takıma göre form istatistikleri
+        """
+        # Artan tarih sırası; eşit tarihlerde giriş sırası ters çevrilir ki her
+        # takımın son `num_matches` satırı calculate_team_form'un seçtiği maçlar olsun
+        team_rows = team_rows.iloc[::-1].sort_values('match_date', kind='stable', na_position='first')
+        team_goals = team_rows['team_goals']
+        opponent_goals = team_rows['opponent_goals']
+        
+        flags = pd.DataFrame({
+            'team': team_rows['team'],
+            'played': 1,
+            'goals_scored': team_goals,
+            'goals_conceded': opponent_goals,
+            'clean_sheets': (opponent_goals == 0).astype(int),
+            'wins': (team_goals > opponent_goals).astype(int),
+            'draws': (team_goals == opponent_goals).astype(int)
+        })
         
-        # Temel özellikler
-        df['match_date'] = pd.to_datetime(df['date'])
-        df['home_win'] = (df['home_goals'] > df['away_goals']).astype(int)
-        df['draw'] = (df['home_goals'] == df['away_goals']).astype(int)
-        df['away_win'] = (df['home_goals'] < df['away_goals']).astype(int)
+        # Her takım için son `num_matches` maçın toplamları (tam sayı toplamları kesindir)
+        sums = (
+            flags.groupby('team', sort=False)
+            .rolling(num_matches, min_periods=1)
+            .sum()
+        )
+        last = sums.groupby(level=0, sort=False).tail(1).droplevel(1)
         
-        # Gol farkı ve toplam gol
-        df['goal_difference'] = df['home_goals'] - df['away_goals']
-        df['total_goals'] = df['home_goals'] + df['away_goals']
+        return {
+            team: DataProcessor._form_stats(
+                total_matches=int(row.played),
+                points=int(3 * row.wins + row.draws),
+                goals_scored=row.goals_scored,
+                goals_conceded=row.goals_conceded,
+                clean_sheets=int(row.clean_sheets),
+                wins=int(row.wins),
+                draws=int(row.draws),
+                losses=int(row.played - row.wins - row.draws)
+            )
+            for team, row in zip(last.index, last.itertuples(index=False))
+        }
+    
+    @staticmethod
+    @handle_errors
+    def calculate_league_form(matches: pd.DataFrame, num_matches: int = 5) -> pd.DataFrame:
+        """Ligdeki tüm takımların formunu tek seferde hesaplar.
+        
+        Her maç hem ev sahibi hem deplasman takımı için bir satır olarak
+        değerlendirilir; takımlar groupby().rolling() ile birlikte işlenir.
         
-        # Zaman bazlı özellikler
-        df['day_of_week'] = df['match_date'].dt.dayofweek
-        df['month'] = df['match_date'].dt.month
+        Args:
+            matches (pd.DataFrame): Lig maçları.
+                Gerekli sütunlar: 'match_date', 'home_team', 'away_team', 'home_goals', 'away_goals'
+            num_matches (int, optional): Değerlendirilecek son maç sayısı. Varsayılan: 5
+            
+        Returns:
+            pd.DataFrame: Takım adına göre indekslenmiş, calculate_team_form ile
+                aynı sütunlara sahip form tablosu
+        """
+        columns = ['form', 'goals_scored', 'goals_conceded', 'clean_sheets',
+                   'win_rate', 'draw_rate', 'loss_rate']
+        if matches is None or matches.empty:
+            logger.warning("Boş lig maç verisi alındı.")
+            return pd.DataFrame(columns=columns)
+            
+        required_columns = ['match_date', 'home_team', 'away_team', 'home_goals', 'away_goals']
+        if not all(col in matches.columns for col in required_columns):
+            raise ValueError("Eksik sütunlar var. Gerekli sütunlar: " + ", ".join(required_columns))
         
-        return df
+        home = pd.DataFrame({
+            'team': matches['home_team'],
+            'match_date': matches['match_date'],
+            'team_goals': matches['home_goals'],
+            'opponent_goals': matches['away_goals']
+        })
+        away = pd.DataFrame({
+            'team': matches['away_team'],
+            'match_date': matches['match_date'],
+            'team_goals': matches['away_goals'],
+            'opponent_goals': matches['home_goals']
+        })
+        # Maçların giriş sırası korunur (eşit tarihlerde calculate_team_form ile aynı seçim)
+        team_rows = pd.concat([home, away]).sort_index(kind='stable').reset_index(drop=True)
+        
+        forms = DataProcessor._rolling_form(team_rows, num_matches)
+        logger.info(f"Lig formu hesaplandı: {len(forms)} takım")
+        return pd.DataFrame.from_dict(forms, orient='index', columns=columns)
 
     @staticmethod
     @handle_errors
@@ -154,73 +352,41 @@ class DataProcessor:
             if not all(col in team_matches.columns for col in required_columns):
                 raise ValueError("Eksik sütunlar var. Gerekli sütunlar: " + ", ".join(required_columns))
             
-            # Son maçları al ve sırala
-            team_matches = team_matches.sort_values('match_date', ascending=False)
+            # Son maçları al ve sırala (eşit tarihlerde giriş sırası korunur)
+            team_matches = team_matches.sort_values('match_date', ascending=False, kind='stable')
             last_matches = team_matches.head(num_matches)
             
             if last_matches.empty:
                 return default_stats
                 
-            # İstatistikleri hesapla
-            form_points = []
-            goals_scored = []
-            goals_conceded = []
-            clean_sheets = []
-            results = []  # 0: mağlubiyet, 1: beraberlik, 2: galibiyet
-            
-            for _, match in last_matches.iterrows():
-                is_home = match['home_team'] == match.get('team_name', '')
-                
-                if is_home:
-                    team_goals = match['home_goals']
-                    opponent_goals = match['away_goals']
-                else:
-                    team_goals = match['away_goals']
-                    opponent_goals = match['home_goals']
-                
-                # Skor durumuna göre puan ve sonuç
-                if team_goals > opponent_goals:
-                    form_points.append(3)  # Galibiyet
-                    results.append(2)
-                elif team_goals == opponent_goals:
-                    form_points.append(1)  # Beraberlik
-                    results.append(1)
-                else:
-                    form_points.append(0)  # Mağlubiyet
-                    results.append(0)
-                
-                # İstatistikler
-                goals_scored.append(team_goals)
-                goals_conceded.append(opponent_goals)
-                clean_sheets.append(1 if opponent_goals == 0 else 0)
+            # Takımın ev sahibi olduğu maçlar ('team_name' yoksa deplasman kabul edilir)
+            team_name = last_matches['team_name'] if 'team_name' in last_matches.columns else ''
+            is_home = (last_matches['home_team'] == team_name).to_numpy()
+            home_goals = last_matches['home_goals'].to_numpy()
+            away_goals = last_matches['away_goals'].to_numpy()
+            
+            # İstatistikleri sütun işlemleriyle hesapla
+            team_goals = np.where(is_home, home_goals, away_goals)
+            opponent_goals = np.where(is_home, away_goals, home_goals)
             
-            # Sonuçları hesapla
             total_matches = len(last_matches)
-            if total_matches == 0:
-                return default_stats
-                
-            # Form ve istatistikler
-            avg_form = sum(form_points) / total_matches
-            avg_goals_scored = sum(goals_scored) / total_matches
-            avg_goals_conceded = sum(goals_conceded) / total_matches
-            clean_sheet_ratio = sum(clean_sheets) / total_matches
-            
-            # Sonuç yüzdeleri
-            win_rate = results.count(2) / total_matches
-            draw_rate = results.count(1) / total_matches
-            loss_rate = results.count(0) / total_matches
-            
-            logger.info(f"Takım formu hesaplandı: {avg_form:.2f} puan (Son {total_matches} maç)")
-            
-            return {
-                'form': round(avg_form, 2),
-                'goals_scored': round(avg_goals_scored, 2),
-                'goals_conceded': round(avg_goals_conceded, 2),
-                'clean_sheets': round(clean_sheet_ratio, 2),
-                'win_rate': round(win_rate, 2),
-                'draw_rate': round(draw_rate, 2),
-                'loss_rate': round(loss_rate, 2)
-            }
+            wins = int((team_goals > opponent_goals).sum())
+            draws = int((team_goals == opponent_goals).sum())
+            
+            stats = DataProcessor._form_stats(
+                total_matches=total_matches,
+                points=3 * wins + draws,
+                goals_scored=team_goals.sum(),
+                goals_conceded=opponent_goals.sum(),
+                clean_sheets=int((opponent_goals == 0).sum()),
+                wins=wins,
+                draws=draws,
+                losses=total_matches - wins - draws
+            )
+            
+            logger.info(f"Takım formu hesaplandı: {stats['form']:.2f} puan (Son {total_matches} maç)")
+            
+            return stats
             
         except Exception as e:
             logger.error(f"Takım formu hesaplanırken hata oluştu: {str(e)}")
@@ -324,13 +490,84 @@ class DataProcessor:
             # Değerleri yuvarla
             features = {k: round(float(v), 4) for k, v in features.items()}
             
-            logger.info("Tahmin için özellikler başarıyla oluşturuldu.")
+            logger.debug("Tahmin için özellikler başarıyla oluşturuldu.")
             return features
             
         except Exception as e:
             logger.error(f"Tahmin verileri hazırlanırken hata oluştu: {str(e)}")
             return {}
             
+    # prepare_prediction_data'daki takım özellikleri: özellik soneki -> istatistik anahtarı
+    TEAM_FEATURE_STATS = {
+        'form': 'form',
+        'goals_scored_avg': 'goals_scored',
+        'goals_conceded_avg': 'goals_conceded',
+        'clean_sheets': 'clean_sheets',
+        'win_rate': 'win_rate',
+        'draw_rate': 'draw_rate',
+        'loss_rate': 'loss_rate'
+    }
+
+    @staticmethod
+    def _stat_columns(stats: Union[pd.DataFrame, Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Takım istatistiklerini float64 sütun dizilerine çevirir."""
+        if isinstance(stats, pd.DataFrame):
+            return {col: stats[col].to_numpy(dtype=np.float64) for col in stats.columns}
+        return {key: np.asarray(values, dtype=np.float64) for key, values in stats.items()}
+
+    @staticmethod
+    def build_feature_matrix(home_stats: Union[pd.DataFrame, Dict[str, Any]],
+                             away_stats: Union[pd.DataFrame, Dict[str, Any]],
+                             feature_order: List[str],
+                             extra: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """Birden fazla maç için tahmin özelliklerini tek bir matris olarak oluşturur.
+        
+        `prepare_prediction_data` ile aynı değerleri (4 basamağa yuvarlanmış)
+        üretir; ancak maç başına sözlük oluşturmaz ve sonucu doğrudan modelin
+        beklediği sütun sırasında döndürür.
+        
+        Args:
+            home_stats (Union[pd.DataFrame, Dict[str, Any]]): Ev sahibi takımların
+                istatistikleri; calculate_team_form anahtarlarıyla sütunlar
+                (örn. calculate_league_form çıktısının satırları)
+            away_stats (Union[pd.DataFrame, Dict[str, Any]]): Deplasman takımlarının istatistikleri
+            feature_order (List[str]): Sütun sırası (örn. PredictionEngine.feature_orders['result'])
+            extra (Dict[str, Any], optional): İstatistiklerden türetilemeyen özelliklerin
+                sütunları (örn. 'temperature'). Verilmeyen özellikler 0 olur.
+                
+        Returns:
+            np.ndarray: (maç sayısı, özellik sayısı) boyutlu, C-sıralı float32 matris
+        """
+        home = DataProcessor._stat_columns(home_stats)
+        away = DataProcessor._stat_columns(away_stats)
+        extra = DataProcessor._stat_columns(extra or {})
+        
+        lengths = {len(values) for values in (*home.values(), *away.values(), *extra.values())}
+        if len(lengths) > 1:
+            raise ValueError(f"Sütun uzunlukları farklı: {sorted(lengths)}")
+        n_matches = lengths.pop() if lengths else 0
+        zeros = np.zeros(n_matches)
+        
+        columns = {}
+        for suffix, stat in DataProcessor.TEAM_FEATURE_STATS.items():
+            columns[f'home_{suffix}'] = home.get(stat, zeros)
+            columns[f'away_{suffix}'] = away.get(stat, zeros)
+        
+        # Karşılaştırmalı istatistikler
+        columns['form_difference'] = columns['home_form'] - columns['away_form']
+        columns['goal_difference'] = (
+            (columns['home_goals_scored_avg'] - columns['home_goals_conceded_avg'])
+            - (columns['away_goals_scored_avg'] - columns['away_goals_conceded_avg'])
+        )
+        columns['attack_strength'] = columns['home_goals_scored_avg'] - columns['away_goals_conceded_avg']
+        columns['defense_strength'] = columns['home_goals_conceded_avg'] - columns['away_goals_scored_avg']
+        columns.update(extra)
+        
+        matrix = np.empty((n_matches, len(feature_order)), dtype=np.float32)
+        for position, name in enumerate(feature_order):
+            matrix[:, position] = np.round(columns.get(name, zeros), 4)
+        return matrix
+
     @staticmethod
     def get_team_form(team_id: str, matches: List[Dict], is_home: bool = True, 
                      num_matches: int = 5) -> Dict[str, float]:
@@ -383,3 +620,60 @@ class DataProcessor:
         except Exception as e:
             logger.error(f"Takım formu hesaplanırken hata oluştu: {str(e)}")
             return {}
+
+    @staticmethod
+    def get_league_form(matches: List[Dict], num_matches: int = 5) -> Dict[Any, Dict[str, Dict[str, float]]]:
+        """Tüm takımların ev sahibi ve deplasman formunu tek geçişte hesaplar.
+        
+        Her takım için `get_team_form(team_id, matches, is_home, num_matches)`
+        ile aynı sonucu verir; ancak maç listesi takım başına yeniden taranmaz,
+        bir kez tabloya dönüştürülüp takıma göre gruplanır.
+        
+        Args:
+            matches (List[Dict]): Tüm maçların listesi
+            num_matches (int, optional): Değerlendirilecek maç sayısı. Varsayılan: 5
+            
+        Returns:
+            Dict[Any, Dict[str, Dict[str, float]]]: Takım ID'sine göre
+                {'home': {...}, 'away': {...}} form istatistikleri. Takımın
+                o tarafta maçı yoksa ilgili sözlük boştur.
+        """
+        try:
+            if not matches:
+                logger.warning("Maç listesi boş.")
+                return {}
+            
+            # get_team_form ile aynı alanlar ve varsayılanlar; ID'ler olduğu gibi korunur
+            frame = pd.DataFrame({
+                'home_team_id': pd.Series([match.get('home_team_id') for match in matches], dtype=object),
+                'away_team_id': pd.Series([match.get('away_team_id') for match in matches], dtype=object),
+                'match_date': [match.get('date') for match in matches],
+                'home_team': [match.get('home_team') for match in matches],
+                'away_team': [match.get('away_team') for match in matches],
+                'home_goals': [match.get('home_goals', 0) for match in matches],
+                'away_goals': [match.get('away_goals', 0) for match in matches]
+            })
+            
+            forms: Dict[Any, Dict[str, Dict[str, float]]] = {}
+            for side, team_column, team_name_column in (
+                ('home', 'home_team_id', 'home_team'),
+                ('away', 'away_team_id', 'away_team')
+            ):
+                # calculate_team_form'daki 'team_name' kuralı: ev sahibi adı eşleşirse ev sahibi
+                is_home = frame['home_team'] == frame[team_name_column]
+                team_rows = pd.DataFrame({
+                    'team': frame[team_column],
+                    'match_date': frame['match_date'],
+                    'team_goals': frame['home_goals'].where(is_home, frame['away_goals']),
+                    'opponent_goals': frame['away_goals'].where(is_home, frame['home_goals'])
+                })
+                
+                for team_id, stats in DataProcessor._rolling_form(team_rows, num_matches).items():
+                    forms.setdefault(team_id, {'home': {}, 'away': {}})[side] = stats
+            
+            logger.info(f"Lig formu hesaplandı: {len(forms)} takım")
+            return forms
+            
+        except Exception as e:
+            logger.error(f"Lig formu hesaplanırken hata oluştu: {str(e)}")
+            return {}
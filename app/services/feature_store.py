@@ -0,0 +1,332 @@
+"""
+Özellik Deposu Modülü
+
+Eğitim için her maçın, o maçtan önceki (point-in-time) form özelliklerini
+maç tablosu üzerinde tek bir sıralı geçişle hesaplar. Sonuç maç ID'sine göre
+anahtarlanmış sütunsal bir dosyaya (.npz) yazılır ve eğitim doğrudan bu
+dosyadan okunur; maç başına ek sorgu yapılmaz.
+
+Dosya, oluşturulduğu andaki tamamlanmış maçların sayısını ve en son
+güncellenme zamanını (updated_at) saklar; bunlar veritabanındakiyle
+uyuşmuyorsa dosya eskimiş sayılır ve `load_or_build` yeniden oluşturur.
+
+Üretilen özellik vektörü `MatchPredictor._features_from_forms` ile birebir
+aynıdır; böylece eğitim ve tahmin aynı özellik uzayını kullanır. Form
+özellikleri takımın tüm müsabakalarındaki maçlardan hesaplanır; `load`
+yalnızca satırları lige göre süzer. Tahmin motoru da formu lige göre süzmez.
+"""
+
+import logging
+import os
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# MatchPredictor._features_from_forms ile aynı sırada 20 özellik
+FEATURE_COLUMNS: List[str] = [
+    "home_avg_goals_for",
+    "home_avg_goals_against",
+    "home_points_ratio",
+    "away_avg_goals_for",
+    "away_avg_goals_against",
+    "away_points_ratio",
+    "home_clean_sheet_ratio",
+    "away_clean_sheet_ratio",
+    "home_failed_to_score_ratio",
+    "away_failed_to_score_ratio",
+] + [f"form_{i}" for i in range(10)]
+
+TARGET_COLUMNS: List[str] = ["home_goals", "away_goals"]
+
+KEY_COLUMNS: List[str] = [
+    "match_id",
+    "match_date",
+    "league_id",
+    "home_team_id",
+    "away_team_id",
+]
+
+
+def _finished_filter():
+    from app.models import Match, MatchStatus
+
+    return (
+        Match.status == MatchStatus.FINISHED,
+        Match.home_goals.isnot(None),
+        Match.away_goals.isnot(None),
+    )
+
+
+def load_finished_matches(session) -> pd.DataFrame:
+    """Tamamlanmış maçları tek sorguyla DataFrame olarak getirir"""
+    from app.models import Match
+
+    rows = (
+        session.query(
+            Match.id,
+            Match.match_date,
+            Match.league_id,
+            Match.home_team_id,
+            Match.away_team_id,
+            Match.home_goals,
+            Match.away_goals,
+        )
+        .filter(*_finished_filter())
+        .all()
+    )
+    return pd.DataFrame(rows, columns=KEY_COLUMNS + TARGET_COLUMNS)
+
+
+def finished_matches_version(session) -> Tuple[Optional[datetime], int]:
+    """Tamamlanmış maçların (en son güncellenme zamanı, sayısı)"""
+    from sqlalchemy import func
+
+    from app.models import Match
+
+    updated_at, count = (
+        session.query(func.max(Match.updated_at), func.count(Match.id))
+        .filter(*_finished_filter())
+        .one()
+    )
+    return updated_at, int(count)
+
+
+def _side_features(long: pd.DataFrame, matches_back: int) -> pd.DataFrame:
+    """Takım bazlı satırlar için maç öncesi son N maç istatistiklerini hesaplar
+
+    `long` takım ve tarihe göre sıralı olmalıdır. Her satır için yalnızca
+    aynı takımın önceki satırları kullanılır (shift), ileriye bakış yoktur.
+    """
+    groups = long.groupby("team_id", sort=False)
+    position = groups.cumcount().to_numpy()
+    played = np.minimum(position, matches_back)
+    safe_played = np.where(played > 0, played, 1)
+
+    stats = {}
+    for column in ["goals_for", "goals_against", "win", "draw", "clean", "blank"]:
+        cumulative = groups[column].cumsum()
+        long["_cum"] = cumulative
+        before = long.groupby("team_id", sort=False)["_cum"].shift(1).fillna(0)
+        window_start = (
+            long.groupby("team_id", sort=False)["_cum"]
+            .shift(matches_back + 1)
+            .fillna(0)
+        )
+        stats[column] = (before - window_start).to_numpy()
+    long.drop(columns="_cum", inplace=True)
+
+    has_played = played > 0
+    points = stats["win"] * 3 + stats["draw"]
+    features = pd.DataFrame(
+        {
+            "avg_goals_for": np.where(
+                has_played, np.round(stats["goals_for"] / safe_played, 2), 0
+            ),
+            "avg_goals_against": np.where(
+                has_played, np.round(stats["goals_against"] / safe_played, 2), 0
+            ),
+            "points_ratio": points / (3 * safe_played),
+            "clean_sheet_ratio": np.where(
+                has_played, np.round(stats["clean"] / safe_played * 100, 1), 0
+            )
+            / 100,
+            "failed_to_score_ratio": np.where(
+                has_played, np.round(stats["blank"] / safe_played * 100, 1), 0
+            )
+            / 100,
+        },
+        index=long.index,
+    )
+
+    # Son maçların sonuçları (en yeni önce): G=1, B=0, M=-1, yoksa NaN
+    for lag in range(1, 6):
+        value = groups["result_value"].shift(lag)
+        features[f"lag_{lag}"] = np.where(lag <= played, value, np.nan)
+
+    return features
+
+
+def compute_point_in_time_features(
+    matches: pd.DataFrame, matches_back: int = 5
+) -> pd.DataFrame:
+    """Her maç için maç öncesi form özelliklerini tek geçişte hesaplar
+
+    Args:
+        matches: KEY_COLUMNS ve TARGET_COLUMNS sütunlarını içeren maç tablosu
+        matches_back: Form için dikkate alınacak son maç sayısı
+
+    Returns:
+        pd.DataFrame: KEY_COLUMNS + FEATURE_COLUMNS + TARGET_COLUMNS
+    """
+    if matches.empty:
+        return pd.DataFrame(columns=KEY_COLUMNS + FEATURE_COLUMNS + TARGET_COLUMNS)
+
+    matches = matches.reset_index(drop=True)
+    home_goals = matches["home_goals"].to_numpy()
+    away_goals = matches["away_goals"].to_numpy()
+
+    # Her maçı iki takım satırına aç
+    long = pd.DataFrame(
+        {
+            "row": np.concatenate([matches.index, matches.index]),
+            "is_home": np.repeat([True, False], len(matches)),
+            "team_id": np.concatenate(
+                [matches["home_team_id"], matches["away_team_id"]]
+            ),
+            "match_date": np.concatenate([matches["match_date"]] * 2),
+            "match_id": np.concatenate([matches["match_id"]] * 2),
+            "goals_for": np.concatenate([home_goals, away_goals]),
+            "goals_against": np.concatenate([away_goals, home_goals]),
+        }
+    )
+    long["win"] = (long["goals_for"] > long["goals_against"]).astype(np.int64)
+    long["draw"] = (long["goals_for"] == long["goals_against"]).astype(np.int64)
+    long["clean"] = (long["goals_against"] == 0).astype(np.int64)
+    long["blank"] = (long["goals_for"] == 0).astype(np.int64)
+    long["result_value"] = long["win"] - (1 - long["win"] - long["draw"])
+
+    long = long.sort_values(["team_id", "match_date", "match_id"], kind="stable")
+    long = long.reset_index(drop=True)
+    side = _side_features(long, matches_back)
+    side["row"] = long["row"].to_numpy()
+
+    home = side[long["is_home"].to_numpy()].set_index("row").sort_index()
+    away = side[~long["is_home"].to_numpy()].set_index("row").sort_index()
+
+    # Form dizileri: önce ev sahibi, sonra deplasman sonuçları; eksikler sona
+    lag_columns = [f"lag_{lag}" for lag in range(1, 6)]
+    sequence = np.hstack([home[lag_columns].to_numpy(), away[lag_columns].to_numpy()])
+    order = np.argsort(np.isnan(sequence), axis=1, kind="stable")
+    sequence = np.nan_to_num(np.take_along_axis(sequence, order, axis=1))
+
+    features = pd.DataFrame(
+        {
+            "home_avg_goals_for": home["avg_goals_for"].to_numpy(),
+            "home_avg_goals_against": home["avg_goals_against"].to_numpy(),
+            "home_points_ratio": home["points_ratio"].to_numpy(),
+            "away_avg_goals_for": away["avg_goals_for"].to_numpy(),
+            "away_avg_goals_against": away["avg_goals_against"].to_numpy(),
+            "away_points_ratio": away["points_ratio"].to_numpy(),
+            "home_clean_sheet_ratio": home["clean_sheet_ratio"].to_numpy(),
+            "away_clean_sheet_ratio": away["clean_sheet_ratio"].to_numpy(),
+            "home_failed_to_score_ratio": home["failed_to_score_ratio"].to_numpy(),
+            "away_failed_to_score_ratio": away["failed_to_score_ratio"].to_numpy(),
+        }
+    )
+    for i in range(10):
+        features[f"form_{i}"] = sequence[:, i]
+
+    return pd.concat(
+        [matches[KEY_COLUMNS], features, matches[TARGET_COLUMNS]], axis=1
+    )
+
+
+class FeatureStore:
+    """Maç ID'sine göre anahtarlanmış, dosya tabanlı özellik deposu"""
+
+    def __init__(self, path: str = None, matches_back: int = 5):
+        """
+        Args:
+            path: Özellik dosyasının yolu (varsayılan: DATA_DIR/features/match_features.npz)
+            matches_back: Form için dikkate alınacak son maç sayısı
+        """
+        self.path = path or os.path.join(
+            Config.DATA_DIR, "features", "match_features.npz"
+        )
+        self.matches_back = matches_back
+
+    def exists(self) -> bool:
+        """Özellik dosyası mevcut mu?"""
+        return os.path.exists(self.path)
+
+    def version(self) -> Optional[Tuple[Optional[datetime], int]]:
+        """Dosyanın oluşturulduğu veri sürümü; dosya yoksa None"""
+        if not self.exists():
+            return None
+        with np.load(self.path) as data:
+            if "source_count" not in data.files:
+                return None
+            updated_at = data["source_updated_at"]
+            return (
+                None if np.isnat(updated_at) else updated_at.item(),
+                int(data["source_count"]),
+            )
+
+    def is_stale(self, session) -> bool:
+        """Dosya yoksa veya veritabanındaki tamamlanmış maçlarla uyuşmuyorsa True"""
+        return self.version() != finished_matches_version(session)
+
+    def build(self, session) -> pd.DataFrame:
+        """Maç tablosundan özellikleri hesaplar ve dosyaya yazar"""
+        # Sürüm önce okunur: hesaplama sırasında gelen sonuçlar bir sonraki
+        # kontrolde dosyayı eskimiş gösterir
+        version = finished_matches_version(session)
+        matches = load_finished_matches(session)
+        frame = compute_point_in_time_features(matches, self.matches_back)
+        self.save(frame, version)
+        logger.info(f"Özellik deposu oluşturuldu: {len(frame)} maç -> {self.path}")
+        return frame
+
+    def save(
+        self,
+        frame: pd.DataFrame,
+        version: Optional[Tuple[Optional[datetime], int]] = None,
+    ) -> None:
+        """Özellik tablosunu sütunsal olarak kaydeder
+
+        Args:
+            frame: Özellik tablosu
+            version: Tablonun hesaplandığı veri sürümü
+                (bkz. `finished_matches_version`); verilmezse dosya ilk
+                kontrolde eskimiş sayılır
+        """
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        columns = {
+            "match_id": frame["match_id"].to_numpy(dtype=np.int64),
+            "match_date": frame["match_date"].to_numpy(dtype="datetime64[us]"),
+            "league_id": frame["league_id"].fillna(-1).to_numpy(dtype=np.int64),
+            "home_team_id": frame["home_team_id"].to_numpy(dtype=np.int64),
+            "away_team_id": frame["away_team_id"].to_numpy(dtype=np.int64),
+            "features": frame[FEATURE_COLUMNS].to_numpy(dtype=np.float32),
+            "targets": frame[TARGET_COLUMNS].to_numpy(dtype=np.float32),
+        }
+        if version is not None:
+            updated_at, count = version
+            columns["source_updated_at"] = np.datetime64(updated_at or "NaT", "us")
+            columns["source_count"] = np.int64(count)
+        # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yaz
+        tmp_path = f"{self.path}.tmp.npz"
+        np.savez(tmp_path, **columns)
+        os.replace(tmp_path, self.path)
+
+    def load(self, league_id: Optional[int] = None) -> pd.DataFrame:
+        """Özellik tablosunu dosyadan okur
+
+        Args:
+            league_id: Sadece bu ligdeki maçları döndür (isteğe bağlı)
+        """
+        with np.load(self.path) as data:
+            mask = (
+                data["league_id"] == league_id
+                if league_id is not None
+                else np.ones(len(data["match_id"]), dtype=bool)
+            )
+            frame = pd.DataFrame(
+                {column: data[column][mask] for column in KEY_COLUMNS}
+            )
+            features = pd.DataFrame(data["features"][mask], columns=FEATURE_COLUMNS)
+            targets = pd.DataFrame(data["targets"][mask], columns=TARGET_COLUMNS)
+
+        return pd.concat([frame, features, targets], axis=1)
+
+    def load_or_build(self, session, league_id: Optional[int] = None) -> pd.DataFrame:
+        """Dosya güncelse okur; yoksa veya eskimişse önce yeniden oluşturur"""
+        if self.is_stale(session):
+            self.build(session)
+        return self.load(league_id)
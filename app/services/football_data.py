@@ -2,6 +2,7 @@ import os
 import requests
 from typing import Dict, Any, List, Optional
 from .api_provider import BaseFootballAPI
+from .http_client import http_client, run_sync
 
 class FootballDataAPI(BaseFootballAPI):
     """Football-Data.org API implementasyonu"""
@@ -16,14 +17,17 @@ class FootballDataAPI(BaseFootballAPI):
         self.headers = {"X-Auth-Token": self.api_key}
     
     def _make_request(self, endpoint: str) -> Dict[str, Any]:
-        """API'ye istek gönderir"""
+        """API'ye istek gönderir (`_make_request_async` sarmalayıcısı)"""
+        return run_sync(self._make_request_async(endpoint))
+    
+    async def _make_request_async(self, endpoint: str) -> Dict[str, Any]:
+        """API'ye paylaşılan asenkron HTTP istemcisiyle istek gönderir"""
         try:
-            response = requests.get(
+            response = await http_client.get(
                 f"{self.BASE_URL}{endpoint}",
                 headers=self.headers,
                 timeout=10
             )
-            response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             print(f"API Error: {e}")
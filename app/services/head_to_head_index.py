@@ -0,0 +1,364 @@
+"""
+Karşılaşma Geçmişi (H2H) İndeksi Modülü
+
+Her takım çifti için (sırasız anahtar) son N karşılaşmayı bellekte, en yeni
+maç başta olacak şekilde küçük demetler halinde tutar. Maç önizlemelerindeki
+H2H istatistikleri veritabanına gitmeden bu indeksten hesaplanır.
+
+İndeks ilk yüklemede her çiftin son N maçını tek bir pencere fonksiyonlu
+sorguyla alır; sonrasında kaydedilen sonuçlar artımlı olarak eklenir:
+    - Bu süreçte kaydedilen sonuçlar, işlem commit edildikten sonra olay
+      dinleyicisiyle eklenir (geri alınan sonuçlar indekse girmez).
+    - Diğer süreçlerin kaydettiği sonuçlar `sync` ile en fazla
+      PREDICTION_CACHE_SYNC_INTERVAL saniyede bir okunur.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from config import Config
+from .match_changes import MatchChangeCursor, defer_until_commit
+
+logger = logging.getLogger(__name__)
+
+# Çift başına tutulan karşılaşma sayısı
+MAX_MEETINGS = 10
+
+
+class Meeting(NamedTuple):
+    """İki takım arasındaki tek bir karşılaşma"""
+
+    match_id: int
+    match_date: datetime
+    home_team_id: int
+    home_goals: int
+    away_goals: int
+
+
+def pair_key(team_a: int, team_b: int) -> Tuple[int, int]:
+    """Takım çifti için sırasız anahtar"""
+    return (team_a, team_b) if team_a <= team_b else (team_b, team_a)
+
+
+def empty_head_to_head() -> Dict[str, Union[int, None, List]]:
+    """Karşılaşması olmayan çift için boş H2H sözlüğü"""
+    return {
+        "total_matches": 0,
+        "home_wins": 0,
+        "draws": 0,
+        "away_wins": 0,
+        "home_goals": 0,
+        "away_goals": 0,
+        "last_meeting": None,
+        "meetings": [],
+    }
+
+
+def head_to_head_from_meetings(
+    meetings: Iterable[Meeting], home_team_id: int
+) -> Dict[str, Union[int, None, List]]:
+    """Karşılaşmalardan, home_team_id'nin bakış açısıyla H2H istatistikleri üretir
+
+    Karşılaşmalar en yeni maç başta olacak şekilde verilmelidir.
+    """
+    stats = empty_head_to_head()
+    for meeting in meetings:
+        if meeting.home_team_id == home_team_id:
+            home_goals, away_goals = meeting.home_goals, meeting.away_goals
+        else:
+            home_goals, away_goals = meeting.away_goals, meeting.home_goals
+
+        if home_goals > away_goals:
+            stats["home_wins"] += 1
+            result = "H"
+        elif home_goals == away_goals:
+            stats["draws"] += 1
+            result = "D"
+        else:
+            stats["away_wins"] += 1
+            result = "A"
+
+        stats["home_goals"] += home_goals
+        stats["away_goals"] += away_goals
+        stats["meetings"].append(
+            {
+                "match_id": meeting.match_id,
+                "date": meeting.match_date,
+                "home_goals": home_goals,
+                "away_goals": away_goals,
+                "result": result,
+            }
+        )
+
+    stats["total_matches"] = len(stats["meetings"])
+    if stats["meetings"]:
+        stats["last_meeting"] = stats["meetings"][0]["date"]
+    return stats
+
+
+class HeadToHeadIndex:
+    """Sırasız takım çifti anahtarlı bellek içi H2H indeksi"""
+
+    def __init__(self, max_meetings: int = MAX_MEETINGS, sync_interval: float = None):
+        """
+        Args:
+            max_meetings: Çift başına tutulan karşılaşma sayısı
+            sync_interval: Diğer süreçlerin sonuçlarını okuma aralığı, saniye
+                (varsayılan: Config.PREDICTION_CACHE_SYNC_INTERVAL)
+        """
+        self.max_meetings = max_meetings
+        self.sync_interval = (
+            Config.PREDICTION_CACHE_SYNC_INTERVAL
+            if sync_interval is None
+            else sync_interval
+        )
+        # Çiftlerin değişmez demetleri; okuyucular kilitsiz okuyabilir
+        self._pairs: Dict[Tuple[int, int], Tuple[Meeting, ...]] = {}
+        self._lock = threading.Lock()
+        self._changes = MatchChangeCursor()
+        self._next_sync = 0.0
+        self.loaded = False
+
+    # ------------------------------------------------------------------
+    # Yükleme / güncelleme
+    # ------------------------------------------------------------------
+    def load(self, session) -> int:
+        """Her çiftin son karşılaşmalarını veritabanından yükler
+
+        Args:
+            session: SQLAlchemy veritabanı oturumu
+
+        Returns:
+            int: Yüklenen maç sayısı
+        """
+        # İmleç sorgudan önce konumlanır: yükleme sırasında kaydedilen
+        # sonuçlar sonraki `refresh` ile okunur
+        self._changes.start(session)
+        rows = self._query_last_meetings(session)
+        self._changes.mark(rows)
+        with self._lock:
+            self._pairs = {}
+            count = self._merge_rows(rows)
+            self.loaded = True
+        logger.info(f"H2H indeksi yüklendi: {count} maç, {len(self._pairs)} çift")
+        return count
+
+    def refresh(self, session) -> int:
+        """Son yüklemeden sonra eklenen/güncellenen maçları indekse ekler
+
+        Returns:
+            int: İndekse eklenen veya güncellenen maç sayısı
+        """
+        if not self.loaded:
+            return self.load(session)
+
+        rows = self._query_updated_matches(session)
+        with self._lock:
+            count = self._merge_rows(rows)
+        if count:
+            logger.info(f"H2H indeksi güncellendi: {count} maç")
+        return count
+
+    def sync(self, session) -> int:
+        """İndeksi en fazla `sync_interval` saniyede bir yükler/yeniler
+
+        Returns:
+            int: İndekse eklenen veya güncellenen maç sayısı
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.loaded and now < self._next_sync:
+                return 0
+            self._next_sync = now + self.sync_interval
+        return self.refresh(session)
+
+    def ensure_loaded(self, session) -> None:
+        """İndeks henüz yüklenmediyse yükler"""
+        if not self.loaded:
+            self.load(session)
+
+    def add_match(self, match) -> None:
+        """Kaydedilen tek bir maç sonucunu indekse ekler"""
+        if match.home_goals is None or match.away_goals is None:
+            return
+        row = (
+            match.id,
+            match.home_team_id,
+            match.away_team_id,
+            match.match_date,
+            match.home_goals,
+            match.away_goals,
+            getattr(match, "updated_at", None),
+        )
+        with self._lock:
+            self._merge_rows([row])
+
+    def _query_last_meetings(self, session):
+        """Her çiftin son `max_meetings` maçını tek sorguyla döndürür"""
+        from sqlalchemy import case, func, select
+
+        from app.models import Match
+
+        low_team = case(
+            (Match.home_team_id < Match.away_team_id, Match.home_team_id),
+            else_=Match.away_team_id,
+        )
+        high_team = case(
+            (Match.home_team_id < Match.away_team_id, Match.away_team_id),
+            else_=Match.home_team_id,
+        )
+        ranked = (
+            select(
+                Match.id,
+                Match.home_team_id,
+                Match.away_team_id,
+                Match.match_date,
+                Match.home_goals,
+                Match.away_goals,
+                Match.updated_at,
+                func.row_number()
+                .over(
+                    partition_by=(low_team, high_team),
+                    order_by=Match.match_date.desc(),
+                )
+                .label("rank"),
+            )
+            .where(*MatchChangeCursor.finished_filter())
+            .subquery()
+        )
+        return session.execute(
+            select(
+                ranked.c.id,
+                ranked.c.home_team_id,
+                ranked.c.away_team_id,
+                ranked.c.match_date,
+                ranked.c.home_goals,
+                ranked.c.away_goals,
+                ranked.c.updated_at,
+            ).where(ranked.c.rank <= self.max_meetings)
+        ).all()
+
+    def _query_updated_matches(self, session):
+        """İmleçten bu yana değişen tamamlanmış maçlar"""
+        from app.models import Match
+
+        return self._changes.fetch(
+            session,
+            Match.id,
+            Match.home_team_id,
+            Match.away_team_id,
+            Match.match_date,
+            Match.home_goals,
+            Match.away_goals,
+            Match.updated_at,
+        )
+
+    def _merge_rows(self, rows: Iterable) -> int:
+        """Maç satırlarını çiftlere birleştirir (kilit altında çağrılır)"""
+        count = 0
+        changed: Dict[Tuple[int, int], List[Meeting]] = {}
+        for (
+            match_id,
+            home_team_id,
+            away_team_id,
+            match_date,
+            home_goals,
+            away_goals,
+            *_,
+        ) in rows:
+            key = pair_key(home_team_id, away_team_id)
+            if key not in changed:
+                changed[key] = list(self._pairs.get(key, ()))
+            meetings = changed[key]
+            # Güncellenen maçın eski kaydını çıkar
+            meetings[:] = [m for m in meetings if m.match_id != match_id]
+            meetings.append(
+                Meeting(
+                    match_id,
+                    match_date,
+                    home_team_id,
+                    int(home_goals),
+                    int(away_goals),
+                )
+            )
+            count += 1
+
+        for key, meetings in changed.items():
+            meetings.sort(key=lambda meeting: meeting.match_date, reverse=True)
+            self._pairs[key] = tuple(meetings[: self.max_meetings])
+        return count
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+    def get_meetings(
+        self, team_a: int, team_b: int, limit: Optional[int] = None
+    ) -> Tuple[Meeting, ...]:
+        """İki takımın son karşılaşmalarını (en yeni başta) döndürür"""
+        meetings = self._pairs.get(pair_key(team_a, team_b), ())
+        return meetings if limit is None else meetings[:limit]
+
+    def get_head_to_head(
+        self, home_team_id: int, away_team_id: int, limit: Optional[int] = None
+    ) -> Dict[str, Union[int, None, List]]:
+        """Ev sahibinin bakış açısıyla H2H istatistiklerini döndürür
+
+        Args:
+            home_team_id: Ev sahibi takım ID'si
+            away_team_id: Deplasman takımı ID'si
+            limit: İncelenecek karşılaşma sayısı (en fazla max_meetings)
+
+        Returns:
+            Dict: `head_to_head_from_meetings` çıktısı
+        """
+        if limit is not None and limit > self.max_meetings:
+            raise ValueError(
+                f"H2H indeksi en fazla {self.max_meetings} karşılaşma tutar"
+            )
+        return head_to_head_from_meetings(
+            self.get_meetings(home_team_id, away_team_id, limit), home_team_id
+        )
+
+    def pair_count(self) -> int:
+        """İndeksteki takım çifti sayısı"""
+        return len(self._pairs)
+
+
+# Süreç genelinde paylaşılan indeks
+head_to_head_index = HeadToHeadIndex()
+
+
+def _apply_committed(matches: List) -> None:
+    """Commit edilen sonuçları (indeks yüklüyse) H2H indeksine ekler"""
+    if head_to_head_index.loaded:
+        for match in matches:
+            head_to_head_index.add_match(match)
+
+
+def queue_match(session, match) -> None:
+    """Tamamlanan maçı commit sonrası H2H indeksine eklenmek üzere sıraya alır"""
+    from app.models import MatchStatus
+
+    if match.status == MatchStatus.FINISHED:
+        defer_until_commit(session, _apply_committed, match)
+
+
+def _on_match_saved(mapper, connection, target) -> None:
+    """Sonucu kaydedilen maçı işlem commit edildiğinde H2H indeksine ekler"""
+    from sqlalchemy.orm import object_session
+
+    queue_match(object_session(target), target)
+
+
+def register_head_to_head_listeners() -> None:
+    """Match kayıt/güncelleme olaylarına H2H indeks güncellemesini bağlar"""
+    from sqlalchemy import event
+
+    from app.models import Match
+
+    for event_name in ("after_insert", "after_update"):
+        if not event.contains(Match, event_name, _on_match_saved):
+            event.listen(Match, event_name, _on_match_saved)
@@ -0,0 +1,225 @@
+"""
+Sağlayıcı HTTP İstemcisi Modülü
+
+Tüm futbol veri sağlayıcılarının (football-data.org, RapidAPI, API-Ninjas)
+paylaştığı asyncio tabanlı HTTP istemcisi:
+    - Ortak bağlantı havuzu: tek bir requests.Session, havuz boyutu eşzamanlı
+      istek sınırı kadar
+    - Sınırlı eşzamanlılık: istekler boyutu sınırlı bir iş parçacığı
+      havuzunda yürütülür; asyncio olay döngüsü bu sırada bloklanmaz
+    - Sunucu (host) bazında jeton kovası ile istek hızı sınırı
+    - Bağlantı hataları ve 429/5xx yanıtlarında üstel geri çekilmeli yeniden
+      deneme (Retry-After başlığına uyulur)
+
+Eşzamanlı istekler `gather` ile birlikte beklenir; toplam süre en yavaş
+isteğin süresi kadardır. Senkron çağıranlar için `run_sync` ve `get_sync`
+sarmalayıcıları vardır.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Yeniden denenecek HTTP durum kodları
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Sunucu bazında (saniyedeki istek, anlık en fazla istek) sınırları
+HOST_RATE_LIMITS = {
+    # Ücretsiz katman: dakikada 10 istek
+    "api.football-data.org": (10 / 60, 10),
+    # RapidAPI: saniyede 10 istek
+    "free-api-live-football-data.p.rapidapi.com": (10.0, 10),
+    "api.api-ninjas.com": (5.0, 5),
+}
+DEFAULT_RATE_LIMIT = (5.0, 5)
+
+
+class RateLimiter:
+    """İş parçacığı güvenli jeton kovası
+
+    Jetonlar `rate` hızıyla en fazla `burst` adede kadar dolar. Her istek bir
+    jeton ayırır; kova boşsa ayırma, jetonun dolacağı ana kadar bekleme
+    süresi döndürür. Ayırma olay döngüsünden bağımsızdır.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Bir jeton ayırır ve beklenmesi gereken süreyi (saniye) döndürür"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def update(self, remaining: int, reset: float) -> None:
+        """Sunucunun bildirdiği kalan istek hakkını kovaya yansıtır
+
+        Args:
+            remaining: Kalan istek sayısı
+            reset: Sayacın sıfırlanmasına kalan süre (saniye)
+        """
+        with self._lock:
+            self._tokens = min(self._tokens, float(remaining))
+            if remaining <= 0:
+                self._blocked_until = time.monotonic() + reset
+
+    async def acquire(self) -> None:
+        """Jeton ayırır ve gerekiyorsa bekler"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class AsyncHTTPClient:
+    """Paylaşılan havuzlu, sınırlı eşzamanlılıklı asyncio HTTP istemcisi"""
+
+    def __init__(
+        self,
+        max_concurrency: int = None,
+        max_retries: int = None,
+        backoff: float = None,
+        rate_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+    ):
+        """
+        Args:
+            max_concurrency: Eşzamanlı en fazla istek (varsayılan:
+                Config.HTTP_MAX_CONCURRENCY)
+            max_retries: İlk denemeden sonraki en fazla deneme (varsayılan:
+                Config.HTTP_MAX_RETRIES)
+            backoff: İlk yeniden deneme gecikmesi, saniye; her denemede
+                iki katına çıkar (varsayılan: Config.HTTP_RETRY_BACKOFF)
+            rate_limits: Sunucu -> (saniyedeki istek, anlık en fazla istek)
+                (varsayılan: HOST_RATE_LIMITS)
+        """
+        self.max_concurrency = max_concurrency or Config.HTTP_MAX_CONCURRENCY
+        self.max_retries = (
+            Config.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.backoff = Config.HTTP_RETRY_BACKOFF if backoff is None else backoff
+        self.rate_limits = HOST_RATE_LIMITS if rate_limits is None else rate_limits
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="http"
+        )
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, host: str) -> RateLimiter:
+        """Sunucunun hız sınırlayıcısını döndürür"""
+        with self._lock:
+            if host not in self._limiters:
+                rate, burst = self.rate_limits.get(host, DEFAULT_RATE_LIMIT)
+                self._limiters[host] = RateLimiter(rate, burst)
+            return self._limiters[host]
+
+    def _retry_delay(self, attempt: int, response=None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff * (2**attempt) * (1 + random.random() / 2)
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict] = None,
+        params: Optional[Dict] = None,
+        timeout: float = 10,
+    ) -> requests.Response:
+        """GET isteği gönderir
+
+        Bağlantı hataları ve RETRY_STATUSES yanıtları yeniden denenir.
+
+        Returns:
+            requests.Response: Başarılı (2xx/3xx) yanıt
+
+        Raises:
+            requests.exceptions.RequestException: Denemeler tükendiğinde veya
+                yeniden denenmeyen bir hata yanıtında
+        """
+        loop = asyncio.get_running_loop()
+        limiter = self.limiter(urlsplit(url).netloc)
+        request = partial(
+            self.session.get, url, headers=headers, params=params, timeout=timeout
+        )
+
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            response = None
+            try:
+                response = await loop.run_in_executor(self._executor, request)
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as e:
+                if attempt == self.max_retries:
+                    raise
+                logger.warning(f"İstek başarısız ({url}): {e}, yeniden denenecek")
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    response.raise_for_status()
+                    return response
+                if attempt == self.max_retries:
+                    response.raise_for_status()
+                logger.warning(
+                    f"İstek başarısız ({url}): {response.status_code}, yeniden denenecek"
+                )
+            await asyncio.sleep(self._retry_delay(attempt, response))
+
+    async def gather(self, *requests_: Awaitable) -> List[Any]:
+        """İstekleri eşzamanlı yürütür; hatalar sonuç listesinde döndürülür"""
+        return await asyncio.gather(*requests_, return_exceptions=True)
+
+    def get_sync(self, url: str, **kwargs) -> requests.Response:
+        """`get` için senkron sarmalayıcı"""
+        return run_sync(self.get(url, **kwargs))
+
+
+def run_sync(coroutine: Awaitable) -> Any:
+    """Korutini senkron olarak çalıştırır ve sonucunu döndürür
+
+    Çalışan bir olay döngüsünün içinden çağrılırsa korutin ayrı bir iş
+    parçacığındaki yeni bir döngüde çalıştırılır.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+# Süreç genelinde paylaşılan istemci (ortak bağlantı havuzu ve hız sınırları)
+http_client = AsyncHTTPClient()
@@ -0,0 +1,231 @@
+"""
+Artımlı Eğitim Modülü
+
+Her maç gününden sonra modeli sıfırdan eğitmek yerine, son eğitimden bu yana
+tamamlanan maçlar için mevcut GradientBoosting modeline ek ağaçlar ekler
+(warm_start). Scaler sabit tutulur; böylece eski ağaçların özellik uzayı
+değişmez.
+
+Aşağıdaki durumlarda artımlı güncelleme yerine tam yeniden eğitim yapılır:
+    - Model veya eğitim bilgisi (.meta.json) yoksa
+    - Son tam eğitimden bu yana FULL_REFIT_DAYS gün geçmişse
+    - Artımlı güncelleme sayısı MAX_INCREMENTAL_UPDATES'e ulaşmışsa
+    - Mevcut modelin yeni maçlardaki MAE değeri, tam eğitimdeki MAE'den
+      DRIFT_TOLERANCE oranından fazla kötüleşmişse (kayma)
+Tam yeniden eğitim mevcut modelin arka ucuyla (gbr, hist, xgboost) yapılır.
+"""
+
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import Config
+from .feature_store import FEATURE_COLUMNS, TARGET_COLUMNS, FeatureStore
+from .match_model import (
+    ensemble_size,
+    load_model_metadata,
+    model_backend,
+    model_paths,
+    save_model_metadata,
+    warm_start_match_model,
+)
+from .model_artifacts import load_artifact, save_artifact
+from .training_orchestrator import (
+    MIN_TRAINING_MATCHES,
+    resolve_league_ids,
+    train_league_job,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tam yeniden eğitim zamanlaması ve kayma eşiği
+FULL_REFIT_DAYS = 30
+MAX_INCREMENTAL_UPDATES = 8
+DRIFT_TOLERANCE = 0.15
+
+# Artımlı güncellemede her çıktıya eklenecek ağaç sayısı
+NEW_ESTIMATORS_PER_UPDATE = 20
+
+# Artımlı güncelleme için gereken en az yeni maç sayısı
+MIN_NEW_MATCHES = 5
+
+
+def full_refit_reason(
+    metadata: Dict[str, Any], now: Optional[datetime] = None
+) -> Optional[str]:
+    """Zamanlamaya göre tam yeniden eğitim gerekiyorsa nedenini döndürür"""
+    if not metadata.get("trained_until") or not metadata.get("full_refit_at"):
+        return "eğitim bilgisi yok"
+
+    now = now or datetime.utcnow()
+    full_refit_at = pd.Timestamp(metadata["full_refit_at"]).to_pydatetime()
+    if now - full_refit_at >= timedelta(days=FULL_REFIT_DAYS):
+        return f"son tam eğitimden bu yana {FULL_REFIT_DAYS} günden fazla geçti"
+
+    if metadata.get("incremental_updates", 0) >= MAX_INCREMENTAL_UPDATES:
+        return f"{MAX_INCREMENTAL_UPDATES} artımlı güncellemeye ulaşıldı"
+
+    return None
+
+
+def has_drifted(baseline_mae: Optional[float], current_mae: float) -> bool:
+    """Yeni maçlardaki hata, tam eğitimdeki hatadan belirgin şekilde kötü mü?"""
+    if not baseline_mae:
+        return False
+    return current_mae > baseline_mae * (1 + DRIFT_TOLERANCE)
+
+
+def update_league_model(
+    league_id: Optional[int],
+    store: FeatureStore,
+    model_dir: str = "models",
+    name: Optional[str] = None,
+    limit: int = 5000,
+    min_matches: int = MIN_TRAINING_MATCHES,
+    now: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Tek bir (lig veya global) modeli yeni maçlarla günceller
+
+    Args:
+        league_id: Lig ID'si (global model için None)
+        store: Güncel maçları içeren özellik deposu
+        model_dir: Model dosyalarının dizini
+        name: Özetlerde kullanılacak ad
+        limit: Tam eğitimde kullanılacak en fazla maç sayısı
+        min_matches: Tam eğitim için gereken en az maç sayısı
+        now: Zamanlama kontrolü için şimdiki zaman (test için)
+
+    Returns:
+        Dict[str, Any]: 'mode' ('full', 'incremental', 'skipped') ve metrikler
+    """
+    started = time.perf_counter()
+    name = name or ("global" if league_id is None else str(league_id))
+    model_path, scaler_path = model_paths(league_id, model_dir)
+    metadata = load_model_metadata(model_path)
+
+    def full_refit(reason: str, model: Any = None) -> Dict[str, Any]:
+        """Modeli sıfırdan eğitir; mevcut modelin arka ucu korunur"""
+        logger.info(f"{name}: tam yeniden eğitim ({reason})")
+        if model is None and os.path.exists(model_path):
+            model = load_artifact(model_path)
+        try:
+            backend = None if model is None else model_backend(model)
+        except ValueError as e:
+            logger.warning(f"{name}: {e}; varsayılan arka uç kullanılacak")
+            backend = None
+        summary = train_league_job(
+            {
+                "name": name,
+                "league_id": league_id,
+                "store_path": store.path,
+                "model_dir": model_dir,
+                "limit": limit,
+                "min_matches": min_matches,
+                "backend": backend,
+            }
+        )
+        summary.update({"mode": "full", "reason": reason})
+        return summary
+
+    if not (os.path.exists(model_path) and os.path.exists(scaler_path)):
+        return full_refit("model dosyası yok")
+
+    reason = full_refit_reason(metadata, now)
+    if reason:
+        return full_refit(reason)
+
+    frame = store.load(league_id)
+    trained_until = pd.Timestamp(metadata["trained_until"])
+    new_matches = frame[frame["match_date"] > trained_until]
+
+    summary = {"name": name, "league_id": league_id, "success": True}
+    if len(new_matches) < MIN_NEW_MATCHES:
+        summary.update(
+            {
+                "mode": "skipped",
+                "message": f"Yetersiz yeni maç: {len(new_matches)}",
+                "wall_time": round(time.perf_counter() - started, 2),
+            }
+        )
+        return summary
+
+    # Güncellenecek model yazılabilir olmalı; bellek eşlemesi kullanılmaz
+    model = load_artifact(model_path, mmap=False)
+    scaler = load_artifact(scaler_path, mmap=False)
+
+    X_new = scaler.transform(new_matches[FEATURE_COLUMNS].to_numpy(dtype=float))
+    y_new = new_matches[TARGET_COLUMNS].to_numpy(dtype=float)
+
+    current_mae = float(np.mean(np.abs(y_new - model.predict(X_new))))
+    if has_drifted(metadata.get("baseline_mae"), current_mae):
+        return full_refit(
+            f"kayma: MAE {metadata['baseline_mae']:.3f} -> {current_mae:.3f}", model
+        )
+
+    warm_start_match_model(model, X_new, y_new, NEW_ESTIMATORS_PER_UPDATE)
+    save_artifact(model, model_path)
+
+    metadata.update(
+        {
+            "trained_until": new_matches["match_date"].max(),
+            "incremental_updates": metadata.get("incremental_updates", 0) + 1,
+            "last_update_at": now or datetime.utcnow(),
+            "last_update_mae": current_mae,
+        }
+    )
+    save_model_metadata(model_path, metadata)
+
+    summary.update(
+        {
+            "mode": "incremental",
+            "new_matches": int(len(new_matches)),
+            "mae_before_update": current_mae,
+            "n_estimators": ensemble_size(model),
+            "wall_time": round(time.perf_counter() - started, 2),
+        }
+    )
+    return summary
+
+
+def update_all_models(
+    session,
+    league_codes: Optional[List[str]] = None,
+    model_dir: str = "models",
+    store: Optional[FeatureStore] = None,
+) -> List[Dict[str, Any]]:
+    """Maç günü sonrasında global ve tüm lig modellerini günceller
+
+    Özellik deposu bir kez yeniden oluşturulur; her model gerekirse tam
+    yeniden eğitilir, aksi halde artımlı olarak güncellenir.
+    """
+    league_codes = list(league_codes or Config.LEAGUES.keys())
+    store = store or FeatureStore()
+    store.build(session)
+
+    targets = [("global", None)] + list(
+        resolve_league_ids(session, league_codes).items()
+    )
+
+    results = []
+    for name, league_id in targets:
+        try:
+            result = update_league_model(league_id, store, model_dir, name=name)
+        except Exception as e:
+            result = {
+                "name": name,
+                "league_id": league_id,
+                "success": False,
+                "message": str(e),
+            }
+        results.append(result)
+        logger.info(
+            f"  {name:<8} {result.get('mode', 'hata')}: "
+            f"{result.get('message') or result.get('reason') or ''}"
+        )
+
+    return results
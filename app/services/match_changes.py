@@ -0,0 +1,186 @@
+"""
+Maç Değişiklikleri Modülü
+
+Süreç içi önbellek ve indeksler (tahmin önbelleği, form ve H2H indeksleri)
+olay dinleyicileriyle yalnızca kendi süreçlerinin kaydettiği sonuçları görür.
+Diğer süreçlerin (diğer gunicorn işçileri, maç aktarım komutu) kaydettiği
+tamamlanmış maçlar `MatchChangeCursor` ile `updated_at` üzerinden okunur.
+
+updated_at kayıt işlemi tamamlanmadan (commit) önce atandığından, geç
+görünür olan kayıtları kaçırmamak için sorgu son görülen zamandan OVERLAP
+kadar geriye bakar. Bu pencerede daha önce işlenmiş (maç id, updated_at)
+çiftleri hatırlanır ve atlanır; her değişiklik bir kez döner.
+
+Olay dinleyicileri ise flush sırasında, işlem tamamlanmadan çalışır.
+`defer_until_commit` dinleyicinin gördüğü maçı oturum commit edilene kadar
+bekletir; geri alınan (rollback) değişiklikler bellekteki yapılara girmez.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Senkronizasyonda geriye dönük taranan süre
+OVERLAP = timedelta(seconds=60)
+
+
+class MatchChangeCursor:
+    """Tamamlanmış maçlardaki değişiklikleri bir kez döndüren updated_at imleci
+
+    Sorgulanan sütunlar `id` ve `updated_at` adlı sütunları içermelidir.
+    """
+
+    def __init__(self, overlap: timedelta = OVERLAP):
+        self.overlap = overlap
+        self.position: Optional[datetime] = None
+        # Örtüşme penceresinde işlenmiş maçlar: id -> updated_at
+        self._seen: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def finished_filter():
+        """Skoru girilmiş tamamlanmış maç koşulları"""
+        from app.models import Match, MatchStatus
+
+        return (
+            Match.status == MatchStatus.FINISHED,
+            Match.home_goals.isnot(None),
+            Match.away_goals.isnot(None),
+        )
+
+    def start(self, session) -> None:
+        """İmleci mevcut son değişikliğe konumlandırır (eski satırlar dönmez)"""
+        from sqlalchemy import func
+
+        from app.models import Match
+
+        latest = (
+            session.query(func.max(Match.updated_at))
+            .filter(*self.finished_filter())
+            .scalar()
+        )
+        with self._lock:
+            self.position = latest or datetime(1970, 1, 1)
+            self._seen = {}
+        self.fetch(session, Match.id, Match.updated_at)
+
+    def fetch(self, session, *columns: Any) -> List[Any]:
+        """Son çağrıdan beri eklenen/güncellenen tamamlanmış maçları döndürür
+
+        İmleç konumlanmamışsa tüm tamamlanmış maçlar döner.
+
+        Args:
+            session: SQLAlchemy veritabanı oturumu
+            columns: Sorgulanacak Match sütunları (id ve updated_at dahil)
+        """
+        from app.models import Match
+
+        with self._lock:
+            query = session.query(*columns).filter(*self.finished_filter())
+            if self.position is not None:
+                query = query.filter(Match.updated_at > self.position - self.overlap)
+            rows = [
+                row
+                for row in query.all()
+                if self._seen.get(row.id, False) != row.updated_at
+            ]
+            self._mark(rows)
+        return rows
+
+    def mark(self, rows: Iterable[Any]) -> None:
+        """Başka bir sorguyla okunmuş satırları işlenmiş sayar"""
+        with self._lock:
+            self._mark(list(rows))
+
+    def reset(self) -> None:
+        """İmleci başa alır; sonraki `fetch` tüm maçları döndürür"""
+        with self._lock:
+            self.position = None
+            self._seen = {}
+
+    def _mark(self, rows: List[Any]) -> None:
+        stamps = [row.updated_at for row in rows if row.updated_at is not None]
+        if not stamps:
+            return
+        latest = max(stamps)
+        if self.position is None or latest > self.position:
+            self.position = latest
+        window_start = self.position - self.overlap
+        for row in rows:
+            if row.updated_at is not None and row.updated_at > window_start:
+                self._seen[row.id] = row.updated_at
+        # Pencereden çıkan satırlar sorguya bir daha girmez
+        self._seen = {
+            match_id: stamp
+            for match_id, stamp in self._seen.items()
+            if stamp > window_start
+        }
+
+
+# Commit bekleyen değişikliklerin tutulduğu session.info anahtarı
+PENDING_KEY = "pending_match_changes"
+
+# Commit sonrasına saklanan maç alanları
+SNAPSHOT_FIELDS = (
+    "id",
+    "home_team_id",
+    "away_team_id",
+    "league_id",
+    "match_date",
+    "status",
+    "home_goals",
+    "away_goals",
+    "updated_at",
+)
+
+
+def defer_until_commit(session, apply: Callable[[List[Any]], None], match: Any) -> None:
+    """Maçın o anki değerlerini oturum commit edildiğinde `apply` ile uygular
+
+    Aynı işlemde birden çok kez kaydedilen maçın son hali uygulanır. İşlem
+    geri alınırsa bekleyen değişiklikler atılır. Oturum yoksa hemen uygulanır.
+
+    Args:
+        session: Maçı kaydeden SQLAlchemy oturumu
+        apply: Commit edilen maç anlık görüntülerinin listesini alan fonksiyon
+        match: Match sütunlarını öznitelik olarak taşıyan nesne
+    """
+    snapshot = SimpleNamespace(
+        **{field: getattr(match, field, None) for field in SNAPSHOT_FIELDS}
+    )
+    if session is None:
+        apply([snapshot])
+        return
+
+    _register_session_listeners()
+    pending = session.info.setdefault(PENDING_KEY, {})
+    pending.setdefault(apply, {})[snapshot.id] = snapshot
+
+
+def _apply_pending(session) -> None:
+    pending = session.info.pop(PENDING_KEY, None)
+    for apply, matches in (pending or {}).items():
+        try:
+            apply(list(matches.values()))
+        except Exception as e:
+            logger.error(f"Commit edilen maç değişiklikleri uygulanamadı: {str(e)}")
+
+
+def _discard_pending(session) -> None:
+    session.info.pop(PENDING_KEY, None)
+
+
+def _register_session_listeners() -> None:
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    for event_name, listener in (
+        ("after_commit", _apply_pending),
+        ("after_rollback", _discard_pending),
+    ):
+        if not event.contains(Session, event_name, listener):
+            event.listen(Session, event_name, listener)
@@ -0,0 +1,292 @@
+"""
+Maç Aktarım Modülü
+
+Sağlayıcı API'sinden (football-data.org) maçları veritabanına aktarır:
+    1. Yarışmanın maçları tarih pencereleri halinde, pencere pencere çekilir
+       (bellekte her seferinde tek pencere tutulur),
+    2. Her pencere parçalara bölünür; her parça API ID'sine göre toplu upsert
+       edilip ayrı bir işlemde kaydedilir,
+    3. Yarışma bazında ilerleme (IngestionState) saklanır: yarım kalan
+       çalıştırma kaldığı pencereden devam eder, artımlı çalıştırmalar ise
+       yalnızca henüz kesinleşmemiş maçların bulunduğu tarihten başlar.
+
+Toplu upsert ile (ORM dışında) yazılan maçlar Match olay dinleyicilerini
+tetiklemez; `apply_match_changes` yazılan değişiklikleri dinleyicilerin
+beslediği türetilmiş yapılara yansıtır (bellek içi indeksler, dinleyicilerde
+olduğu gibi işlem commit edildikten sonra güncellenir):
+    - Takım sezon istatistikleri (TeamStatistics)
+    - Takım maç kaydı (team_match_log)
+    - H2H indeksi
+    - Takım form indeksi
+    - Tahmin önbelleği
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Bir daha değişmeyecek (kesinleşmiş) maç durumları (API değerleri)
+FINAL_API_STATUSES = {"FINISHED", "AWARDED", "CANCELLED"}
+
+# Artımlı çalıştırmalarda bugünden sonra çekilecek gün sayısı (fikstür)
+LOOKAHEAD_DAYS = 14
+
+
+def apply_match_changes(session, changes: List[Tuple[Optional[Any], Any]]) -> None:
+    """Toplu yazılan maç değişikliklerini türetilmiş yapılara yansıtır
+
+    Args:
+        session: Maçları yazan SQLAlchemy veritabanı oturumu
+        changes: (eski maç, yeni maç) çiftleri; yeni eklenen maçın eski hali
+            None'dır. Maçlar Match sütunlarını (id dahil) öznitelik olarak
+            taşıyan herhangi bir nesne olabilir.
+    """
+    from app.services.head_to_head_index import queue_match as queue_head_to_head
+    from app.services.prediction_cache import _on_match_saved as invalidate_predictions
+    from app.services.team_form_index import queue_match as queue_team_form
+    from app.services.team_match_log import write_match_rows
+    from app.services.team_statistics import apply_match_changes as apply_statistics
+
+    if not changes:
+        return
+
+    apply_statistics(session, changes)
+
+    connection = session.connection()
+    matches = [new for _, new in changes]
+    write_match_rows(connection, matches)
+    for match in matches:
+        invalidate_predictions(None, connection, match)
+        queue_head_to_head(session, match)
+        queue_team_form(session, match)
+
+    logger.debug(f"{len(changes)} maç değişikliği türetilmiş yapılara yansıtıldı")
+
+
+def date_windows(
+    start: datetime, end: datetime, days: int
+) -> Iterator[Tuple[datetime, datetime]]:
+    """[start, end) aralığını en fazla `days` günlük ardışık pencerelere böler"""
+    while start < end:
+        window_end = min(start + timedelta(days=days), end)
+        yield start, window_end
+        start = window_end
+
+
+def season_range(season: int) -> Tuple[datetime, datetime]:
+    """Başlangıç yılı verilen sezonun [başlangıç, bitiş) tarih aralığı"""
+    from app.services.team_statistics import SEASON_START_MONTH
+
+    return (
+        datetime(season, SEASON_START_MONTH, 1),
+        datetime(season + 1, SEASON_START_MONTH, 1),
+    )
+
+
+def _today() -> datetime:
+    return datetime.combine(datetime.utcnow().date(), datetime.min.time())
+
+
+class MatchIngestionPipeline:
+    """Yarışma maçlarını pencereler halinde çekip parça parça upsert eder"""
+
+    def __init__(
+        self,
+        client,
+        session,
+        window_days: int = None,
+        batch_size: int = None,
+        league_ids: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Args:
+            client: `get_matches`, `upsert_matches` ve `sync_teams_to_db`
+                metodlarını sağlayan API istemcisi (FootballAPI)
+            session: SQLAlchemy veritabanı oturumu
+            window_days: İstek başına gün aralığı
+                (varsayılan: Config.MATCH_INGEST_WINDOW_DAYS)
+            batch_size: İşlem başına maç sayısı
+                (varsayılan: Config.MATCH_INGEST_BATCH_SIZE)
+            league_ids: Yarışma kodu -> maçlara yazılacak yerel lig ID'si
+        """
+        self.client = client
+        self.session = session
+        self.window_days = window_days or Config.MATCH_INGEST_WINDOW_DAYS
+        self.batch_size = batch_size or Config.MATCH_INGEST_BATCH_SIZE
+        self.league_ids = league_ids or {}
+
+    def _state(self, competition_code: str):
+        """Yarışmanın aktarım durumunu getirir; yoksa oluşturur"""
+        from app.models import IngestionState
+
+        state = (
+            self.session.query(IngestionState)
+            .filter_by(competition_code=competition_code)
+            .first()
+        )
+        if state is None:
+            state = IngestionState(competition_code=competition_code)
+            self.session.add(state)
+        return state
+
+    def fetch_windows(
+        self, competition_code: str, start: datetime, end: datetime
+    ) -> Iterator[Tuple[datetime, List[Dict]]]:
+        """Pencere bitişi ve penceredeki maçları sırayla üretir
+
+        İstek hızı sınırına paylaşılan HTTP istemcisi uyar. İstek hatası
+        çalıştırmayı durdurur; sonraki çalıştırma aynı pencereden devam eder.
+        """
+        for window_start, window_end in date_windows(start, end, self.window_days):
+            matches = self.client.get_matches(
+                competition_code,
+                date_from=window_start.date().isoformat(),
+                # dateTo API'de dahil olduğundan bir önceki gün
+                date_to=(window_end - timedelta(days=1)).date().isoformat(),
+                limit=None,
+                raise_errors=True,
+            )
+            yield window_end, matches
+
+    def _ingest_batch(self, state, batch: List[Dict], league_id: Optional[int]):
+        result = self.client.upsert_matches(batch, league_id)
+
+        open_dates = [
+            datetime.fromisoformat(match["utcDate"].replace("Z", "+00:00")).replace(
+                tzinfo=None
+            )
+            for match in batch
+            if match.get("status") not in FINAL_API_STATUSES
+        ]
+        if open_dates:
+            state.open_from = min(filter(None, [state.open_from, *open_dates]))
+        return result
+
+    @staticmethod
+    def _advance_high_water_mark(state, start: datetime, end: datetime) -> None:
+        """Tamamlanan çalıştırmaya göre kesinleşme sınırını ilerletir"""
+        settled = min(state.open_from or end, end, _today())
+        mark = state.high_water_mark
+        if mark is None or start <= mark <= end:
+            state.high_water_mark = settled
+        elif end < mark and state.open_from is not None:
+            # Sınırdan önce kesinleşmemiş bir maç bulundu
+            state.high_water_mark = min(mark, state.open_from)
+
+    def run(
+        self,
+        competition_code: str,
+        start: datetime,
+        end: datetime,
+        force: bool = False,
+    ) -> Dict[str, int]:
+        """Yarışmanın [start, end) aralığındaki maçlarını aktarır
+
+        Aynı aralıkla yarım kalmış bir çalıştırma varsa kaldığı pencereden
+        devam edilir; aynı aralık daha önce tamamlandıysa (force verilmedikçe)
+        atlanır.
+
+        Args:
+            competition_code: Yarışma kodu (Örn: 'PL')
+            start: Aralık başlangıcı
+            end: Aralık bitişi (hariç)
+            force: Tamamlanmış aralığı yeniden aktar
+
+        Returns:
+            Dict: added, updated, unchanged, skipped ve windows sayıları
+        """
+        state = self._state(competition_code)
+        totals = Counter(added=0, updated=0, unchanged=0, skipped=0, windows=0)
+
+        same_range = (state.run_from, state.run_to) == (start, end)
+        if same_range and state.cursor is None and not force:
+            logger.info(
+                f"{competition_code}: {start:%Y-%m-%d} - {end:%Y-%m-%d} zaten aktarıldı"
+            )
+            return dict(totals)
+        if same_range and state.cursor is not None:
+            logger.info(
+                f"{competition_code}: {state.cursor:%Y-%m-%d} tarihinden devam ediliyor"
+            )
+        else:
+            state.run_from, state.run_to = start, end
+            state.cursor, state.open_from = start, None
+            self.session.commit()
+
+        league_id = self.league_ids.get(competition_code)
+        for window_end, matches in self.fetch_windows(
+            competition_code, state.cursor, end
+        ):
+            for batch_start in range(0, len(matches), self.batch_size):
+                batch = matches[batch_start : batch_start + self.batch_size]
+                totals.update(self._ingest_batch(state, batch, league_id)._asdict())
+                self.session.commit()
+            state.cursor = window_end
+            self.session.commit()
+            totals["windows"] += 1
+
+        self._advance_high_water_mark(state, start, end)
+        state.cursor = None
+        state.last_run_at = datetime.utcnow()
+        self.session.commit()
+
+        logger.info(f"{competition_code}: maç aktarımı tamamlandı {dict(totals)}")
+        return dict(totals)
+
+    def sync(self, competition_code: str) -> Dict[str, int]:
+        """Kesinleşme sınırından bugünden sonraki fikstüre kadar artımlı aktarım
+
+        Yarım kalmış bir çalıştırma varsa önce o tamamlanır.
+        """
+        state = self._state(competition_code)
+        if state.cursor is not None:
+            self.run(competition_code, state.run_from, state.run_to)
+
+        self.client.sync_teams_to_db(competition_code)
+        start = state.high_water_mark or season_range(_today().year - 1)[0]
+        end = _today() + timedelta(days=LOOKAHEAD_DAYS + 1)
+        return self.run(competition_code, start, end)
+
+    def backfill(
+        self,
+        competition_codes: Iterable[str],
+        seasons: Iterable[int],
+        force: bool = False,
+    ) -> Dict[str, Dict[str, int]]:
+        """Yarışmaların verilen sezonlarını (ilk sezondan son sezona) aktarır
+
+        Yeniden çalıştırıldığında tamamlanan yarışmalar atlanır, yarım kalan
+        yarışma kaldığı pencereden devam eder. Bir yarışmadaki hata diğer
+        yarışmaları durdurmaz.
+
+        Returns:
+            Dict: Yarışma kodu -> aktarım sayıları (hata durumunda error)
+        """
+        seasons = sorted(seasons)
+        start, end = season_range(seasons[0])[0], season_range(seasons[-1])[1]
+
+        summary = {}
+        for competition_code in competition_codes:
+            try:
+                state = self._state(competition_code)
+                completed = (state.run_from, state.run_to) == (
+                    start,
+                    end,
+                ) and state.cursor is None
+                if not completed or force:
+                    # Takımlar önce: bilinmeyen takımların maçları atlanır
+                    for season in seasons:
+                        self.client.sync_teams_to_db(competition_code, season)
+                summary[competition_code] = self.run(
+                    competition_code, start, end, force=force
+                )
+            except Exception as e:
+                self.session.rollback()
+                logger.error(f"{competition_code} aktarılırken hata oluştu: {str(e)}")
+                summary[competition_code] = {"error": str(e)}
+        return summary
@@ -0,0 +1,288 @@
+"""
+Maç Skor Modeli Modülü
+
+MatchPredictor'ın kullandığı çok çıktılı (ev golü, deplasman golü) regresyon
+modelinin oluşturulması, eğitilmesi ve dosya yollarıyla ilgili ortak
+yardımcıları içerir. Veritabanına bağımlı değildir; eğitim işçi süreçlerinde
+de doğrudan kullanılabilir.
+
+Desteklenen arka uçlar (`Config.MODEL_BACKEND`):
+    - "gbr": GradientBoostingRegressor (tek iş parçacıklı, varsayılan)
+    - "hist": HistGradientBoostingRegressor (OpenMP ile çok iş parçacıklı)
+    - "xgboost": XGBRegressor (tek modelle çok çıktılı, çok iş parçacıklı)
+Tüm arka uçlar aynı (n, 2) tahmin çıktısını verir ve joblib ile kaydedilir.
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor
+from sklearn.model_selection import train_test_split
+from sklearn.multioutput import MultiOutputRegressor
+from sklearn.preprocessing import StandardScaler
+
+from config import Config
+
+BACKENDS: List[str] = ["gbr", "hist", "xgboost"]
+
+
+def model_paths(
+    league_id: Optional[int] = None, model_dir: str = "models"
+) -> Tuple[str, str]:
+    """Lige özgü model ve scaler dosya yollarını döndürür"""
+    if league_id:
+        return (
+            os.path.join(model_dir, f"match_predictor_league_{league_id}.joblib"),
+            os.path.join(model_dir, f"scaler_league_{league_id}.joblib"),
+        )
+    return (
+        os.path.join(model_dir, "match_predictor_global.joblib"),
+        os.path.join(model_dir, "scaler_global.joblib"),
+    )
+
+
+def metadata_path(model_path: str) -> str:
+    """Model dosyasının yanındaki eğitim bilgisi (.meta.json) dosyasının yolu"""
+    return f"{os.path.splitext(model_path)[0]}.meta.json"
+
+
+def load_model_metadata(model_path: str) -> Dict[str, Any]:
+    """Modelin eğitim bilgisini okur; dosya yoksa boş sözlük döndürür"""
+    try:
+        with open(metadata_path(model_path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_model_metadata(model_path: str, metadata: Dict[str, Any]) -> None:
+    """Modelin eğitim bilgisini atomik olarak yazar"""
+    path = metadata_path(model_path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+
+
+def create_match_model(backend: Optional[str] = None, n_jobs: int = -1) -> Any:
+    """Yeni, eğitilmemiş skor modeli oluşturur
+
+    Args:
+        backend: "gbr", "hist" veya "xgboost" (varsayılan: Config.MODEL_BACKEND)
+        n_jobs: XGBoost iş parçacığı sayısı (-1: tüm çekirdekler). "hist"
+            arka ucu OpenMP kullanır ve threadpoolctl ile sınırlandırılır.
+    """
+    backend = backend or Config.MODEL_BACKEND
+    if backend == "gbr":
+        base_model = GradientBoostingRegressor(
+            n_estimators=200,
+            learning_rate=0.05,
+            max_depth=5,
+            random_state=42,
+            min_samples_split=8,
+            min_samples_leaf=4,
+            subsample=0.8,
+        )
+        return MultiOutputRegressor(base_model)
+    if backend == "hist":
+        base_model = HistGradientBoostingRegressor(
+            max_iter=200,
+            learning_rate=0.05,
+            max_depth=5,
+            min_samples_leaf=4,
+            early_stopping=False,
+            random_state=42,
+        )
+        return MultiOutputRegressor(base_model)
+    if backend == "xgboost":
+        import xgboost as xgb
+
+        return xgb.XGBRegressor(
+            n_estimators=200,
+            learning_rate=0.05,
+            max_depth=5,
+            min_child_weight=4,
+            subsample=0.8,
+            tree_method="hist",
+            n_jobs=n_jobs,
+            random_state=42,
+        )
+    raise ValueError(f"Bilinmeyen model arka ucu: {backend} (seçenekler: {BACKENDS})")
+
+
+def model_backend(model: Any) -> str:
+    """Eğitilmiş modelin arka ucunu ("gbr", "hist" veya "xgboost") döndürür
+
+    Raises:
+        ValueError: Model desteklenen arka uçlardan biriyle oluşturulmamışsa
+    """
+    if isinstance(model, MultiOutputRegressor):
+        estimator = getattr(model, "estimators_", [model.estimator])[0]
+        if isinstance(estimator, HistGradientBoostingRegressor):
+            return "hist"
+        if isinstance(estimator, GradientBoostingRegressor):
+            return "gbr"
+        name = type(estimator).__name__
+    else:
+        if type(model).__module__.startswith("xgboost") and hasattr(
+            model, "get_booster"
+        ):
+            return "xgboost"
+        name = type(model).__name__
+    raise ValueError(
+        f"Desteklenmeyen model türü: {name} (GradientBoostingRegressor, "
+        f"HistGradientBoostingRegressor veya XGBRegressor bekleniyor)"
+    )
+
+
+def fit_match_model(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    test_size: float = 0.2,
+    random_state: int = 42,
+) -> Tuple[Any, StandardScaler, Dict[str, float]]:
+    """Modeli ölçeklenmiş veriyle eğitir ve test metriklerini hesaplar
+
+    Args:
+        model: Eğitilecek model
+        X: Özellik matrisi
+        y: Hedefler ([ev golü, deplasman golü])
+        test_size: Test verisi oranı
+        random_state: Rastgelelik tohumu
+
+    Returns:
+        (model, scaler, metrikler)
+    """
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # Eğitim ve test verilerini ayır
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=random_state
+    )
+
+    # Veriyi ölçeklendir
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+
+    # Modeli eğit
+    model.fit(X_train_scaled, y_train)
+
+    # Modeli değerlendir
+    y_pred = model.predict(X_test_scaled)
+    metrics = {
+        "train_score": float(model.score(X_train_scaled, y_train)),
+        "test_score": float(model.score(X_test_scaled, y_test)),
+        "mae": float(np.mean(np.abs(y_test - y_pred))),
+        "mse": float(np.mean((y_test - y_pred) ** 2)),
+        "matches_used": int(len(X)),
+    }
+    return model, scaler, metrics
+
+
+def warm_start_match_model(
+    model: Any,
+    X: np.ndarray,
+    y: np.ndarray,
+    n_new_estimators: int = 20,
+) -> Any:
+    """Eğitilmiş modele yeni maçlar için ek ağaçlar ekler (warm_start)
+
+    MultiOutputRegressor.fit alt modelleri yeniden klonladığı için her çıktının
+    eğitilmiş alt modeli ayrı ayrı devam ettirilir. XGBoost modellerinde
+    mevcut booster'a yeni turlar eklenir. X, modelin eğitildiği scaler ile
+    ölçeklenmiş olmalıdır.
+
+    Args:
+        model: Eğitilmiş skor modeli (herhangi bir arka uç)
+        X: Yeni maçların ölçeklenmiş özellik matrisi
+        y: Yeni maçların hedefleri ([ev golü, deplasman golü])
+        n_new_estimators: Her çıktı için eklenecek ağaç sayısı
+
+    Raises:
+        ValueError: Model desteklenen arka uçlardan biri değilse
+    """
+    y = np.asarray(y, dtype=float)
+
+    if model_backend(model) == "xgboost":
+        booster = model.get_booster()
+        model.set_params(n_estimators=n_new_estimators)
+        model.fit(X, y, xgb_model=booster)
+        return model
+
+    for output, estimator in enumerate(model.estimators_):
+        if isinstance(estimator, HistGradientBoostingRegressor):
+            estimator.set_params(
+                warm_start=True, max_iter=estimator.max_iter + n_new_estimators
+            )
+        else:
+            estimator.set_params(
+                warm_start=True,
+                n_estimators=estimator.n_estimators + n_new_estimators,
+            )
+        estimator.fit(X, y[:, output])
+    return model
+
+
+def ensemble_size(model: Any) -> int:
+    """Modeldeki (çıktı başına) ağaç/tur sayısını döndürür"""
+    if not isinstance(model, MultiOutputRegressor):
+        return int(model.get_booster().num_boosted_rounds())
+    estimator = model.estimators_[0]
+    if isinstance(estimator, HistGradientBoostingRegressor):
+        return int(estimator.n_iter_)
+    return int(len(estimator.estimators_))
+
+
+def benchmark_backends(
+    X: np.ndarray,
+    y: np.ndarray,
+    backends: Optional[List[str]] = None,
+    predict_rounds: int = 200,
+) -> List[Dict[str, Any]]:
+    """Arka uçları eğitim süresi, tahmin gecikmesi ve doğruluk açısından karşılaştırır
+
+    Args:
+        X: Özellik matrisi
+        y: Hedefler ([ev golü, deplasman golü])
+        backends: Karşılaştırılacak arka uçlar (varsayılan: BACKENDS)
+        predict_rounds: Tek satırlık tahmin gecikmesi için tekrar sayısı
+
+    Returns:
+        List[Dict[str, Any]]: Her arka uç için fit_time, tek satır p50/p99
+        gecikmesi (ms), toplu tahmin süresi ve test metrikleri
+    """
+    results = []
+    for backend in backends or BACKENDS:
+        started = time.perf_counter()
+        model, scaler, metrics = fit_match_model(create_match_model(backend), X, y)
+        fit_time = time.perf_counter() - started
+
+        X_scaled = scaler.transform(np.asarray(X, dtype=float))
+        latencies = []
+        for i in range(predict_rounds):
+            row = X_scaled[i % len(X_scaled)].reshape(1, -1)
+            started = time.perf_counter()
+            model.predict(row)
+            latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        model.predict(X_scaled)
+        batch_time = time.perf_counter() - started
+
+        results.append(
+            {
+                "backend": backend,
+                "fit_time": round(fit_time, 3),
+                "predict_p50_ms": round(float(np.percentile(latencies, 50)) * 1000, 3),
+                "predict_p99_ms": round(float(np.percentile(latencies, 99)) * 1000, 3),
+                "batch_predict_time": round(batch_time, 4),
+                **metrics,
+            }
+        )
+    return results
@@ -0,0 +1,139 @@
+"""
+Maç Sorguları Modülü
+
+Bir takımın son maçlarını getiren sorgular `home_team_id = X OR
+away_team_id = X` koşulu yüzünden takım indekslerini kullanamaz ve tüm
+eşleşen maçları sıralamak zorunda kalır. Buradaki yardımcılar sorguyu ev
+sahibi ve deplasman tarafı olarak ikiye böler (UNION ALL). Her taraf kendi
+(takım, durum, tarih) bileşik indeksini geriye doğru tarayarak yalnızca ilk
+`limit` satırı okur; sonuç bu küçük kümelerin birleştirilmesiyle elde edilir.
+
+Config.USE_TEAM_MATCH_LOG açıksa `recent_team_matches` aynı satırları
+maç başına iki satır tutan team_match_log tablosundan tek bir indeks
+aralığıyla okur.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import literal, select, union_all
+
+from config import Config
+
+
+def team_match_sides(
+    matches: Any,
+    team_id: int,
+    *conditions,
+    limit: Optional[int] = None,
+    home_goals: Any = None,
+    away_goals: Any = None,
+    date_column: Any = None,
+):
+    """Takımın maçlarını takım bakış açısıyla döndüren UNION ALL sorgusu
+
+    Args:
+        matches: Maç sütunlarına nitelik olarak erişilen nesne (ORM Match
+            sınıfı veya `Table.c`)
+        team_id: Takım ID'si
+        *conditions: Her iki tarafa da uygulanacak ek filtreler
+        limit: Takım başına en yeni kaç maç alınacağı
+        home_goals: Ev sahibi gol sütunu (varsayılan: matches.home_goals)
+        away_goals: Deplasman gol sütunu (varsayılan: matches.away_goals)
+        date_column: Tarih sütunu (varsayılan: matches.match_date)
+
+    Returns:
+        Select: match_id, match_date, is_home, opponent_id, goals_for ve
+        goals_against sütunlarını en yeni maç başta olacak şekilde döndürür
+    """
+    home_goals = matches.home_goals if home_goals is None else home_goals
+    away_goals = matches.away_goals if away_goals is None else away_goals
+    date_column = matches.match_date if date_column is None else date_column
+
+    def side(team_column, opponent_column, goals_for, goals_against, is_home):
+        query = (
+            select(
+                matches.id.label("match_id"),
+                date_column.label("match_date"),
+                literal(is_home).label("is_home"),
+                opponent_column.label("opponent_id"),
+                goals_for.label("goals_for"),
+                goals_against.label("goals_against"),
+            )
+            .where(team_column == team_id, *conditions)
+            .order_by(date_column.desc())
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        # ORDER BY/LIMIT'li taraflar UNION ALL içinde alt sorgu olmalıdır
+        return select(query.subquery())
+
+    sides = union_all(
+        side(matches.home_team_id, matches.away_team_id, home_goals, away_goals, True),
+        side(matches.away_team_id, matches.home_team_id, away_goals, home_goals, False),
+    ).subquery()
+
+    query = select(sides).order_by(sides.c.match_date.desc())
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def recent_team_matches(
+    team_id: int,
+    before: Optional[datetime] = None,
+    league_id: Optional[int] = None,
+    limit: Optional[int] = None,
+    use_log: Optional[bool] = None,
+):
+    """Takımın tamamlanmış maçlarını takım bakış açısıyla döndüren sorgu
+
+    Args:
+        team_id: Takım ID'si
+        before: Yalnızca bu tarihten önceki maçlar
+        league_id: Yalnızca bu ligdeki maçlar
+        limit: En yeni kaç maç alınacağı
+        use_log: team_match_log kullanılsın mı (varsayılan:
+            Config.USE_TEAM_MATCH_LOG)
+
+    Returns:
+        Select: `team_match_sides` ile aynı sütunlar, en yeni maç başta
+    """
+    if use_log is None:
+        use_log = Config.USE_TEAM_MATCH_LOG
+
+    if use_log:
+        from app.models import TeamMatchLog as log
+
+        query = (
+            select(
+                log.match_id,
+                log.match_date,
+                log.is_home,
+                log.opponent_id,
+                log.goals_for,
+                log.goals_against,
+            )
+            .where(log.team_id == team_id)
+            .order_by(log.match_date.desc())
+        )
+        if before is not None:
+            query = query.where(log.match_date < before)
+        if league_id is not None:
+            query = query.where(log.league_id == league_id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    from app.models import Match, MatchStatus
+
+    conditions = [
+        Match.status == MatchStatus.FINISHED,
+        Match.home_goals.isnot(None),
+        Match.away_goals.isnot(None),
+    ]
+    if before is not None:
+        conditions.append(Match.match_date < before)
+    if league_id is not None:
+        conditions.append(Match.league_id == league_id)
+    return team_match_sides(Match, team_id, *conditions, limit=limit)
@@ -0,0 +1,113 @@
+"""
+Model Dosyaları Modülü
+
+Model dosyalarını `mmap_mode` ile yüklenebilecek düzende (sıkıştırmasız
+joblib) kaydeder ve okur. Bellek eşlemeli yüklemede nesnenin içindeki NumPy
+dizileri diskteki sayfalara salt okunur olarak bağlanır; aynı dosyayı açan
+tüm gunicorn işçileri bu sayfaları işletim sistemi sayfa önbelleği üzerinden
+paylaşır ve her işçi kendi kopyasını tutmaz.
+
+Not: sklearn'ün Cython `Tree` nesneleri (GradientBoosting*/RandomForest*)
+yüklenirken düğüm dizilerini kendi belleğine kopyalar; bu modellerde
+paylaşılan kısım scaler ve diğer ndarray öznitelikleriyle sınırlıdır.
+HistGradientBoosting ağaçları (`TreePredictor.nodes`) doğrudan eşlenir.
+`load_artifact_with_report` gerçekte ne kadarının eşlendiğini raporlar.
+"""
+
+import logging
+import mmap as _mmap
+import os
+import sys
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from joblib import dump, load
+
+logger = logging.getLogger(__name__)
+
+
+def save_artifact(obj: Any, path: str) -> None:
+    """Nesneyi bellek eşlemeye uygun biçimde (sıkıştırmasız) kaydeder
+
+    Dosya önce geçici bir yola yazılıp atomik olarak yerine taşınır. Böylece
+    eski dosyayı eşlemiş işçiler bozuk sayfa görmez; eski inode, son eşleme
+    kapanana kadar yaşamaya devam eder.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    dump(obj, tmp_path, compress=0)
+    os.replace(tmp_path, path)
+
+
+def load_artifact(path: str, mmap: bool = True) -> Any:
+    """Model dosyasını yükler
+
+    Args:
+        path: Dosya yolu
+        mmap: True ise NumPy dizileri salt okunur bellek eşlemesiyle açılır
+    """
+    return load(path, mmap_mode="r" if mmap else None)
+
+
+def mapped_nbytes(obj: Any, _seen: Optional[set] = None) -> int:
+    """Nesne ağacındaki bellek eşlemeli dizilerin toplam boyutunu döndürür"""
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        base = obj
+        while isinstance(base, np.ndarray) and not isinstance(base, np.memmap):
+            base = base.base
+        return obj.nbytes if isinstance(base, (np.memmap, _mmap.mmap)) else 0
+    if isinstance(obj, dict):
+        return sum(mapped_nbytes(value, seen) for value in obj.values())
+    if isinstance(obj, (list, tuple, set)):
+        return sum(mapped_nbytes(item, seen) for item in obj)
+    if hasattr(obj, "__dict__"):
+        return mapped_nbytes(vars(obj), seen)
+    return 0
+
+
+def _resident_bytes() -> Optional[int]:
+    """Sürecin yerleşik (RSS) bellek miktarı; Linux dışında None"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def load_artifact_with_report(path: str, mmap: bool = True) -> Tuple[Any, Dict]:
+    """Model dosyasını yükler ve bellek kullanım raporu döndürür
+
+    Returns:
+        (nesne, rapor): Rapor şu anahtarları içerir:
+            - file_bytes: Dosya boyutu
+            - mapped_bytes: Paylaşılan (eşlenmiş) sayfalarda kalan dizi baytı;
+              işçi başına tasarruf edilen yerleşik belleğin tahmini
+            - private_bytes: Yükleme sırasında sürecin RSS artışı (Linux)
+    """
+    rss_before = _resident_bytes()
+    obj = load_artifact(path, mmap=mmap)
+    rss_after = _resident_bytes()
+
+    report = {
+        "path": path,
+        "file_bytes": os.path.getsize(path),
+        "mapped_bytes": mapped_nbytes(obj) if mmap else 0,
+        "private_bytes": (
+            rss_after - rss_before
+            if rss_before is not None and rss_after is not None
+            else None
+        ),
+    }
+    logger.info(
+        f"Model dosyası yüklendi: {path} "
+        f"(eşlenen: {report['mapped_bytes']} bayt, dosya: {report['file_bytes']} bayt)"
+    )
+    return obj, report
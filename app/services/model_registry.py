@@ -0,0 +1,223 @@
+"""
+Model Kayıt Defteri Modülü
+
+Lige özgü (model, scaler) çiftlerini süreç genelinde paylaşılan, sınırlı
+boyutlu bir LRU önbellekte tutar. Böylece ligler arasında gidip gelen
+trafikte joblib dosyaları her seferinde diskten yeniden okunmaz. Dosyaların
+değiştirilme zamanı (mtime) kontrol edilir; model yeniden eğitildiğinde
+önbellekteki kopya otomatik olarak yenilenir.
+
+`Config.MODEL_COMPILED_INFERENCE` açıksa her model yüklenirken bir kez
+düz NumPy dizilerine derlenir (bkz. compiled_model) ve kayıtla birlikte
+önbellekte tutulur. `Config.MODEL_COMPILED_PERSIST` açıksa derlenmiş diziler
+modelin yanına kaydedilip bellek eşlemesiyle açılır ve işçiler arasında
+paylaşılır; kapalıysa her işçi kendi özel kopyasını derler.
+
+Diskten yükleme ve derleme genel kilidin dışında, lig bazında bir kilit
+altında yapılır: bir ligin modeli yüklenirken diğer liglerin önbellekteki
+modelleri beklemeden döner, aynı lig için gelen eşzamanlı istekler ise
+modeli bir kez yükler.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from config import Config
+from .compiled_model import compile_model, load_or_compile
+from .model_artifacts import load_artifact_with_report, mapped_nbytes
+
+logger = logging.getLogger(__name__)
+
+
+class ModelEntry(NamedTuple):
+    """Önbellekteki model kaydı"""
+
+    model: Any
+    scaler: Any
+    model_mtime: float
+    scaler_mtime: float
+    mapped_bytes: int = 0
+    compiled: Any = None
+
+
+class ModelRegistry:
+    """Lige göre anahtarlanmış, iş parçacığı güvenli LRU model önbelleği"""
+
+    def __init__(
+        self,
+        max_size: int = None,
+        mmap: bool = None,
+        compiled: bool = None,
+        persist_compiled: bool = None,
+    ):
+        """
+        Args:
+            max_size: Bellekte tutulacak en fazla model sayısı
+                (varsayılan: Config.MODEL_CACHE_SIZE)
+            mmap: Model dizilerini bellek eşlemesiyle yükle
+                (varsayılan: Config.MODEL_MMAP)
+            compiled: Modelleri yüklerken derle
+                (varsayılan: Config.MODEL_COMPILED_INFERENCE)
+            persist_compiled: Derlenmiş dizileri dosyaya kaydedip oradan aç
+                (varsayılan: Config.MODEL_COMPILED_PERSIST)
+        """
+        self.max_size = max_size or Config.MODEL_CACHE_SIZE
+        self.mmap = Config.MODEL_MMAP if mmap is None else mmap
+        self.compiled = (
+            Config.MODEL_COMPILED_INFERENCE if compiled is None else compiled
+        )
+        self.persist_compiled = (
+            Config.MODEL_COMPILED_PERSIST
+            if persist_compiled is None
+            else persist_compiled
+        )
+        self._entries: "OrderedDict[Hashable, ModelEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.evictions = 0
+
+    def get(
+        self, league_id: Optional[int], model_path: str, scaler_path: str
+    ) -> Optional[Tuple[Any, Any]]:
+        """Ligin (model, scaler) çiftini döndürür
+
+        Önbellekte güncel bir kopya varsa diske gidilmez. Dosyalar yoksa None
+        döner.
+
+        Args:
+            league_id: Lig ID'si (global model için None)
+            model_path: Model dosyasının yolu
+            scaler_path: Scaler dosyasının yolu
+        """
+        entry = self.get_entry(league_id, model_path, scaler_path)
+        return None if entry is None else (entry.model, entry.scaler)
+
+    def get_entry(
+        self, league_id: Optional[int], model_path: str, scaler_path: str
+    ) -> Optional[ModelEntry]:
+        """Ligin derlenmiş modeli de içeren önbellek kaydını döndürür
+
+        Argümanlar ve önbellek davranışı `get` ile aynıdır.
+        """
+        key = league_id
+        try:
+            model_mtime = os.path.getmtime(model_path)
+            scaler_mtime = os.path.getmtime(scaler_path)
+        except OSError:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+
+        with self._lock:
+            entry = self._cached(key, model_mtime, scaler_mtime)
+            if entry is not None:
+                return entry
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                # Beklerken başka bir iş parçacığı yüklemiş olabilir
+                entry = self._cached(key, model_mtime, scaler_mtime)
+                if entry is not None:
+                    return entry
+                if key in self._entries:
+                    self.reloads += 1
+                else:
+                    self.misses += 1
+
+            model, model_report = load_artifact_with_report(model_path, self.mmap)
+            scaler, scaler_report = load_artifact_with_report(scaler_path, self.mmap)
+            compiled = self._compile(
+                model, scaler, model_path, (model_mtime, scaler_mtime)
+            )
+            entry = ModelEntry(
+                model,
+                scaler,
+                model_mtime,
+                scaler_mtime,
+                model_report["mapped_bytes"]
+                + scaler_report["mapped_bytes"]
+                + (mapped_nbytes(compiled) if compiled is not None else 0),
+                compiled,
+            )
+
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    evicted, _ = self._entries.popitem(last=False)
+                    self.evictions += 1
+                    logger.info(f"Model önbellekten çıkarıldı: {evicted}")
+
+        logger.info(f"Model önbelleğe yüklendi: {model_path}")
+        return entry
+
+    def _cached(
+        self, key: Hashable, model_mtime: float, scaler_mtime: float
+    ) -> Optional[ModelEntry]:
+        """Güncel önbellek kaydını döndürür (genel kilit altında çağrılır)"""
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or entry.model_mtime != model_mtime
+            or entry.scaler_mtime != scaler_mtime
+        ):
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def _compile(
+        self,
+        model: Any,
+        scaler: Any,
+        model_path: str,
+        source_mtimes: Tuple[float, float],
+    ) -> Any:
+        """Modeli derler; derlenemiyorsa None döndürür (sklearn yolu kullanılır)"""
+        if not self.compiled:
+            return None
+        try:
+            if self.persist_compiled:
+                return load_or_compile(
+                    model, scaler, model_path, source_mtimes, self.mmap
+                )
+            return compile_model(model, scaler)
+        except Exception as e:
+            logger.warning(f"Model derlenemedi, sklearn ile tahmin yapılacak: {e}")
+            return None
+
+    def invalidate(
+        self, league_id: Optional[int] = None, clear_all: bool = False
+    ) -> None:
+        """Bir ligin (veya tüm liglerin) önbellekteki modelini siler"""
+        with self._lock:
+            if clear_all:
+                self._entries.clear()
+            else:
+                self._entries.pop(league_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Önbellek sayaçlarını döndürür"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "evictions": self.evictions,
+                "mapped_bytes": sum(
+                    entry.mapped_bytes for entry in self._entries.values()
+                ),
+            }
+
+
+# Süreç genelinde paylaşılan kayıt defteri
+model_registry = ModelRegistry()
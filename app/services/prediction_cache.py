@@ -0,0 +1,194 @@
+"""
+Tahmin Önbelleği Modülü
+
+Aynı maç için tekrar tekrar yapılan tahminleri (form sorguları, özellik
+hazırlama, model ve Poisson hesapları) süreç içi, TTL'li bir LRU önbellekte
+tutar. Anahtar; takım ID'leri, maç tarihi, lig ve model dosyasının sürümünden
+(mtime) oluşur.
+
+Geçersiz kılma:
+    - Model yeniden eğitildiğinde dosya sürümü değiştiği için eski kayıtlar
+      bir daha okunmaz.
+    - Bir takım için yeni sonuç kaydedildiğinde takımın sürüm sayacı artırılır;
+      o takımı içeren eski anahtarlar geçersiz kalır. Sayaç anahtarın
+      parçası olduğundan, geçersiz kılma sırasında hesaplanmakta olan bir
+      tahmin de eski anahtara yazılır ve okunmaz.
+    - Olay dinleyicileri yalnızca bu süreçteki kayıtları görür. Diğer
+      süreçlerin (diğer gunicorn işçileri, maç aktarım komutu) kaydettiği
+      sonuçlar `sync` ile okunur: en fazla SYNC_INTERVAL saniyede bir,
+      son senkronizasyondan beri güncellenen (updated_at) tamamlanmış
+      maçların takımları geçersiz kılınır (bkz. match_changes; her değişiklik
+      bir kez işlenir). Bir başka süreçte kaydedilen sonuç bu nedenle en geç
+      SYNC_INTERVAL saniye sonra yansır.
+Eski kayıtlar LRU ve TTL ile zamanla temizlenir.
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime
+from typing import Any, Dict, Hashable, Optional, Tuple, Union
+
+from config import Config
+from .match_changes import MatchChangeCursor
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCache:
+    """İş parçacığı güvenli, TTL'li LRU tahmin önbelleği"""
+
+    def __init__(
+        self, max_size: int = None, ttl: float = None, sync_interval: float = None
+    ):
+        """
+        Args:
+            max_size: En fazla kayıt sayısı (varsayılan: Config.PREDICTION_CACHE_SIZE)
+            ttl: Kayıt ömrü, saniye (varsayılan: Config.PREDICTION_CACHE_TTL)
+            sync_interval: Diğer süreçlerin sonuçlarını okuma aralığı, saniye
+                (varsayılan: Config.PREDICTION_CACHE_SYNC_INTERVAL)
+        """
+        self.max_size = max_size or Config.PREDICTION_CACHE_SIZE
+        self.ttl = Config.PREDICTION_CACHE_TTL if ttl is None else ttl
+        self.sync_interval = (
+            Config.PREDICTION_CACHE_SYNC_INTERVAL
+            if sync_interval is None
+            else sync_interval
+        )
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict]]" = OrderedDict()
+        self._team_versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._next_sync = 0.0
+        self._changes = MatchChangeCursor()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        home_team_id: int,
+        away_team_id: int,
+        match_date: Union[datetime, date, None],
+        league_id: Optional[int],
+        model_version: Any,
+    ) -> Tuple:
+        """Tahmin için önbellek anahtarı oluşturur (takım sürümleri dahil)"""
+        if isinstance(match_date, datetime):
+            match_date = match_date.date()
+        with self._lock:
+            home_version = self._team_versions.get(home_team_id, 0)
+            away_version = self._team_versions.get(away_team_id, 0)
+        return (
+            home_team_id,
+            away_team_id,
+            match_date,
+            league_id,
+            model_version,
+            home_version,
+            away_version,
+        )
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """Kayıtlı tahminin bir kopyasını döndürür; yoksa veya süresi dolmuşsa None"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None or item[0] < time.monotonic():
+                if item is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = item[1]
+        # Çağıranlar sonucu değiştirebilir; önbellekteki kopya korunur
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Dict) -> None:
+        """Tahmini önbelleğe yazar"""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate_teams(self, *team_ids: int) -> None:
+        """Takımları içeren tüm tahminleri geçersiz kılar"""
+        with self._lock:
+            for team_id in team_ids:
+                if team_id is not None:
+                    self._team_versions[team_id] = (
+                        self._team_versions.get(team_id, 0) + 1
+                    )
+
+    def sync(self, session) -> int:
+        """Diğer süreçlerde kaydedilen sonuçların takımlarını geçersiz kılar
+
+        En fazla `sync_interval` saniyede bir veritabanına gidilir. İlk
+        çağrıda yalnızca imleç mevcut son değişikliğe konumlanır.
+
+        Returns:
+            int: Geçersiz kılınan takım sayısı
+        """
+        from app.models import Match
+
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_sync:
+                return 0
+            self._next_sync = now + self.sync_interval
+
+        if self._changes.position is None:
+            self._changes.start(session)
+            return 0
+
+        rows = self._changes.fetch(
+            session,
+            Match.id,
+            Match.home_team_id,
+            Match.away_team_id,
+            Match.updated_at,
+        )
+        team_ids = {team_id for row in rows for team_id in row[1:3]}
+        self.invalidate_teams(*team_ids)
+        return len(team_ids)
+
+    def clear(self) -> None:
+        """Tüm önbelleği temizler"""
+        with self._lock:
+            self._entries.clear()
+            self._team_versions.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Önbellek sayaçlarını döndürür"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Süreç genelinde paylaşılan tahmin önbelleği
+prediction_cache = PredictionCache()
+
+
+def _on_match_saved(mapper, connection, target) -> None:
+    """Sonucu kaydedilen maçın takımlarına ait tahminleri geçersiz kılar"""
+    from app.models import MatchStatus
+
+    if target.status == MatchStatus.FINISHED:
+        prediction_cache.invalidate_teams(target.home_team_id, target.away_team_id)
+
+
+def register_match_listeners() -> None:
+    """Match kayıt/güncelleme olaylarına önbellek geçersiz kılmayı bağlar"""
+    from sqlalchemy import event
+
+    from app.models import Match
+
+    for event_name in ("after_insert", "after_update"):
+        if not event.contains(Match, event_name, _on_match_saved):
+            event.listen(Match, event_name, _on_match_saved)
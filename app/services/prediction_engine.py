@@ -9,13 +9,14 @@ Temel olarak maç sonucu, gol sayısı ve her iki takımın da gol atıp atmayac
 import os
 import json
 import logging
+import threading
+from collections.abc import MutableMapping
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Union, Any, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Union, Any, Tuple
 
 import numpy as np
 import pandas as pd
-import joblib
 from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
@@ -26,10 +27,67 @@ from sklearn.metrics import (
 )
 import xgboost as xgb
 
+from .data_processor import DataProcessor
+from .model_artifacts import load_artifact_with_report, save_artifact
+
 # Loglama yapılandırması
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+class LazyModels(MutableMapping):
+    """
+    İlk erişimde yüklenen model sözlüğü.
+    
+    Anahtarlar baştan bellidir; her model yalnızca `models[tür]` ile ilk kez
+    istendiğinde diskten okunur. Diskte olmayan modeller None döner.
+    """
+    
+    _NOT_LOADED = object()
+    
+    def __init__(self, loader: Callable[[str], Any], model_types: List[str]):
+        """
+        Args:
+            loader (Callable[[str], Any]): Model türünü alıp modeli (veya None) döndüren fonksiyon
+            model_types (List[str]): Desteklenen model türleri
+        """
+        self._loader = loader
+        self._models = {model_type: self._NOT_LOADED for model_type in model_types}
+        self._lock = threading.Lock()
+    
+    def __getitem__(self, model_type: str) -> Any:
+        model = self._models[model_type]
+        if model is self._NOT_LOADED:
+            with self._lock:
+                model = self._models[model_type]
+                if model is self._NOT_LOADED:
+                    model = self._loader(model_type)
+                    self._models[model_type] = model
+        return model
+    
+    def __setitem__(self, model_type: str, model: Any) -> None:
+        self._models[model_type] = model
+    
+    def __delitem__(self, model_type: str) -> None:
+        self._models[model_type] = self._NOT_LOADED
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._models)
+    
+    def __len__(self) -> int:
+        return len(self._models)
+    
+    def is_loaded(self, model_type: str) -> bool:
+        """Model bellekte mi (yükleme denendi mi)?"""
+        return self._models.get(model_type, self._NOT_LOADED) is not self._NOT_LOADED
+    
+    def loaded_items(self) -> List[Tuple[str, Any]]:
+        """Yalnızca yüklenmiş modelleri döndürür (yükleme tetiklemez)."""
+        return [
+            (model_type, model) for model_type, model in self._models.items()
+            if model is not self._NOT_LOADED
+        ]
+
+
 class PredictionEngine:
     """
     Futbol maçları için tahmin motoru sınıfı.
@@ -38,80 +96,175 @@ class PredictionEngine:
     futbol maçları için tahminler yapmayı sağlar.
     """
     
-    def __init__(self, model_dir: str = 'data/models'):
+    # Desteklenen model türleri
+    MODEL_TYPES = [
+        'result',        # Maç sonucu (1-X-2)
+        'over_under',    # Üst/Alt gol tahmini
+        'btts',          # Her iki takım da gol atar mı?
+        'correct_score',  # Kesin skor tahmini
+        'corners',       # Köşe vuruşu tahmini
+        'goals'          # Gol sayısı tahmini
+    ]
+    
+    # Her model için özellik sıralaması
+    FEATURE_ORDERS = {
+        'result': [
+            'home_form', 'home_goals_scored_avg', 'home_goals_conceded_avg',
+            'home_win_rate', 'home_draw_rate', 'home_loss_rate',
+            'away_form', 'away_goals_scored_avg', 'away_goals_conceded_avg',
+            'away_win_rate', 'away_draw_rate', 'away_loss_rate',
+            'form_difference', 'goal_difference', 'attack_strength', 'defense_strength'
+        ],
+        'over_under': [
+            'home_goals_scored_avg', 'home_goals_conceded_avg',
+            'away_goals_scored_avg', 'away_goals_conceded_avg',
+            'goal_difference', 'attack_strength', 'defense_strength',
+            'match_importance', 'temperature', 'humidity'
+        ],
+        'btts': [
+            'home_goals_scored_avg', 'home_goals_conceded_avg', 'home_clean_sheets',
+            'away_goals_scored_avg', 'away_goals_conceded_avg', 'away_clean_sheets',
+            'attack_strength', 'defense_strength', 'btts_last_5_home', 'btts_last_5_away'
+        ]
+    }
+    
+    def __init__(self, model_dir: str = 'data/models', warmup: Optional[List[str]] = None,
+                 mmap: bool = True):
         """Tahmin motorunu başlatır.
         
+        Modeller ilk kullanıldıklarında yüklenir; `warmup` ile verilen
+        modeller ise başlangıçta yüklenir.
+        
         Args:
             model_dir (str, optional): Modellerin kaydedileceği/okunacağı dizin. 
                                     Varsayılan: 'data/models'
+            warmup (List[str], optional): Başlangıçta yüklenecek model türleri
+            mmap (bool, optional): Modelleri bellek eşlemesiyle yükle. Varsayılan: True
         """
         self.model_dir = Path(model_dir)
         self.model_dir.mkdir(parents=True, exist_ok=True)
+        self.mmap = mmap
         
-        # Modelleri saklamak için sözlük
-        self.models = {
-            'result': None,        # Maç sonucu (1-X-2)
-            'over_under': None,    # Üst/Alt gol tahmini
-            'btts': None,          # Her iki takım da gol atar mı?
-            'correct_score': None,  # Kesin skor tahmini
-            'corners': None,       # Köşe vuruşu tahmini
-            'goals': None          # Gol sayısı tahmini
-        }
+        # Model yükleme raporları (bellek kullanımı)
+        self.model_reports = {}
+        
+        # Modelleri saklamak için sözlük (ilk erişimde yüklenir)
+        self.models = LazyModels(self._load_model, self.MODEL_TYPES)
         
         # Model metriklerini saklamak için sözlük
         self.model_metrics = {}
         
         # Her model için özellik sıralaması
         self.feature_orders = {
-            'result': [
-                'home_form', 'home_goals_scored_avg', 'home_goals_conceded_avg',
-                'home_win_rate', 'home_draw_rate', 'home_loss_rate',
-                'away_form', 'away_goals_scored_avg', 'away_goals_conceded_avg',
-                'away_win_rate', 'away_draw_rate', 'away_loss_rate',
-                'form_difference', 'goal_difference', 'attack_strength', 'defense_strength'
-            ],
-            'over_under': [
-                'home_goals_scored_avg', 'home_goals_conceded_avg',
-                'away_goals_scored_avg', 'away_goals_conceded_avg',
-                'goal_difference', 'attack_strength', 'defense_strength',
-                'match_importance', 'temperature', 'humidity'
-            ],
-            'btts': [
-                'home_goals_scored_avg', 'home_goals_conceded_avg', 'home_clean_sheets',
-                'away_goals_scored_avg', 'away_goals_conceded_avg', 'away_clean_sheets',
-                'attack_strength', 'defense_strength', 'btts_last_5_home', 'btts_last_5_away'
-            ]
+            model_type: list(order) for model_type, order in self.FEATURE_ORDERS.items()
         }
         
         # Kategorik özellikler için etiket kodlayıcılar
         self.label_encoders = {}
         
-        # Kayıtlı modelleri ve metrikleri yükle
-        self.load_models()
+        # Metrikleri yükle, istenen modelleri önceden ısıt
         self.load_metrics()
+        if warmup:
+            self.load_models(warmup)
     
-    def load_models(self) -> None:
-        """Diskten tüm kayıtlı modelleri yükler."""
-        for model_type in self.models.keys():
-            model_path = self.model_dir / f"{model_type}_model.joblib"
-            if model_path.exists():
-                try:
-                    self.models[model_type] = joblib.load(model_path)
-                    logger.info(f"{model_type} modeli başarıyla yüklendi: {model_path}")
-                except Exception as e:
-                    logger.error(f"{model_type} modeli yüklenirken hata oluştu: {e}")
+    def _load_model(self, model_type: str) -> Any:
+        """Tek bir modeli diskten yükler; dosya yoksa None döndürür."""
+        model_path = self.model_dir / f"{model_type}_model.joblib"
+        if not model_path.exists():
+            return None
+        try:
+            model, self.model_reports[model_type] = load_artifact_with_report(
+                str(model_path), mmap=self.mmap
+            )
+            logger.info(f"{model_type} modeli başarıyla yüklendi: {model_path}")
+            return model
+        except Exception as e:
+            logger.error(f"{model_type} modeli yüklenirken hata oluştu: {e}")
+            return None
+    
+    def load_models(self, model_types: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Verilen (veya tüm) modelleri diskten hemen yükler.
+        
+        Args:
+            model_types (List[str], optional): Yüklenecek model türleri.
+                Varsayılan: tüm model türleri
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Model türüne göre bellek raporları
+        """
+        for model_type in model_types or self.models.keys():
+            self.models[model_type]
+        return {
+            model_type: report for model_type, report in self.model_reports.items()
+            if model_types is None or model_type in model_types
+        }
     
     def save_models(self) -> None:
         """Tüm modelleri diske kaydeder."""
-        for model_type, model in self.models.items():
+        for model_type, model in self.models.loaded_items():
             if model is not None:
                 try:
                     model_path = self.model_dir / f"{model_type}_model.joblib"
-                    joblib.dump(model, model_path)
+                    save_artifact(model, str(model_path))
                     logger.info(f"{model_type} modeli başarıyla kaydedildi: {model_path}")
                 except Exception as e:
                     logger.error(f"{model_type} modeli kaydedilirken hata oluştu: {e}")
     
+    def build_feature_matrix(self, model_type: str,
+                             home_stats: Union[pd.DataFrame, Dict[str, Any]],
+                             away_stats: Union[pd.DataFrame, Dict[str, Any]],
+                             extra: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """Birden fazla maç için modelin özellik matrisini tek seferde oluşturur.
+        
+        Args:
+            model_type (str): 'result', 'over_under' veya 'btts'
+            home_stats (Union[pd.DataFrame, Dict[str, Any]]): Ev sahibi takım istatistik sütunları
+            away_stats (Union[pd.DataFrame, Dict[str, Any]]): Deplasman takımı istatistik sütunları
+            extra (Dict[str, Any], optional): Türetilemeyen özelliklerin sütunları
+        
+        Returns:
+            np.ndarray: feature_orders[model_type] sırasında (n, özellik) float32 matris
+        """
+        return DataProcessor.build_feature_matrix(
+            home_stats, away_stats, self.feature_orders[model_type], extra
+        )
+    
+    def update_model(self, model_type: str, X_new: Union[np.ndarray, pd.DataFrame],
+                     y_new: Union[np.ndarray, pd.Series], n_rounds: int = 20) -> Any:
+        """Eğitilmiş modeli yeni verilerle sıfırdan eğitmeden günceller.
+        
+        XGBoost modellerinde mevcut booster'a `n_rounds` yeni tur eklenir
+        (`xgb_model` ile devam). sklearn GradientBoosting modellerinde
+        `warm_start` ile ek ağaçlar eğitilir. Diğer modeller desteklenmez.
+        
+        Args:
+            model_type (str): Güncellenecek model türü
+            X_new (Union[np.ndarray, pd.DataFrame]): Yeni maçların özellikleri
+            y_new (Union[np.ndarray, pd.Series]): Yeni maçların hedefleri
+            n_rounds (int, optional): Eklenecek tur/ağaç sayısı. Varsayılan: 20
+        
+        Returns:
+            Any: Güncellenmiş model
+        """
+        model = self.models[model_type]
+        if model is None:
+            raise ValueError(f"{model_type} modeli eğitilmemiş, güncellenemez")
+        
+        if isinstance(model, xgb.XGBModel):
+            # Yeni turlar mevcut booster'ın üzerine eklenir
+            booster = model.get_booster()
+            model.set_params(n_estimators=n_rounds)
+            model.fit(X_new, y_new, xgb_model=booster)
+        elif isinstance(model, GradientBoostingClassifier):
+            model.set_params(warm_start=True, n_estimators=model.n_estimators + n_rounds)
+            model.fit(X_new, y_new)
+        else:
+            raise ValueError(f"{type(model).__name__} artımlı eğitimi desteklemiyor")
+        
+        self.models[model_type] = model
+        logger.info(f"{model_type} modeli {len(X_new)} yeni örnekle güncellendi")
+        return model
+    
     def load_metrics(self) -> None:
         """Model metriklerini diskten yükler."""
         metrics_path = self.model_dir / "model_metrics.json"
@@ -0,0 +1,81 @@
+"""
+Skor Olasılıkları Modülü
+
+Beklenen gol değerlerinden (Poisson) maç sonucu, alt/üst ve 5+ gol
+olasılıklarını hesaplar. Hesaplamalar NumPy ile vektörize edilmiştir; tek
+bir çağrıda N maçın tamamı için skor matrisi oluşturulur.
+"""
+
+from typing import Dict, Union
+
+import numpy as np
+from scipy.stats import poisson
+
+ArrayLike = Union[float, np.ndarray, list]
+
+# Skor matrisinde hesaba katılan maksimum gol sayısı (0..MAX_GOALS-1)
+MAX_GOALS = 10
+
+
+def calculate_score_probabilities(
+    home_expected: ArrayLike,
+    away_expected: ArrayLike,
+    max_goals: int = MAX_GOALS,
+    over_under_line: float = 2.5,
+    high_scoring_goals: int = 5,
+) -> Dict[str, np.ndarray]:
+    """N maç için skor olasılıklarını tek geçişte hesaplar.
+
+    Her maç için ev sahibi ve deplasman gol dağılımlarının dış çarpımı
+    (max_goals x max_goals skor matrisi) alınır; 1-X-2 olasılıkları bu
+    matristen, alt/üst ve 5+ gol olasılıkları ise toplam golün Poisson
+    dağılımından kapalı formda hesaplanır.
+
+    Args:
+        home_expected: Ev sahibi beklenen gol(ler)i, skaler veya (N,) dizi
+        away_expected: Deplasman beklenen gol(ler)i, skaler veya (N,) dizi
+        max_goals: Skor matrisinin boyutu
+        over_under_line: Alt/üst çizgisi (varsayılan 2.5)
+        high_scoring_goals: Yüksek skor eşiği (varsayılan 5+ gol)
+
+    Returns:
+        Dict[str, np.ndarray]: (N,) boyutlu diziler:
+            - home_win, draw, away_win: Normalize edilmiş maç sonucu olasılıkları
+            - over, under: Alt/üst çizgisi olasılıkları
+            - high_scoring: high_scoring_goals ve üzeri gol olasılığı
+    """
+    home = np.clip(np.atleast_1d(np.asarray(home_expected, dtype=float)), 0, None)
+    away = np.clip(np.atleast_1d(np.asarray(away_expected, dtype=float)), 0, None)
+    home, away = np.broadcast_arrays(home, away)
+
+    goals = np.arange(max_goals)
+    home_pmf = poisson.pmf(goals[np.newaxis, :], home[:, np.newaxis])
+    away_pmf = poisson.pmf(goals[np.newaxis, :], away[:, np.newaxis])
+
+    # (N, max_goals, max_goals) skor matrisi: [n, i, j] = P(ev=i) * P(dep=j)
+    score_matrix = home_pmf[:, :, np.newaxis] * away_pmf[:, np.newaxis, :]
+
+    home_win = np.tril(score_matrix, k=-1).sum(axis=(1, 2))
+    away_win = np.triu(score_matrix, k=1).sum(axis=(1, 2))
+    draw = np.trace(score_matrix, axis1=1, axis2=2)
+
+    # Olasılıkları normalize et (kesilen kuyruk kütlesini dağıt)
+    total = home_win + draw + away_win
+    safe_total = np.where(total > 0, total, 1.0)
+    home_win = np.where(total > 0, home_win / safe_total, 0.4)
+    draw = np.where(total > 0, draw / safe_total, 0.3)
+    away_win = np.where(total > 0, away_win / safe_total, 0.3)
+
+    # İki bağımsız Poisson'un toplamı da Poisson'dur: λ = λ_ev + λ_dep
+    total_expected = home + away
+    under = poisson.cdf(int(np.floor(over_under_line)), total_expected)
+    high_scoring = poisson.sf(high_scoring_goals - 1, total_expected)
+
+    return {
+        "home_win": home_win,
+        "draw": draw,
+        "away_win": away_win,
+        "over": np.clip(1 - under, 0, 1),
+        "under": np.clip(under, 0, 1),
+        "high_scoring": np.clip(high_scoring, 0, 1),
+    }
@@ -0,0 +1,363 @@
+"""
+Takım Form İndeksi Modülü
+
+Tamamlanmış maçları bir kez belleğe yükleyip her takım için tarihe göre
+sıralı NumPy dizileri (tarih, atılan gol, yenen gol, lig) tutar. Herhangi bir
+tarihten önceki son N maçlık form, veritabanına gitmeden `searchsorted` ile
+bulunur. Yeni sonuçlar geldiğinde indeks artımlı olarak güncellenir:
+    - Bu süreçte kaydedilen sonuçlar, işlem commit edildikten sonra olay
+      dinleyicisiyle eklenir (geri alınan sonuçlar indekse girmez).
+    - Diğer süreçlerin kaydettiği sonuçlar `sync` ile, tahmin önbelleğiyle
+      aynı aralıkta (PREDICTION_CACHE_SYNC_INTERVAL) okunur.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Set, Union
+
+import numpy as np
+
+from config import Config
+from .match_changes import MatchChangeCursor, defer_until_commit
+
+logger = logging.getLogger(__name__)
+
+
+class TeamMatchArrays(NamedTuple):
+    """Bir takımın tarihe göre sıralı maç dizileri"""
+
+    dates: np.ndarray  # datetime64[us]
+    goals_for: np.ndarray
+    goals_against: np.ndarray
+    league_ids: np.ndarray
+    match_ids: np.ndarray
+
+
+def empty_form() -> Dict[str, Union[int, float, List[str]]]:
+    """Maçı olmayan takım için boş form sözlüğü"""
+    return {
+        "wins": 0,
+        "draws": 0,
+        "losses": 0,
+        "goals_for": 0,
+        "goals_against": 0,
+        "form": [],
+        "points": 0,
+        "avg_goals_for": 0,
+        "avg_goals_against": 0,
+        "clean_sheets": 0,
+        "failed_to_score": 0,
+        "clean_sheet_percent": 0,
+        "failed_to_score_percent": 0,
+    }
+
+
+def form_from_arrays(
+    goals_for: np.ndarray, goals_against: np.ndarray
+) -> Dict[str, Union[int, float, List[str]]]:
+    """Son maçların gol dizilerinden form istatistiklerini hesaplar
+
+    Diziler en yeni maç başta olacak şekilde verilmelidir.
+    """
+    total_matches = len(goals_for)
+    if total_matches == 0:
+        return empty_form()
+
+    wins_mask = goals_for > goals_against
+    draws_mask = goals_for == goals_against
+    wins = int(wins_mask.sum())
+    draws = int(draws_mask.sum())
+    losses = total_matches - wins - draws
+    total_for = int(goals_for.sum())
+    total_against = int(goals_against.sum())
+    clean_sheets = int((goals_against == 0).sum())
+    failed_to_score = int((goals_for == 0).sum())
+
+    return {
+        "wins": wins,
+        "draws": draws,
+        "losses": losses,
+        "goals_for": total_for,
+        "goals_against": total_against,
+        "form": np.where(wins_mask, "W", np.where(draws_mask, "D", "L")).tolist(),
+        "points": wins * 3 + draws,
+        "avg_goals_for": round(total_for / total_matches, 2),
+        "avg_goals_against": round(total_against / total_matches, 2),
+        "clean_sheets": clean_sheets,
+        "clean_sheet_percent": round((clean_sheets / total_matches) * 100, 1),
+        "failed_to_score": failed_to_score,
+        "failed_to_score_percent": round((failed_to_score / total_matches) * 100, 1),
+    }
+
+
+class TeamFormIndex:
+    """Takım bazlı, tarihe göre sıralı bellek içi form indeksi"""
+
+    def __init__(self, sync_interval: float = None):
+        """
+        Args:
+            sync_interval: Diğer süreçlerin sonuçlarını okuma aralığı, saniye
+                (varsayılan: Config.PREDICTION_CACHE_SYNC_INTERVAL)
+        """
+        self.sync_interval = (
+            Config.PREDICTION_CACHE_SYNC_INTERVAL
+            if sync_interval is None
+            else sync_interval
+        )
+        self._teams: Dict[int, TeamMatchArrays] = {}
+        self._lock = threading.Lock()
+        self._changes = MatchChangeCursor()
+        self._next_sync = 0.0
+        self.loaded = False
+
+    # ------------------------------------------------------------------
+    # Yükleme / güncelleme
+    # ------------------------------------------------------------------
+    def load(self, session) -> int:
+        """Tüm tamamlanmış maçları veritabanından yükler
+
+        Args:
+            session: SQLAlchemy veritabanı oturumu
+
+        Returns:
+            int: Yüklenen maç sayısı
+        """
+        self._changes.reset()
+        rows = self._query_finished_matches(session)
+        with self._lock:
+            self._teams = {}
+            count = self._merge_rows(rows)
+            self.loaded = True
+        logger.info(
+            f"Takım form indeksi yüklendi: {count} maç, {len(self._teams)} takım"
+        )
+        return count
+
+    def refresh(self, session) -> int:
+        """Son yüklemeden sonra eklenen/güncellenen maçları indekse ekler
+
+        Returns:
+            int: İndekse eklenen veya güncellenen maç sayısı
+        """
+        if not self.loaded:
+            return self.load(session)
+        return len(self._refresh(session))
+
+    def sync(self, session) -> Set[int]:
+        """İndeksi en fazla `sync_interval` saniyede bir yeniler
+
+        İndeks yüklenmemişse yüklenir.
+
+        Returns:
+            Set[int]: Formu değişen takımların ID'leri (tahminleri geçersiz
+            kılınmalıdır)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self.loaded and now < self._next_sync:
+                return set()
+            self._next_sync = now + self.sync_interval
+
+        if not self.loaded:
+            self.load(session)
+            return set()
+        return self._refresh(session)
+
+    def _refresh(self, session) -> Set[int]:
+        rows = self._query_finished_matches(session)
+        with self._lock:
+            count = self._merge_rows(rows)
+        if count:
+            logger.info(f"Takım form indeksi güncellendi: {count} maç")
+        return {team_id for row in rows for team_id in row[1:3]}
+
+    def ensure_loaded(self, session) -> None:
+        """İndeks henüz yüklenmediyse yükler"""
+        if not self.loaded:
+            self.load(session)
+
+    def add_match(self, match) -> None:
+        """Kaydedilen tek bir maç sonucunu indekse ekler"""
+        if match.home_goals is None or match.away_goals is None:
+            return
+        row = (
+            match.id,
+            match.home_team_id,
+            match.away_team_id,
+            match.league_id,
+            match.match_date,
+            match.home_goals,
+            match.away_goals,
+        )
+        with self._lock:
+            self._merge_rows([row])
+
+    def _query_finished_matches(self, session):
+        """İmleçten bu yana değişen (imleç başta ise tüm) tamamlanmış maçlar"""
+        from app.models import Match
+
+        return self._changes.fetch(
+            session,
+            Match.id,
+            Match.home_team_id,
+            Match.away_team_id,
+            Match.league_id,
+            Match.match_date,
+            Match.home_goals,
+            Match.away_goals,
+            Match.updated_at,
+        )
+
+    def _merge_rows(self, rows: Iterable) -> int:
+        """Maç satırlarını takım dizilerine birleştirir (kilit altında çağrılır)"""
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        (
+            match_ids,
+            home_ids,
+            away_ids,
+            league_ids,
+            dates,
+            home_goals,
+            away_goals,
+            *_,
+        ) = zip(*rows)
+        match_ids = np.asarray(match_ids, dtype=np.int64)
+        league_ids = np.asarray(
+            [-1 if league is None else league for league in league_ids], dtype=np.int64
+        )
+        dates = np.asarray(dates, dtype="datetime64[us]")
+        home_goals = np.asarray(home_goals, dtype=np.int16)
+        away_goals = np.asarray(away_goals, dtype=np.int16)
+
+        # Her maçı iki satıra aç: ev sahibi ve deplasman bakış açısı
+        team_ids = np.concatenate([np.asarray(home_ids), np.asarray(away_ids)])
+        side_dates = np.concatenate([dates, dates])
+        side_for = np.concatenate([home_goals, away_goals])
+        side_against = np.concatenate([away_goals, home_goals])
+        side_leagues = np.concatenate([league_ids, league_ids])
+        side_matches = np.concatenate([match_ids, match_ids])
+
+        order = np.lexsort((side_dates, team_ids))
+        team_ids = team_ids[order]
+        unique_teams, starts = np.unique(team_ids, return_index=True)
+        ends = np.append(starts[1:], len(team_ids))
+
+        for team_id, start, end in zip(unique_teams, starts, ends):
+            sel = order[start:end]
+            new = TeamMatchArrays(
+                side_dates[sel],
+                side_for[sel],
+                side_against[sel],
+                side_leagues[sel],
+                side_matches[sel],
+            )
+            existing = self._teams.get(int(team_id))
+            if existing is not None:
+                # Güncellenen maçların eski kayıtlarını çıkar
+                keep = ~np.isin(existing.match_ids, new.match_ids)
+                merged = [
+                    np.concatenate([old[keep], fresh])
+                    for old, fresh in zip(existing, new)
+                ]
+                merged_order = np.argsort(merged[0], kind="stable")
+                new = TeamMatchArrays(*(arr[merged_order] for arr in merged))
+            self._teams[int(team_id)] = new
+
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Sorgular
+    # ------------------------------------------------------------------
+    def get_form(
+        self,
+        team_id: int,
+        match_date: datetime,
+        matches_back: int = 5,
+        league_id: int = None,
+    ) -> Dict[str, Union[int, float, List[str]]]:
+        """Takımın verilen tarihten önceki son maçlarındaki formunu döndürür
+
+        Args:
+            team_id: Takım ID'si
+            match_date: Referans tarihi (bu tarihten önceki maçlar dikkate alınır)
+            matches_back: İncelenecek maç sayısı
+            league_id: Sadece bu ligdeki maçları dikkate al (isteğe bağlı)
+
+        Returns:
+            MatchPredictor.get_team_form ile aynı yapıda form sözlüğü
+        """
+        arrays = self._teams.get(team_id)
+        if arrays is None:
+            return empty_form()
+
+        cutoff = np.searchsorted(
+            arrays.dates, np.datetime64(match_date, "us"), side="left"
+        )
+        goals_for = arrays.goals_for[:cutoff]
+        goals_against = arrays.goals_against[:cutoff]
+
+        if league_id is not None:
+            mask = arrays.league_ids[:cutoff] == league_id
+            goals_for = goals_for[mask]
+            goals_against = goals_against[mask]
+
+        start = max(0, len(goals_for) - matches_back)
+        # En yeni maç başta olacak şekilde ters çevir
+        return form_from_arrays(
+            goals_for[start:][::-1].astype(np.int64),
+            goals_against[start:][::-1].astype(np.int64),
+        )
+
+    def team_count(self) -> int:
+        """İndeksteki takım sayısı"""
+        return len(self._teams)
+
+
+# Süreç genelinde paylaşılan indeks
+team_form_index = TeamFormIndex()
+
+
+def _apply_committed(matches: List) -> None:
+    """Commit edilen sonuçları (indeks yüklüyse) form indeksine ekler
+
+    Flush ile commit arasında eski formla hesaplanıp önbelleğe yazılmış
+    tahminler de geçersiz kılınır.
+    """
+    from .prediction_cache import prediction_cache
+
+    if not team_form_index.loaded:
+        return
+    for match in matches:
+        team_form_index.add_match(match)
+        prediction_cache.invalidate_teams(match.home_team_id, match.away_team_id)
+
+
+def queue_match(session, match) -> None:
+    """Tamamlanan maçı commit sonrası form indeksine eklenmek üzere sıraya alır"""
+    from app.models import MatchStatus
+
+    if match.status == MatchStatus.FINISHED:
+        defer_until_commit(session, _apply_committed, match)
+
+
+def _on_match_saved(mapper, connection, target) -> None:
+    """Sonucu kaydedilen maçı işlem commit edildiğinde form indeksine ekler"""
+    from sqlalchemy.orm import object_session
+
+    queue_match(object_session(target), target)
+
+
+def register_team_form_listeners() -> None:
+    """Match kayıt/güncelleme olaylarına form indeksi güncellemesini bağlar"""
+    from sqlalchemy import event
+
+    from app.models import Match
+
+    for event_name in ("after_insert", "after_update"):
+        if not event.contains(Match, event_name, _on_match_saved):
+            event.listen(Match, event_name, _on_match_saved)
@@ -0,0 +1,196 @@
+"""
+Takım Maç Kaydı Modülü
+
+`team_match_log` tablosunu Match'ten türetir: tamamlanmış her maç için biri
+ev sahibi, biri deplasman takımının bakış açısıyla iki satır. Maç kaydedilip
+güncellendikçe (Match olay dinleyicileri) maçın satırları aynı bağlantı
+üzerinden silinip yeniden yazılır; böylece kayıt, maçla aynı işlemde
+tutarlı kalır.
+
+Mevcut veritabanları için `rebuild_team_match_log` tabloyu tek bir
+INSERT ... SELECT ile baştan oluşturur.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+logger = logging.getLogger(__name__)
+
+
+def match_result(goals_for: int, goals_against: int) -> str:
+    """Takım açısından maç sonucu (W, D, L)"""
+    if goals_for > goals_against:
+        return "W"
+    if goals_for == goals_against:
+        return "D"
+    return "L"
+
+
+def log_rows(match: Any) -> List[Dict[str, Any]]:
+    """Tamamlanmış maçın iki takım satırını döndürür; aksi halde boş liste"""
+    from app.models import MatchStatus
+
+    if (
+        match.status != MatchStatus.FINISHED
+        or match.home_goals is None
+        or match.away_goals is None
+    ):
+        return []
+
+    rows = []
+    for team_id, opponent_id, goals_for, goals_against, is_home in (
+        (
+            match.home_team_id,
+            match.away_team_id,
+            match.home_goals,
+            match.away_goals,
+            True,
+        ),
+        (
+            match.away_team_id,
+            match.home_team_id,
+            match.away_goals,
+            match.home_goals,
+            False,
+        ),
+    ):
+        rows.append(
+            {
+                "match_id": match.id,
+                "team_id": team_id,
+                "opponent_id": opponent_id,
+                "league_id": match.league_id,
+                "match_date": match.match_date,
+                "is_home": is_home,
+                "goals_for": goals_for,
+                "goals_against": goals_against,
+                "result": match_result(goals_for, goals_against),
+            }
+        )
+    return rows
+
+
+def write_match_rows(connection, matches: Iterable[Any]) -> None:
+    """Maçların kayıt satırlarını maçların güncel haliyle yeniden yazar"""
+    from app.models import TeamMatchLog
+
+    matches = list(matches)
+    if not matches:
+        return
+    table = TeamMatchLog.__table__
+    connection.execute(
+        table.delete().where(table.c.match_id.in_([match.id for match in matches]))
+    )
+    rows = [row for match in matches for row in log_rows(match)]
+    if rows:
+        connection.execute(table.insert(), rows)
+
+
+def _on_match_saved(mapper, connection, target) -> None:
+    """Maçın kayıt satırlarını maçın güncel haliyle yeniden yazar"""
+    write_match_rows(connection, [target])
+
+
+def _on_match_deleted(mapper, connection, target) -> None:
+    """Silinen maçın kayıt satırlarını kaldırır"""
+    from app.models import TeamMatchLog
+
+    table = TeamMatchLog.__table__
+    connection.execute(table.delete().where(table.c.match_id == target.id))
+
+
+def register_match_log_listeners() -> None:
+    """Match kayıt/güncelleme/silme olaylarına takım maç kaydını bağlar"""
+    from sqlalchemy import event
+
+    from app.models import Match
+
+    for event_name, listener in (
+        ("after_insert", _on_match_saved),
+        ("after_update", _on_match_saved),
+        ("before_delete", _on_match_deleted),
+    ):
+        if not event.contains(Match, event_name, listener):
+            event.listen(Match, event_name, listener)
+
+
+def rebuild_team_match_log(session) -> int:
+    """Takım maç kaydını tamamlanmış maçlardan yeniden oluşturur
+
+    Args:
+        session: SQLAlchemy veritabanı oturumu
+
+    Returns:
+        int: Yazılan satır sayısı
+    """
+    from sqlalchemy import case, func, literal, select, union_all
+
+    from app.models import Match, MatchStatus, TeamMatchLog
+
+    now = datetime.utcnow()
+
+    def side(team_column, opponent_column, goals_for, goals_against, is_home):
+        return select(
+            Match.id,
+            team_column,
+            opponent_column,
+            Match.league_id,
+            Match.match_date,
+            literal(is_home),
+            goals_for,
+            goals_against,
+            case(
+                (goals_for > goals_against, "W"),
+                (goals_for == goals_against, "D"),
+                else_="L",
+            ),
+            literal(now),
+            literal(now),
+            literal(True),
+        ).where(
+            Match.status == MatchStatus.FINISHED,
+            Match.home_goals.isnot(None),
+            Match.away_goals.isnot(None),
+        )
+
+    table = TeamMatchLog.__table__
+    session.execute(table.delete())
+    session.execute(
+        table.insert().from_select(
+            [
+                "match_id",
+                "team_id",
+                "opponent_id",
+                "league_id",
+                "match_date",
+                "is_home",
+                "goals_for",
+                "goals_against",
+                "result",
+                "created_at",
+                "updated_at",
+                "is_active",
+            ],
+            union_all(
+                side(
+                    Match.home_team_id,
+                    Match.away_team_id,
+                    Match.home_goals,
+                    Match.away_goals,
+                    True,
+                ),
+                side(
+                    Match.away_team_id,
+                    Match.home_team_id,
+                    Match.away_goals,
+                    Match.home_goals,
+                    False,
+                ),
+            ),
+        )
+    )
+    count = session.execute(select(func.count()).select_from(table)).scalar()
+    session.commit()
+    logger.info(f"Takım maç kaydı yeniden oluşturuldu: {count} satır")
+    return count
@@ -0,0 +1,388 @@
+"""
+Takım İstatistikleri Modülü
+
+Takımların sezonluk istatistiklerini (TeamStatistics) maç sonuçları
+kaydedildikçe artımlı olarak günceller. Her flush'ta yeni, değişen veya
+silinen tamamlanmış maçlar için eski sonuç geri alınır ve yenisi eklenir;
+böylece istatistik okumak takımın tüm maç geçmişini taramak yerine tek
+satırlık bir sorgudur.
+
+Mevcut veritabanları için `rebuild_team_statistics` tabloyu tek bir
+gruplanmış sorguyla baştan oluşturur.
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Sezon bu aydan itibaren bir sonraki yıla sayılır (Temmuz)
+SEASON_START_MONTH = 7
+
+# Sonuçlardan türetilen sayaç sütunları
+COUNTER_FIELDS = [
+    "matches_played",
+    "wins",
+    "draws",
+    "losses",
+    "goals_for",
+    "goals_against",
+    "clean_sheets",
+    "failed_to_score",
+    "home_matches",
+    "home_wins",
+    "home_draws",
+    "home_losses",
+    "home_goals_for",
+    "home_goals_against",
+    "away_matches",
+    "away_wins",
+    "away_draws",
+    "away_losses",
+    "away_goals_for",
+    "away_goals_against",
+]
+
+# Maç sonucunu istatistiklere yansıtmak için gereken Match alanları
+RESULT_FIELDS = [
+    "status",
+    "home_team_id",
+    "away_team_id",
+    "match_date",
+    "home_goals",
+    "away_goals",
+]
+
+
+class MatchResult(NamedTuple):
+    """İstatistiklere yansıtılan tamamlanmış maç sonucu"""
+
+    home_team_id: int
+    away_team_id: int
+    season: str
+    home_goals: int
+    away_goals: int
+
+
+def season_of(match_date: Union[datetime, date]) -> str:
+    """Maç tarihinin ait olduğu sezonu döndürür (Örn: '2024/2025')"""
+    start_year = match_date.year
+    if match_date.month < SEASON_START_MONTH:
+        start_year -= 1
+    return f"{start_year}/{start_year + 1}"
+
+
+def result_deltas(goals_for: int, goals_against: int, is_home: bool) -> Dict[str, int]:
+    """Tek bir maçın takım sayaçlarına katkısını döndürür"""
+    if goals_for > goals_against:
+        outcome = "wins"
+    elif goals_for == goals_against:
+        outcome = "draws"
+    else:
+        outcome = "losses"
+    side = "home" if is_home else "away"
+
+    return {
+        "matches_played": 1,
+        outcome: 1,
+        "goals_for": goals_for,
+        "goals_against": goals_against,
+        "clean_sheets": int(goals_against == 0),
+        "failed_to_score": int(goals_for == 0),
+        f"{side}_matches": 1,
+        f"{side}_{outcome}": 1,
+        f"{side}_goals_for": goals_for,
+        f"{side}_goals_against": goals_against,
+    }
+
+
+def apply_result(
+    stats: Any, goals_for: int, goals_against: int, is_home: bool, sign: int = 1
+) -> None:
+    """Maç sonucunu istatistik satırına ekler (sign=-1 ile geri alır)"""
+    for field, value in result_deltas(goals_for, goals_against, is_home).items():
+        setattr(stats, field, (getattr(stats, field) or 0) + sign * value)
+
+    played = stats.matches_played or 0
+    stats.average_goals_per_match = stats.goals_for / played if played else 0.0
+    stats.average_goals_conceded = stats.goals_against / played if played else 0.0
+
+
+def summarize(rows: Iterable[Any]) -> Dict[str, Union[int, float]]:
+    """Bir veya daha fazla sezon satırından görüntüleme istatistiklerini üretir"""
+    totals = {field: 0 for field in COUNTER_FIELDS}
+    for row in rows:
+        for field in COUNTER_FIELDS:
+            totals[field] += getattr(row, field) or 0
+
+    played = totals["matches_played"]
+    return {
+        "total_matches_played": played,
+        "total_wins": totals["wins"],
+        "total_draws": totals["draws"],
+        "total_losses": totals["losses"],
+        "total_goals_for": totals["goals_for"],
+        "total_goals_against": totals["goals_against"],
+        "win_percentage": (totals["wins"] / played) * 100 if played else 0,
+        "avg_goals_per_match": totals["goals_for"] / played if played else 0,
+        "goals_conceded_per_match": totals["goals_against"] / played if played else 0,
+    }
+
+
+def get_team_statistics(session, team_id: int, season: Optional[str] = None):
+    """Takım istatistiklerini döndürür
+
+    Args:
+        session: SQLAlchemy veritabanı oturumu
+        team_id: Takım ID'si
+        season: Sezon (Örn: '2024/2025'); None ise tüm sezonların toplamı
+
+    Returns:
+        Dict: `summarize` çıktısı
+    """
+    from app.models import TeamStatistics
+
+    query = session.query(TeamStatistics).filter(TeamStatistics.team_id == team_id)
+    if season is not None:
+        query = query.filter(TeamStatistics.season == season)
+    return summarize(query.all())
+
+
+def _match_result(match, previous: bool = False) -> Optional[MatchResult]:
+    """Maçın (flush öncesi veya sonrası) tamamlanmış sonucunu döndürür"""
+    from sqlalchemy import inspect
+
+    from app.models import MatchStatus
+
+    values = {}
+    state = inspect(match) if previous else None
+    for field in RESULT_FIELDS:
+        value = getattr(match, field)
+        if previous:
+            history = state.attrs[field].history
+            if history.deleted:
+                value = history.deleted[0]
+        values[field] = value
+
+    if (
+        values["status"] != MatchStatus.FINISHED
+        or values["home_goals"] is None
+        or values["away_goals"] is None
+        or values["match_date"] is None
+    ):
+        return None
+    return MatchResult(
+        values["home_team_id"],
+        values["away_team_id"],
+        season_of(values["match_date"]),
+        values["home_goals"],
+        values["away_goals"],
+    )
+
+
+def _stats_row(session, rows: Dict[Tuple[int, str], Any], team_id: int, season: str):
+    """Takımın sezon satırını (kilitleyerek) getirir; yoksa oluşturur"""
+    from app.models import TeamStatistics
+
+    key = (team_id, season)
+    if key not in rows:
+        stats = (
+            session.query(TeamStatistics)
+            .filter_by(team_id=team_id, season=season)
+            .with_for_update()
+            .first()
+        )
+        if stats is None:
+            stats = TeamStatistics(team_id=team_id, season=season)
+            for field in COUNTER_FIELDS:
+                setattr(stats, field, 0)
+            session.add(stats)
+        rows[key] = stats
+    return rows[key]
+
+
+def _apply_match_result(session, rows, result: MatchResult, sign: int) -> None:
+    for team_id, goals_for, goals_against, is_home in (
+        (result.home_team_id, result.home_goals, result.away_goals, True),
+        (result.away_team_id, result.away_goals, result.home_goals, False),
+    ):
+        stats = _stats_row(session, rows, team_id, result.season)
+        apply_result(stats, goals_for, goals_against, is_home, sign)
+
+
+def _on_before_flush(session, flush_context, instances) -> None:
+    """Flush edilecek maç sonuçlarını takım istatistiklerine yansıtır"""
+    from app.models import Match
+
+    changes: List[Tuple[Optional[MatchResult], Optional[MatchResult]]] = []
+    for match in session.new:
+        if isinstance(match, Match):
+            changes.append((None, _match_result(match)))
+    for match in session.dirty:
+        if isinstance(match, Match) and session.is_modified(match):
+            changes.append((_match_result(match, previous=True), _match_result(match)))
+    for match in session.deleted:
+        if isinstance(match, Match):
+            changes.append((_match_result(match, previous=True), None))
+    _apply_result_changes(session, changes)
+
+
+def _apply_result_changes(
+    session, changes: List[Tuple[Optional[MatchResult], Optional[MatchResult]]]
+) -> None:
+    """(eski, yeni) sonuç çiftlerini istatistik satırlarına yansıtır"""
+    rows: Dict[Tuple[int, str], Any] = {}
+    with session.no_autoflush:
+        for old, new in changes:
+            if old == new:
+                continue
+            if old is not None:
+                _apply_match_result(session, rows, old, sign=-1)
+            if new is not None:
+                _apply_match_result(session, rows, new, sign=1)
+
+
+def apply_match_changes(session, changes: Iterable[Tuple[Any, Any]]) -> None:
+    """ORM dışında (ör. toplu upsert ile) yazılan maç değişikliklerini yansıtır
+
+    Args:
+        session: SQLAlchemy veritabanı oturumu
+        changes: (eski maç, yeni maç) çiftleri; maçlar RESULT_FIELDS
+            alanlarına sahip herhangi bir nesne olabilir, yeni eklenen maçın
+            eski hali ve silinen maçın yeni hali None'dır
+    """
+    _apply_result_changes(
+        session,
+        [
+            (
+                _match_result(old) if old is not None else None,
+                _match_result(new) if new is not None else None,
+            )
+            for old, new in changes
+        ],
+    )
+
+
+def register_statistics_listeners() -> None:
+    """Oturum flush olayına takım istatistiği güncellemesini bağlar"""
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    if not event.contains(Session, "before_flush", _on_before_flush):
+        event.listen(Session, "before_flush", _on_before_flush)
+
+
+def rebuild_team_statistics(session, team_ids: Optional[List[int]] = None) -> int:
+    """Takım istatistiklerini tamamlanmış maçlardan yeniden oluşturur
+
+    Tüm sayaçlar (takım, sezon başlangıç yılı, iç saha/deplasman) bazında
+    tek bir gruplanmış sorguyla hesaplanır; maçlar Python'a yüklenmez.
+
+    Args:
+        session: SQLAlchemy veritabanı oturumu
+        team_ids: Yalnızca bu takımlar (None ise tümü)
+
+    Returns:
+        int: Oluşturulan istatistik satırı sayısı
+    """
+    from sqlalchemy import case, extract, func, literal, select, union_all
+
+    from app.models import Match, MatchStatus, TeamStatistics
+
+    def side(team_column, goals_for, goals_against, is_home):
+        month = extract("month", Match.match_date)
+        year = extract("year", Match.match_date)
+        query = select(
+            team_column.label("team_id"),
+            case((month < SEASON_START_MONTH, year - 1), else_=year).label(
+                "start_year"
+            ),
+            literal(is_home).label("is_home"),
+            goals_for.label("goals_for"),
+            goals_against.label("goals_against"),
+        ).where(
+            Match.status == MatchStatus.FINISHED,
+            Match.home_goals.isnot(None),
+            Match.away_goals.isnot(None),
+        )
+        if team_ids is not None:
+            query = query.where(team_column.in_(team_ids))
+        return query
+
+    rows = union_all(
+        side(Match.home_team_id, Match.home_goals, Match.away_goals, True),
+        side(Match.away_team_id, Match.away_goals, Match.home_goals, False),
+    ).subquery()
+    totals = session.execute(
+        select(
+            rows.c.team_id,
+            rows.c.start_year,
+            rows.c.is_home,
+            func.count().label("matches"),
+            func.sum(case((rows.c.goals_for > rows.c.goals_against, 1), else_=0)).label(
+                "wins"
+            ),
+            func.sum(
+                case((rows.c.goals_for == rows.c.goals_against, 1), else_=0)
+            ).label("draws"),
+            func.sum(rows.c.goals_for).label("goals_for"),
+            func.sum(rows.c.goals_against).label("goals_against"),
+            func.sum(case((rows.c.goals_against == 0, 1), else_=0)).label(
+                "clean_sheets"
+            ),
+            func.sum(case((rows.c.goals_for == 0, 1), else_=0)).label(
+                "failed_to_score"
+            ),
+        ).group_by(rows.c.team_id, rows.c.start_year, rows.c.is_home)
+    ).all()
+
+    statistics: Dict[Tuple[int, str], Dict[str, int]] = {}
+    for row in totals:
+        start_year = int(row.start_year)
+        counters = statistics.setdefault(
+            (row.team_id, f"{start_year}/{start_year + 1}"),
+            {field: 0 for field in COUNTER_FIELDS},
+        )
+        matches, wins, draws = int(row.matches), int(row.wins), int(row.draws)
+        side_totals = {
+            "matches": matches,
+            "wins": wins,
+            "draws": draws,
+            "losses": matches - wins - draws,
+            "goals_for": int(row.goals_for),
+            "goals_against": int(row.goals_against),
+        }
+        prefix = "home" if row.is_home else "away"
+        for field, value in side_totals.items():
+            counters[f"{prefix}_{field}"] += value
+            counters["matches_played" if field == "matches" else field] += value
+        counters["clean_sheets"] += int(row.clean_sheets)
+        counters["failed_to_score"] += int(row.failed_to_score)
+
+    query = session.query(TeamStatistics)
+    if team_ids is not None:
+        query = query.filter(TeamStatistics.team_id.in_(team_ids))
+    existing = {(stats.team_id, stats.season): stats for stats in query}
+
+    for key, counters in statistics.items():
+        stats = existing.pop(key, None)
+        if stats is None:
+            stats = TeamStatistics(team_id=key[0], season=key[1])
+            session.add(stats)
+        for field, value in counters.items():
+            setattr(stats, field, value)
+        played = counters["matches_played"]
+        stats.average_goals_per_match = counters["goals_for"] / played
+        stats.average_goals_conceded = counters["goals_against"] / played
+
+    # Artık tamamlanmış maçı olmayan sezonların sayaçlarını sıfırla
+    for stats in existing.values():
+        for field in COUNTER_FIELDS:
+            setattr(stats, field, 0)
+        stats.average_goals_per_match = 0.0
+        stats.average_goals_conceded = 0.0
+
+    session.commit()
+    logger.info(f"Takım istatistikleri yeniden oluşturuldu: {len(statistics)} satır")
+    return len(statistics)
@@ -0,0 +1,203 @@
+"""
+Eğitim Orkestratörü Modülü
+
+Global modeli ve `Config.LEAGUES` içindeki her lig modelini bir süreç
+havuzunda eşzamanlı olarak eğitir. Tüm işçiler aynı özellik deposu
+anlık görüntüsünü (tek bir .npz dosyası) okur; veritabanına yalnızca ana
+süreç bir kez gider. Model dosyaları atomik olarak yazılır ve her lig için
+süre ve skor özeti döndürülür.
+"""
+
+import logging
+import os
+import time
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
+
+from threadpoolctl import threadpool_limits
+
+from config import Config
+from .feature_store import FEATURE_COLUMNS, TARGET_COLUMNS, FeatureStore
+from .match_model import (
+    create_match_model,
+    fit_match_model,
+    model_paths,
+    save_model_metadata,
+)
+from .model_artifacts import save_artifact
+
+logger = logging.getLogger(__name__)
+
+# Bir lig modeli için gereken en az maç sayısı
+MIN_TRAINING_MATCHES = 50
+
+
+def resolve_league_ids(session, league_codes: List[str]) -> Dict[str, int]:
+    """Lig kodlarını (örn. 'PL') veritabanındaki lig ID'lerine çevirir
+
+    League modelinde kod sütunu yoksa ligler Config.LEAGUES içindeki adlarıyla
+    eşleştirilir.
+    """
+    from app.models import League
+
+    if hasattr(League, "code"):
+        rows = (
+            session.query(League.code, League.id)
+            .filter(League.code.in_(league_codes))
+            .all()
+        )
+    else:
+        codes_by_name = {
+            Config.LEAGUES[code]["name"]: code
+            for code in league_codes
+            if code in Config.LEAGUES
+        }
+        rows = [
+            (codes_by_name[name], league_id)
+            for name, league_id in session.query(League.name, League.id)
+            .filter(League.name.in_(list(codes_by_name)))
+            .all()
+        ]
+    resolved = {code: league_id for code, league_id in rows}
+    for code in league_codes:
+        if code not in resolved:
+            logger.warning(f"{code} ligi veritabanında bulunamadı, atlanıyor")
+    return resolved
+
+
+def train_league_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Tek bir (lig veya global) modeli eğitir; işçi süreçte çalışır
+
+    Args:
+        job: 'name', 'league_id', 'store_path', 'model_dir', 'limit',
+            'min_matches' ve isteğe bağlı 'backend', 'threads' anahtarlarını
+            içeren iş tanımı
+
+    Returns:
+        Dict[str, Any]: Lig, süre ve skor bilgilerini içeren özet
+    """
+    started = time.perf_counter()
+    summary = {"name": job["name"], "league_id": job["league_id"], "success": False}
+
+    try:
+        frame = FeatureStore(path=job["store_path"]).load(job["league_id"])
+        frame = frame.sort_values("match_date", ascending=False).head(job["limit"])
+
+        if len(frame) < job["min_matches"]:
+            summary["message"] = f"Yetersiz veri: {len(frame)} maç"
+            return summary
+
+        # Çok iş parçacıklı arka uçlar süreç havuzunda çekirdekleri aşmasın
+        threads = job.get("threads") or os.cpu_count() or 1
+        with threadpool_limits(limits=threads):
+            model, scaler, metrics = fit_match_model(
+                create_match_model(job.get("backend"), n_jobs=threads),
+                frame[FEATURE_COLUMNS].to_numpy(dtype=float),
+                frame[TARGET_COLUMNS].to_numpy(dtype=float),
+            )
+
+        model_path, scaler_path = model_paths(job["league_id"], job["model_dir"])
+        save_artifact(scaler, scaler_path)
+        save_artifact(model, model_path)
+        save_model_metadata(
+            model_path,
+            {
+                "trained_until": frame["match_date"].max(),
+                "full_refit_at": datetime.utcnow(),
+                "baseline_mae": metrics["mae"],
+                "incremental_updates": 0,
+            },
+        )
+
+        summary.update(metrics)
+        summary.update({"success": True, "model_path": os.path.abspath(model_path)})
+    except Exception as e:
+        summary["message"] = str(e)
+    finally:
+        summary["wall_time"] = round(time.perf_counter() - started, 2)
+
+    return summary
+
+
+def train_all_models(
+    session,
+    league_codes: Optional[List[str]] = None,
+    max_workers: Optional[int] = None,
+    model_dir: str = "models",
+    store: Optional[FeatureStore] = None,
+    limit: int = 5000,
+    min_matches: int = MIN_TRAINING_MATCHES,
+    backend: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Global modeli ve tüm lig modellerini paralel olarak eğitir
+
+    Args:
+        session: SQLAlchemy veritabanı oturumu (yalnızca ana süreçte kullanılır)
+        league_codes: Eğitilecek lig kodları (varsayılan: Config.LEAGUES)
+        max_workers: En fazla işçi süreç sayısı (varsayılan: çekirdek sayısı)
+        model_dir: Model dosyalarının yazılacağı dizin
+        store: Kullanılacak özellik deposu (varsayılan: FeatureStore())
+        limit: Model başına kullanılacak en fazla (en yeni) maç sayısı
+        min_matches: Model eğitmek için gereken en az maç sayısı
+        backend: Model arka ucu (varsayılan: Config.MODEL_BACKEND)
+
+    Returns:
+        Dict[str, Any]: 'wall_time' ve her model için özetleri içeren 'results'
+    """
+    started = time.perf_counter()
+    league_codes = list(league_codes or Config.LEAGUES.keys())
+    store = store or FeatureStore()
+
+    # Tüm işçilerin paylaşacağı tek özellik anlık görüntüsü
+    store.build(session)
+    league_ids = resolve_league_ids(session, league_codes)
+
+    jobs = [{"name": "global", "league_id": None}] + [
+        {"name": code, "league_id": league_id} for code, league_id in league_ids.items()
+    ]
+    workers = max(1, min(len(jobs), max_workers or os.cpu_count() or 1))
+    for job in jobs:
+        job.update(
+            {
+                "store_path": store.path,
+                "model_dir": model_dir,
+                "limit": limit,
+                "min_matches": min_matches,
+                "backend": backend,
+                "threads": max(1, (os.cpu_count() or 1) // workers),
+            }
+        )
+
+    logger.info(f"{len(jobs)} model {workers} işçi süreçle eğitiliyor...")
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(train_league_job, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {
+                    "name": job["name"],
+                    "league_id": job["league_id"],
+                    "success": False,
+                    "message": str(e),
+                }
+            results.append(result)
+
+    results.sort(key=lambda result: (result["league_id"] is not None, result["name"]))
+    wall_time = round(time.perf_counter() - started, 2)
+
+    logger.info(f"Eğitim tamamlandı: {wall_time} sn")
+    for result in results:
+        if result["success"]:
+            logger.info(
+                f"  {result['name']:<8} {result['wall_time']:>7.2f} sn  "
+                f"maç: {result['matches_used']:>5}  test skoru: {result['test_score']:.4f}"
+            )
+        else:
+            logger.warning(f"  {result['name']:<8} atlandı: {result.get('message')}")
+
+    return {"wall_time": wall_time, "workers": workers, "results": results}
@@ -50,6 +50,30 @@ class Config:
     # Uygulama Ayarları
     ITEMS_PER_PAGE = 20
     MODEL_DIR = os.path.join(basedir, "models")
+    MODEL_CACHE_SIZE = int(os.environ.get("MODEL_CACHE_SIZE", 10))
+    MODEL_MMAP = os.environ.get("MODEL_MMAP", "True") == "True"
+    MODEL_BACKEND = os.environ.get("MODEL_BACKEND", "gbr")
+    MODEL_COMPILED_INFERENCE = (
+        os.environ.get("MODEL_COMPILED_INFERENCE", "True") == "True"
+    )
+    # Derlenmiş diziler dosyaya kaydedilip işçiler arasında paylaşılsın mı
+    # (kapalıysa her işçi kendi özel kopyasını tutar)
+    MODEL_COMPILED_PERSIST = os.environ.get("MODEL_COMPILED_PERSIST", "True") == "True"
+    PREDICTION_CACHE_SIZE = int(os.environ.get("PREDICTION_CACHE_SIZE", 1024))
+    PREDICTION_CACHE_TTL = int(os.environ.get("PREDICTION_CACHE_TTL", 600))
+    # Diğer süreçlerde kaydedilen sonuçların tahmin önbelleğine yansıma aralığı
+    PREDICTION_CACHE_SYNC_INTERVAL = float(
+        os.environ.get("PREDICTION_CACHE_SYNC_INTERVAL", 10)
+    )
+    # Takım bazlı sorgular team_match_log tablosundan okunur
+    USE_TEAM_MATCH_LOG = os.environ.get("USE_TEAM_MATCH_LOG", "False") == "True"
+    # Maç aktarımı: API isteği başına gün aralığı ve işlem başına maç sayısı
+    MATCH_INGEST_WINDOW_DAYS = int(os.environ.get("MATCH_INGEST_WINDOW_DAYS", 10))
+    MATCH_INGEST_BATCH_SIZE = int(os.environ.get("MATCH_INGEST_BATCH_SIZE", 200))
+    # Sağlayıcı HTTP istemcisi: eşzamanlı istek ve yeniden deneme ayarları
+    HTTP_MAX_CONCURRENCY = int(os.environ.get("HTTP_MAX_CONCURRENCY", 10))
+    HTTP_MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", 3))
+    HTTP_RETRY_BACKOFF = float(os.environ.get("HTTP_RETRY_BACKOFF", 0.5))
     DATA_DIR = os.path.join(basedir, "data")
 
     # Loglama Ayarları
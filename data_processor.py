@@ -2,7 +2,7 @@ import numpy as np
 from datetime import datetime, timedelta
 from app.models import Team, Match, Player, InjuryReport
 from app import db
-from sqlalchemy import func, desc
+from sqlalchemy import and_, case, desc, func, or_, select, union_all
 import math
 
 
@@ -20,8 +20,9 @@ class DataProcessor:
 
     def prepare_team_data(self, home_team, away_team):
         """Prepare comprehensive team data for AI models"""
-        home_data = self._get_team_features(home_team, is_home=True)
-        away_data = self._get_team_features(away_team, is_home=False)
+        features = self.get_bulk_team_features([home_team, away_team])
+        home_data = features[home_team.id]
+        away_data = dict(features[away_team.id], home_advantage=1.0)
 
         # Add head-to-head statistics
         h2h_stats = self._get_head_to_head_stats(home_team, away_team)
@@ -33,120 +34,164 @@ class DataProcessor:
             "match_context": self._get_match_context(),
         }
 
-    def _get_team_features(self, team, is_home=True):
-        """Extract comprehensive features for a team"""
-        features = {
-            "team_id": team.id,
-            "team_name": team.name,
-            "league": team.league,
-            "attack_rating": team.attack_rating,
-            "defense_rating": team.defense_rating,
-            "home_advantage": team.home_advantage if is_home else 1.0,
-            "current_form": team.current_form,
-        }
-
-        # Recent match statistics
-        recent_matches = self._get_recent_match_stats(team, limit=5)
-        features.update(recent_matches)
+    def get_bulk_team_features(self, teams, is_home=True):
+        """Extract features for many teams with one aggregate query per feature group
+
+        Returns:
+            dict: team id -> the same feature dict as _get_team_features
+        """
+        team_ids = [team.id for team in teams]
+        recent = self._get_recent_match_stats_bulk(team_ids, limit=5)
+        players = self._get_player_stats_bulk(team_ids)
+        injuries = self._get_injury_stats_bulk(team_ids)
+        trends = self._calculate_performance_trends_bulk(team_ids)
+
+        features = {}
+        for team in teams:
+            team_features = {
+                "team_id": team.id,
+                "team_name": team.name,
+                "league": team.league,
+                "attack_rating": team.attack_rating,
+                "defense_rating": team.defense_rating,
+                "home_advantage": team.home_advantage if is_home else 1.0,
+                "current_form": team.current_form,
+            }
+            team_features.update(recent[team.id])
+            team_features.update(players[team.id])
+            team_features.update(injuries[team.id])
+            team_features.update(trends[team.id])
+            features[team.id] = team_features
 
-        # Player-based statistics
-        player_stats = self._get_player_stats(team)
-        features.update(player_stats)
+        return features
 
-        # Injury analysis
-        injury_stats = self._get_injury_stats(team)
-        features.update(injury_stats)
+    def _get_team_features(self, team, is_home=True):
+        """Extract comprehensive features for a team"""
+        return self.get_bulk_team_features([team], is_home=is_home)[team.id]
 
-        # Performance trends
-        trends = self._calculate_performance_trends(team)
-        features.update(trends)
+    @staticmethod
+    def _team_match_rows(team_ids, since=None):
+        """Played matches as one row per (team, match) from the team's point of view
+
+        Missing goals count as 0; missing or zero shots, shots on target,
+        possession and corners fall back to 12, 5, 50 and 5.
+        """
+
+        def side(team_column, goals_for, goals_against, prefix):
+            conditions = [team_column.in_(team_ids), Match.played == True]
+            if since is not None:
+                conditions.append(Match.match_date >= since)
+            return select(
+                team_column.label("team_id"),
+                Match.match_date.label("match_date"),
+                func.coalesce(goals_for, 0).label("goals_for"),
+                func.coalesce(goals_against, 0).label("goals_against"),
+                func.coalesce(
+                    func.nullif(getattr(Match, f"{prefix}_shots"), 0), 12
+                ).label("shots"),
+                func.coalesce(
+                    func.nullif(getattr(Match, f"{prefix}_shots_on_target"), 0), 5
+                ).label("shots_on_target"),
+                func.coalesce(
+                    func.nullif(getattr(Match, f"{prefix}_possession"), 0), 50
+                ).label("possession"),
+                func.coalesce(
+                    func.nullif(getattr(Match, f"{prefix}_corners"), 0), 5
+                ).label("corners"),
+            ).where(*conditions)
+
+        return union_all(
+            side(Match.home_team_id, Match.home_score, Match.away_score, "home"),
+            side(Match.away_team_id, Match.away_score, Match.home_score, "away"),
+        ).subquery()
 
-        return features
+    @staticmethod
+    def _result_counts(goals_for, goals_against):
+        """SUM(CASE ...) columns counting wins, draws and losses"""
+        return (
+            func.sum(case((goals_for > goals_against, 1), else_=0)).label("wins"),
+            func.sum(case((goals_for == goals_against, 1), else_=0)).label("draws"),
+            func.sum(case((goals_for < goals_against, 1), else_=0)).label("losses"),
+        )
 
     def _get_recent_match_stats(self, team, limit=5):
         """Get statistics from recent matches"""
-        recent_matches = (
-            Match.query.filter(
-                (Match.home_team_id == team.id) | (Match.away_team_id == team.id)
+        return self._get_recent_match_stats_bulk([team.id], limit)[team.id]
+
+    def _get_recent_match_stats_bulk(self, team_ids, limit=5):
+        """Recent match statistics for many teams in a single aggregate query"""
+        rows = self._team_match_rows(team_ids)
+        ranked = select(
+            rows,
+            func.row_number()
+            .over(partition_by=rows.c.team_id, order_by=rows.c.match_date.desc())
+            .label("rank"),
+        ).subquery()
+
+        query = (
+            select(
+                ranked.c.team_id,
+                func.count().label("matches"),
+                func.sum(ranked.c.goals_for).label("goals_for"),
+                func.sum(ranked.c.goals_against).label("goals_against"),
+                func.sum(ranked.c.shots).label("shots"),
+                func.sum(ranked.c.shots_on_target).label("shots_on_target"),
+                func.sum(ranked.c.possession).label("possession"),
+                func.sum(ranked.c.corners).label("corners"),
+                func.sum(case((ranked.c.goals_against == 0, 1), else_=0)).label(
+                    "clean_sheets"
+                ),
+                *self._result_counts(ranked.c.goals_for, ranked.c.goals_against),
             )
-            .filter(Match.played == True)
-            .order_by(Match.match_date.desc())
-            .limit(limit)
-            .all()
+            .where(ranked.c.rank <= limit)
+            .group_by(ranked.c.team_id)
         )
+        totals = {row.team_id: row for row in db.session.execute(query)}
 
-        if not recent_matches:
-            return {
-                "recent_matches": 0,
-                "recent_form": 50.0,
-                "avg_goals_scored": 1.5,
-                "avg_goals_conceded": 1.5,
-                "recent_wins": 0,
-                "recent_draws": 0,
-                "recent_losses": 0,
-                "goal_difference": 0,
-                "avg_shots": 12.0,
-                "avg_shots_on_target": 5.0,
-                "avg_possession": 50.0,
-                "avg_corners": 5.0,
-                "clean_sheets": 0,
-                "scoring_frequency": 0.6,
-            }
+        return {
+            team_id: self._recent_stats_from_totals(totals[team_id])
+            if team_id in totals
+            else self._default_recent_stats()
+            for team_id in team_ids
+        }
 
-        stats = {
-            "recent_matches": len(recent_matches),
-            "avg_goals_scored": 0,
-            "avg_goals_conceded": 0,
+    @staticmethod
+    def _default_recent_stats():
+        """Recent match statistics for a team without played matches"""
+        return {
+            "recent_matches": 0,
+            "recent_form": 50.0,
+            "avg_goals_scored": 1.5,
+            "avg_goals_conceded": 1.5,
             "recent_wins": 0,
             "recent_draws": 0,
             "recent_losses": 0,
-            "total_shots": 0,
-            "total_shots_on_target": 0,
-            "total_possession": 0,
-            "total_corners": 0,
+            "goal_difference": 0,
+            "avg_shots": 12.0,
+            "avg_shots_on_target": 5.0,
+            "avg_possession": 50.0,
+            "avg_corners": 5.0,
             "clean_sheets": 0,
+            "scoring_frequency": 0.6,
         }
 
-        for match in recent_matches:
-            if match.home_team_id == team.id:
-                # Home match
-                goals_scored = match.home_score or 0
-                goals_conceded = match.away_score or 0
-                shots = match.home_shots or 12
-                shots_on_target = match.home_shots_on_target or 5
-                possession = match.home_possession or 50
-                corners = match.home_corners or 5
-            else:
-                # Away match
-                goals_scored = match.away_score or 0
-                goals_conceded = match.home_score or 0
-                shots = match.away_shots or 12
-                shots_on_target = match.away_shots_on_target or 5
-                possession = match.away_possession or 50
-                corners = match.away_corners or 5
-
-            stats["avg_goals_scored"] += goals_scored
-            stats["avg_goals_conceded"] += goals_conceded
-            stats["total_shots"] += shots
-            stats["total_shots_on_target"] += shots_on_target
-            stats["total_possession"] += possession
-            stats["total_corners"] += corners
-
-            if goals_conceded == 0:
-                stats["clean_sheets"] += 1
-
-            # Match result
-            if goals_scored > goals_conceded:
-                stats["recent_wins"] += 1
-            elif goals_scored == goals_conceded:
-                stats["recent_draws"] += 1
-            else:
-                stats["recent_losses"] += 1
-
-        # Calculate averages
-        num_matches = len(recent_matches)
-        stats["avg_goals_scored"] /= num_matches
-        stats["avg_goals_conceded"] /= num_matches
+    @staticmethod
+    def _recent_stats_from_totals(totals):
+        """Build the recent match statistics dict from aggregated totals"""
+        num_matches = int(totals.matches)
+        stats = {
+            "recent_matches": num_matches,
+            "avg_goals_scored": int(totals.goals_for) / num_matches,
+            "avg_goals_conceded": int(totals.goals_against) / num_matches,
+            "recent_wins": int(totals.wins),
+            "recent_draws": int(totals.draws),
+            "recent_losses": int(totals.losses),
+            "total_shots": int(totals.shots),
+            "total_shots_on_target": int(totals.shots_on_target),
+            "total_possession": int(totals.possession),
+            "total_corners": int(totals.corners),
+            "clean_sheets": int(totals.clean_sheets),
+        }
         stats["avg_shots"] = stats["total_shots"] / num_matches
         stats["avg_shots_on_target"] = stats["total_shots_on_target"] / num_matches
         stats["avg_possession"] = stats["total_possession"] / num_matches
@@ -154,201 +199,276 @@ class DataProcessor:
 
         # Calculate form (points from recent matches)
         points = stats["recent_wins"] * 3 + stats["recent_draws"]
-        max_points = num_matches * 3
-        stats["recent_form"] = (points / max_points) * 100 if max_points > 0 else 50
+        stats["recent_form"] = (points / (num_matches * 3)) * 100
 
-        # Goal difference
+        # Goal difference and scoring frequency (goals per match)
         stats["goal_difference"] = (
             stats["avg_goals_scored"] - stats["avg_goals_conceded"]
         )
-
-        # Scoring frequency (goals per match)
         stats["scoring_frequency"] = stats["avg_goals_scored"]
 
         return stats
 
     def _get_player_stats(self, team):
         """Get player-based team statistics"""
-        players = Player.query.filter_by(team_id=team.id).all()
-
-        if not players:
-            return {
-                "squad_size": 0,
-                "avg_skill_rating": 50.0,
-                "top_scorer_goals": 0,
-                "total_goals": 0,
-                "total_assists": 0,
-                "experienced_players": 0,
-                "young_prospects": 0,
-            }
-
-        total_skill = sum(player.skill_rating for player in players)
-        total_goals = sum(player.goals_scored for player in players)
-        total_assists = sum(player.assists for player in players)
-
-        # Player age analysis
-        experienced_players = sum(
-            1 for player in players if player.age and player.age >= 28
-        )
-        young_prospects = sum(
-            1 for player in players if player.age and player.age <= 21
-        )
-
-        # Top scorer
-        top_scorer_goals = (
-            max(player.goals_scored for player in players) if players else 0
+        return self._get_player_stats_bulk([team.id])[team.id]
+
+    def _get_player_stats_bulk(self, team_ids):
+        """Player-based statistics for many teams in a single aggregate query"""
+        query = (
+            select(
+                Player.team_id,
+                func.count().label("squad_size"),
+                func.sum(Player.skill_rating).label("total_skill"),
+                func.max(Player.goals_scored).label("top_scorer_goals"),
+                func.sum(Player.goals_scored).label("total_goals"),
+                func.sum(Player.assists).label("total_assists"),
+                func.sum(case((Player.age >= 28, 1), else_=0)).label(
+                    "experienced_players"
+                ),
+                func.sum(
+                    case((and_(Player.age > 0, Player.age <= 21), 1), else_=0)
+                ).label("young_prospects"),
+            )
+            .where(Player.team_id.in_(team_ids))
+            .group_by(Player.team_id)
         )
-
-        return {
-            "squad_size": len(players),
-            "avg_skill_rating": total_skill / len(players),
-            "top_scorer_goals": top_scorer_goals,
-            "total_goals": total_goals,
-            "total_assists": total_assists,
-            "experienced_players": experienced_players,
-            "young_prospects": young_prospects,
-        }
+        totals = {row.team_id: row for row in db.session.execute(query)}
+
+        stats = {}
+        for team_id in team_ids:
+            row = totals.get(team_id)
+            if row is None:
+                stats[team_id] = {
+                    "squad_size": 0,
+                    "avg_skill_rating": 50.0,
+                    "top_scorer_goals": 0,
+                    "total_goals": 0,
+                    "total_assists": 0,
+                    "experienced_players": 0,
+                    "young_prospects": 0,
+                }
+                continue
+
+            stats[team_id] = {
+                "squad_size": int(row.squad_size),
+                "avg_skill_rating": float(row.total_skill) / int(row.squad_size),
+                "top_scorer_goals": row.top_scorer_goals,
+                "total_goals": int(row.total_goals),
+                "total_assists": int(row.total_assists),
+                "experienced_players": int(row.experienced_players),
+                "young_prospects": int(row.young_prospects),
+            }
+        return stats
 
     def _get_injury_stats(self, team):
         """Get injury-related statistics"""
-        # Current injuries
-        current_injuries = (
-            InjuryReport.query.join(Player)
-            .filter(Player.team_id == team.id, InjuryReport.status == "injured")
-            .all()
-        )
-
-        # Key player injuries (high skill rating players)
-        key_players_injured = sum(
-            1 for injury in current_injuries if injury.player.skill_rating >= 70
-        )
-
-        # Total injury impact
-        total_impact = 0
-        position_impact = {"GK": 0, "DEF": 0, "MID": 0, "ATT": 0}
-
-        for injury in current_injuries:
-            player = injury.player
-            impact = (player.skill_rating / 100) * (injury.severity / 10)
-            total_impact += impact
-
-            # Categorize position impact
-            if player.position in ["GK"]:
-                position_impact["GK"] += impact
-            elif player.position in ["CB", "LB", "RB"]:
-                position_impact["DEF"] += impact
-            elif player.position in ["CM", "CDM", "CAM", "LW", "RW"]:
-                position_impact["MID"] += impact
-            elif player.position in ["ST", "CF"]:
-                position_impact["ATT"] += impact
-
-        return {
-            "current_injuries": len(current_injuries),
-            "key_players_injured": key_players_injured,
-            "total_injury_impact": min(1.0, total_impact),  # Cap at 100%
-            "goalkeeper_injuries": position_impact["GK"],
-            "defense_injuries": position_impact["DEF"],
-            "midfield_injuries": position_impact["MID"],
-            "attack_injuries": position_impact["ATT"],
-            "injury_severity_avg": sum(injury.severity for injury in current_injuries)
-            / len(current_injuries)
-            if current_injuries
-            else 0,
-        }
-
-    def _calculate_performance_trends(self, team):
-        """Calculate performance trends over time"""
-        # Get matches from last 3 months
-        three_months_ago = datetime.utcnow() - timedelta(days=90)
-        recent_matches = (
-            Match.query.filter(
-                (Match.home_team_id == team.id) | (Match.away_team_id == team.id),
-                Match.played == True,
-                Match.match_date >= three_months_ago,
+        return self._get_injury_stats_bulk([team.id])[team.id]
+
+    def _get_injury_stats_bulk(self, team_ids):
+        """Injury statistics for many teams in a single aggregate query"""
+        impact = (Player.skill_rating / 100.0) * (InjuryReport.severity / 10.0)
+
+        def position_impact(positions):
+            return func.sum(case((Player.position.in_(positions), impact), else_=0))
+
+        query = (
+            select(
+                Player.team_id,
+                func.count().label("current_injuries"),
+                func.sum(case((Player.skill_rating >= 70, 1), else_=0)).label(
+                    "key_players_injured"
+                ),
+                func.sum(impact).label("total_impact"),
+                position_impact(["GK"]).label("goalkeeper_injuries"),
+                position_impact(["CB", "LB", "RB"]).label("defense_injuries"),
+                position_impact(["CM", "CDM", "CAM", "LW", "RW"]).label(
+                    "midfield_injuries"
+                ),
+                position_impact(["ST", "CF"]).label("attack_injuries"),
+                func.sum(InjuryReport.severity).label("total_severity"),
             )
-            .order_by(Match.match_date.desc())
-            .all()
+            .join(Player, InjuryReport.player_id == Player.id)
+            .where(Player.team_id.in_(team_ids), InjuryReport.status == "injured")
+            .group_by(Player.team_id)
         )
-
-        if len(recent_matches) < 3:
-            return {
-                "scoring_trend": 0.0,
-                "defensive_trend": 0.0,
-                "form_trend": 0.0,
-                "momentum": 0.0,
+        totals = {row.team_id: row for row in db.session.execute(query)}
+
+        stats = {}
+        for team_id in team_ids:
+            row = totals.get(team_id)
+            if row is None:
+                stats[team_id] = {
+                    "current_injuries": 0,
+                    "key_players_injured": 0,
+                    "total_injury_impact": 0,
+                    "goalkeeper_injuries": 0,
+                    "defense_injuries": 0,
+                    "midfield_injuries": 0,
+                    "attack_injuries": 0,
+                    "injury_severity_avg": 0,
+                }
+                continue
+
+            stats[team_id] = {
+                "current_injuries": int(row.current_injuries),
+                "key_players_injured": int(row.key_players_injured),
+                "total_injury_impact": min(1.0, float(row.total_impact)),  # Cap at 100%
+                "goalkeeper_injuries": float(row.goalkeeper_injuries),
+                "defense_injuries": float(row.defense_injuries),
+                "midfield_injuries": float(row.midfield_injuries),
+                "attack_injuries": float(row.attack_injuries),
+                "injury_severity_avg": float(row.total_severity)
+                / int(row.current_injuries),
             }
+        return stats
 
-        # Divide matches into recent and older periods
-        mid_point = len(recent_matches) // 2
-        recent_period = recent_matches[:mid_point]
-        older_period = recent_matches[mid_point:]
-
-        # Calculate trends
-        def calculate_period_stats(matches):
-            if not matches:
-                return {"goals_for": 0, "goals_against": 0, "points": 0}
-
-            goals_for = goals_against = points = 0
-            for match in matches:
-                if match.home_team_id == team.id:
-                    gf, ga = match.home_score or 0, match.away_score or 0
-                else:
-                    gf, ga = match.away_score or 0, match.home_score or 0
-
-                goals_for += gf
-                goals_against += ga
+    def _calculate_performance_trends(self, team):
+        """Calculate performance trends over time"""
+        return self._calculate_performance_trends_bulk([team.id])[team.id]
 
-                if gf > ga:
-                    points += 3
-                elif gf == ga:
-                    points += 1
+    def _calculate_performance_trends_bulk(self, team_ids):
+        """Performance trends for many teams in a single aggregate query
 
+        Each team's matches from the last 3 months are split into the more
+        recent half (floor(n / 2) matches) and the older rest.
+        """
+        three_months_ago = datetime.utcnow() - timedelta(days=90)
+        rows = self._team_match_rows(team_ids, since=three_months_ago)
+        ranked = select(
+            rows,
+            func.row_number()
+            .over(partition_by=rows.c.team_id, order_by=rows.c.match_date.desc())
+            .label("rank"),
+            func.count().over(partition_by=rows.c.team_id).label("total"),
+        ).subquery()
+
+        is_recent = case((ranked.c.rank * 2 <= ranked.c.total, 1), else_=0)
+        wins, draws, _ = self._result_counts(ranked.c.goals_for, ranked.c.goals_against)
+        query = select(
+            ranked.c.team_id,
+            is_recent.label("is_recent"),
+            func.max(ranked.c.total).label("total"),
+            func.count().label("matches"),
+            func.sum(ranked.c.goals_for).label("goals_for"),
+            func.sum(ranked.c.goals_against).label("goals_against"),
+            wins,
+            draws,
+        ).group_by(ranked.c.team_id, is_recent)
+
+        periods = {}
+        for row in db.session.execute(query):
+            periods.setdefault(row.team_id, {})[bool(row.is_recent)] = row
+
+        def period_stats(row):
+            matches = int(row.matches)
             return {
-                "goals_for": goals_for / len(matches),
-                "goals_against": goals_against / len(matches),
-                "points": points / len(matches),
+                "goals_for": int(row.goals_for) / matches,
+                "goals_against": int(row.goals_against) / matches,
+                "points": (int(row.wins) * 3 + int(row.draws)) / matches,
             }
 
-        recent_stats = calculate_period_stats(recent_period)
-        older_stats = calculate_period_stats(older_period)
-
-        # Calculate trends (positive = improving, negative = declining)
-        scoring_trend = recent_stats["goals_for"] - older_stats["goals_for"]
-        defensive_trend = (
-            older_stats["goals_against"] - recent_stats["goals_against"]
-        )  # Lower goals against is better
-        form_trend = recent_stats["points"] - older_stats["points"]
-
-        # Overall momentum (weighted combination)
-        momentum = scoring_trend * 0.4 + defensive_trend * 0.3 + form_trend * 0.3
-
-        return {
-            "scoring_trend": round(scoring_trend, 2),
-            "defensive_trend": round(defensive_trend, 2),
-            "form_trend": round(form_trend, 2),
-            "momentum": round(momentum, 2),
-        }
+        trends = {}
+        for team_id in team_ids:
+            team_periods = periods.get(team_id, {})
+            total = max((int(row.total) for row in team_periods.values()), default=0)
+            if total < 3:
+                trends[team_id] = {
+                    "scoring_trend": 0.0,
+                    "defensive_trend": 0.0,
+                    "form_trend": 0.0,
+                    "momentum": 0.0,
+                }
+                continue
+
+            recent_stats = period_stats(team_periods[True])
+            older_stats = period_stats(team_periods[False])
+
+            # Calculate trends (positive = improving, negative = declining)
+            scoring_trend = recent_stats["goals_for"] - older_stats["goals_for"]
+            defensive_trend = (
+                older_stats["goals_against"] - recent_stats["goals_against"]
+            )  # Lower goals against is better
+            form_trend = recent_stats["points"] - older_stats["points"]
+
+            # Overall momentum (weighted combination)
+            momentum = scoring_trend * 0.4 + defensive_trend * 0.3 + form_trend * 0.3
+
+            trends[team_id] = {
+                "scoring_trend": round(scoring_trend, 2),
+                "defensive_trend": round(defensive_trend, 2),
+                "form_trend": round(form_trend, 2),
+                "momentum": round(momentum, 2),
+            }
+        return trends
 
-    def _get_head_to_head_stats(self, home_team, away_team):
+    def _get_head_to_head_stats(self, home_team, away_team, limit=10):
         """Get head-to-head statistics between teams"""
-        h2h_matches = (
-            Match.query.filter(
-                (
-                    (Match.home_team_id == home_team.id)
-                    & (Match.away_team_id == away_team.id)
-                )
-                | (
-                    (Match.home_team_id == away_team.id)
-                    & (Match.away_team_id == home_team.id)
-                )
+        totals = self._query_head_to_head_totals(home_team, away_team, limit)
+        return self._head_to_head_from_totals(totals)
+
+    def _query_head_to_head_totals(self, home_team, away_team, limit=10):
+        """Head-to-head totals of the last meetings with one aggregate query"""
+        is_home_side = Match.home_team_id == home_team.id
+        last_meetings = (
+            select(
+                Match.match_date.label("match_date"),
+                case(
+                    (is_home_side, func.coalesce(Match.home_score, 0)),
+                    else_=func.coalesce(Match.away_score, 0),
+                ).label("home_goals"),
+                case(
+                    (is_home_side, func.coalesce(Match.away_score, 0)),
+                    else_=func.coalesce(Match.home_score, 0),
+                ).label("away_goals"),
+            )
+            .where(
+                or_(
+                    and_(
+                        Match.home_team_id == home_team.id,
+                        Match.away_team_id == away_team.id,
+                    ),
+                    and_(
+                        Match.home_team_id == away_team.id,
+                        Match.away_team_id == home_team.id,
+                    ),
+                ),
+                Match.played == True,
             )
-            .filter(Match.played == True)
             .order_by(Match.match_date.desc())
-            .limit(10)
-            .all()
+            .limit(limit)
+            .subquery()
         )
+        home_wins, draws, away_wins = self._result_counts(
+            last_meetings.c.home_goals, last_meetings.c.away_goals
+        )
+        row = db.session.execute(
+            select(
+                func.count().label("total_matches"),
+                home_wins,
+                draws,
+                away_wins,
+                func.sum(last_meetings.c.home_goals).label("total_goals_home"),
+                func.sum(last_meetings.c.away_goals).label("total_goals_away"),
+                func.max(last_meetings.c.match_date).label("last_meeting"),
+            )
+        ).one()
+
+        return {
+            "total_matches": int(row.total_matches),
+            "home_team_wins": int(row.wins or 0),
+            "away_team_wins": int(row.losses or 0),
+            "draws": int(row.draws or 0),
+            "total_goals_home": int(row.total_goals_home or 0),
+            "total_goals_away": int(row.total_goals_away or 0),
+            "last_meeting": row.last_meeting,
+        }
 
-        if not h2h_matches:
+    @staticmethod
+    def _head_to_head_from_totals(totals):
+        """Build head-to-head statistics from meeting totals"""
+        total_matches = totals["total_matches"]
+        if not total_matches:
             return {
                 "total_matches": 0,
                 "home_team_wins": 0,
@@ -361,37 +481,19 @@ class DataProcessor:
             }
 
         stats = {
-            "total_matches": len(h2h_matches),
-            "home_team_wins": 0,
-            "away_team_wins": 0,
-            "draws": 0,
-            "total_goals_home": 0,
-            "total_goals_away": 0,
+            key: totals[key]
+            for key in [
+                "total_matches",
+                "home_team_wins",
+                "away_team_wins",
+                "draws",
+                "total_goals_home",
+                "total_goals_away",
+            ]
         }
-
-        for match in h2h_matches:
-            if match.home_team_id == home_team.id:
-                # home_team was playing at home
-                home_goals = match.home_score or 0
-                away_goals = match.away_score or 0
-            else:
-                # home_team was playing away
-                home_goals = match.away_score or 0
-                away_goals = match.home_score or 0
-
-            stats["total_goals_home"] += home_goals
-            stats["total_goals_away"] += away_goals
-
-            if home_goals > away_goals:
-                stats["home_team_wins"] += 1
-            elif home_goals < away_goals:
-                stats["away_team_wins"] += 1
-            else:
-                stats["draws"] += 1
-
-        stats["avg_goals_home"] = stats["total_goals_home"] / len(h2h_matches)
-        stats["avg_goals_away"] = stats["total_goals_away"] / len(h2h_matches)
-        stats["last_meeting"] = h2h_matches[0].match_date if h2h_matches else None
+        stats["avg_goals_home"] = stats["total_goals_home"] / total_matches
+        stats["avg_goals_away"] = stats["total_goals_away"] / total_matches
+        stats["last_meeting"] = totals["last_meeting"]
 
         # Calculate home team dominance (0-1 scale)
         total_points_home = stats["home_team_wins"] * 3 + stats["draws"]
@@ -418,66 +520,40 @@ class DataProcessor:
         """Calculate comprehensive team statistics for display"""
         stats = self._get_team_features(team, is_home=True)
 
-        # Additional display statistics
-        all_matches = Match.query.filter(
-            (Match.home_team_id == team.id) | (Match.away_team_id == team.id),
-            Match.played == True,
-        ).all()
-
-        if all_matches:
-            total_matches = len(all_matches)
-            wins = draws = losses = 0
-            goals_for = goals_against = 0
-
-            for match in all_matches:
-                if match.home_team_id == team.id:
-                    gf, ga = match.home_score or 0, match.away_score or 0
-                else:
-                    gf, ga = match.away_score or 0, match.home_score or 0
-
-                goals_for += gf
-                goals_against += ga
-
-                if gf > ga:
-                    wins += 1
-                elif gf == ga:
-                    draws += 1
-                else:
-                    losses += 1
-
-            stats.update(
-                {
-                    "total_matches_played": total_matches,
-                    "total_wins": wins,
-                    "total_draws": draws,
-                    "total_losses": losses,
-                    "total_goals_for": goals_for,
-                    "total_goals_against": goals_against,
-                    "win_percentage": (wins / total_matches) * 100
-                    if total_matches > 0
-                    else 0,
-                    "avg_goals_per_match": goals_for / total_matches
-                    if total_matches > 0
-                    else 0,
-                    "goals_conceded_per_match": goals_against / total_matches
-                    if total_matches > 0
-                    else 0,
-                }
-            )
-        else:
-            stats.update(
-                {
-                    "total_matches_played": 0,
-                    "total_wins": 0,
-                    "total_draws": 0,
-                    "total_losses": 0,
-                    "total_goals_for": 0,
-                    "total_goals_against": 0,
-                    "win_percentage": 0,
-                    "avg_goals_per_match": 0,
-                    "goals_conceded_per_match": 0,
-                }
+        # Additional display statistics over all played matches
+        rows = self._team_match_rows([team.id])
+        totals = db.session.execute(
+            select(
+                func.count().label("matches"),
+                func.sum(rows.c.goals_for).label("goals_for"),
+                func.sum(rows.c.goals_against).label("goals_against"),
+                *self._result_counts(rows.c.goals_for, rows.c.goals_against),
             )
+        ).one()
+
+        total_matches = int(totals.matches)
+        goals_for = int(totals.goals_for or 0)
+        goals_against = int(totals.goals_against or 0)
+        wins = int(totals.wins or 0)
+        stats.update(
+            {
+                "total_matches_played": total_matches,
+                "total_wins": wins,
+                "total_draws": int(totals.draws or 0),
+                "total_losses": int(totals.losses or 0),
+                "total_goals_for": goals_for,
+                "total_goals_against": goals_against,
+                "win_percentage": (wins / total_matches) * 100
+                if total_matches > 0
+                else 0,
+                "avg_goals_per_match": goals_for / total_matches
+                if total_matches > 0
+                else 0,
+                "goals_conceded_per_match": goals_against / total_matches
+                if total_matches > 0
+                else 0,
+            }
+        )
 
         return stats
 
@@ -1,8 +1,25 @@
 from app import db
-from app.models import Team, Player, Match, Injury, TeamStatistics, Prediction
+from config import Config
+from app.models import (
+    Team,
+    Player,
+    Match,
+    Injury,
+    TeamStatistics,
+    TeamMatchLog,
+    Prediction,
+)
+from app.services.head_to_head_index import head_to_head_index
+from app.services.match_queries import recent_team_matches, team_match_sides
 from datetime import datetime, timedelta
+import logging
 import random
 
+import numpy as np
+from sqlalchemy import func, select, union_all
+
+logger = logging.getLogger(__name__)
+
 
 def initialize_sample_data():
     """Initialize the database with sample teams and data"""
@@ -315,21 +332,24 @@ def initialize_sample_data():
 
 def get_team_recent_form(team_id, limit=5):
     """Get recent form for a team"""
-    recent_matches = (
-        Match.query.filter(
-            (Match.home_team_id == team_id) | (Match.away_team_id == team_id)
-        )
-        .filter(Match.is_played == True)
-        .order_by(Match.match_date.desc())
-        .limit(limit)
-        .all()
+    if Config.USE_TEAM_MATCH_LOG:
+        query = recent_team_matches(team_id, limit=limit, use_log=True)
+    else:
+        query = team_match_sides(Match, team_id, Match.is_played == True, limit=limit)
+    recent_matches = db.session.execute(query).all()
+
+    # Opponent names in one query instead of a lazy load per match
+    opponent_ids = {match.opponent_id for match in recent_matches}
+    opponent_names = dict(
+        db.session.query(Team.id, Team.name).filter(Team.id.in_(opponent_ids)).all()
+        if opponent_ids
+        else []
     )
 
     form_data = []
     for match in recent_matches:
-        is_home = match.home_team_id == team_id
-        team_goals = match.home_goals if is_home else match.away_goals
-        opp_goals = match.away_goals if is_home else match.home_goals
+        team_goals = match.goals_for
+        opp_goals = match.goals_against
 
         if team_goals > opp_goals:
             result = "W"
@@ -341,10 +361,10 @@ def get_team_recent_form(team_id, limit=5):
         form_data.append(
             {
                 "date": match.match_date.strftime("%Y-%m-%d"),
-                "opponent": match.away_team.name if is_home else match.home_team.name,
+                "opponent": opponent_names.get(match.opponent_id),
                 "result": result,
                 "score": f"{team_goals}-{opp_goals}",
-                "is_home": is_home,
+                "is_home": bool(match.is_home),
             }
         )
 
@@ -352,7 +372,48 @@ def get_team_recent_form(team_id, limit=5):
 
 
 def get_head_to_head_stats(home_team_id, away_team_id, limit=10):
-    """Get head-to-head statistics between two teams"""
+    """Get head-to-head statistics between two teams
+
+    Served from the in-memory head-to-head index, which picks up results
+    saved by other processes at most once per sync interval; falls back to
+    the database when the index is unavailable or holds fewer meetings.
+    """
+    if limit <= head_to_head_index.max_meetings:
+        try:
+            head_to_head_index.sync(db.session)
+            h2h = head_to_head_index.get_head_to_head(home_team_id, away_team_id, limit)
+            return _format_head_to_head_stats(h2h)
+        except Exception as e:
+            logger.warning(f"Head-to-head index unavailable, querying database: {e}")
+
+    return _query_head_to_head_stats(home_team_id, away_team_id, limit)
+
+
+def _format_head_to_head_stats(h2h):
+    """Shape head-to-head index output like _query_head_to_head_stats"""
+    total_matches = h2h["total_matches"]
+    return {
+        "total_matches": total_matches,
+        "home_wins": h2h["home_wins"],
+        "draws": h2h["draws"],
+        "away_wins": h2h["away_wins"],
+        "home_win_percentage": (h2h["home_wins"] / max(total_matches, 1)) * 100,
+        "away_win_percentage": (h2h["away_wins"] / max(total_matches, 1)) * 100,
+        "average_home_goals": h2h["home_goals"] / max(total_matches, 1),
+        "average_away_goals": h2h["away_goals"] / max(total_matches, 1),
+        "matches": [
+            {
+                "date": meeting["date"].strftime("%Y-%m-%d"),
+                "score": f"{meeting['home_goals']}-{meeting['away_goals']}",
+                "result": meeting["result"],
+            }
+            for meeting in h2h["meetings"]
+        ],
+    }
+
+
+def _query_head_to_head_stats(home_team_id, away_team_id, limit=10):
+    """Get head-to-head statistics between two teams from the database"""
     h2h_matches = (
         Match.query.filter(
             (
@@ -422,47 +483,96 @@ def get_head_to_head_stats(home_team_id, away_team_id, limit=10):
 
 def update_team_form(team_id):
     """Update team's current form based on recent matches"""
-    recent_matches = (
-        Match.query.filter(
-            (Match.home_team_id == team_id) | (Match.away_team_id == team_id)
-        )
-        .filter(Match.is_played == True)
-        .order_by(Match.match_date.desc())
-        .limit(5)
-        .all()
-    )
+    return update_team_forms([team_id])[team_id]
 
-    if not recent_matches:
-        return 50.0  # Default form
 
-    form_points = 0
-    total_matches = len(recent_matches)
+def update_team_forms(team_ids=None, limit=5):
+    """Update current form of many teams in one query and one transaction
 
-    for i, match in enumerate(recent_matches):
-        is_home = match.home_team_id == team_id
-        team_goals = match.home_goals if is_home else match.away_goals
-        opp_goals = match.away_goals if is_home else match.home_goals
+    Each team's last `limit` played matches are selected with a single
+    ROW_NUMBER window over team partitions; the weighted form (most recent
+    match = 1.0, each older one 0.1 less) is computed for all teams at once
+    and written back with one bulk update.
 
-        # Calculate points for this match
-        if team_goals > opp_goals:
-            points = 3  # Win
-        elif team_goals == opp_goals:
-            points = 1  # Draw
-        else:
-            points = 0  # Loss
+    Args:
+        team_ids: Teams to update (None for every team with a played match)
+        limit: Number of recent matches per team
 
-        # Weight recent matches more heavily
-        weight = 1.0 - (i * 0.1)  # Most recent = 1.0, oldest = 0.6
-        form_points += points * weight
+    Returns:
+        dict: team id -> form percentage (50.0 for teams without matches,
+        which are left unchanged)
+    """
+
+    if Config.USE_TEAM_MATCH_LOG:
+        rows = select(
+            TeamMatchLog.team_id,
+            TeamMatchLog.match_date,
+            TeamMatchLog.goals_for,
+            TeamMatchLog.goals_against,
+        )
+        if team_ids is not None:
+            rows = rows.where(TeamMatchLog.team_id.in_(team_ids))
+        rows = rows.subquery()
+    else:
+
+        def side(team_column, goals_for, goals_against):
+            query = select(
+                team_column.label("team_id"),
+                Match.match_date.label("match_date"),
+                goals_for.label("goals_for"),
+                goals_against.label("goals_against"),
+            ).where(Match.is_played == True)
+            if team_ids is not None:
+                query = query.where(team_column.in_(team_ids))
+            return query
+
+        rows = union_all(
+            side(Match.home_team_id, Match.home_goals, Match.away_goals),
+            side(Match.away_team_id, Match.away_goals, Match.home_goals),
+        ).subquery()
+    ranked = select(
+        rows,
+        func.row_number()
+        .over(partition_by=rows.c.team_id, order_by=rows.c.match_date.desc())
+        .label("rank"),
+    ).subquery()
+    recent = db.session.execute(
+        select(
+            ranked.c.team_id,
+            ranked.c.rank,
+            ranked.c.goals_for,
+            ranked.c.goals_against,
+        ).where(ranked.c.rank <= limit)
+    ).all()
+
+    forms = {team_id: 50.0 for team_id in team_ids or []}  # Default form
+    if not recent:
+        return forms
+
+    team_column, rank, goals_for, goals_against = (
+        np.asarray(column) for column in zip(*recent)
+    )
+    points = np.select(
+        [goals_for > goals_against, goals_for == goals_against], [3, 1], default=0
+    )
+
+    # Weight recent matches more heavily (most recent = 1.0, oldest = 0.6)
+    weight = 1.0 - (rank - 1) * 0.1
+    teams, positions = np.unique(team_column, return_inverse=True)
+    form_points = np.bincount(positions, weights=points * weight)
+    max_possible_points = np.bincount(positions, weights=3 * weight)
 
     # Convert to 0-100 scale
-    max_possible_points = sum(3 * (1.0 - i * 0.1) for i in range(total_matches))
-    form_percentage = (form_points / max_possible_points) * 100
+    form_percentages = (form_points / max_possible_points) * 100
+    updated = {
+        int(team_id): float(form) for team_id, form in zip(teams, form_percentages)
+    }
 
-    # Update team's current form
-    team = Team.query.get(team_id)
-    if team:
-        team.current_form = form_percentage
-        db.session.commit()
+    db.session.bulk_update_mappings(
+        Team,
+        [{"id": team_id, "current_form": form} for team_id, form in updated.items()],
+    )
+    db.session.commit()
 
-    return form_percentage
+    forms.update(updated)
+    return forms
@@ -3,20 +3,69 @@ import json
 import time
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Union, Any
+from types import SimpleNamespace
+from typing import Dict, List, NamedTuple, Optional, Union, Any
+from urllib.parse import urlsplit
 
 import requests
 from flask import current_app
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
 
 from app import db
-from app.models import Team, Match, Player
+from app.models import Team, Match, MatchStatus, Player
+from app.services.bulk_upsert import classify_rows, fetch_existing, upsert_rows
+from app.services.http_client import http_client, run_sync
+from app.services.match_ingest import apply_match_changes
 from config import Config
 
 # Logging configuration
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Team columns written from the API payload
+TEAM_SYNC_COLUMNS = [
+    "name",
+    "short_name",
+    "logo",
+    "founded",
+    "country",
+]
+
+# Match columns written from the API payload (league_id only when given)
+MATCH_SYNC_COLUMNS = [
+    "home_team_id",
+    "away_team_id",
+    "match_date",
+    "status",
+    "home_goals",
+    "away_goals",
+    "half_time_home_goals",
+    "half_time_away_goals",
+]
+
+# football-data.org match statuses mapped to MatchStatus
+API_MATCH_STATUSES = {
+    "SCHEDULED": MatchStatus.SCHEDULED,
+    "TIMED": MatchStatus.TIMED,
+    "IN_PLAY": MatchStatus.IN_PLAY,
+    "PAUSED": MatchStatus.IN_PLAY,
+    "FINISHED": MatchStatus.FINISHED,
+    "AWARDED": MatchStatus.FINISHED,
+    "POSTPONED": MatchStatus.POSTPONED,
+    "SUSPENDED": MatchStatus.POSTPONED,
+    "CANCELLED": MatchStatus.CANCELLED,
+}
+
+
+class SyncResult(NamedTuple):
+    """Row counts of a sync run."""
+
+    added: int
+    updated: int
+    unchanged: int
+    skipped: int = 0
+
 
 class FootballAPI:
     """Football API integration class for fetching and processing football data."""
@@ -33,28 +82,50 @@ class FootballAPI:
         self.headers = {"X-Auth-Token": self.api_key} if self.api_key else {}
         self.rate_limit_remaining = 10
         self.rate_limit_reset = 60
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.http = http_client
 
-    def _make_request(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+    def _make_request(
+        self, endpoint: str, params: Optional[Dict] = None, raise_errors: bool = False
+    ) -> Dict:
         """Make a request to the Football API.
 
+        Blocking wrapper around `_make_request_async`.
+
         Args:
             endpoint: API endpoint (e.g., 'competitions/PL/teams')
             params: Query parameters for the request
+            raise_errors: Re-raise request errors instead of returning {}
+
+        Returns:
+            dict: JSON response from the API
+        """
+        return run_sync(self._make_request_async(endpoint, params, raise_errors))
+
+    async def _make_request_async(
+        self, endpoint: str, params: Optional[Dict] = None, raise_errors: bool = False
+    ) -> Dict:
+        """Make a request to the Football API on the shared async HTTP client.
+
+        Args:
+            endpoint: API endpoint (e.g., 'competitions/PL/teams')
+            params: Query parameters for the request
+            raise_errors: Re-raise request errors instead of returning {}
 
         Returns:
             dict: JSON response from the API
         """
         if not self.api_key:
+            if raise_errors:
+                raise ValueError("No API key provided.")
             logger.warning("No API key provided. Using sample data.")
             return {}
 
         url = f"{self.base_url}/{endpoint}"
 
         try:
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
+            response = await self.http.get(
+                url, headers=self.headers, params=params, timeout=10
+            )
 
             # Update rate limit info
             self.rate_limit_remaining = int(
@@ -63,11 +134,16 @@ class FootballAPI:
             self.rate_limit_reset = int(
                 response.headers.get("X-RequestCounter-Reset", 60)
             )
+            self.http.limiter(urlsplit(url).netloc).update(
+                self.rate_limit_remaining, self.rate_limit_reset
+            )
 
             return response.json()
 
         except requests.exceptions.RequestException as e:
             logger.error(f"API request failed: {e}")
+            if raise_errors:
+                raise
             return {}
 
     def get_competitions(self) -> List[Dict]:
@@ -100,6 +176,8 @@ class FootballAPI:
         date_from: str = None,
         date_to: str = None,
         limit: int = 10,
+        season: int = None,
+        raise_errors: bool = False,
     ) -> List[Dict]:
         """Get matches based on filters.
 
@@ -110,6 +188,8 @@ class FootballAPI:
             date_from: Start date (YYYY-MM-DD)
             date_to: End date (YYYY-MM-DD)
             limit: Maximum number of matches to return
+            season: Season start year
+            raise_errors: Re-raise request errors instead of returning []
 
         Returns:
             list: List of match dictionaries
@@ -130,8 +210,10 @@ class FootballAPI:
             params["dateTo"] = date_to
         if limit:
             params["limit"] = limit
+        if season:
+            params["season"] = season
 
-        return self._make_request(endpoint, params).get("matches", [])
+        return self._make_request(endpoint, params, raise_errors).get("matches", [])
 
     def get_team(self, team_id: int) -> Dict:
         """Get team details by ID.
@@ -158,61 +240,279 @@ class FootballAPI:
         endpoint = f"competitions/{competition_code}/standings"
         return self._make_request(endpoint, params).get("standings", [])
 
-    def sync_teams_to_db(
-        self, competition_code: str, season: int = None
-    ) -> Tuple[int, int]:
+    @staticmethod
+    def _team_values(team_data: Dict, current: Optional[Dict] = None) -> Dict:
+        """Map an API team onto team columns, keeping stored values for missing keys."""
+        current = current or {}
+        return {
+            "api_id": team_data["id"],
+            "name": team_data["name"],
+            "short_name": team_data.get("shortName", current.get("short_name") or ""),
+            "logo": team_data.get("crest", current.get("logo") or ""),
+            "founded": team_data.get("founded", current.get("founded")),
+            "country": (team_data.get("area") or {}).get(
+                "name", current.get("country") or ""
+            ),
+        }
+
+    @staticmethod
+    def _resolve_team_names(added: List[Dict], updated: List[Dict]):
+        """Check new and changed teams against the unique team name.
+
+        A new team whose name belongs to a stored team without an api_id
+        (e.g. one created before syncing) is matched to that team. Teams whose
+        name belongs to a team with another api_id, or repeats in the payload,
+        are skipped.
+
+        Returns:
+            tuple: (rows to upsert, rows to update by id, skipped rows)
+        """
+        names = {row["name"] for row in added + updated}
+        owners = {
+            name: (team_id, api_id)
+            for name, team_id, api_id in db.session.query(
+                Team.name, Team.id, Team.api_id
+            ).filter(Team.name.in_(names))
+        }
+
+        upserts, adopted, skipped = [], [], []
+        claimed = set()
+        for is_new, rows in ((True, added), (False, updated)):
+            for row in rows:
+                owner_id, owner_api_id = owners.get(row["name"], (None, row["api_id"]))
+                if row["name"] in claimed:
+                    skipped.append(row)
+                elif owner_api_id is None and is_new:
+                    adopted.append(dict(row, id=owner_id))
+                elif owner_api_id != row["api_id"]:
+                    skipped.append(row)
+                else:
+                    upserts.append(row)
+                claimed.add(row["name"])
+        return upserts, adopted, skipped
+
+    def sync_teams_to_db(self, competition_code: str, season: int = None) -> SyncResult:
         """Sync teams from API to database.
 
+        Existing teams are read with a single IN query on api_id and only new
+        or changed teams are written, with one bulk upsert. A new team whose
+        name is already stored without an api_id takes over that row; teams
+        whose name belongs to another api_id are skipped and logged.
+
         Args:
             competition_code: Competition code
             season: Season year
 
         Returns:
-            tuple: (number_of_teams_added, number_of_teams_updated)
+            SyncResult: Counts of added, updated, unchanged and skipped teams
         """
         try:
-            teams_data = self.get_teams(competition_code, season)
-            added = 0
-            updated = 0
-
-            for team_data in teams_data:
-                team = Team.query.filter_by(api_id=team_data["id"]).first()
-
-                if not team:
-                    team = Team(
-                        api_id=team_data["id"],
-                        name=team_data["name"],
-                        short_name=team_data.get("shortName", ""),
-                        tla=team_data.get("tla", ""),
-                        crest_url=team_data.get("crest", ""),
-                        venue=team_data.get("venue", ""),
-                        founded=team_data.get("founded"),
-                        country=team_data.get("area", {}).get("name", ""),
-                    )
-                    db.session.add(team)
-                    added += 1
-                else:
-                    team.name = team_data["name"]
-                    team.short_name = team_data.get("shortName", team.short_name or "")
-                    team.tla = team_data.get("tla", team.tla or "")
-                    team.crest_url = team_data.get("crest", team.crest_url or "")
-                    team.venue = team_data.get("venue", team.venue or "")
-                    team.founded = team_data.get("founded", team.founded)
-                    team.country = team_data.get("area", {}).get(
-                        "name", team.country or ""
-                    )
-                    updated += 1
-
+            teams_data = {
+                team["id"]: team for team in self.get_teams(competition_code, season)
+            }
+            table = Team.__table__
+            existing = fetch_existing(
+                db.session, table, "api_id", teams_data, TEAM_SYNC_COLUMNS
+            )
+            rows = [
+                self._team_values(team_data, existing.get(api_id))
+                for api_id, team_data in teams_data.items()
+            ]
+            added, updated, unchanged = classify_rows(
+                rows, existing, "api_id", TEAM_SYNC_COLUMNS
+            )
+            upserts, adopted, skipped = self._resolve_team_names(added, updated)
+            if skipped:
+                logger.warning(
+                    "Skipped teams whose name belongs to another team: "
+                    f"{sorted(row['name'] for row in skipped)}"
+                )
+
+            now = datetime.utcnow()
+            upsert_rows(
+                db.session,
+                table,
+                [dict(row, updated_at=now) for row in upserts],
+                ["api_id"],
+                TEAM_SYNC_COLUMNS + ["updated_at"],
+            )
+            if adopted:
+                db.session.execute(
+                    update(Team), [dict(row, updated_at=now) for row in adopted]
+                )
             db.session.commit()
-            return added, updated
+
+            new = sum(1 for row in upserts if row["api_id"] not in existing)
+            result = SyncResult(
+                new, len(upserts) - new + len(adopted), len(unchanged), len(skipped)
+            )
+            logger.info(f"Synced teams for {competition_code}: {result}")
+            return result
 
         except SQLAlchemyError as e:
             db.session.rollback()
             logger.error(f"Database error while syncing teams: {e}")
-            return 0, 0
+            return SyncResult(0, 0, 0)
         except Exception as e:
             logger.error(f"Error syncing teams: {e}")
-            return 0, 0
+            return SyncResult(0, 0, 0)
+
+    @staticmethod
+    def _match_values(
+        match_data: Dict, team_ids: Dict[int, int], league_id: int = None
+    ) -> Optional[Dict]:
+        """Map an API match onto match columns.
+
+        Returns None when either team is not in the database yet.
+        """
+        home_team_id = team_ids.get((match_data.get("homeTeam") or {}).get("id"))
+        away_team_id = team_ids.get((match_data.get("awayTeam") or {}).get("id"))
+        if home_team_id is None or away_team_id is None:
+            return None
+
+        score = match_data.get("score") or {}
+        full_time = score.get("fullTime") or {}
+        half_time = score.get("halfTime") or {}
+        values = {
+            "api_id": match_data["id"],
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "match_date": datetime.fromisoformat(
+                match_data["utcDate"].replace("Z", "+00:00")
+            ).replace(tzinfo=None),
+            "status": API_MATCH_STATUSES.get(
+                match_data.get("status"), MatchStatus.SCHEDULED
+            ),
+            "home_goals": full_time.get("home"),
+            "away_goals": full_time.get("away"),
+            "half_time_home_goals": half_time.get("home"),
+            "half_time_away_goals": half_time.get("away"),
+        }
+        if league_id is not None:
+            values["league_id"] = league_id
+        return values
+
+    def upsert_matches(
+        self, matches_data: List[Dict], league_id: int = None
+    ) -> SyncResult:
+        """Write API matches to the database with a single bulk upsert.
+
+        Existing matches and the local ids of both teams are each read with
+        one IN query. New and changed matches are upserted on api_id and
+        passed to the derived stores (team statistics, team match log, H2H
+        index, prediction cache), since the bulk write bypasses the ORM
+        events. The caller commits.
+
+        Args:
+            matches_data: Matches as returned by the API
+            league_id: Local league id to store on the matches (optional)
+
+        Returns:
+            SyncResult: Counts of added, updated, unchanged and skipped matches
+        """
+        matches_data = list({match["id"]: match for match in matches_data}.values())
+        team_api_ids = {
+            (match.get(side) or {}).get("id")
+            for match in matches_data
+            for side in ("homeTeam", "awayTeam")
+        }
+        team_ids = dict(
+            db.session.query(Team.api_id, Team.id).filter(
+                Team.api_id.in_(team_api_ids - {None})
+            )
+        )
+
+        rows = []
+        for match_data in matches_data:
+            values = self._match_values(match_data, team_ids, league_id)
+            if values is not None:
+                rows.append(values)
+        skipped = len(matches_data) - len(rows)
+
+        columns = MATCH_SYNC_COLUMNS + (["league_id"] if league_id is not None else [])
+        table = Match.__table__
+        existing = fetch_existing(
+            db.session,
+            table,
+            "api_id",
+            [row["api_id"] for row in rows],
+            ["id", "league_id", *MATCH_SYNC_COLUMNS],
+        )
+        added, updated, unchanged = classify_rows(rows, existing, "api_id", columns)
+
+        now = datetime.utcnow()
+        changed = [dict(row, updated_at=now) for row in added + updated]
+        upsert_rows(db.session, table, changed, ["api_id"], columns + ["updated_at"])
+
+        if changed:
+            match_ids = dict(
+                db.session.query(Match.api_id, Match.id).filter(
+                    Match.api_id.in_([row["api_id"] for row in changed])
+                )
+            )
+            changes = []
+            for row in changed:
+                old = existing.get(row["api_id"])
+                new = SimpleNamespace(
+                    **{
+                        "league_id": None,
+                        **(old or {}),
+                        **row,
+                        "id": match_ids[row["api_id"]],
+                    }
+                )
+                changes.append((SimpleNamespace(**old) if old else None, new))
+            apply_match_changes(db.session, changes)
+
+        return SyncResult(len(added), len(updated), len(unchanged), skipped)
+
+    def sync_matches_to_db(
+        self,
+        competition_code: str,
+        season: int = None,
+        status: str = None,
+        date_from: str = None,
+        date_to: str = None,
+        league_id: int = None,
+    ) -> SyncResult:
+        """Sync matches of a competition from API to database.
+
+        Teams must be synced first; matches with unknown teams are skipped.
+
+        Args:
+            competition_code: Competition code
+            season: Season year
+            status: Filter by match status
+            date_from: Start date (YYYY-MM-DD)
+            date_to: End date (YYYY-MM-DD)
+            league_id: Local league id to store on the matches (optional)
+
+        Returns:
+            SyncResult: Counts of added, updated, unchanged and skipped matches
+        """
+        try:
+            matches_data = self.get_matches(
+                competition_code,
+                status=status,
+                date_from=date_from,
+                date_to=date_to,
+                limit=None,
+                season=season,
+            )
+            result = self.upsert_matches(matches_data, league_id)
+            db.session.commit()
+
+            logger.info(f"Synced matches for {competition_code}: {result}")
+            return result
+
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Database error while syncing matches: {e}")
+            return SyncResult(0, 0, 0)
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Error syncing matches: {e}")
+            return SyncResult(0, 0, 0)
 
 
 # Singleton instance
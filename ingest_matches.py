@@ -0,0 +1,69 @@
+import argparse
+import logging
+from app import create_app, db
+from app.services.match_ingest import MatchIngestionPipeline
+from football_api import football_api
+
+# Uygulama bağlamını oluştur
+app = create_app()
+app.app_context().push()
+
+# Loglama ayarı
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# football-data.org ücretsiz katmanındaki sekiz lig
+DEFAULT_COMPETITIONS = ["PL", "PD", "BL1", "SA", "FL1", "DED", "PPL", "ELC"]
+
+
+def ingest_matches(competitions, seasons=None, force=False):
+    """Maçları aktarır: sezon verilirse geçmiş sezonları, aksi halde artımlı
+
+    Yarıda kesilen çalıştırma aynı komutla yeniden başlatıldığında kaldığı
+    yerden devam eder.
+    """
+    pipeline = MatchIngestionPipeline(football_api, db.session)
+
+    if seasons:
+        summary = pipeline.backfill(competitions, seasons, force=force)
+    else:
+        summary = {}
+        for competition in competitions:
+            try:
+                summary[competition] = pipeline.sync(competition)
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"{competition} aktarılırken hata oluştu: {str(e)}")
+                summary[competition] = {"error": str(e)}
+
+    for competition, totals in summary.items():
+        logger.info(f"{competition}: {totals}")
+    return all("error" not in totals for totals in summary.values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maçları API'den veritabanına aktarır")
+    parser.add_argument(
+        "--competitions",
+        nargs="+",
+        default=DEFAULT_COMPETITIONS,
+        help="Yarışma kodları (varsayılan: sekiz büyük lig)",
+    )
+    parser.add_argument(
+        "--seasons",
+        nargs="+",
+        type=int,
+        default=None,
+        help="Geçmiş sezonların başlangıç yılları (Örn: 2020 2021 2022 2023 2024)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Daha önce tamamlanan sezon aralığını yeniden aktar",
+    )
+    args = parser.parse_args()
+
+    success = ingest_matches(args.competitions, args.seasons, args.force)
+    raise SystemExit(0 if success else 1)
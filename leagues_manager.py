@@ -1,6 +1,7 @@
 from app.models import Team, Match, Player
 from app import db
-import requests
+from app.services.http_client import http_client, run_sync
+import asyncio
 import os
 
 
@@ -81,7 +82,11 @@ class LeaguesManager:
         return list(self.supported_leagues.keys())
 
     def get_league_teams(self, league_name):
-        """Get teams from a specific league"""
+        """Get teams from a specific league (blocking wrapper)"""
+        return run_sync(self.get_league_teams_async(league_name))
+
+    async def get_league_teams_async(self, league_name):
+        """Get teams from a specific league on the shared async HTTP client"""
         if league_name not in self.supported_leagues:
             return self._get_sample_teams_for_league(league_name)
 
@@ -93,16 +98,13 @@ class LeaguesManager:
         try:
             # Get teams from specific league
             teams_url = f"{self.base_url}/competitions/{league_info['api_id']}/teams"
-            response = requests.get(teams_url, headers=self.headers, timeout=10)
-
-            if response.status_code == 200:
-                teams_data = response.json()["teams"]
-                return self._process_league_teams(
-                    teams_data, league_name, league_info["country"]
-                )
-            else:
-                print(f"API Error for {league_name}: {response.status_code}")
-                return self._get_sample_teams_for_league(league_name)
+            response = await http_client.get(
+                teams_url, headers=self.headers, timeout=10
+            )
+            teams_data = response.json()["teams"]
+            return self._process_league_teams(
+                teams_data, league_name, league_info["country"]
+            )
 
         except Exception as e:
             print(f"Exception getting {league_name} teams: {e}")
@@ -482,13 +484,24 @@ class LeaguesManager:
 
         return sample_teams.get(league_name, [])
 
+    async def _get_all_league_teams(self):
+        """Fetch the teams of all supported leagues concurrently"""
+        league_names = list(self.supported_leagues)
+        results = await asyncio.gather(
+            *(self.get_league_teams_async(name) for name in league_names)
+        )
+        return dict(zip(league_names, results))
+
     def update_all_leagues(self):
-        """Update teams from all supported leagues"""
+        """Update teams from all supported leagues
+
+        All leagues are fetched concurrently, so the refresh takes as long as
+        the slowest request; database writes then run in order.
+        """
         total_updated = 0
 
-        for league_name in self.supported_leagues:
+        for league_name, teams_data in run_sync(self._get_all_league_teams()).items():
             print(f"Updating {league_name}...")
-            teams_data = self.get_league_teams(league_name)
 
             for team_data in teams_data:
                 existing_team = Team.query.filter_by(name=team_data["name"]).first()
@@ -0,0 +1,56 @@
+"""Team match covering indexes
+
+Revision ID: 4b7e2c91d5a3
+Revises: 9f6d052021be
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "4b7e2c91d5a3"
+down_revision = "9f6d052021be"
+branch_labels = None
+depends_on = None
+
+
+# Takım bakış açısıyla son maç sorguları (UNION ALL'un her tarafı) için
+# (takım, durum, tarih) indeksleri; rakip ve goller de anahtarın sonunda
+# tutulduğundan sorgu tabloya gitmeden indeksten okunur. Match modelindeki
+# tanımlarla aynıdır.
+TEAM_MATCH_INDEXES = {
+    "idx_matches_home_team_status_date": (
+        "home_team_id",
+        ["away_team_id", "home_goals", "away_goals"],
+    ),
+    "idx_matches_away_team_status_date": (
+        "away_team_id",
+        ["home_team_id", "home_goals", "away_goals"],
+    ),
+}
+
+
+def _match_date_column():
+    # Model `match_date` kullanır; ilk migration şemasında sütun `match_datetime`
+    columns = {
+        column["name"] for column in sa.inspect(op.get_bind()).get_columns("matches")
+    }
+    return "match_date" if "match_date" in columns else "match_datetime"
+
+
+def upgrade():
+    match_date = _match_date_column()
+    for name, (team_column, covered) in TEAM_MATCH_INDEXES.items():
+        op.create_index(
+            name,
+            "matches",
+            [team_column, "status", match_date] + covered,
+            unique=False,
+        )
+
+
+def downgrade():
+    for name in reversed(list(TEAM_MATCH_INDEXES)):
+        op.drop_index(name, table_name="matches")
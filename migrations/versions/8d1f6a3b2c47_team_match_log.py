@@ -0,0 +1,55 @@
+"""Team match log table
+
+Revision ID: 8d1f6a3b2c47
+Revises: 4b7e2c91d5a3
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "8d1f6a3b2c47"
+down_revision = "4b7e2c91d5a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "team_match_log",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("match_id", sa.Integer(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=False),
+        sa.Column("opponent_id", sa.Integer(), nullable=False),
+        sa.Column("league_id", sa.Integer(), nullable=True),
+        sa.Column("match_date", sa.DateTime(), nullable=False),
+        sa.Column("is_home", sa.Boolean(), nullable=False),
+        sa.Column("goals_for", sa.Integer(), nullable=False),
+        sa.Column("goals_against", sa.Integer(), nullable=False),
+        sa.Column("result", sa.String(length=1), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["match_id"], ["matches.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"]),
+        sa.ForeignKeyConstraint(["opponent_id"], ["teams.id"]),
+        sa.ForeignKeyConstraint(["league_id"], ["leagues.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("match_id", "team_id", name="uq_team_match_log_match_team"),
+    )
+    with op.batch_alter_table("team_match_log", schema=None) as batch_op:
+        batch_op.create_index(
+            "idx_team_match_log_team_date", ["team_id", "match_date"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_team_match_log_is_active"), ["is_active"], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("team_match_log", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_team_match_log_is_active"))
+        batch_op.drop_index("idx_team_match_log_team_date")
+    op.drop_table("team_match_log")
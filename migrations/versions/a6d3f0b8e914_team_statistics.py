@@ -0,0 +1,90 @@
+"""Team statistics table
+
+Revision ID: a6d3f0b8e914
+Revises: e2a9c4d7f613
+Create Date: 2026-10-17 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a6d3f0b8e914"
+down_revision = "e2a9c4d7f613"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "team_statistics",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("team_id", sa.Integer(), nullable=False),
+        sa.Column("season", sa.String(length=9), nullable=False),
+        *[
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+            for name in [
+                "matches_played",
+                "wins",
+                "draws",
+                "losses",
+                "goals_for",
+                "goals_against",
+                "clean_sheets",
+                "failed_to_score",
+                "home_matches",
+                "home_wins",
+                "home_draws",
+                "home_losses",
+                "home_goals_for",
+                "home_goals_against",
+                "away_matches",
+                "away_wins",
+                "away_draws",
+                "away_losses",
+                "away_goals_for",
+                "away_goals_against",
+            ]
+        ],
+        sa.Column(
+            "average_goals_per_match", sa.Float(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "average_goals_conceded", sa.Float(), nullable=False, server_default="0"
+        ),
+        *[
+            sa.Column(name, sa.Float(), nullable=True)
+            for name in [
+                "avg_possession",
+                "shots_per_game",
+                "shots_on_target_per_game",
+                "pass_accuracy",
+                "aerials_won",
+                "tackles_per_game",
+                "interceptions_per_game",
+                "fouls_per_game",
+                "corners_per_game",
+            ]
+        ],
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("team_id", "season", name="uq_team_statistics_team_season"),
+    )
+    with op.batch_alter_table("team_statistics", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_team_statistics_team_id"), ["team_id"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_team_statistics_is_active"), ["is_active"], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("team_statistics", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_team_statistics_is_active"))
+        batch_op.drop_index(batch_op.f("ix_team_statistics_team_id"))
+    op.drop_table("team_statistics")
@@ -0,0 +1,37 @@
+"""Provider api_id natural keys for teams and matches
+
+Revision ID: c5e8a1f47b92
+Revises: 8d1f6a3b2c47
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c5e8a1f47b92"
+down_revision = "8d1f6a3b2c47"
+branch_labels = None
+depends_on = None
+
+
+# Toplu upsert'lerin (ON CONFLICT) çakışma hedefi olan benzersiz sütunlar
+API_ID_TABLES = {
+    "teams": "uq_teams_api_id",
+    "matches": "uq_matches_api_id",
+}
+
+
+def upgrade():
+    for table, constraint in API_ID_TABLES.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column("api_id", sa.Integer(), nullable=True))
+            batch_op.create_unique_constraint(constraint, ["api_id"])
+
+
+def downgrade():
+    for table, constraint in reversed(list(API_ID_TABLES.items())):
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_constraint(constraint, type_="unique")
+            batch_op.drop_column("api_id")
@@ -0,0 +1,45 @@
+"""Match ingestion state table
+
+Revision ID: e2a9c4d7f613
+Revises: c5e8a1f47b92
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e2a9c4d7f613"
+down_revision = "c5e8a1f47b92"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "ingestion_states",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("competition_code", sa.String(length=10), nullable=False),
+        sa.Column("high_water_mark", sa.DateTime(), nullable=True),
+        sa.Column("run_from", sa.DateTime(), nullable=True),
+        sa.Column("run_to", sa.DateTime(), nullable=True),
+        sa.Column("cursor", sa.DateTime(), nullable=True),
+        sa.Column("open_from", sa.DateTime(), nullable=True),
+        sa.Column("last_run_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("competition_code"),
+    )
+    with op.batch_alter_table("ingestion_states", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_ingestion_states_is_active"), ["is_active"], unique=False
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("ingestion_states", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_ingestion_states_is_active"))
+    op.drop_table("ingestion_states")
@@ -0,0 +1,38 @@
+"""Matches home/away/date index
+
+Revision ID: f4b8d2a6c1e3
+Revises: a6d3f0b8e914
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "f4b8d2a6c1e3"
+down_revision = "a6d3f0b8e914"
+branch_labels = None
+depends_on = None
+
+
+def _match_date_column():
+    # Model `match_date` kullanır; ilk migration şemasında sütun `match_datetime`
+    columns = {
+        column["name"] for column in sa.inspect(op.get_bind()).get_columns("matches")
+    }
+    return "match_date" if "match_date" in columns else "match_datetime"
+
+
+def upgrade():
+    # Takım çifti (H2H) sorguları için
+    op.create_index(
+        "ix_matches_home_away_date",
+        "matches",
+        ["home_team_id", "away_team_id", _match_date_column()],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_matches_home_away_date", table_name="matches")
@@ -8,11 +8,19 @@ from app import db
 from sklearn.metrics import accuracy_score
 from sklearn.model_selection import train_test_split
 
+from app.models.enums import MatchStatus
 from app.models.match import Match
+from app.services.score_probabilities import calculate_score_probabilities
+from app.services.team_form_index import TeamFormIndex, team_form_index
+from app.services.match_queries import recent_team_matches
+from app.services.feature_store import FEATURE_COLUMNS, TARGET_COLUMNS, FeatureStore
+from app.services.match_model import create_match_model, fit_match_model
+from app.services.model_artifacts import save_artifact
+from app.services.model_registry import model_registry
+from app.services.compiled_model import compile_model
+from app.services.prediction_cache import PredictionCache, prediction_cache
 from sklearn.ensemble import GradientBoostingClassifier
-from joblib import dump, load
 from typing import Dict, List, Tuple, Optional, Union
-from scipy.stats import poisson
 from sklearn.ensemble import GradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler
 from sklearn.multioutput import MultiOutputRegressor
@@ -28,18 +36,31 @@ logger = logging.getLogger(__name__)
 class MatchPredictor:
     """Futbol maçı tahminleri için makine öğrenmesi tabanlı tahmin motoru"""
 
-    def __init__(self, db_session: Session, league_id: int = None):
+    def __init__(
+        self,
+        db_session: Session,
+        league_id: int = None,
+        form_index: Optional[TeamFormIndex] = team_form_index,
+        cache: Optional[PredictionCache] = prediction_cache,
+    ):
         """
         Tahmin motorunu başlat
 
         Args:
             db_session: SQLAlchemy veritabanı oturumu
             league_id: Belirli bir lig için model kullanılacaksa lig ID'si
+            form_index: Takım formları için bellek içi indeks (None ise her
+                çağrıda veritabanı sorgulanır)
+            cache: Tahmin önbelleği (None ise önbellek kullanılmaz)
         """
         self.db = db_session
         self.league_id = league_id
+        self.form_index = form_index
+        self.cache = cache
         self.model = None
         self.scaler = StandardScaler()
+        self.compiled_model = None
+        self.model_version = None
 
         # Model dosya yollarını lige özgü hale getir
         if league_id:
@@ -56,10 +77,14 @@ class MatchPredictor:
         try:
             os.makedirs("models", exist_ok=True)
 
-            if os.path.exists(self.model_path) and os.path.exists(self.scaler_path):
-                self.model = load(self.model_path)
-                self.scaler = load(self.scaler_path)
-                logger.info("Önceden eğitilmiş model ve scaler yüklendi")
+            # Süreç genelindeki LRU önbellekten al (gerekirse diskten yüklenir)
+            entry = model_registry.get_entry(
+                self.league_id, self.model_path, self.scaler_path
+            )
+            if entry is not None:
+                self.model, self.scaler = entry.model, entry.scaler
+                self.compiled_model = entry.compiled
+                self.model_version = (entry.model_mtime, entry.scaler_mtime)
             else:
                 self._create_new_model()
         except Exception as e:
@@ -69,17 +94,9 @@ class MatchPredictor:
     def _create_new_model(self) -> None:
         """Yeni bir tahmin modeli oluştur"""
         try:
-            base_model = GradientBoostingRegressor(
-                n_estimators=200,
-                learning_rate=0.05,
-                max_depth=5,
-                random_state=42,
-                min_samples_split=8,
-                min_samples_leaf=4,
-                subsample=0.8,
-            )
-
-            self.model = MultiOutputRegressor(base_model)
+            self.model = create_match_model()
+            self.compiled_model = None
+            self.model_version = None
             logger.info("Yeni çoklu çıktılı model oluşturuldu")
 
             # Modeli kaydet
@@ -93,8 +110,8 @@ class MatchPredictor:
         """Modeli ve scaler'ı diske kaydet"""
         try:
             if self.model:
-                dump(self.model, self.model_path)
-                dump(self.scaler, self.scaler_path)
+                save_artifact(self.model, self.model_path)
+                save_artifact(self.scaler, self.scaler_path)
                 logger.info("Model ve scaler başarıyla kaydedildi")
                 return True
             return False
@@ -112,6 +129,9 @@ class MatchPredictor:
         """
         Takımın son maçlardaki formunu getirir
 
+        Form indeksi tanımlıysa sonuç bellekten okunur; aksi halde (veya
+        indeks hata verirse) veritabanı sorgulanır.
+
         Args:
             team_id: Takım ID'si
             match_date: Referans tarihi
@@ -120,30 +140,61 @@ class MatchPredictor:
         Returns:
             Takım formu ile ilgili istatistikler
         """
-        from app.models import Match
-
-        try:
-            from app.models import Match, Team
-
-            query = (
-                self.db.query(Match)
-                .join(
-                    Team,
-                    ((Match.home_team_id == Team.id) | (Match.away_team_id == Team.id)),
+        if self.form_index is not None:
+            try:
+                self._sync_form_index()
+                return self.form_index.get_form(
+                    team_id, match_date, matches_back, league_id=league_id
                 )
-                .filter(
-                    ((Match.home_team_id == team_id) | (Match.away_team_id == team_id)),
-                    Match.match_date < match_date,
-                    Match.status == "FINISHED",
-                    Match.home_score.isnot(None),
-                    Match.away_score.isnot(None),
+            except Exception as e:
+                logger.warning(
+                    f"Form indeksi kullanılamadı, veritabanı sorgulanıyor: {str(e)}"
                 )
-            )
 
-            if league_id is not None:
-                query = query.filter(Team.league_id == league_id)
+        return self._query_team_form(team_id, match_date, matches_back, league_id)
+
+    def _match_forms(
+        self, home_team_id: int, away_team_id: int, match_date: datetime
+    ) -> Tuple[Dict, Dict]:
+        """Model girdisi için ev sahibi ve deplasman takımlarının formu
+
+        Eğitim verisi (özellik deposu) formu takımın tüm müsabakalarındaki
+        maçlardan hesaplar; lig modelleri bu satırların lige göre süzülmüş
+        haliyle eğitilir. Tahminde de aynı kapsam kullanılır: form lige göre
+        süzülmez, lig yalnızca modeli seçer.
+        """
+        return (
+            self.get_team_form(home_team_id, match_date),
+            self.get_team_form(away_team_id, match_date),
+        )
+
+    def _sync_form_index(self) -> None:
+        """Form indeksini diğer süreçlerin sonuçlarıyla (aralıkta bir) yeniler
+
+        Formu değişen takımların önbellekteki tahminleri geçersiz kılınır.
+        """
+        changed = self.form_index.sync(self.db)
+        if changed and self.cache is not None:
+            self.cache.invalidate_teams(*changed)
+
+    def _query_team_form(
+        self,
+        team_id: int,
+        match_date: datetime,
+        matches_back: int = 5,
+        league_id: int = None,
+    ) -> Dict[str, Union[int, float, List[str]]]:
+        """Takım formunu doğrudan veritabanından hesaplar"""
+        from app.models import Match
 
-            matches = query.order_by(Match.match_date.desc()).limit(matches_back).all()
+        try:
+            # Ev sahibi ve deplasman tarafları ayrı indekslerden (veya
+            # team_match_log'dan) okunur
+            matches = self.db.execute(
+                recent_team_matches(
+                    team_id, before=match_date, league_id=league_id, limit=matches_back
+                )
+            ).all()
 
             if not matches:
                 return {
@@ -166,12 +217,8 @@ class MatchPredictor:
             clean_sheets = failed_to_score = 0
 
             for match in matches:
-                is_home = match.home_team_id == team_id
-                team_goals = match.home_goals if is_home else match.away_goals
-                opponent_goals = match.away_goals if is_home else match.home_goals
-
-                team_goals = team_goals or 0
-                opponent_goals = opponent_goals or 0
+                team_goals = match.goals_for or 0
+                opponent_goals = match.goals_against or 0
 
                 goals_for += team_goals
                 goals_against += opponent_goals
@@ -252,29 +299,24 @@ class MatchPredictor:
             home_expected = (home_attack + away_defense) / 2 * home_advantage
             away_expected = (away_attack + home_defense) / 2
 
-            # 5+ gol olasılığı
-            high_scoring_prob = self._calculate_high_scoring_prob(
-                home_expected, away_expected
-            )
-
-            # Maç sonucu olasılıkları
-            (
-                home_win_prob,
-                draw_prob,
-                away_win_prob,
-            ) = self._calculate_outcome_probabilities(home_expected, away_expected)
+            # Maç sonucu, alt/üst ve 5+ gol olasılıkları
+            probs = calculate_score_probabilities(home_expected, away_expected)
 
             return {
                 "match_prediction": {
-                    "home_win_prob": round(home_win_prob, 3),
-                    "draw_prob": round(draw_prob, 3),
-                    "away_win_prob": round(away_win_prob, 3),
+                    "home_win_prob": round(float(probs["home_win"][0]), 3),
+                    "draw_prob": round(float(probs["draw"][0]), 3),
+                    "away_win_prob": round(float(probs["away_win"][0]), 3),
                 },
                 "expected_goals": {
                     "home": round(home_expected, 2),
                     "away": round(away_expected, 2),
                 },
-                "high_scoring_prob": round(high_scoring_prob, 3),
+                "over_under": {
+                    "over_2_5": round(float(probs["over"][0]), 3),
+                    "under_2_5": round(float(probs["under"][0]), 3),
+                },
+                "high_scoring_prob": round(float(probs["high_scoring"][0]), 3),
                 "home_team_form": home_form,
                 "away_team_form": away_form,
                 "model_used": "simple",
@@ -290,11 +332,8 @@ class MatchPredictor:
     ) -> float:
         """5+ gol olma olasılığını hesaplar"""
         try:
-            total_goals = home_goals + away_goals
-            # 0-4 gol olma olasılığını hesapla
-            prob_under_5 = sum(poisson.pmf(i, total_goals) for i in range(5))
-            # 5+ gol olma olasılığı
-            return max(0, min(1, 1 - prob_under_5))
+            probs = calculate_score_probabilities(home_goals, away_goals)
+            return float(probs["high_scoring"][0])
         except Exception as e:
             logger.error(f"Yüksek skor olasılığı hesaplanırken hata: {str(e)}")
             return 0.0
@@ -304,32 +343,12 @@ class MatchPredictor:
     ) -> Tuple[float, float, float]:
         """Maç sonucu olasılıklarını hesaplar"""
         try:
-            # Poisson dağılımına göre olasılıkları hesapla
-            home_win_prob = 0.0
-            draw_prob = 0.0
-            away_win_prob = 0.0
-
-            # Maksimum gol sayısı (hesaplama için)
-            max_goals = 10
-
-            for i in range(max_goals):  # Ev sahibi golleri
-                for j in range(max_goals):  # Deplasman golleri
-                    prob = poisson.pmf(i, home_goals) * poisson.pmf(j, away_goals)
-                    if i > j:
-                        home_win_prob += prob
-                    elif i == j:
-                        draw_prob += prob
-                    else:
-                        away_win_prob += prob
-
-            # Olasılıkları normalize et
-            total = home_win_prob + draw_prob + away_win_prob
-            if total > 0:
-                home_win_prob /= total
-                draw_prob /= total
-                away_win_prob /= total
-
-            return home_win_prob, draw_prob, away_win_prob
+            probs = calculate_score_probabilities(home_goals, away_goals)
+            return (
+                float(probs["home_win"][0]),
+                float(probs["draw"][0]),
+                float(probs["away_win"][0]),
+            )
 
         except Exception as e:
             logger.error(f"Maç sonucu olasılıkları hesaplanırken hata: {str(e)}")
@@ -343,72 +362,90 @@ class MatchPredictor:
         match_date: datetime,
         league_id: int = None,
     ) -> Optional[np.ndarray]:
-        """Maç için özellik vektörünü hazırlar"""
+        """Maç için özellik vektörünü hazırlar
+
+        Form, eğitimdeki gibi tüm müsabakalardan hesaplanır (bkz.
+        `_match_forms`); league_id yalnızca uyumluluk için kabul edilir.
+        """
         try:
             # Takım formlarını al
-            home_form = self.get_team_form(
-                home_team_id, match_date, league_id=league_id
-            )
-            away_form = self.get_team_form(
-                away_team_id, match_date, league_id=league_id
+            home_form, away_form = self._match_forms(
+                home_team_id, away_team_id, match_date
             )
 
-            # Temel özellikler
-            features = [
-                home_form["avg_goals_for"],
-                home_form["avg_goals_against"],
-                home_form["points"]
-                / (
-                    3
-                    * (
-                        home_form["wins"] + home_form["draws"] + home_form["losses"]
-                        or 1
-                    )
-                ),
-                away_form["avg_goals_for"],
-                away_form["avg_goals_against"],
-                away_form["points"]
-                / (
-                    3
-                    * (
-                        away_form["wins"] + away_form["draws"] + away_form["losses"]
-                        or 1
-                    )
-                ),
-                home_form["clean_sheet_percent"] / 100,
-                away_form["clean_sheet_percent"] / 100,
-                home_form["failed_to_score_percent"] / 100,
-                away_form["failed_to_score_percent"] / 100,
-            ]
-
-            # Son 5 maç formu (son maç en önemli)
-            for i in range(min(5, len(home_form["form"]))):
-                # Galibiyet: 1, Beraberlik: 0, Mağlubiyet: -1
-                if home_form["form"][i] == "W":
-                    features.append(1.0)
-                elif home_form["form"][i] == "D":
-                    features.append(0.0)
-                else:
-                    features.append(-1.0)
-
-            for i in range(min(5, len(away_form["form"]))):
-                if away_form["form"][i] == "W":
-                    features.append(1.0)
-                elif away_form["form"][i] == "D":
-                    features.append(0.0)
-                else:
-                    features.append(-1.0)
-
-            # Eksik form verileri için sıfır ekle
-            while len(features) < 20:  # Toplam 20 özellik
-                features.append(0.0)
-
-            return np.array(features[:20])  # İlk 20 özelliği al
+            return self._features_from_forms(home_form, away_form)
 
         except Exception as e:
             logger.error(f"Özellik hazırlanırken hata: {str(e)}")
             return None
 
+    @staticmethod
+    def _features_from_forms(home_form: dict, away_form: dict) -> np.ndarray:
+        """Hazır takım formlarından 20 elemanlı özellik vektörünü oluşturur"""
+        # Temel özellikler
+        features = [
+            home_form["avg_goals_for"],
+            home_form["avg_goals_against"],
+            home_form["points"]
+            / (3 * (home_form["wins"] + home_form["draws"] + home_form["losses"] or 1)),
+            away_form["avg_goals_for"],
+            away_form["avg_goals_against"],
+            away_form["points"]
+            / (3 * (away_form["wins"] + away_form["draws"] + away_form["losses"] or 1)),
+            home_form["clean_sheet_percent"] / 100,
+            away_form["clean_sheet_percent"] / 100,
+            home_form["failed_to_score_percent"] / 100,
+            away_form["failed_to_score_percent"] / 100,
+        ]
+
+        # Son 5 maç formu (son maç en önemli)
+        # Galibiyet: 1, Beraberlik: 0, Mağlubiyet: -1
+        result_values = {"W": 1.0, "D": 0.0}
+        for form in (home_form["form"], away_form["form"]):
+            for result in form[:5]:
+                features.append(result_values.get(result, -1.0))
+
+        # Eksik form verileri için sıfır ekle
+        while len(features) < 20:  # Toplam 20 özellik
+            features.append(0.0)
+
+        return np.array(features[:20])  # İlk 20 özelliği al
+
+    def _cache_key(
+        self,
+        home_team_id: int,
+        away_team_id: int,
+        match_date: datetime,
+        league_id: int = None,
+    ) -> Optional[tuple]:
+        """Tahmin önbelleği anahtarı; önbellek veya eğitilmiş model yoksa None"""
+        if self.cache is None or self.model_version is None:
+            return None
+        try:
+            # Diğer süreçlerde kaydedilen sonuçlar (en fazla aralıkta bir)
+            self.cache.sync(self.db)
+            if self.form_index is not None:
+                self._sync_form_index()
+        except Exception as e:
+            logger.warning(f"Tahmin önbelleği senkronize edilemedi: {str(e)}")
+        return self.cache.make_key(
+            home_team_id,
+            away_team_id,
+            match_date,
+            league_id if league_id else self.league_id,
+            self.model_version,
+        )
+
+    def _predict_scores(self, X: np.ndarray) -> np.ndarray:
+        """Ölçeklenmemiş özellik matrisi için [ev golü, deplasman golü] tahmini
+
+        Derlenmiş model varsa sklearn doğrulaması ve dağıtımı atlanır; yoksa
+        scaler ve model ayrı ayrı uygulanır.
+        """
+        if self.compiled_model is not None:
+            return self.compiled_model.predict(X)
+        return self.model.predict(self.scaler.transform(X))
+
     def predict_match(
         self,
         home_team_id: int,
@@ -438,55 +475,54 @@ class MatchPredictor:
             self.scaler_path = f"models/scaler_league_{league_id}.joblib"
             self._initialize_model()
 
+        cache_key = self._cache_key(home_team_id, away_team_id, match_date, league_id)
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             # Takım formlarını al
-            home_form = self.get_team_form(
-                home_team_id, match_date, league_id=league_id
-            )
-            away_form = self.get_team_form(
-                away_team_id, match_date, league_id=league_id
+            home_form, away_form = self._match_forms(
+                home_team_id, away_team_id, match_date
             )
 
             # Eğer model yoksa veya boşsa, basit bir tahmin yap
             if self.model is None:
                 return self._simple_prediction(home_form, away_form)
 
-            # Özellik vektörünü hazırla
-            features = self.prepare_match_features(
-                home_team_id, away_team_id, match_date, league_id
-            )
-            if features is None:
-                logger.warning("Özellik hazırlanamadı, basit tahmin yapılıyor...")
+            # Özellik vektörünü hazırla (formlar yeniden sorgulanmaz)
+            try:
+                features = self._features_from_forms(home_form, away_form)
+            except Exception as e:
+                logger.warning(
+                    f"Özellik hazırlanamadı, basit tahmin yapılıyor: {str(e)}"
+                )
                 return self._simple_prediction(home_form, away_form)
 
             # Tahmin yap
-            predicted_scores = self.model.predict(features.reshape(1, -1))[0]
+            predicted_scores = self._predict_scores(features.reshape(1, -1))[0]
             home_goals = max(0, round(predicted_scores[0], 1))
             away_goals = max(0, round(predicted_scores[1], 1))
 
-            # 5+ gol olasılığı
-            high_scoring_prob = self._calculate_high_scoring_prob(
-                home_goals, away_goals
-            )
-
-            # Maç sonucu olasılıkları
-            (
-                home_win_prob,
-                draw_prob,
-                away_win_prob,
-            ) = self._calculate_outcome_probabilities(home_goals, away_goals)
+            # Maç sonucu, alt/üst ve 5+ gol olasılıkları
+            probs = calculate_score_probabilities(home_goals, away_goals)
 
-            return {
+            result = {
                 "match_prediction": {
-                    "home_win_prob": round(home_win_prob, 3),
-                    "draw_prob": round(draw_prob, 3),
-                    "away_win_prob": round(away_win_prob, 3),
+                    "home_win_prob": round(float(probs["home_win"][0]), 3),
+                    "draw_prob": round(float(probs["draw"][0]), 3),
+                    "away_win_prob": round(float(probs["away_win"][0]), 3),
                 },
                 "expected_goals": {
                     "home": round(home_goals, 2),
                     "away": round(away_goals, 2),
                 },
-                "high_scoring_prob": round(high_scoring_prob, 3),
+                "over_under": {
+                    "over_2_5": round(float(probs["over"][0]), 3),
+                    "under_2_5": round(float(probs["under"][0]), 3),
+                },
+                "high_scoring_prob": round(float(probs["high_scoring"][0]), 3),
                 "home_team_form": home_form,
                 "away_team_form": away_form,
                 "league_id": league_id if league_id else self.league_id,
@@ -494,6 +530,9 @@ class MatchPredictor:
                 if self.league_id
                 else "global",
             }
+            if cache_key is not None:
+                self.cache.set(cache_key, result)
+            return result
 
         except Exception as e:
             logger.error(
@@ -501,58 +540,121 @@ class MatchPredictor:
             )
             return {"error": "Tahmin yapılırken bir hata oluştu", "details": str(e)}
 
+    def predict_many(self, fixtures: List[Dict], league_id: int = None) -> List[Dict]:
+        """
+        Birden fazla maç için toplu tahmin yapar
 
-class MatchPredictor:
-    """Futbol maçı tahminleri için makine öğrenmesi tabanlı tahmin motoru"""
+        Tüm maçların özellik matrisi tek seferde oluşturulur ve model tek bir
+        predict çağrısıyla çalıştırılır; olasılıklar vektörize hesaplanır.
 
-    def _initialize_model(self) -> None:
-        """Tahmin modelini başlat veya önceden eğitilmiş modeli yükle"""
-        try:
-            os.makedirs("models", exist_ok=True)
+        Args:
+            fixtures: 'home_team_id', 'away_team_id' ve isteğe bağlı
+                'match_date' (datetime veya YYYY-MM-DD) içeren maç sözlükleri
+            league_id: Lig ID'si (isteğe bağlı)
 
-            if os.path.exists(self.model_path) and os.path.exists(self.scaler_path):
-                self.model = load(self.model_path)
-                self.scaler = load(self.scaler_path)
-                logger.info(
-                    f"Önceden eğitilmiş model ve scaler yüklendi: {self.model_path}"
+        Returns:
+            Giriş sırasıyla tahmin sonuçları. Hatalı satırlar için
+            {"error": ..., "details": ...} döner.
+        """
+        if league_id is not None and league_id != self.league_id:
+            self.league_id = league_id
+            self.model_path = f"models/match_predictor_league_{league_id}.joblib"
+            self.scaler_path = f"models/scaler_league_{league_id}.joblib"
+            self._initialize_model()
+
+        results: List[Optional[Dict]] = [None] * len(fixtures)
+        rows, forms, features, cache_keys = [], [], [], []
+
+        for idx, fixture in enumerate(fixtures):
+            try:
+                match_date = fixture.get("match_date") or datetime.now()
+                if isinstance(match_date, str):
+                    match_date = datetime.strptime(match_date, "%Y-%m-%d")
+
+                cache_key = self._cache_key(
+                    fixture["home_team_id"],
+                    fixture["away_team_id"],
+                    match_date,
+                    league_id,
+                )
+                if cache_key is not None:
+                    cached = self.cache.get(cache_key)
+                    if cached is not None:
+                        results[idx] = cached
+                        continue
+
+                home_form, away_form = self._match_forms(
+                    fixture["home_team_id"], fixture["away_team_id"], match_date
                 )
-            else:
-                self._create_new_model()
-        except Exception as e:
-            logger.error(f"Model yüklenirken hata oluştu: {str(e)}")
-            self._create_new_model()
 
-    def _create_new_model(self) -> None:
-        """Yeni bir tahmin modeli oluştur"""
-        try:
-            base_model = GradientBoostingRegressor(
-                n_estimators=200,
-                learning_rate=0.05,
-                max_depth=5,
-                random_state=42,
-                min_samples_split=8,
-                min_samples_leaf=4,
-                subsample=0.8,
-            )
+                if self.model is None:
+                    results[idx] = self._simple_prediction(home_form, away_form)
+                    continue
 
-            self.model = MultiOutputRegressor(base_model)
-            logger.info("Yeni çoklu çıktılı model oluşturuldu")
+                features.append(self._features_from_forms(home_form, away_form))
+                forms.append((home_form, away_form))
+                cache_keys.append(cache_key)
+                rows.append(idx)
 
-            # Modeli kaydet
-            self.save_model()
+            except Exception as e:
+                logger.error(
+                    f"Toplu tahmin için maç hazırlanırken hata (Sıra: {idx}): {str(e)}"
+                )
+                results[idx] = {
+                    "error": "Tahmin yapılırken bir hata oluştu",
+                    "details": str(e),
+                }
 
-        except Exception as e:
-            logger.error(f"Yeni model oluşturulurken hata: {str(e)}")
-            raise
+        if rows:
+            try:
+                # Tek model çağrısı
+                predicted_scores = self._predict_scores(np.vstack(features))
+                home_goals = np.maximum(0, np.round(predicted_scores[:, 0], 1))
+                away_goals = np.maximum(0, np.round(predicted_scores[:, 1], 1))
+                probs = calculate_score_probabilities(home_goals, away_goals)
+
+                model_used = f"league_{self.league_id}" if self.league_id else "global"
+                for n, idx in enumerate(rows):
+                    home_form, away_form = forms[n]
+                    results[idx] = {
+                        "match_prediction": {
+                            "home_win_prob": round(float(probs["home_win"][n]), 3),
+                            "draw_prob": round(float(probs["draw"][n]), 3),
+                            "away_win_prob": round(float(probs["away_win"][n]), 3),
+                        },
+                        "expected_goals": {
+                            "home": round(float(home_goals[n]), 2),
+                            "away": round(float(away_goals[n]), 2),
+                        },
+                        "over_under": {
+                            "over_2_5": round(float(probs["over"][n]), 3),
+                            "under_2_5": round(float(probs["under"][n]), 3),
+                        },
+                        "high_scoring_prob": round(float(probs["high_scoring"][n]), 3),
+                        "home_team_form": home_form,
+                        "away_team_form": away_form,
+                        "league_id": league_id if league_id else self.league_id,
+                        "model_used": model_used,
+                    }
+                    if cache_keys[n] is not None:
+                        self.cache.set(cache_keys[n], results[idx])
+
+            except Exception as e:
+                logger.error(f"Toplu tahmin yapılırken hata: {str(e)}")
+                for idx in rows:
+                    results[idx] = {
+                        "error": "Tahmin yapılırken bir hata oluştu",
+                        "details": str(e),
+                    }
 
-    def save_model(self):
-        """Save the trained model to disk"""
-        if self.model:
-            dump(self.model, self.model_path)
+        return results
 
     def find_high_draw_probability_matches(self, matches, min_draw_prob=0.35):
         """Berabere kalma ihtimali yüksek maçları bulur
 
+        Maçlar tek model çağrısıyla toplu tahmin edilir; tahmin edilemeyen maç
+        loglanıp atlanır.
+
         Args:
             matches: Tahmin yapılacak maç listesi
             min_draw_prob: Minimum beraberlik olasılığı (0-1 arası)
@@ -562,30 +664,36 @@ class MatchPredictor:
         """
         high_draw_matches = []
 
-        for match in matches:
+        try:
+            predictions = self.predict_many(matches)
+        except Exception as e:
+            logger.error(
+                f"Toplu tahmin yapılamadı, maçlar tek tek tahmin ediliyor: {str(e)}"
+            )
+            predictions = [None] * len(matches)
+
+        for match, prediction in zip(matches, predictions):
             try:
-                # Maç tahminini yap
-                prediction = self.predict_match(
-                    match["home_team_id"],
-                    match["away_team_id"],
-                    datetime.strptime(match["match_date"], "%Y-%m-%d")
-                    if isinstance(match["match_date"], str)
-                    else match["match_date"],
-                )
+                if prediction is None:
+                    match_date = match.get("match_date")
+                    prediction = self.predict_match(
+                        match["home_team_id"],
+                        match["away_team_id"],
+                        datetime.strptime(match_date, "%Y-%m-%d")
+                        if isinstance(match_date, str)
+                        else match_date,
+                    )
+                if "error" in prediction:
+                    raise ValueError(prediction.get("details"))
 
                 # Beraberlik olasılığını kontrol et
-                if (
-                    prediction
-                    and prediction.get("match_prediction", {}).get("draw_prob", 0)
-                    >= min_draw_prob
-                ):
+                draw_prob = prediction.get("match_prediction", {}).get("draw_prob", 0)
+                if draw_prob >= min_draw_prob:
                     high_draw_matches.append(
                         {
                             "match": match,
                             "prediction": prediction,
-                            "draw_probability": prediction["match_prediction"][
-                                "draw_prob"
-                            ],
+                            "draw_probability": draw_prob,
                         }
                     )
 
@@ -600,127 +708,6 @@ class MatchPredictor:
             high_draw_matches, key=lambda x: x["draw_probability"], reverse=True
         )
 
-    def get_team_form(self, team_id, match_date, matches_back=5):
-        """Takımın son maçlardaki formunu getirir"""
-        try:
-            matches = (
-                self.db.session.query(Match)
-                .filter(
-                    ((Match.home_team_id == team_id) | (Match.away_team_id == team_id)),
-                    Match.match_date < match_date,
-                    Match.status == "FINISHED",
-                )
-                .order_by(Match.match_date.desc())
-                .limit(matches_back)
-                .all()
-            )
-
-            if not matches:
-                return {
-                    "wins": 0,
-                    "draws": 0,
-                    "losses": 0,
-                    "goals_for": 0,
-                    "goals_against": 0,
-                    "form": [],
-                }
-
-            form = []
-            wins = draws = losses = 0
-            goals_for = goals_against = 0
-
-            for match in matches:
-                is_home = match.home_team_id == team_id
-
-                if is_home:
-                    team_goals = match.home_goals or 0
-                    opponent_goals = match.away_goals or 0
-                else:
-                    team_goals = match.away_goals or 0
-                    opponent_goals = match.home_goals or 0
-
-                goals_for += team_goals
-                goals_against += opponent_goals
-
-                if team_goals > opponent_goals:
-                    form.append("W")
-                    wins += 1
-                elif team_goals == opponent_goals:
-                    form.append("D")
-                    draws += 1
-                else:
-                    form.append("L")
-                    losses += 1
-
-            return {
-                "wins": wins,
-                "draws": draws,
-                "losses": losses,
-                "goals_for": goals_for,
-                "goals_against": goals_against,
-                "form": form,
-                "points": wins * 3 + draws,
-                "avg_goals_for": round(goals_for / len(matches), 2) if matches else 0,
-                "avg_goals_against": round(goals_against / len(matches), 2)
-                if matches
-                else 0,
-            }
-
-        except Exception as e:
-            logger.error(f"Takım formu alınırken hata: {str(e)}")
-            form = []
-
-        # Pad with None if not enough matches
-        while len(form) < matches_back:
-            form.append(None)
-
-        return form[:matches_back]
-
-    def prepare_match_data(
-        self, home_team_id, away_team_id, match_date, matches_back=5
-    ):
-        """Prepare feature vector for prediction"""
-        home_form = self.get_team_form(home_team_id, match_date, matches_back)
-        away_form = self.get_team_form(away_team_id, match_date, matches_back)
-
-        # Convert form to features (count of W/D/L in last 5 matches)
-        def form_to_features(form):
-            return [
-                form.count("W"),
-                form.count("D"),
-                form.count("L"),
-                len([x for x in form if x is not None]),  # Number of matches available
-            ]
-
-        home_features = form_to_features(home_form)
-        away_features = form_to_features(away_form)
-
-        # Combine features
-        features = home_features + away_features
-
-        return np.array(features).reshape(1, -1)
-
-    def predict_match(self, home_team_id, away_team_id, match_date=None):
-        """Predict match outcome"""
-        if match_date is None:
-            match_date = datetime.now()
-
-        # Prepare features
-        X = self.prepare_match_data(home_team_id, away_team_id, match_date)
-
-        # Make prediction
-        if self.model:
-            proba = self.model.predict_proba(X)[0]
-            prediction = self.model.predict(X)[0]
-
-            return {
-                "home_win_prob": float(proba[0]),
-                "draw_prob": float(proba[1]),
-                "away_win_prob": float(proba[2]),
-                "prediction": ["Home Win", "Draw", "Away Win"][prediction],
-            }
-        return None
-
     def calculate_high_scoring_probability(
         self, home_team_id: int, away_team_id: int, match_date: datetime = None
     ) -> float:
@@ -770,31 +757,15 @@ class MatchPredictor:
         """Takımın son maçlarındaki gol ortalamasını hesaplar"""
         try:
             # Son 10 maçı getir
-            matches = (
-                self.db.query(Match)
-                .filter(
-                    ((Match.home_team_id == team_id) | (Match.away_team_id == team_id)),
-                    Match.date < match_date,
-                    Match.home_goals.isnot(None),
-                    Match.away_goals.isnot(None),
-                )
-                .order_by(Match.date.desc())
-                .limit(10)
-                .all()
-            )
+            matches = self.db.execute(
+                recent_team_matches(team_id, before=match_date, limit=10)
+            ).all()
 
             if not matches:
                 return 1.5  # Varsayılan ortalama
 
-            total_goals = 0
-            match_count = 0
-
-            for match in matches:
-                if match.home_team_id == team_id:
-                    total_goals += match.home_goals
-                else:
-                    total_goals += match.away_goals
-                match_count += 1
+            total_goals = sum(match.goals_for for match in matches)
+            match_count = len(matches)
 
             return total_goals / match_count if match_count > 0 else 1.5
 
@@ -802,6 +773,21 @@ class MatchPredictor:
             logger.error(f"Gol ortalaması hesaplanırken hata: {str(e)}")
             return 1.5
 
+    def _load_training_data(
+        self, league_id: int = None, limit: int = 5000
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Eğitim matrislerini point-in-time özellik deposundan okur
+
+        Returns:
+            (X, y): 20 özellikli matris ve [ev golü, deplasman golü] hedefleri
+        """
+        frame = FeatureStore().load_or_build(self.db, league_id=league_id)
+        frame = frame.sort_values("match_date", ascending=False).head(limit)
+        return (
+            frame[FEATURE_COLUMNS].to_numpy(dtype=float),
+            frame[TARGET_COLUMNS].to_numpy(dtype=float),
+        )
+
     def train_model(self, matches=None, league_id: int = None):
         """
         Tahmin modelini eğitir
@@ -821,62 +807,45 @@ class MatchPredictor:
             self.model_path = "models/match_predictor_global.joblib"
             self.scaler_path = "models/scaler_global.joblib"
 
-        # Eğitim verisi sağlanmamışsa veritabanından çek
+        # Eğitim verisi sağlanmamışsa özellik deposundan oku (maç başına sorgu yok)
         if matches is None:
-            from app.models import Match, Team
-
-            query = (
-                self.db.query(Match)
-                .join(Team, Match.home_team_id == Team.id)
-                .filter(
-                    Match.status == "FINISHED",
-                    Match.home_score.isnot(None),
-                    Match.away_score.isnot(None),
-                )
-            )
-
-            if league_id is not None:
-                query = query.filter(Team.league_id == league_id)
-
-            matches = query.order_by(Match.match_date.desc()).limit(5000).all()
-
-        if not matches:
-            logger.warning("Eğitim için maç bulunamadı")
-            return
-
-        logger.info(f"{len(matches)} maç ile model eğitiliyor...")
-        X = []
-        y = []
+            X, y = self._load_training_data(league_id)
+            if not len(X):
+                logger.warning("Eğitim için maç bulunamadı")
+                return
+            logger.info(f"{len(X)} maç ile model eğitiliyor (özellik deposu)...")
+        else:
+            if not matches:
+                logger.warning("Eğitim için maç bulunamadı")
+                return
 
-        for match in matches:
-            if (
-                match.status != "Finished"
-                or match.home_goals is None
-                or match.away_goals is None
-            ):
-                continue
+            logger.info(f"{len(matches)} maç ile model eğitiliyor...")
+            X = []
+            y = []
 
-            # Prepare features
-            try:
-                features = self.prepare_match_data(
-                    match.home_team_id, match.away_team_id, match.match_date
+            for match in matches:
+                if (
+                    match.status != MatchStatus.FINISHED
+                    or match.home_goals is None
+                    or match.away_goals is None
+                ):
+                    continue
+
+                # Tahminle aynı 20 özellik; hedef [ev golü, deplasman golü]
+                features = self.prepare_match_features(
+                    match.home_team_id,
+                    match.away_team_id,
+                    match.match_date,
+                    league_id=league_id,
                 )
+                if features is None:
+                    logger.warning(f"Maç {match.id} için özellik hazırlanamadı")
+                    continue
 
-                # Determine outcome (0: home win, 1: draw, 2: away win)
-                if match.home_goals > match.away_goals:
-                    outcome = 0
-                elif match.home_goals == match.away_goals:
-                    outcome = 1
-                else:
-                    outcome = 2
-
-                X.append(features[0])  # Flatten the features
-                y.append(outcome)
+                X.append(features)
+                y.append([match.home_goals, match.away_goals])
 
-            except Exception as e:
-                print(f"Error processing match {match.id}: {e}")
-
-        if not X:
+        if not len(X):
             logger.error("Eğitim için geçerli veri bulunamadı")
             return {
                 "success": False,
@@ -885,34 +854,15 @@ class MatchPredictor:
             }
 
         try:
-            # Veriyi numpy array'lerine dönüştür
-            X = np.array(X)
-            y = np.array(y)
-
-            # Eğitim ve test verilerini ayır
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=0.2, random_state=42
-            )
-
-            # Veriyi ölçeklendir
-            self.scaler = StandardScaler()
-            X_train_scaled = self.scaler.fit_transform(X_train)
-            X_test_scaled = self.scaler.transform(X_test)
-
-            # Modeli eğit
+            # Modeli ölçeklenmiş veriyle eğit ve değerlendir
             logger.info("Model eğitimi başlıyor...")
-            self.model.fit(X_train_scaled, y_train)
-
-            # Modeli değerlendir
-            train_score = self.model.score(X_train_scaled, y_train)
-            test_score = self.model.score(X_test_scaled, y_test)
-
-            # Tahminler
-            y_pred = self.model.predict(X_test_scaled)
-
-            # Hata metrikleri
-            mae = np.mean(np.abs(y_test - y_pred))
-            mse = np.mean((y_test - y_pred) ** 2)
+            self.model, self.scaler, metrics = fit_match_model(
+                self.model, np.array(X), np.array(y)
+            )
+            self.compiled_model = compile_model(self.model, self.scaler)
+            self.model_version = ("trained", datetime.now().timestamp())
+            train_score = metrics["train_score"]
+            test_score = metrics["test_score"]
 
             # Modeli kaydet
             self.save_model()
@@ -923,11 +873,7 @@ class MatchPredictor:
 
             return {
                 "success": True,
-                "matches_used": len(X),
-                "train_score": float(train_score),
-                "test_score": float(test_score),
-                "mae": float(mae),
-                "mse": float(mse),
+                **metrics,
                 "model_path": os.path.abspath(self.model_path),
                 "league_id": self.league_id,
                 "training_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -0,0 +1,77 @@
+"""
+Servis testleri için ortak fixture'lar.
+
+app/models/__init__.py uygulama dışı modülleri (app.utils vb.) içe aktardığından
+gerçek model modülleri paket başlatıcısı atlanarak yüklenir; böylece testler
+gerçek tablo tanımları (Team.__table__, Match.__table__) ve eşleyicilerle
+bellek içi SQLite veritabanında çalışır.
+"""
+import importlib
+import os
+import sys
+import types
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session, configure_mappers
+
+# Proje kök dizinini Python path'ine ekle
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.insert(0, ROOT)
+
+MODEL_MODULES = [
+    "base",
+    "enums",
+    "team",
+    "match",
+    "league",
+    "prediction",
+    "team_statistics",
+    "team_match_log",
+    "ingestion_state",
+]
+
+
+def load_models():
+    """Model modüllerini app.models paketine yükler ve paketi döndürür"""
+    import app
+
+    package = sys.modules.get("app.models")
+    if package is not None and hasattr(package, "Match"):
+        return package
+
+    package = types.ModuleType("app.models")
+    package.__path__ = [os.path.join(ROOT, "app", "models")]
+    sys.modules["app.models"] = package
+    app.models = package
+    for name in MODEL_MODULES:
+        module = importlib.import_module(f"app.models.{name}")
+        for key, value in vars(module).items():
+            if not key.startswith("_"):
+                setattr(package, key, value)
+    configure_mappers()
+    return package
+
+
+@pytest.fixture(scope="session")
+def models():
+    """Gerçek model sınıflarını içeren app.models paketi."""
+    return load_models()
+
+
+@pytest.fixture
+def engine(models):
+    """Tüm model tabloları oluşturulmuş bellek içi SQLite veritabanı."""
+    from app.extensions import db
+
+    engine = sa.create_engine("sqlite://")
+    db.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Gerçek modellerle çalışan SQLAlchemy oturumu."""
+    with Session(engine) as session:
+        yield session
@@ -0,0 +1,84 @@
+"""
+Toplu upsert modülü için testler.
+"""
+import os
+import sys
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import Session
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.bulk_upsert import classify_rows, fetch_existing, upsert_rows
+
+COLUMNS = ["name", "founded"]
+
+
+@pytest.fixture
+def session():
+    """api_id üzerinde benzersiz indeksli takım tablosu olan SQLite oturumu."""
+    metadata = sa.MetaData()
+    teams = sa.Table(
+        "teams",
+        metadata,
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column("api_id", sa.Integer, unique=True),
+        sa.Column("name", sa.String(100), nullable=False),
+        sa.Column("founded", sa.Integer),
+    )
+    engine = sa.create_engine("sqlite://")
+    metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(
+            teams.insert(),
+            [
+                {"api_id": 1, "name": "Arsenal", "founded": 1886},
+                {"api_id": 2, "name": "Chelsea", "founded": 1905},
+            ],
+        )
+        yield session, teams
+    engine.dispose()
+
+
+class TestBulkUpsert:
+    """fetch_existing, classify_rows ve upsert_rows testleri."""
+
+    def test_classify_rows(self, session):
+        """Satırlar eklenecek, güncellenecek ve değişmemiş olarak ayrılır."""
+        session, teams = session
+        rows = [
+            {"api_id": 1, "name": "Arsenal", "founded": 1886},
+            {"api_id": 2, "name": "Chelsea FC", "founded": 1905},
+            {"api_id": 3, "name": "Everton", "founded": 1878},
+        ]
+        existing = fetch_existing(session, teams, "api_id", [1, 2, 3], COLUMNS)
+        added, updated, unchanged = classify_rows(rows, existing, "api_id", COLUMNS)
+
+        assert set(existing) == {1, 2}
+        assert [row["api_id"] for row in added] == [3]
+        assert [row["api_id"] for row in updated] == [2]
+        assert [row["api_id"] for row in unchanged] == [1]
+
+    def test_upsert_inserts_and_updates_in_chunks(self, session):
+        """Var olan satırlar güncellenir, yeniler eklenir; id'ler korunur."""
+        session, teams = session
+        ids_before = dict(session.execute(sa.select(teams.c.api_id, teams.c.id)).all())
+        rows = [{"api_id": 2, "name": "Chelsea FC", "founded": 1905}] + [
+            {"api_id": api_id, "name": f"Team {api_id}", "founded": None}
+            for api_id in range(3, 8)
+        ]
+
+        assert upsert_rows(session, teams, rows, ["api_id"], chunk_size=2) == 6
+
+        stored = {row.api_id: row for row in session.execute(sa.select(teams)).all()}
+        assert len(stored) == 7
+        assert stored[2].name == "Chelsea FC"
+        assert stored[2].id == ids_before[2]
+        assert stored[1].name == "Arsenal"
+
+    def test_empty_rows(self, session):
+        """Boş satır listesi veritabanına yazılmaz."""
+        session, teams = session
+        assert upsert_rows(session, teams, [], ["api_id"]) == 0
@@ -0,0 +1,159 @@
+"""
+Derlenmiş model için testler.
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services import compiled_model
+from app.services.compiled_model import compile_model, compiled_path
+from app.services.match_model import (
+    create_match_model,
+    fit_match_model,
+    warm_start_match_model,
+)
+from app.services.model_artifacts import mapped_nbytes, save_artifact
+from app.services.model_registry import ModelRegistry
+
+
+@pytest.fixture(scope="module")
+def data():
+    """20 özellikli rastgele eğitim verisi."""
+    rng = np.random.default_rng(5)
+    X = rng.normal(loc=2.0, scale=3.0, size=(300, 20))
+    y = np.column_stack(
+        [rng.poisson(1.5, size=300), rng.poisson(1.1, size=300)]
+    ).astype(float)
+    return X, y
+
+
+class TestCompiledModel:
+    """compile_model testleri."""
+
+    @pytest.mark.parametrize("backend", ["gbr", "hist"])
+    def test_matches_sklearn(self, backend, data):
+        """Derlenmiş tahmin, scaler + sklearn tahminiyle aynıdır."""
+        X, y = data
+        model, scaler, _ = fit_match_model(create_match_model(backend), X, y)
+        compiled = compile_model(model, scaler)
+
+        expected = model.predict(scaler.transform(X))
+        np.testing.assert_allclose(compiled.predict(X), expected, atol=1e-9)
+        np.testing.assert_allclose(compiled.predict(X[0]), expected[:1], atol=1e-9)
+
+    def test_warm_started_model(self, data):
+        """Artımlı eklenen ağaçlar da derlenir."""
+        X, y = data
+        model, scaler, _ = fit_match_model(create_match_model("gbr"), X, y)
+        warm_start_match_model(model, scaler.transform(X[:50]), y[:50], 10)
+
+        compiled = compile_model(model, scaler)
+
+        assert compiled.n_trees == 2 * 210
+        np.testing.assert_allclose(
+            compiled.predict(X), model.predict(scaler.transform(X)), atol=1e-9
+        )
+
+    def test_unsupported_models(self, data):
+        """XGBoost ve eğitilmemiş modeller derlenmez."""
+        X, y = data
+        model, scaler, _ = fit_match_model(create_match_model("xgboost"), X, y)
+        assert compile_model(model, scaler) is None
+        assert compile_model(create_match_model("gbr"), scaler) is None
+
+    def test_registry_entry_is_compiled(self, data, tmp_path):
+        """Kayıt defteri modeli yüklerken bir kez derler."""
+        X, y = data
+        model, scaler, _ = fit_match_model(create_match_model("hist"), X, y)
+        model_path = str(tmp_path / "model.joblib")
+        scaler_path = str(tmp_path / "scaler.joblib")
+        save_artifact(model, model_path)
+        save_artifact(scaler, scaler_path)
+
+        registry = ModelRegistry(max_size=2, compiled=True)
+        entry = registry.get_entry(1, model_path, scaler_path)
+
+        assert entry.compiled is not None
+        assert registry.get_entry(1, model_path, scaler_path).compiled is entry.compiled
+        np.testing.assert_allclose(
+            entry.compiled.predict(X[:5]),
+            entry.model.predict(entry.scaler.transform(X[:5])),
+            atol=1e-9,
+        )
+        assert (
+            ModelRegistry(compiled=False).get_entry(1, model_path, scaler_path).compiled
+            is None
+        )
+
+
+class TestPersistedCompiledModel:
+    """Derlenmiş dizilerin dosyaya kaydedilip paylaşılması testleri."""
+
+    @pytest.fixture
+    def model_files(self, data, tmp_path):
+        """Eğitilmiş hist modeli ve scaler dosyaları."""
+        X, y = data
+        model, scaler, _ = fit_match_model(create_match_model("hist"), X, y)
+        model_path = str(tmp_path / "model.joblib")
+        scaler_path = str(tmp_path / "scaler.joblib")
+        save_artifact(model, model_path)
+        save_artifact(scaler, scaler_path)
+        return model_path, scaler_path
+
+    def test_compiled_arrays_are_shared(self, data, model_files, monkeypatch):
+        """İkinci süreç (kayıt defteri) derlemeden eşlenmiş dizileri kullanır."""
+        X, _ = data
+        model_path, scaler_path = model_files
+        first = ModelRegistry(compiled=True, persist_compiled=True)
+        entry = first.get_entry(1, model_path, scaler_path)
+        assert os.path.exists(compiled_path(model_path))
+
+        def fail(*args):
+            raise AssertionError("yeniden derlenmemeli")
+
+        monkeypatch.setattr(compiled_model, "compile_model", fail)
+        second = ModelRegistry(compiled=True, persist_compiled=True, mmap=True)
+        shared = second.get_entry(1, model_path, scaler_path)
+
+        assert mapped_nbytes(shared.compiled) > 0
+        np.testing.assert_allclose(
+            shared.compiled.predict(X[:5]), entry.compiled.predict(X[:5])
+        )
+
+    def test_retrained_model_is_recompiled(self, data, model_files):
+        """Model dosyası değişince kaydedilmiş diziler yeniden derlenir."""
+        X, y = data
+        model_path, scaler_path = model_files
+        ModelRegistry(compiled=True, persist_compiled=True).get_entry(
+            1, model_path, scaler_path
+        )
+
+        model, scaler, _ = fit_match_model(create_match_model("gbr"), X, y)
+        save_artifact(model, model_path)
+        save_artifact(scaler, scaler_path)
+        stat = os.stat(model_path)
+        os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        entry = ModelRegistry(compiled=True, persist_compiled=True).get_entry(
+            1, model_path, scaler_path
+        )
+        np.testing.assert_allclose(
+            entry.compiled.predict(X[:5]),
+            model.predict(scaler.transform(X[:5])),
+            atol=1e-9,
+        )
+
+    def test_persistence_disabled(self, model_files):
+        """Kapalıyken diziler süreç içinde derlenir, dosya yazılmaz."""
+        model_path, scaler_path = model_files
+        entry = ModelRegistry(compiled=True, persist_compiled=False).get_entry(
+            1, model_path, scaler_path
+        )
+
+        assert entry.compiled is not None
+        assert not os.path.exists(compiled_path(model_path))
@@ -0,0 +1,304 @@
+"""
+DataProcessor form hesaplamaları için testler.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.data_processor import DataProcessor
+
+
+def _reference_team_form(team_matches, num_matches=5):
+    """Eski iterrows tabanlı calculate_team_form (referans)."""
+    last_matches = team_matches.sort_values(
+        "match_date", ascending=False, kind="stable"
+    ).head(num_matches)
+    points, scored, conceded, clean, results = [], [], [], [], []
+    for _, match in last_matches.iterrows():
+        is_home = match["home_team"] == match.get("team_name", "")
+        team_goals = match["home_goals"] if is_home else match["away_goals"]
+        opponent_goals = match["away_goals"] if is_home else match["home_goals"]
+        if team_goals > opponent_goals:
+            points.append(3)
+            results.append(2)
+        elif team_goals == opponent_goals:
+            points.append(1)
+            results.append(1)
+        else:
+            points.append(0)
+            results.append(0)
+        scored.append(team_goals)
+        conceded.append(opponent_goals)
+        clean.append(1 if opponent_goals == 0 else 0)
+    total = len(last_matches)
+    return {
+        "form": round(sum(points) / total, 2),
+        "goals_scored": round(sum(scored) / total, 2),
+        "goals_conceded": round(sum(conceded) / total, 2),
+        "clean_sheets": round(sum(clean) / total, 2),
+        "win_rate": round(results.count(2) / total, 2),
+        "draw_rate": round(results.count(1) / total, 2),
+        "loss_rate": round(results.count(0) / total, 2),
+    }
+
+
+@pytest.fixture
+def league_matches():
+    """Rastgele ama tekrarlanabilir lig maçları."""
+    rng = np.random.default_rng(21)
+    teams = [f"Takım {i}" for i in range(8)]
+    rows = []
+    for n in range(90):
+        home, away = rng.choice(len(teams), size=2, replace=False)
+        rows.append(
+            {
+                "match_date": datetime(2024, 1, 1) + timedelta(days=int(n // 3)),
+                "home_team": teams[home],
+                "away_team": teams[away],
+                "home_goals": int(rng.poisson(1.4)),
+                "away_goals": int(rng.poisson(1.1)),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+class TestCalculateTeamForm:
+    """calculate_team_form testleri."""
+
+    @pytest.mark.parametrize("num_matches", [1, 5, 8])
+    def test_matches_reference(self, league_matches, num_matches):
+        """Vektörize hesap, eski döngüyle aynı sonucu verir."""
+        for team in league_matches["home_team"].unique():
+            team_matches = league_matches[
+                (league_matches["home_team"] == team)
+                | (league_matches["away_team"] == team)
+            ].assign(team_name=team)
+            assert DataProcessor.calculate_team_form(
+                team_matches, num_matches
+            ) == _reference_team_form(team_matches, num_matches)
+
+    def test_without_team_name(self, league_matches):
+        """'team_name' yoksa maçlar deplasman açısından değerlendirilir."""
+        assert DataProcessor.calculate_team_form(
+            league_matches.head(4)
+        ) == _reference_team_form(league_matches.head(4))
+
+    def test_empty(self):
+        """Boş veri varsayılan istatistikleri döndürür."""
+        assert DataProcessor.calculate_team_form(pd.DataFrame())["form"] == 0.0
+
+
+class TestCalculateLeagueForm:
+    """calculate_league_form testleri."""
+
+    @pytest.mark.parametrize("num_matches", [3, 5])
+    def test_matches_per_team_form(self, league_matches, num_matches):
+        """Toplu hesap, her takım için tek tek hesaplanan formla aynıdır."""
+        league_form = DataProcessor.calculate_league_form(league_matches, num_matches)
+
+        teams = set(league_matches["home_team"]) | set(league_matches["away_team"])
+        assert set(league_form.index) == teams
+        for team in teams:
+            team_matches = league_matches[
+                (league_matches["home_team"] == team)
+                | (league_matches["away_team"] == team)
+            ].assign(team_name=team)
+            expected = DataProcessor.calculate_team_form(team_matches, num_matches)
+            assert league_form.loc[team].to_dict() == expected
+
+
+class TestGetLeagueForm:
+    """get_league_form testleri."""
+
+    @pytest.fixture
+    def matches(self):
+        """API biçiminde (sözlük listesi) maçlar."""
+        rng = np.random.default_rng(8)
+        rows = []
+        for n in range(120):
+            home, away = (rng.choice(10, size=2, replace=False) + 1).tolist()
+            rows.append(
+                {
+                    "date": (datetime(2024, 8, 1) + timedelta(days=n // 4)).strftime(
+                        "%Y-%m-%d"
+                    ),
+                    "home_team_id": home,
+                    "away_team_id": away,
+                    "home_team": f"Takım {home}",
+                    "away_team": f"Takım {away}",
+                    "home_goals": int(rng.poisson(1.4)),
+                    "away_goals": int(rng.poisson(1.1)),
+                }
+            )
+        # Yalnızca deplasmanda oynamış bir takım
+        rows.append({**rows[0], "home_team_id": 3, "away_team_id": 99})
+        return rows
+
+    @pytest.mark.parametrize("num_matches", [1, 5, 7])
+    def test_parity_with_get_team_form(self, matches, num_matches):
+        """Toplu hesap, takım başına get_team_form ile birebir aynıdır."""
+        league_form = DataProcessor.get_league_form(matches, num_matches)
+
+        team_ids = {m["home_team_id"] for m in matches} | {
+            m["away_team_id"] for m in matches
+        }
+        assert set(league_form) == team_ids
+        for team_id in team_ids:
+            for side, is_home in (("home", True), ("away", False)):
+                assert league_form[team_id][side] == DataProcessor.get_team_form(
+                    team_id, matches, is_home, num_matches
+                )
+
+    def test_empty(self):
+        """Boş liste boş sözlük döndürür."""
+        assert DataProcessor.get_league_form([]) == {}
+
+
+class TestPreprocessMatches:
+    """preprocess_matches testleri."""
+
+    @pytest.fixture
+    def rows(self):
+        """Biri eksik skorlu, sözlük listesi biçiminde maçlar."""
+        return [
+            {
+                "date": "2024-03-02",
+                "home_team": "A",
+                "away_team": "B",
+                "home_goals": 2,
+                "away_goals": 1,
+                "referee": "X",
+            },
+            {
+                "date": "2024-03-03",
+                "home_team": "B",
+                "away_team": "C",
+                "home_goals": 0,
+                "away_goals": 0,
+                "referee": None,
+            },
+            {
+                "date": "2024-03-09",
+                "home_team": "C",
+                "away_team": "A",
+                "home_goals": 3,
+                "away_goals": None,
+                "referee": "Y",
+            },
+        ]
+
+    def test_compact_dtypes_and_targeted_fills(self, rows):
+        """Küçük tipler kullanılır, yalnızca skor sütunları doldurulur."""
+        df = DataProcessor.preprocess_matches(rows)
+
+        assert df["home_goals"].dtype == np.int16
+        assert df["home_team"].dtype == "category"
+        assert list(df["home_team"].cat.categories) == list(
+            df["away_team"].cat.categories
+        )
+        assert np.issubdtype(df["match_date"].dtype, np.datetime64)
+        assert df["home_win"].tolist() == [1, 0, 0]
+        assert df["draw"].tolist() == [0, 1, 0]
+        assert df["goal_difference"].tolist() == [1, 0, 0]
+        assert df["total_goals"].tolist() == [3, 0, 0]
+        assert df["away_goals"].tolist() == [1, 0, 0]
+        assert df["day_of_week"].tolist() == [5, 6, 5]
+        assert df["referee"].isna().tolist() == [False, True, False]
+        assert df.attrs["memory_report"]["rows"] == 3
+
+    def test_columnar_and_cursor_sources(self, rows):
+        """Sütun sözlüğü ve SQL imleci, sözlük listesiyle aynı sonucu verir."""
+        import sqlite3
+
+        columns = ["date", "home_team", "away_team", "home_goals", "away_goals"]
+        expected = DataProcessor.preprocess_matches(
+            [{key: row[key] for key in columns} for row in rows]
+        )
+
+        from_columns = DataProcessor.preprocess_matches(
+            {key: np.array([row[key] for row in rows]) for key in columns}
+        )
+        pd.testing.assert_frame_equal(from_columns, expected, check_categorical=False)
+
+        connection = sqlite3.connect(":memory:")
+        connection.execute(f"CREATE TABLE matches ({', '.join(columns)})")
+        connection.executemany(
+            "INSERT INTO matches VALUES (?, ?, ?, ?, ?)",
+            [tuple(row[key] for key in columns) for row in rows],
+        )
+        cursor = connection.execute(f"SELECT {', '.join(columns)} FROM matches")
+        from_cursor = DataProcessor.preprocess_matches(cursor, chunk_size=2)
+
+        assert from_cursor.attrs["memory_report"]["chunks"] == 2
+        assert from_cursor["home_team"].dtype == "category"
+        pd.testing.assert_frame_equal(from_cursor, expected, check_categorical=False)
+
+    def test_dataframe_input_is_not_modified(self, rows):
+        """DataFrame girdisi yerinde değiştirilmez."""
+        frame = pd.DataFrame(rows)
+        original = frame.copy()
+
+        df = DataProcessor.preprocess_matches(frame)
+
+        assert df is not frame
+        assert "match_date" in df.columns
+        pd.testing.assert_frame_equal(frame, original)
+
+    def test_input_columns_are_kept(self, rows):
+        """Ham 'date' korunur; kategorik takım adları metin gibi kullanılır."""
+        df = DataProcessor.preprocess_matches(rows)
+
+        assert df["date"].tolist() == ["2024-03-02", "2024-03-03", "2024-03-09"]
+        assert df["match_date"].tolist() == list(pd.to_datetime(df["date"]))
+        assert (df["home_team"] == "A").tolist() == [True, False, False]
+        assert df["away_team"].astype(str).tolist() == ["B", "C", "A"]
+
+    def test_large_scores_do_not_wrap(self, rows):
+        """127 üzerindeki skorlar taşmadan korunur."""
+        rows[0].update(home_goals=130, away_goals=2)
+
+        df = DataProcessor.preprocess_matches(rows)
+
+        assert df["home_goals"].tolist()[0] == 130
+        assert df["total_goals"].tolist()[0] == 132
+        assert df["goal_difference"].tolist()[0] == 128
+
+
+class TestBuildFeatureMatrix:
+    """build_feature_matrix testleri."""
+
+    @pytest.mark.parametrize("model_type", ["result", "over_under", "btts"])
+    def test_matches_prepare_prediction_data(self, league_matches, model_type):
+        """Toplu matris, maç başına prepare_prediction_data ile aynıdır."""
+        from app.services.prediction_engine import PredictionEngine
+
+        order = PredictionEngine.FEATURE_ORDERS[model_type]
+        league_form = DataProcessor.calculate_league_form(league_matches)
+        fixtures = league_matches[["home_team", "away_team"]].head(40)
+        home_stats = league_form.loc[fixtures["home_team"]]
+        away_stats = league_form.loc[fixtures["away_team"]]
+        extra = {"temperature": np.linspace(5, 25, len(fixtures))}
+
+        matrix = DataProcessor.build_feature_matrix(
+            home_stats, away_stats, order, extra
+        )
+
+        assert matrix.dtype == np.float32
+        assert matrix.shape == (len(fixtures), len(order))
+        assert matrix.flags["C_CONTIGUOUS"]
+        for row, (home, away) in enumerate(zip(home_stats.index, away_stats.index)):
+            features = DataProcessor.prepare_prediction_data(
+                league_form.loc[home].to_dict(), league_form.loc[away].to_dict()
+            )
+            features["temperature"] = round(float(extra["temperature"][row]), 4)
+            expected = np.array(
+                [features.get(name, 0.0) for name in order], dtype=np.float32
+            )
+            np.testing.assert_array_equal(matrix[row], expected)
@@ -0,0 +1,231 @@
+"""
+database_utils.update_team_forms için eski takım başına döngüyle (23c5be2)
+eşdeğerlik testleri.
+
+Kök database_utils modülü eski şemayı (Match.is_played, Team.current_form,
+Player, Injury) kullanır; bu modeller ağaçta bulunmadığından test kendi eski
+şema modellerini tanımlar ve modülü bunlarla yükler.
+"""
+import importlib.util
+import os
+import random
+import sys
+import types
+from datetime import datetime, timedelta
+
+import pytest
+import sqlalchemy as sa
+from sqlalchemy.orm import DeclarativeBase, Session
+
+# Proje kök dizinini Python path'ine ekle
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.insert(0, ROOT)
+
+from config import Config
+
+
+class LegacyBase(DeclarativeBase):
+    pass
+
+
+class Team(LegacyBase):
+    __tablename__ = "teams"
+    id = sa.Column(sa.Integer, primary_key=True)
+    name = sa.Column(sa.String(100))
+    current_form = sa.Column(sa.Float)
+
+
+class Match(LegacyBase):
+    __tablename__ = "matches"
+    id = sa.Column(sa.Integer, primary_key=True)
+    home_team_id = sa.Column(sa.Integer, sa.ForeignKey("teams.id"))
+    away_team_id = sa.Column(sa.Integer, sa.ForeignKey("teams.id"))
+    match_date = sa.Column(sa.DateTime)
+    is_played = sa.Column(sa.Boolean, default=False)
+    home_goals = sa.Column(sa.Integer)
+    away_goals = sa.Column(sa.Integer)
+
+
+class TeamMatchLog(LegacyBase):
+    __tablename__ = "team_match_log"
+    id = sa.Column(sa.Integer, primary_key=True)
+    team_id = sa.Column(sa.Integer, sa.ForeignKey("teams.id"))
+    match_date = sa.Column(sa.DateTime)
+    goals_for = sa.Column(sa.Integer)
+    goals_against = sa.Column(sa.Integer)
+
+
+@pytest.fixture
+def legacy_session():
+    """Eski şema tablolarıyla bellek içi SQLite oturumu."""
+    engine = sa.create_engine("sqlite://")
+    LegacyBase.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def database_utils(models, legacy_session, monkeypatch):
+    """Eski şema modelleriyle yüklenmiş kök database_utils modülü."""
+    # Servis modüllerini gerçek modellerle önceden yükle
+    import app.services.head_to_head_index  # noqa: F401
+    import app.services.match_queries  # noqa: F401
+
+    legacy_models = types.ModuleType("app.models")
+    for model in (Team, Match, TeamMatchLog):
+        setattr(legacy_models, model.__name__, model)
+    # update_team_forms tarafından kullanılmayan modeller
+    for name in ("Player", "Injury", "TeamStatistics", "Prediction"):
+        setattr(legacy_models, name, None)
+    monkeypatch.setitem(sys.modules, "app.models", legacy_models)
+
+    spec = importlib.util.spec_from_file_location(
+        "root_database_utils", os.path.join(ROOT, "database_utils.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "db", types.SimpleNamespace(session=legacy_session))
+    return module
+
+
+@pytest.fixture
+def league(legacy_session):
+    """Rastgele oynanmış ve oynanmamış maçlar içeren eski şema veritabanı."""
+    rng = random.Random(11)
+    teams = [Team(name=f"Team {i}", current_form=0.0) for i in range(8)]
+    legacy_session.add_all(teams)
+    legacy_session.flush()
+
+    # Son takım yalnızca oynanmamış maçlara çıkar
+    for n in range(60):
+        home, away = rng.sample(teams[:-1], 2)
+        match = Match(
+            home_team_id=home.id,
+            away_team_id=away.id,
+            match_date=datetime(2024, 1, 1) + timedelta(hours=13 * n),
+            is_played=n % 7 != 0,
+            home_goals=rng.randint(0, 4),
+            away_goals=rng.randint(0, 3),
+        )
+        legacy_session.add(match)
+        if match.is_played:
+            for team_id, goals_for, goals_against in (
+                (home.id, match.home_goals, match.away_goals),
+                (away.id, match.away_goals, match.home_goals),
+            ):
+                legacy_session.add(
+                    TeamMatchLog(
+                        team_id=team_id,
+                        match_date=match.match_date,
+                        goals_for=goals_for,
+                        goals_against=goals_against,
+                    )
+                )
+    legacy_session.add(
+        Match(
+            home_team_id=teams[-1].id,
+            away_team_id=teams[0].id,
+            match_date=datetime(2024, 6, 1),
+            is_played=False,
+        )
+    )
+    legacy_session.commit()
+    return [team.id for team in teams]
+
+
+def legacy_team_form(session, team_id):
+    """Eski takım başına döngü (veritabanına yazmadan)."""
+    recent_matches = (
+        session.query(Match)
+        .filter((Match.home_team_id == team_id) | (Match.away_team_id == team_id))
+        .filter(Match.is_played == True)  # noqa: E712
+        .order_by(Match.match_date.desc())
+        .limit(5)
+        .all()
+    )
+    if not recent_matches:
+        return 50.0
+
+    form_points = 0
+    for i, match in enumerate(recent_matches):
+        is_home = match.home_team_id == team_id
+        team_goals = match.home_goals if is_home else match.away_goals
+        opp_goals = match.away_goals if is_home else match.home_goals
+        if team_goals > opp_goals:
+            points = 3
+        elif team_goals == opp_goals:
+            points = 1
+        else:
+            points = 0
+        form_points += points * (1.0 - (i * 0.1))
+
+    max_possible_points = sum(3 * (1.0 - i * 0.1) for i in range(len(recent_matches)))
+    return (form_points / max_possible_points) * 100
+
+
+class TestUpdateTeamForms:
+    """update_team_forms testleri."""
+
+    @pytest.mark.parametrize("use_log", [False, True])
+    def test_matches_per_team_loop(
+        self, database_utils, legacy_session, league, monkeypatch, use_log
+    ):
+        """Ağırlıklı formlar eski döngüyle aynıdır ve takımlara yazılır."""
+        monkeypatch.setattr(Config, "USE_TEAM_MATCH_LOG", use_log)
+        expected = {
+            team_id: legacy_team_form(legacy_session, team_id) for team_id in league
+        }
+
+        forms = database_utils.update_team_forms(league)
+
+        assert forms == pytest.approx(expected)
+        legacy_session.expire_all()
+        for team in legacy_session.query(Team):
+            if team.id == league[-1]:
+                # Oynanmış maçı olmayan takımın formu değişmez
+                assert team.current_form == 0.0
+            else:
+                assert team.current_form == pytest.approx(expected[team.id])
+
+    def test_all_teams_and_single_team(self, database_utils, legacy_session, league):
+        """team_ids verilmezse maçı olan tüm takımlar güncellenir."""
+        expected = {
+            team_id: legacy_team_form(legacy_session, team_id)
+            for team_id in league[:-1]
+        }
+
+        assert database_utils.update_team_forms() == pytest.approx(expected)
+        assert database_utils.update_team_form(league[2]) == pytest.approx(
+            expected[league[2]]
+        )
+        assert database_utils.update_team_form(league[-1]) == 50.0
+
+    def test_shorter_history_and_limit(self, database_utils, legacy_session):
+        """Beş maçtan az oynayan takımda ağırlıklar yalnızca oynanan maçlara göre."""
+        home, away = Team(name="Home"), Team(name="Away")
+        legacy_session.add_all([home, away])
+        legacy_session.flush()
+        for day, (home_goals, away_goals) in enumerate([(2, 0), (1, 1)]):
+            legacy_session.add(
+                Match(
+                    home_team_id=home.id,
+                    away_team_id=away.id,
+                    match_date=datetime(2024, 3, 1 + day),
+                    is_played=True,
+                    home_goals=home_goals,
+                    away_goals=away_goals,
+                )
+            )
+        legacy_session.commit()
+
+        forms = database_utils.update_team_forms([home.id, away.id])
+
+        # En yeni beraberlik 1.0, eski galibiyet 0.9 ağırlıklı
+        assert forms[home.id] == pytest.approx((1 * 1.0 + 3 * 0.9) / (3 * 1.9) * 100)
+        assert forms[away.id] == pytest.approx(
+            legacy_team_form(legacy_session, away.id)
+        )
+        assert database_utils.update_team_forms([home.id], limit=1)[
+            home.id
+        ] == pytest.approx(100 / 3)
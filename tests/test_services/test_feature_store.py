@@ -0,0 +1,185 @@
+"""
+Özellik deposu için testler.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.feature_store import (
+    FEATURE_COLUMNS,
+    FeatureStore,
+    compute_point_in_time_features,
+)
+from app.services.team_form_index import TeamFormIndex
+
+
+def _features_from_forms(home_form, away_form):
+    """MatchPredictor._features_from_forms ile aynı vektör (referans)."""
+    features = [
+        home_form["avg_goals_for"],
+        home_form["avg_goals_against"],
+        home_form["points"]
+        / (3 * (home_form["wins"] + home_form["draws"] + home_form["losses"] or 1)),
+        away_form["avg_goals_for"],
+        away_form["avg_goals_against"],
+        away_form["points"]
+        / (3 * (away_form["wins"] + away_form["draws"] + away_form["losses"] or 1)),
+        home_form["clean_sheet_percent"] / 100,
+        away_form["clean_sheet_percent"] / 100,
+        home_form["failed_to_score_percent"] / 100,
+        away_form["failed_to_score_percent"] / 100,
+    ]
+    result_values = {"W": 1.0, "D": 0.0}
+    for form in (home_form["form"], away_form["form"]):
+        for result in form[:5]:
+            features.append(result_values.get(result, -1.0))
+    while len(features) < 20:
+        features.append(0.0)
+    return np.array(features[:20])
+
+
+@pytest.fixture
+def matches():
+    """Rastgele ama tekrarlanabilir maç tablosu."""
+    rng = np.random.default_rng(7)
+    rows = []
+    for match_id in range(1, 121):
+        home, away = rng.choice(8, size=2, replace=False) + 1
+        rows.append(
+            {
+                "match_id": match_id,
+                "match_date": datetime(2023, 8, 1) + timedelta(days=3 * match_id),
+                "league_id": 1 + match_id % 2,
+                "home_team_id": int(home),
+                "away_team_id": int(away),
+                "home_goals": int(rng.poisson(1.5)),
+                "away_goals": int(rng.poisson(1.1)),
+            }
+        )
+    # Sıralı olmayan giriş de doğru işlenmeli
+    return pd.DataFrame(rows).sample(frac=1, random_state=3)
+
+
+class TestFeatureStore:
+    """Özellik deposu için test sınıfı."""
+
+    def test_parity_with_form_index(self, matches):
+        """Özellikler maç anındaki form indeksiyle birebir aynı olmalı."""
+        index = TeamFormIndex()
+        for row in matches.itertuples():
+            index.add_match(
+                SimpleNamespace(
+                    id=row.match_id,
+                    home_team_id=row.home_team_id,
+                    away_team_id=row.away_team_id,
+                    league_id=row.league_id,
+                    match_date=row.match_date,
+                    home_goals=row.home_goals,
+                    away_goals=row.away_goals,
+                    updated_at=None,
+                )
+            )
+
+        frame = compute_point_in_time_features(matches)
+
+        assert len(frame) == len(matches)
+        for row in frame.itertuples():
+            expected = _features_from_forms(
+                index.get_form(row.home_team_id, row.match_date),
+                index.get_form(row.away_team_id, row.match_date),
+            )
+            actual = frame.loc[row.Index, FEATURE_COLUMNS].to_numpy(dtype=float)
+            np.testing.assert_allclose(actual, expected, atol=1e-9)
+
+    def test_first_match_has_no_history(self, matches):
+        """Takımın ilk maçında form özellikleri sıfır olmalı."""
+        frame = compute_point_in_time_features(matches)
+        first = frame.sort_values("match_date").iloc[0]
+
+        assert (first[FEATURE_COLUMNS] == 0).all()
+
+    def test_save_and_load(self, matches, tmp_path):
+        """Dosyaya yazılan tablo lig filtresiyle geri okunabilmeli."""
+        store = FeatureStore(path=str(tmp_path / "features.npz"))
+        frame = compute_point_in_time_features(matches)
+        store.save(frame)
+
+        loaded = store.load(league_id=2)
+
+        expected = frame[frame["league_id"] == 2]
+        assert len(loaded) == len(expected)
+        np.testing.assert_allclose(
+            loaded[FEATURE_COLUMNS].to_numpy(),
+            expected[FEATURE_COLUMNS].to_numpy(),
+            rtol=1e-6,
+        )
+        assert loaded["match_id"].tolist() == expected["match_id"].tolist()
+
+
+class TestFeatureStoreStaleness:
+    """Veritabanı değiştiğinde dosyanın yeniden oluşturulması testleri."""
+
+    @pytest.fixture
+    def store(self, db_session, models, tmp_path):
+        """Üç tamamlanmış maçlı veritabanı için özellik deposu."""
+        teams = [models.Team(name=f"Team {i}") for i in range(3)]
+        db_session.add_all(teams)
+        db_session.flush()
+        for day, (home, away) in enumerate([(0, 1), (1, 2), (2, 0)]):
+            db_session.add(
+                models.Match(
+                    home_team_id=teams[home].id,
+                    away_team_id=teams[away].id,
+                    match_date=datetime(2024, 1, 1) + timedelta(days=day),
+                    status=models.MatchStatus.FINISHED,
+                    home_goals=1,
+                    away_goals=0,
+                )
+            )
+        db_session.commit()
+        return FeatureStore(path=str(tmp_path / "features.npz"))
+
+    def test_fresh_file_is_reused(self, store, db_session):
+        """Veri değişmediyse dosya yeniden oluşturulmaz."""
+        store.build(db_session)
+
+        assert not store.is_stale(db_session)
+
+    def test_changed_results_rebuild(self, store, db_session, models):
+        """Yeni ve düzeltilen sonuçlar dosyayı eskimiş yapar."""
+        store.build(db_session)
+        match = db_session.query(models.Match).order_by(models.Match.id).first()
+        match.home_goals = 4
+        db_session.commit()
+
+        assert store.is_stale(db_session)
+        frame = store.load_or_build(db_session)
+        assert frame.loc[frame["match_id"] == match.id, "home_goals"].item() == 4
+        assert not store.is_stale(db_session)
+
+        db_session.add(
+            models.Match(
+                home_team_id=match.away_team_id,
+                away_team_id=match.home_team_id,
+                match_date=datetime(2024, 2, 1),
+                status=models.MatchStatus.FINISHED,
+                home_goals=2,
+                away_goals=2,
+            )
+        )
+        db_session.commit()
+        assert len(store.load_or_build(db_session)) == 4
+
+    def test_file_without_version_is_stale(self, store, db_session):
+        """Sürüm bilgisi olmayan dosya eskimiş sayılır."""
+        store.save(store.build(db_session))
+
+        assert store.is_stale(db_session)
@@ -0,0 +1,137 @@
+"""
+FootballAPI takım ve maç eşitlemesi için testler.
+"""
+import importlib.util
+import os
+import sys
+import types
+from datetime import datetime
+
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.insert(0, ROOT)
+
+
+def _team(api_id, name, **extra):
+    return {
+        "id": api_id,
+        "name": name,
+        "shortName": name.split()[0],
+        "crest": f"https://crests.example/{api_id}.png",
+        "founded": 1880 + api_id,
+        "area": {"name": "England"},
+        "tla": name[:3].upper(),
+        "venue": f"{name} Stadium",
+        **extra,
+    }
+
+
+def _match(api_id, home, away, status="FINISHED", score=(2, 1)):
+    return {
+        "id": api_id,
+        "utcDate": "2024-09-01T15:00:00Z",
+        "status": status,
+        "homeTeam": {"id": home},
+        "awayTeam": {"id": away},
+        "score": {
+            "fullTime": {"home": score[0], "away": score[1]},
+            "halfTime": {"home": 0, "away": 0},
+        },
+    }
+
+
+@pytest.fixture
+def football_api(models, db_session, monkeypatch):
+    """Gerçek Team ve Match tablolarıyla çalışan football_api modülü."""
+    # Kök modül ağaçta bulunmayan Player modelini de içe aktarır
+    monkeypatch.setattr(models, "Player", None, raising=False)
+    spec = importlib.util.spec_from_file_location(
+        "root_football_api", os.path.join(ROOT, "football_api.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "db", types.SimpleNamespace(session=db_session))
+    monkeypatch.setattr(module, "apply_match_changes", lambda session, changes: None)
+    return module
+
+
+@pytest.fixture
+def api(football_api, monkeypatch):
+    """get_teams yanıtı test tarafından belirlenen istemci."""
+    client = football_api.FootballAPI(api_key="test")
+    client.teams = []
+    monkeypatch.setattr(client, "get_teams", lambda code, season=None: client.teams)
+    return client
+
+
+class TestSyncTeams:
+    """sync_teams_to_db testleri."""
+
+    def test_columns_exist_on_team_table(self, football_api, models):
+        """Eşitlenen sütunların hepsi Team tablosunda bulunur."""
+        assert set(football_api.TEAM_SYNC_COLUMNS) <= set(
+            models.Team.__table__.c.keys()
+        )
+
+    def test_adds_and_updates_teams(self, api, db_session, models):
+        """Takımlar eklenir, logo crest'ten alınır; değişenler güncellenir."""
+        api.teams = [_team(1, "Arsenal FC"), _team(2, "Chelsea FC")]
+        assert api.sync_teams_to_db("PL") == (2, 0, 0, 0)
+
+        api.teams = [_team(1, "Arsenal FC", founded=1886), _team(2, "Chelsea FC")]
+        assert api.sync_teams_to_db("PL") == (0, 1, 1, 0)
+
+        arsenal = db_session.query(models.Team).filter_by(api_id=1).one()
+        assert arsenal.name == "Arsenal FC"
+        assert arsenal.short_name == "Arsenal"
+        assert arsenal.logo == "https://crests.example/1.png"
+        assert arsenal.founded == 1886
+        assert arsenal.country == "England"
+
+    def test_existing_name_without_api_id_is_matched(self, api, db_session, models):
+        """api_id'si olmayan aynı adlı takım eşleştirilip güncellenir."""
+        db_session.add(models.Team(name="Arsenal FC", country="England"))
+        db_session.commit()
+
+        api.teams = [_team(1, "Arsenal FC"), _team(2, "Chelsea FC")]
+        assert api.sync_teams_to_db("PL") == (1, 1, 0, 0)
+
+        teams = db_session.query(models.Team).order_by(models.Team.id).all()
+        assert [(team.name, team.api_id) for team in teams] == [
+            ("Arsenal FC", 1),
+            ("Chelsea FC", 2),
+        ]
+        assert teams[0].logo == "https://crests.example/1.png"
+
+    def test_name_of_other_api_team_is_skipped(self, api, db_session, models):
+        """Adı başka api_id'li takıma ait takım atlanır, diğerleri yazılır."""
+        api.teams = [_team(1, "Arsenal FC")]
+        api.sync_teams_to_db("PL")
+
+        api.teams = [_team(7, "Arsenal FC"), _team(2, "Chelsea FC")]
+        assert api.sync_teams_to_db("PL") == (1, 0, 0, 1)
+
+        assert dict(db_session.query(models.Team.api_id, models.Team.name)) == {
+            1: "Arsenal FC",
+            2: "Chelsea FC",
+        }
+
+
+class TestSyncedTeamsAndMatches:
+    """Takım eşitlemesinden sonra maçların eşitlenmesi."""
+
+    def test_matches_of_synced_teams_are_written(self, api, db_session, models):
+        """Eşitlenen takımların maçları atlanmadan yazılır."""
+        api.teams = [_team(1, "Arsenal FC"), _team(2, "Chelsea FC")]
+        api.sync_teams_to_db("PL")
+
+        result = api.upsert_matches([_match(100, 1, 2), _match(101, 2, 3)])
+        db_session.commit()
+
+        assert result == (1, 0, 0, 1)
+        match = db_session.query(models.Match).filter_by(api_id=100).one()
+        assert (match.home_goals, match.away_goals) == (2, 1)
+        assert match.match_date == datetime(2024, 9, 1, 15, 0)
+        assert match.status == models.MatchStatus.FINISHED
@@ -0,0 +1,176 @@
+"""
+H2H indeksi için testler.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.head_to_head_index import HeadToHeadIndex, pair_key
+
+
+def _match(match_id, home, away, day, home_goals, away_goals):
+    return SimpleNamespace(
+        id=match_id,
+        home_team_id=home,
+        away_team_id=away,
+        match_date=datetime(2024, 1, 1) + timedelta(days=day),
+        home_goals=home_goals,
+        away_goals=away_goals,
+        updated_at=datetime(2024, 6, 1) + timedelta(days=day),
+    )
+
+
+@pytest.fixture
+def index():
+    """İki çiftin karşılaşmalarıyla doldurulmuş indeks."""
+    index = HeadToHeadIndex(max_meetings=3)
+    for match in [
+        _match(1, 1, 2, 0, 2, 0),
+        _match(2, 2, 1, 7, 1, 1),
+        _match(3, 1, 2, 14, 0, 3),
+        _match(4, 2, 1, 21, 0, 1),
+        _match(5, 3, 1, 10, 2, 2),
+    ]:
+        index.add_match(match)
+    return index
+
+
+class TestHeadToHeadIndex:
+    """HeadToHeadIndex testleri."""
+
+    def test_pair_key_is_unordered(self):
+        """Çift anahtarı takım sırasından bağımsızdır."""
+        assert pair_key(7, 3) == pair_key(3, 7) == (3, 7)
+
+    def test_keeps_last_meetings(self, index):
+        """Çift başına yalnızca en yeni max_meetings maç tutulur."""
+        meetings = index.get_meetings(2, 1)
+
+        assert [meeting.match_id for meeting in meetings] == [4, 3, 2]
+        assert index.get_meetings(1, 2, limit=1)[0].match_id == 4
+        assert index.pair_count() == 2
+
+    def test_stats_from_home_perspective(self, index):
+        """İstatistikler istenen ev sahibinin bakış açısıyla hesaplanır."""
+        h2h = index.get_head_to_head(1, 2)
+
+        assert (h2h["home_wins"], h2h["draws"], h2h["away_wins"]) == (1, 1, 1)
+        assert (h2h["home_goals"], h2h["away_goals"]) == (2, 4)
+        assert [meeting["result"] for meeting in h2h["meetings"]] == ["H", "A", "D"]
+        assert h2h["last_meeting"] == datetime(2024, 1, 22)
+
+        reverse = index.get_head_to_head(2, 1)
+        assert (reverse["home_wins"], reverse["away_wins"]) == (1, 1)
+        assert (reverse["home_goals"], reverse["away_goals"]) == (4, 2)
+
+    def test_updated_result_replaces_meeting(self, index):
+        """Düzeltilen skor aynı maçın eski kaydının yerine geçer."""
+        index.add_match(_match(4, 2, 1, 21, 3, 1))
+
+        meetings = index.get_meetings(1, 2)
+        assert [meeting.match_id for meeting in meetings] == [4, 3, 2]
+        assert (meetings[0].home_goals, meetings[0].away_goals) == (3, 1)
+
+    def test_unknown_pair_and_limit(self, index):
+        """Karşılaşmamış çiftler boş döner; limit kapasiteyi aşamaz."""
+        assert index.get_head_to_head(4, 5)["total_matches"] == 0
+        with pytest.raises(ValueError):
+            index.get_head_to_head(1, 2, limit=10)
+
+
+class TestHeadToHeadSync:
+    """Veritabanıyla senkronizasyon ve olay dinleyicisi testleri."""
+
+    @pytest.fixture
+    def teams(self, db_session, models):
+        home, away = models.Team(name="Home"), models.Team(name="Away")
+        db_session.add_all([home, away])
+        db_session.commit()
+        return home.id, away.id
+
+    @pytest.fixture
+    def listeners(self, models, monkeypatch):
+        from sqlalchemy import event
+
+        from app.services import head_to_head_index as module
+
+        monkeypatch.setattr(module, "head_to_head_index", HeadToHeadIndex())
+        module.register_head_to_head_listeners()
+        yield module.head_to_head_index
+        for event_name in ("after_insert", "after_update"):
+            event.remove(models.Match, event_name, module._on_match_saved)
+
+    def _save_elsewhere(self, db_session, models, teams, day, home_goals):
+        """Maçı olay dinleyicilerini tetiklemeden (başka süreç gibi) kaydeder."""
+        import sqlalchemy as sa
+
+        db_session.execute(
+            sa.insert(models.Match.__table__).values(
+                home_team_id=teams[0],
+                away_team_id=teams[1],
+                match_date=datetime(2024, 1, 1) + timedelta(days=day),
+                status=models.MatchStatus.FINISHED.name,
+                home_goals=home_goals,
+                away_goals=1,
+                updated_at=datetime.utcnow(),
+            )
+        )
+        db_session.commit()
+
+    def test_sync_reads_results_saved_elsewhere(self, db_session, models, teams):
+        """İlk sync indeksi yükler; sonrakiler yeni sonuçları ekler."""
+        index = HeadToHeadIndex(sync_interval=0)
+        self._save_elsewhere(db_session, models, teams, 0, 2)
+
+        assert index.sync(db_session) == 1
+        assert index.sync(db_session) == 0
+        self._save_elsewhere(db_session, models, teams, 7, 0)
+        assert index.sync(db_session) == 1
+
+        h2h = index.get_head_to_head(*teams)
+        assert [meeting["result"] for meeting in h2h["meetings"]] == ["A", "H"]
+
+    def test_sync_interval(self, db_session, models, teams, monkeypatch):
+        """Yüklemeden sonra veritabanına en fazla aralıkta bir gidilir."""
+        from app.services import head_to_head_index as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        index = HeadToHeadIndex(sync_interval=10)
+        index.sync(db_session)
+        self._save_elsewhere(db_session, models, teams, 0, 2)
+
+        assert index.sync(db_session) == 0
+        now[0] += 10
+        assert index.sync(db_session) == 1
+
+    def test_rolled_back_result_not_indexed(self, listeners, db_session, models, teams):
+        """Geri alınan sonuç indekse girmez; commit edilen sonuç commit'te girer."""
+        listeners.load(db_session)
+
+        def finished(day, home_goals):
+            return models.Match(
+                home_team_id=teams[0],
+                away_team_id=teams[1],
+                match_date=datetime(2024, 1, 1) + timedelta(days=day),
+                status=models.MatchStatus.FINISHED,
+                home_goals=home_goals,
+                away_goals=1,
+            )
+
+        db_session.add(finished(0, 2))
+        db_session.flush()
+        db_session.rollback()
+        assert listeners.get_meetings(*teams) == ()
+
+        db_session.add(finished(7, 1))
+        db_session.flush()
+        assert listeners.get_meetings(*teams) == ()
+        db_session.commit()
+        assert listeners.get_head_to_head(*teams)["draws"] == 1
@@ -0,0 +1,123 @@
+"""
+Sağlayıcı HTTP istemcisi için testler.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.http_client import AsyncHTTPClient, RateLimiter, run_sync
+
+DELAY = 0.3
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """/slow gecikmeli yanıt verir; /flaky ilk iki istekte 503 döndürür."""
+
+    flaky_calls = 0
+
+    def do_GET(self):
+        if self.path == "/slow":
+            time.sleep(DELAY)
+            status = 200
+        elif self.path == "/flaky":
+            type(self).flaky_calls += 1
+            status = 503 if type(self).flaky_calls <= 2 else 200
+        else:
+            status = 404
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    """Yerel test HTTP sunucusu; (temel URL, istemci) döndürür."""
+    _Handler.flaky_calls = 0
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    host = f"127.0.0.1:{httpd.server_port}"
+    client = AsyncHTTPClient(
+        max_concurrency=8, max_retries=3, backoff=0.01, rate_limits={host: (100, 100)}
+    )
+    yield f"http://{host}", client
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestAsyncHTTPClient:
+    """AsyncHTTPClient testleri."""
+
+    def test_concurrent_requests_take_slowest_time(self, server):
+        """Eşzamanlı istekler toplamda en yavaş istek kadar sürer."""
+        base_url, client = server
+
+        async def fetch_all():
+            return await client.gather(
+                *(client.get(f"{base_url}/slow") for _ in range(8))
+            )
+
+        started = time.perf_counter()
+        responses = run_sync(fetch_all())
+        elapsed = time.perf_counter() - started
+
+        assert [response.json() for response in responses] == [{"ok": True}] * 8
+        assert elapsed < DELAY * 3
+
+    def test_retries_server_errors(self, server):
+        """503 yanıtları yeniden denenir."""
+        base_url, client = server
+        response = client.get_sync(f"{base_url}/flaky")
+
+        assert response.status_code == 200
+        assert _Handler.flaky_calls == 3
+
+    def test_client_errors_are_not_retried(self, server):
+        """404 yeniden denenmeden hata olarak döner."""
+        base_url, client = server
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get_sync(f"{base_url}/missing")
+
+    def test_run_sync_inside_running_loop(self, server):
+        """Senkron sarmalayıcı çalışan bir olay döngüsünün içinden de çalışır."""
+        base_url, client = server
+
+        async def caller():
+            return client.get_sync(f"{base_url}/slow").status_code
+
+        assert asyncio.run(caller()) == 200
+
+
+class TestRateLimiter:
+    """Jeton kovası testleri."""
+
+    def test_burst_then_rate(self):
+        """Kova dolu olduğu sürece beklenmez; sonra hız kadar beklenir."""
+        limiter = RateLimiter(rate=10, burst=2)
+        waits = [limiter.reserve() for _ in range(4)]
+
+        assert waits[:2] == [0.0, 0.0]
+        assert waits[2] == pytest.approx(0.1, abs=0.01)
+        assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+    def test_server_exhaustion_blocks_until_reset(self):
+        """Sunucu hakkın bittiğini bildirince sıfırlanmaya kadar beklenir."""
+        limiter = RateLimiter(rate=10, burst=10)
+        limiter.update(remaining=0, reset=5)
+
+        assert limiter.reserve() == pytest.approx(5, abs=0.05)
@@ -0,0 +1,141 @@
+"""
+Artımlı eğitim için testler.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services import incremental_training
+from app.services.feature_store import FeatureStore, compute_point_in_time_features
+from app.services.incremental_training import full_refit_reason, update_league_model
+from app.services.match_model import load_model_metadata, model_backend, model_paths
+from app.services.model_artifacts import load_artifact
+from app.services.training_orchestrator import train_league_job
+
+
+def _matches(count, seed=3):
+    """Rastgele ama tekrarlanabilir maç tablosu."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for match_id in range(1, count + 1):
+        home, away = rng.choice(10, size=2, replace=False) + 1
+        rows.append(
+            {
+                "match_id": match_id,
+                "match_date": datetime(2023, 8, 1) + timedelta(days=match_id),
+                "league_id": 1,
+                "home_team_id": int(home),
+                "away_team_id": int(away),
+                "home_goals": int(rng.poisson(1.5)),
+                "away_goals": int(rng.poisson(1.1)),
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """İlk 150 maçı içeren özellik deposu."""
+    store = FeatureStore(path=str(tmp_path / "features.npz"))
+    store.save(compute_point_in_time_features(_matches(200).head(150)))
+    return store
+
+
+class TestIncrementalTraining:
+    """update_league_model testleri."""
+
+    def test_first_run_is_full_refit(self, store, tmp_path):
+        """Model yoksa tam eğitim yapılır ve eğitim bilgisi yazılır."""
+        result = update_league_model(1, store, model_dir=str(tmp_path))
+
+        assert result["mode"] == "full"
+        assert result["success"]
+        metadata = load_model_metadata(model_paths(1, str(tmp_path))[0])
+        assert metadata["incremental_updates"] == 0
+        assert pd.Timestamp(metadata["trained_until"]) == pd.Timestamp("2023-12-29")
+
+    def test_new_matches_add_trees(self, store, tmp_path, monkeypatch):
+        """Yeni maçlar mevcut modele ek ağaç olarak eklenir."""
+        update_league_model(1, store, model_dir=str(tmp_path))
+        store.save(compute_point_in_time_features(_matches(200)))
+        monkeypatch.setattr(incremental_training, "DRIFT_TOLERANCE", float("inf"))
+
+        result = update_league_model(1, store, model_dir=str(tmp_path))
+
+        assert result["mode"] == "incremental"
+        assert result["new_matches"] == 50
+        model = load_artifact(model_paths(1, str(tmp_path))[0], mmap=False)
+        assert all(
+            estimator.n_estimators == 220 and len(estimator.estimators_) == 220
+            for estimator in model.estimators_
+        )
+        metadata = load_model_metadata(model_paths(1, str(tmp_path))[0])
+        assert metadata["incremental_updates"] == 1
+
+    def test_no_new_matches_is_skipped(self, store, tmp_path):
+        """Yeni maç yoksa model değişmez."""
+        update_league_model(1, store, model_dir=str(tmp_path))
+        result = update_league_model(1, store, model_dir=str(tmp_path))
+        assert result["mode"] == "skipped"
+
+    def test_drift_triggers_full_refit(self, store, tmp_path, monkeypatch):
+        """Yeni maçlarda hata kötüleşirse tam eğitim yapılır."""
+        update_league_model(1, store, model_dir=str(tmp_path))
+        store.save(compute_point_in_time_features(_matches(200)))
+        monkeypatch.setattr(incremental_training, "DRIFT_TOLERANCE", -1.0)
+
+        result = update_league_model(1, store, model_dir=str(tmp_path))
+
+        assert result["mode"] == "full"
+        assert result["reason"].startswith("kayma")
+
+    def test_scheduled_refit_keeps_backend(self, store, tmp_path, monkeypatch):
+        """Zamanlanmış tam eğitim mevcut modelin arka ucunu korur."""
+        monkeypatch.setattr(incremental_training.Config, "MODEL_BACKEND", "gbr")
+        train_league_job(
+            {
+                "name": "1",
+                "league_id": 1,
+                "store_path": store.path,
+                "model_dir": str(tmp_path),
+                "limit": 5000,
+                "min_matches": 50,
+                "backend": "hist",
+            }
+        )
+
+        result = update_league_model(
+            1,
+            store,
+            model_dir=str(tmp_path),
+            now=datetime.utcnow() + timedelta(days=31),
+        )
+
+        assert result["mode"] == "full"
+        assert result["success"]
+        model = load_artifact(model_paths(1, str(tmp_path))[0], mmap=False)
+        assert model_backend(model) == "hist"
+
+
+class TestFullRefitSchedule:
+    """full_refit_reason testleri."""
+
+    def test_schedule(self):
+        """Süre ve güncelleme sayısı sınırları tam eğitimi tetikler."""
+        now = datetime(2024, 3, 1)
+        metadata = {
+            "trained_until": "2024-02-28",
+            "full_refit_at": "2024-02-20",
+            "incremental_updates": 2,
+        }
+        assert full_refit_reason(metadata, now) is None
+        assert full_refit_reason({}, now) is not None
+        assert full_refit_reason({**metadata, "incremental_updates": 8}, now)
+        assert full_refit_reason(metadata, now + timedelta(days=30))
@@ -0,0 +1,85 @@
+"""
+Maç değişiklik imleci için testler.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.match_changes import MatchChangeCursor
+
+NOW = datetime(2024, 5, 1, 12, 0)
+
+
+@pytest.fixture
+def add_match(db_session, models):
+    """Verilen updated_at ile tamamlanmış maç ekleyen yardımcı."""
+    teams = [models.Team(name=f"Team {i}") for i in range(2)]
+    db_session.add_all(teams)
+    db_session.flush()
+
+    def add(updated_at, status=models.MatchStatus.FINISHED):
+        match = models.Match(
+            home_team_id=teams[0].id,
+            away_team_id=teams[1].id,
+            match_date=NOW,
+            status=status,
+            home_goals=1,
+            away_goals=0,
+            updated_at=updated_at,
+        )
+        db_session.add(match)
+        db_session.commit()
+        return match.id
+
+    return add
+
+
+def _ids(cursor, session, models):
+    return sorted(
+        row.id
+        for row in cursor.fetch(session, models.Match.id, models.Match.updated_at)
+    )
+
+
+class TestMatchChangeCursor:
+    """MatchChangeCursor testleri."""
+
+    def test_each_change_returned_once(self, db_session, models, add_match):
+        """İlk okuma tüm maçları, sonrakiler yalnızca yeni değişiklikleri döndürür."""
+        cursor = MatchChangeCursor()
+        first = add_match(NOW)
+        add_match(NOW, status=models.MatchStatus.SCHEDULED)
+
+        assert _ids(cursor, db_session, models) == [first]
+        assert _ids(cursor, db_session, models) == []
+
+        second = add_match(NOW + timedelta(seconds=5))
+        assert _ids(cursor, db_session, models) == [second]
+        assert _ids(cursor, db_session, models) == []
+
+    def test_late_commit_inside_overlap(self, db_session, models, add_match):
+        """Son konumdan eski ama pencere içindeki geç kayıt kaçırılmaz."""
+        cursor = MatchChangeCursor(overlap=timedelta(seconds=60))
+        add_match(NOW)
+        cursor.fetch(db_session, models.Match.id, models.Match.updated_at)
+
+        late = add_match(NOW - timedelta(seconds=30))
+        add_match(NOW - timedelta(seconds=90))
+
+        assert _ids(cursor, db_session, models) == [late]
+
+    def test_start_skips_existing_rows(self, db_session, models, add_match):
+        """start sonrası yalnızca yeni değişiklikler döner."""
+        add_match(NOW)
+        add_match(NOW - timedelta(seconds=10))
+        cursor = MatchChangeCursor()
+        cursor.start(db_session)
+
+        assert _ids(cursor, db_session, models) == []
+        new = add_match(NOW + timedelta(seconds=1))
+        assert _ids(cursor, db_session, models) == [new]
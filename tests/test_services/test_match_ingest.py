@@ -0,0 +1,34 @@
+"""
+Maç aktarım modülü için testler.
+"""
+import os
+import sys
+from datetime import datetime
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.match_ingest import date_windows, season_range
+
+
+class TestDateWindows:
+    """Tarih penceresi ve sezon aralığı testleri."""
+
+    def test_windows_are_contiguous(self):
+        """Pencereler aralığı boşluksuz ve çakışmasız kaplar."""
+        windows = list(date_windows(datetime(2024, 1, 1), datetime(2024, 1, 25), 10))
+
+        assert windows == [
+            (datetime(2024, 1, 1), datetime(2024, 1, 11)),
+            (datetime(2024, 1, 11), datetime(2024, 1, 21)),
+            (datetime(2024, 1, 21), datetime(2024, 1, 25)),
+        ]
+
+    def test_empty_range(self):
+        """Boş aralık için pencere üretilmez."""
+        assert list(date_windows(datetime(2024, 1, 1), datetime(2024, 1, 1), 10)) == []
+
+    def test_consecutive_seasons_touch(self):
+        """Ardışık sezonların aralıkları birbirine bitişiktir."""
+        assert season_range(2023) == (datetime(2023, 7, 1), datetime(2024, 7, 1))
+        assert season_range(2023)[1] == season_range(2024)[0]
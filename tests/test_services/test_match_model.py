@@ -0,0 +1,98 @@
+"""
+Skor modeli arka uçları için testler.
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.match_model import (
+    BACKENDS,
+    benchmark_backends,
+    create_match_model,
+    ensemble_size,
+    fit_match_model,
+    model_backend,
+    warm_start_match_model,
+)
+from app.services.model_artifacts import load_artifact, save_artifact
+
+
+@pytest.fixture
+def data():
+    """20 özellikli rastgele eğitim verisi."""
+    rng = np.random.default_rng(11)
+    X = rng.normal(size=(200, 20))
+    y = np.column_stack(
+        [rng.poisson(1.5, size=200), rng.poisson(1.1, size=200)]
+    ).astype(float)
+    return X, y
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+class TestBackends:
+    """Her arka uç aynı sözleşmeyi sağlamalı."""
+
+    def test_fit_save_load_predict(self, backend, data, tmp_path):
+        """Eğitilen model kaydedilip yüklendikten sonra aynı (n, 2) tahmini verir."""
+        X, y = data
+        model, scaler, metrics = fit_match_model(create_match_model(backend), X, y)
+        assert metrics["matches_used"] == 200
+
+        path = str(tmp_path / "model.joblib")
+        save_artifact(model, path)
+        loaded = load_artifact(path, mmap=False)
+
+        X_scaled = scaler.transform(X[:5])
+        assert loaded.predict(X_scaled).shape == (5, 2)
+        np.testing.assert_allclose(loaded.predict(X_scaled), model.predict(X_scaled))
+
+    def test_warm_start_adds_trees(self, backend, data):
+        """Artımlı güncelleme her arka uçta ağaç sayısını artırır."""
+        X, y = data
+        model, scaler, _ = fit_match_model(create_match_model(backend), X, y)
+        before = ensemble_size(model)
+
+        warm_start_match_model(model, scaler.transform(X[:40]), y[:40], 10)
+
+        assert ensemble_size(model) == before + 10
+        assert model.predict(scaler.transform(X[:3])).shape == (3, 2)
+
+    def test_model_backend(self, backend, data):
+        """Eğitilmiş modelin arka ucu modelden okunur."""
+        X, y = data
+        model, _, _ = fit_match_model(create_match_model(backend), X, y)
+        assert model_backend(model) == backend
+
+
+def test_unknown_backend():
+    """Bilinmeyen arka uç hata verir."""
+    with pytest.raises(ValueError):
+        create_match_model("lightgbm")
+
+
+def test_warm_start_unsupported_model(data):
+    """Desteklenmeyen modelin artımlı güncellemesi açık bir hata verir."""
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.multioutput import MultiOutputRegressor
+
+    X, y = data
+    model = MultiOutputRegressor(RandomForestRegressor(n_estimators=5)).fit(X, y)
+
+    with pytest.raises(ValueError, match="RandomForestRegressor"):
+        warm_start_match_model(model, X[:10], y[:10])
+
+
+def test_benchmark_backends(data):
+    """Karşılaştırma her arka uç için süre ve doğruluk bilgisi döndürür."""
+    X, y = data
+    results = benchmark_backends(X, y, ["gbr", "hist"], predict_rounds=5)
+    assert [result["backend"] for result in results] == ["gbr", "hist"]
+    for result in results:
+        assert result["fit_time"] > 0
+        assert result["predict_p99_ms"] >= result["predict_p50_ms"]
+        assert "mae" in result
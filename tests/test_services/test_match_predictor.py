@@ -0,0 +1,265 @@
+"""
+MatchPredictor (kök prediction_engine modülü) için testler.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.match_model import create_match_model, fit_match_model
+
+
+@pytest.fixture
+def predictor_class(models):
+    """Dışa aktarılan MatchPredictor sınıfı."""
+    import prediction_engine
+
+    return prediction_engine.MatchPredictor
+
+
+@pytest.fixture
+def predictor(predictor_class, db_session, models, tmp_path, monkeypatch):
+    """Bitmiş maçları olan veritabanında eğitilmiş modelli tahmin motoru."""
+    monkeypatch.chdir(tmp_path)
+    teams = [models.Team(name=f"Team {i}") for i in range(4)]
+    db_session.add_all(teams)
+    db_session.flush()
+
+    start = datetime(2024, 1, 1)
+    for n in range(24):
+        home, away = teams[n % 4], teams[(n + 1 + n // 4) % 4]
+        if home is away:
+            continue
+        db_session.add(
+            models.Match(
+                home_team_id=home.id,
+                away_team_id=away.id,
+                match_date=start + timedelta(days=n),
+                status=models.MatchStatus.FINISHED,
+                home_goals=n % 3,
+                away_goals=(n // 2) % 3,
+            )
+        )
+    db_session.commit()
+
+    predictor = predictor_class(db_session, form_index=None, cache=None)
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 20))
+    y = np.abs(rng.normal(1.3, 0.6, size=(60, 2)))
+    predictor.model, predictor.scaler, _ = fit_match_model(
+        create_match_model("gbr"), X, y
+    )
+    predictor.compiled_model = None
+    return predictor, [team.id for team in teams]
+
+
+class TestMatchPredictorClass:
+    """Modülde tek bir MatchPredictor sınıfı tanımlı olmalı."""
+
+    def test_exported_class_has_prediction_api(self, predictor_class):
+        """Toplu tahmin ve eğitim metodları dışa aktarılan sınıfta olmalı."""
+        for name in (
+            "__init__",
+            "predict_match",
+            "predict_many",
+            "find_high_draw_probability_matches",
+            "train_model",
+        ):
+            assert name in vars(predictor_class)
+
+
+class TestFindHighDrawProbabilityMatches:
+    """find_high_draw_probability_matches için test sınıfı."""
+
+    def test_returns_matches_sorted_by_draw_probability(self, predictor):
+        """Maçlar beraberlik olasılığına göre azalan sırada döner."""
+        predictor, team_ids = predictor
+        matches = [
+            {
+                "id": 1,
+                "home_team_id": team_ids[0],
+                "away_team_id": team_ids[1],
+                "match_date": "2024-03-01",
+            },
+            {
+                "id": 2,
+                "home_team_id": team_ids[2],
+                "away_team_id": team_ids[3],
+                "match_date": datetime(2024, 3, 2),
+            },
+        ]
+
+        result = predictor.find_high_draw_probability_matches(matches, min_draw_prob=0)
+
+        assert {item["match"]["id"] for item in result} == {1, 2}
+        draws = [item["draw_probability"] for item in result]
+        assert draws == sorted(draws, reverse=True)
+        for item in result:
+            assert (
+                item["draw_probability"]
+                == item["prediction"]["match_prediction"]["draw_prob"]
+            )
+
+    def test_failed_match_is_skipped(self, predictor):
+        """Tahmin edilemeyen maç loglanıp atlanır, diğerleri döner."""
+        predictor, team_ids = predictor
+        matches = [
+            {
+                "id": 1,
+                "home_team_id": team_ids[0],
+                "away_team_id": team_ids[1],
+                "match_date": "2024-03-01",
+            },
+            {"id": 2, "home_team_id": team_ids[2], "match_date": "2024-03-02"},
+            {
+                "id": 3,
+                "home_team_id": team_ids[1],
+                "away_team_id": team_ids[2],
+                "match_date": "not-a-date",
+            },
+        ]
+
+        result = predictor.find_high_draw_probability_matches(matches, min_draw_prob=0)
+
+        assert [item["match"]["id"] for item in result] == [1]
+
+    def test_falls_back_to_single_predictions(self, predictor, monkeypatch):
+        """Toplu tahmin başarısız olursa maçlar tek tek tahmin edilir."""
+        predictor, team_ids = predictor
+
+        def broken_predict_many(*args, **kwargs):
+            raise RuntimeError("model hatası")
+
+        monkeypatch.setattr(predictor, "predict_many", broken_predict_many)
+        matches = [
+            {
+                "id": 1,
+                "home_team_id": team_ids[0],
+                "away_team_id": team_ids[1],
+                "match_date": "2024-03-01",
+            },
+            {"id": 2, "home_team_id": team_ids[2], "match_date": "2024-03-02"},
+        ]
+
+        result = predictor.find_high_draw_probability_matches(matches, min_draw_prob=0)
+
+        assert [item["match"]["id"] for item in result] == [1]
+
+
+class TestTrainModel:
+    """train_model için test sınıfı."""
+
+    def test_train_on_given_matches(self, predictor, db_session, models):
+        """Verilen maçlarla skor hedefli model eğitilir."""
+        predictor, _ = predictor
+        matches = db_session.query(models.Match).all()
+
+        result = predictor.train_model(matches=matches)
+
+        assert result["success"] is True
+        assert (
+            predictor.predict_many(
+                [
+                    {
+                        "home_team_id": matches[0].home_team_id,
+                        "away_team_id": matches[0].away_team_id,
+                    }
+                ]
+            )[0]["expected_goals"]["home"]
+            >= 0
+        )
+
+
+class TestFormIndexSync:
+    """Form indeksi ile tahmin önbelleğinin senkronizasyonu."""
+
+    def test_result_saved_elsewhere_refreshes_form(self, predictor, db_session, models):
+        """Başka süreçte kaydedilen sonuç forma yansır, eski tahmin okunmaz."""
+        import sqlalchemy as sa
+
+        from app.services.prediction_cache import PredictionCache
+        from app.services.team_form_index import TeamFormIndex
+
+        predictor, team_ids = predictor
+        predictor.form_index = TeamFormIndex(sync_interval=0)
+        predictor.cache = PredictionCache(max_size=10, ttl=600, sync_interval=600)
+        predictor.model_version = 1
+        match_date = datetime(2024, 6, 1)
+        before = predictor.get_team_form(team_ids[0], match_date)
+        key = predictor._cache_key(team_ids[0], team_ids[1], match_date)
+        predictor.cache.set(key, {"value": 1})
+
+        db_session.execute(
+            sa.insert(models.Match.__table__).values(
+                home_team_id=team_ids[0],
+                away_team_id=team_ids[1],
+                match_date=datetime(2024, 5, 1),
+                status=models.MatchStatus.FINISHED.name,
+                home_goals=5,
+                away_goals=0,
+                updated_at=datetime.utcnow(),
+            )
+        )
+        db_session.commit()
+
+        key = predictor._cache_key(team_ids[0], team_ids[1], match_date)
+        assert predictor.cache.get(key) is None
+        after = predictor.get_team_form(team_ids[0], match_date)
+        assert after["form"] == ["W"] + before["form"][:4]
+
+
+class TestFormScope:
+    """Eğitim ve tahmin özelliklerinin aynı form kapsamını kullanması."""
+
+    def test_league_prediction_features_match_feature_store(
+        self, predictor_class, db_session, models, tmp_path, monkeypatch
+    ):
+        """Lig tahminindeki özellikler özellik deposundaki lig satırıyla aynıdır."""
+        from app.services.feature_store import (
+            FEATURE_COLUMNS,
+            compute_point_in_time_features,
+            load_finished_matches,
+        )
+        from app.services.team_form_index import TeamFormIndex
+
+        monkeypatch.chdir(tmp_path)
+        teams = [models.Team(name=f"Team {i}") for i in range(3)]
+        db_session.add_all(teams)
+        db_session.flush()
+        start = datetime(2024, 1, 1)
+        # Takım 0'ın maçları iki müsabakaya dağılmış
+        for n, (home, away, league_id, goals) in enumerate(
+            [(0, 1, 1, (2, 0)), (2, 0, 2, (3, 0)), (0, 2, 2, (1, 1)), (1, 0, 1, (0, 1))]
+        ):
+            db_session.add(
+                models.Match(
+                    home_team_id=teams[home].id,
+                    away_team_id=teams[away].id,
+                    league_id=league_id,
+                    match_date=start + timedelta(days=7 * n),
+                    status=models.MatchStatus.FINISHED,
+                    home_goals=goals[0],
+                    away_goals=goals[1],
+                )
+            )
+        db_session.commit()
+
+        frame = compute_point_in_time_features(load_finished_matches(db_session))
+        row = frame[frame["league_id"] == 1].sort_values("match_date").iloc[-1]
+
+        for form_index in (TeamFormIndex(sync_interval=0), None):
+            predictor = predictor_class(db_session, form_index=form_index, cache=None)
+            features = predictor.prepare_match_features(
+                int(row["home_team_id"]),
+                int(row["away_team_id"]),
+                row["match_date"].to_pydatetime(),
+                league_id=1,
+            )
+            np.testing.assert_allclose(
+                features, row[FEATURE_COLUMNS].to_numpy(dtype=float), atol=1e-9
+            )
@@ -0,0 +1,233 @@
+"""
+Takım maç sorguları ve bileşik indeks migration'ı için testler.
+"""
+import importlib.util
+import os
+import sys
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+# Proje kök dizinini Python path'ine ekle
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.insert(0, ROOT)
+
+from app.services.match_queries import team_match_sides
+
+VERSIONS_DIR = os.path.join(ROOT, "migrations", "versions")
+CUTOFF = datetime(2024, 6, 1)
+# Enum sütunu MatchStatus üyelerini adlarıyla saklar
+FINISHED = "FINISHED"
+
+
+def _load_migration(filename="4b7e2c91d5a3_team_match_covering_indexes.py"):
+    spec = importlib.util.spec_from_file_location(
+        filename[:-3], os.path.join(VERSIONS_DIR, filename)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run(connection, step):
+    with Operations.context(MigrationContext.configure(connection)):
+        step()
+
+
+@pytest.fixture
+def database(models):
+    """Match modelinin tablo ve indeksleriyle, örnek maçlarla dolu SQLite veritabanı."""
+    from app.extensions import db
+
+    matches = models.Match.__table__
+    engine = sa.create_engine("sqlite://")
+    db.metadata.create_all(
+        engine, tables=[models.Team.__table__, models.League.__table__, matches]
+    )
+
+    rng = np.random.default_rng(4)
+    rows = []
+    for n in range(2000):
+        home, away = (rng.choice(20, size=2, replace=False) + 1).tolist()
+        rows.append(
+            {
+                "home_team_id": home,
+                "away_team_id": away,
+                "status": FINISHED if n < 1800 else "SCHEDULED",
+                "match_date": datetime(2020, 1, 1) + timedelta(hours=12 * n),
+                "home_goals": int(rng.poisson(1.4)),
+                "away_goals": int(rng.poisson(1.1)),
+            }
+        )
+
+    with engine.begin() as connection:
+        connection.execute(matches.insert(), rows)
+        connection.exec_driver_sql("ANALYZE")
+    yield engine, matches
+    engine.dispose()
+
+
+def _recent_form_query(matches, team_id, limit=5):
+    return team_match_sides(
+        matches.c,
+        team_id,
+        matches.c.status == FINISHED,
+        matches.c.match_date < CUTOFF,
+        limit=limit,
+    )
+
+
+class TestTeamMatchSides:
+    """team_match_sides ve indeks testleri."""
+
+    def test_planner_uses_covering_indexes(self, database):
+        """Her taraf modeldeki kendi bileşik indeksini kapsayan indeks olarak kullanır."""
+        engine, matches = database
+        sql = str(
+            _recent_form_query(matches, 3).compile(
+                engine, compile_kwargs={"literal_binds": True}
+            )
+        )
+        with engine.connect() as connection:
+            plan = " | ".join(
+                row[-1]
+                for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+            )
+
+        assert "COVERING INDEX idx_matches_home_team_status_date" in plan
+        assert "COVERING INDEX idx_matches_away_team_status_date" in plan
+        assert "SCAN matches" not in plan
+
+    def test_matches_or_query(self, database):
+        """UNION ALL sonucu eski OR sorgusuyla aynı maçları döndürür."""
+        engine, matches = database
+        c = matches.c
+        legacy = (
+            sa.select(c.id, c.home_team_id, c.home_goals, c.away_goals)
+            .where(
+                (c.home_team_id == 3) | (c.away_team_id == 3),
+                c.status == FINISHED,
+                c.match_date < CUTOFF,
+            )
+            .order_by(c.match_date.desc())
+            .limit(7)
+        )
+        with engine.connect() as connection:
+            expected = connection.execute(legacy).all()
+            rows = connection.execute(_recent_form_query(matches, 3, limit=7)).all()
+
+        assert [row.match_id for row in rows] == [row.id for row in expected]
+        for row, match in zip(rows, expected):
+            assert bool(row.is_home) == (match.home_team_id == 3)
+            goals = (match.home_goals, match.away_goals)
+            assert (row.goals_for, row.goals_against) == (
+                goals if row.is_home else goals[::-1]
+            )
+
+
+class TestCoveringIndexMigration:
+    """Kapsayan indeks migration testleri."""
+
+    @pytest.mark.parametrize("date_column", ["match_date", "match_datetime"])
+    def test_creates_model_indexes(self, models, date_column):
+        """Migration modeldeki indeksleri tablodaki tarih sütunuyla oluşturur."""
+        migration = _load_migration()
+        engine = sa.create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                "CREATE TABLE matches (id INTEGER PRIMARY KEY, home_team_id INTEGER, "
+                "away_team_id INTEGER, status VARCHAR(20), "
+                f"{date_column} DATETIME, home_goals INTEGER, away_goals INTEGER)"
+            )
+            _run(connection, migration.upgrade)
+            indexes = {
+                index["name"]: index["column_names"]
+                for index in sa.inspect(connection).get_indexes("matches")
+            }
+            _run(connection, migration.downgrade)
+            assert not sa.inspect(connection).get_indexes("matches")
+        engine.dispose()
+
+        expected = {
+            index.name: [
+                date_column if column.name == "match_date" else column.name
+                for column in index.columns
+            ]
+            for index in models.Match.__table__.indexes
+            if index.name in migration.TEAM_MATCH_INDEXES
+        }
+        assert set(expected) == set(migration.TEAM_MATCH_INDEXES)
+        assert indexes == expected
+
+
+class TestTeamMatchLogMigration:
+    """team_match_log migration testleri."""
+
+    def test_team_query_is_single_index_range(self, database):
+        """Takımın son maçları tek bir indeks aralığından, sıralamasız okunur."""
+        engine, _ = database
+        migration = _load_migration("8d1f6a3b2c47_team_match_log.py")
+        assert migration.down_revision == "4b7e2c91d5a3"
+
+        with engine.begin() as connection:
+            _run(connection, migration.upgrade)
+            log = sa.Table("team_match_log", sa.MetaData(), autoload_with=connection)
+            query = (
+                sa.select(log.c.match_id, log.c.goals_for, log.c.goals_against)
+                .where(log.c.team_id == 3, log.c.match_date < CUTOFF)
+                .order_by(log.c.match_date.desc())
+                .limit(5)
+            )
+            sql = str(query.compile(engine, compile_kwargs={"literal_binds": True}))
+            plan = [
+                row[-1]
+                for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+            ]
+
+            _run(connection, migration.downgrade)
+            assert "team_match_log" not in sa.inspect(connection).get_table_names()
+
+        assert len(plan) == 1
+        assert "USING INDEX idx_team_match_log_team_date" in plan[0]
+
+
+class TestHomeAwayDateIndexMigration:
+    """ix_matches_home_away_date migration testleri."""
+
+    @pytest.mark.parametrize("date_column", ["match_date", "match_datetime"])
+    def test_creates_model_index(self, models, date_column):
+        """Migration modeldeki takım çifti indeksini oluşturur."""
+        migration = _load_migration("f4b8d2a6c1e3_matches_home_away_date_index.py")
+        assert migration.down_revision == "a6d3f0b8e914"
+        engine = sa.create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.exec_driver_sql(
+                "CREATE TABLE matches (id INTEGER PRIMARY KEY, home_team_id INTEGER, "
+                f"away_team_id INTEGER, {date_column} DATETIME)"
+            )
+            _run(connection, migration.upgrade)
+            indexes = {
+                index["name"]: index["column_names"]
+                for index in sa.inspect(connection).get_indexes("matches")
+            }
+            _run(connection, migration.downgrade)
+            assert not sa.inspect(connection).get_indexes("matches")
+        engine.dispose()
+
+        model_index = next(
+            index
+            for index in models.Match.__table__.indexes
+            if index.name == "ix_matches_home_away_date"
+        )
+        assert indexes == {
+            "ix_matches_home_away_date": ["home_team_id", "away_team_id", date_column]
+        }
+        assert [column.name for column in model_index.columns] == [
+            "home_team_id",
+            "away_team_id",
+            "match_date",
+        ]
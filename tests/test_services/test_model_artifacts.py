@@ -0,0 +1,50 @@
+"""
+Model dosyaları modülü için testler.
+"""
+import os
+import sys
+
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.preprocessing import StandardScaler
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.model_artifacts import (
+    load_artifact,
+    load_artifact_with_report,
+    save_artifact,
+)
+
+
+class TestModelArtifacts:
+    """Model dosyası kaydetme/yükleme için test sınıfı."""
+
+    def test_mmap_load_shares_tree_arrays(self, tmp_path):
+        """Eşlemeli yüklenen model aynı tahminleri üretmeli ve dizileri eşlenmeli."""
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(300, 6))
+        y = X[:, 0] * 2 + rng.normal(size=300)
+        model = HistGradientBoostingRegressor(max_iter=20).fit(X, y)
+
+        path = str(tmp_path / "model.joblib")
+        save_artifact(model, path)
+        loaded, report = load_artifact_with_report(path)
+
+        np.testing.assert_allclose(loaded.predict(X), model.predict(X))
+        assert report["mapped_bytes"] > 0
+        assert report["file_bytes"] == os.path.getsize(path)
+
+    def test_plain_load(self, tmp_path):
+        """mmap kapalıyken hiçbir dizi eşlenmemeli."""
+        scaler = StandardScaler().fit(np.arange(20.0).reshape(10, 2))
+        path = str(tmp_path / "scaler.joblib")
+        save_artifact(scaler, path)
+
+        loaded, report = load_artifact_with_report(path, mmap=False)
+
+        np.testing.assert_allclose(loaded.mean_, scaler.mean_)
+        assert report["mapped_bytes"] == 0
+        assert not os.path.exists(f"{path}.{os.getpid()}.tmp")
+        assert isinstance(load_artifact(path).mean_, np.memmap)
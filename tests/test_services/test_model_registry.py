@@ -0,0 +1,145 @@
+"""
+Model kayıt defteri için testler.
+"""
+import os
+import sys
+import threading
+
+import pytest
+from joblib import dump
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services import model_registry as registry_module
+from app.services.model_registry import ModelRegistry
+
+
+@pytest.fixture
+def model_files(tmp_path):
+    """Üç lig için model ve scaler dosyaları oluşturur."""
+    paths = {}
+    for league_id in (1, 2, 3):
+        model_path = tmp_path / f"match_predictor_league_{league_id}.joblib"
+        scaler_path = tmp_path / f"scaler_league_{league_id}.joblib"
+        dump({"league": league_id}, model_path)
+        dump({"scaler": league_id}, scaler_path)
+        paths[league_id] = (str(model_path), str(scaler_path))
+    return paths
+
+
+class TestModelRegistry:
+    """ModelRegistry için test sınıfı."""
+
+    def test_hits_and_misses(self, model_files):
+        """İkinci erişim diskten okumadan önbellekten dönmeli."""
+        registry = ModelRegistry(max_size=2)
+
+        model, scaler = registry.get(1, *model_files[1])
+        assert model == {"league": 1}
+        assert scaler == {"scaler": 1}
+        registry.get(1, *model_files[1])
+
+        stats = registry.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+
+    def test_lru_eviction(self, model_files):
+        """Kapasite aşılınca en eski kullanılan model çıkarılmalı."""
+        registry = ModelRegistry(max_size=2)
+
+        registry.get(1, *model_files[1])
+        registry.get(2, *model_files[2])
+        registry.get(1, *model_files[1])
+        registry.get(3, *model_files[3])
+        registry.get(2, *model_files[2])
+
+        stats = registry.stats()
+        assert stats["evictions"] == 2
+        assert stats["misses"] == 4
+        assert stats["size"] == 2
+
+    def test_reload_on_mtime_change(self, model_files):
+        """Dosya değişince model yeniden yüklenmeli."""
+        registry = ModelRegistry(max_size=2)
+        model_path, scaler_path = model_files[1]
+        registry.get(1, model_path, scaler_path)
+
+        dump({"league": 1, "version": 2}, model_path)
+        stat = os.stat(model_path)
+        os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        model, _ = registry.get(1, model_path, scaler_path)
+        assert model["version"] == 2
+        assert registry.stats()["reloads"] == 1
+
+    def test_missing_files(self, tmp_path):
+        """Dosya yoksa None dönmeli."""
+        registry = ModelRegistry(max_size=2)
+        missing = str(tmp_path / "yok.joblib")
+
+        assert registry.get(None, missing, missing) is None
+
+
+class TestConcurrentLoading:
+    """Eşzamanlı yükleme testleri."""
+
+    @pytest.fixture
+    def slow_loader(self, monkeypatch):
+        """Lig 1 modelinin yüklenmesini serbest bırakılana kadar bekleten yükleyici."""
+        started, release = threading.Event(), threading.Event()
+        calls = []
+        load = registry_module.load_artifact_with_report
+
+        def slow_load(path, mmap):
+            calls.append(path)
+            if "league_1" in path:
+                started.set()
+                assert release.wait(5)
+            return load(path, mmap)
+
+        monkeypatch.setattr(registry_module, "load_artifact_with_report", slow_load)
+        return started, release, calls
+
+    def test_other_leagues_not_blocked_by_load(self, model_files, slow_loader):
+        """Bir lig yüklenirken önbellekteki diğer lig beklemeden dönmeli."""
+        started, release, _ = slow_loader
+        registry = ModelRegistry(max_size=3)
+        registry.get(2, *model_files[2])
+
+        loader = threading.Thread(target=registry.get, args=(1, *model_files[1]))
+        loader.start()
+        assert started.wait(5)
+
+        model, _ = registry.get(2, *model_files[2])
+        assert model == {"league": 2}
+        assert loader.is_alive()
+
+        release.set()
+        loader.join(5)
+        assert registry.stats()["size"] == 2
+
+    def test_same_league_loaded_once(self, model_files, slow_loader):
+        """Aynı lig için eşzamanlı istekler modeli bir kez yüklemeli."""
+        started, release, calls = slow_loader
+        registry = ModelRegistry(max_size=3)
+        results = []
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(registry.get(1, *model_files[1]))
+            )
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(results) == 4
+        assert calls.count(model_files[1][0]) == 1
+        stats = registry.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 3
@@ -0,0 +1,169 @@
+"""
+Tahmin önbelleği için testler.
+"""
+import os
+import sys
+from datetime import datetime
+
+import pytest
+import sqlalchemy as sa
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services import prediction_cache as prediction_cache_module
+from app.services.prediction_cache import PredictionCache
+
+MATCH_DATE = datetime(2024, 3, 2, 18, 0)
+
+
+class TestPredictionCache:
+    """PredictionCache testleri."""
+
+    def test_hit_returns_copy(self):
+        """Aynı anahtar önbellekten döner; dönen sonuç kopyadır."""
+        cache = PredictionCache(max_size=10, ttl=60)
+        key = cache.make_key(1, 2, MATCH_DATE, 39, (1.0, 1.0))
+        assert cache.get(key) is None
+
+        cache.set(key, {"expected_goals": {"home": 1.4}})
+        cached = cache.get(cache.make_key(1, 2, MATCH_DATE.date(), 39, (1.0, 1.0)))
+        cached["expected_goals"]["home"] = 9
+
+        assert cache.get(key) == {"expected_goals": {"home": 1.4}}
+        assert cache.stats()["hits"] == 2
+
+    def test_team_result_invalidates(self):
+        """Takımlardan birine yeni sonuç gelince eski tahmin okunmaz."""
+        cache = PredictionCache(max_size=10, ttl=60)
+        key = cache.make_key(1, 2, MATCH_DATE, 39, (1.0, 1.0))
+        other = cache.make_key(3, 4, MATCH_DATE, 39, (1.0, 1.0))
+        cache.set(key, {"value": 1})
+        cache.set(other, {"value": 2})
+
+        cache.invalidate_teams(2, 7)
+
+        assert cache.get(cache.make_key(1, 2, MATCH_DATE, 39, (1.0, 1.0))) is None
+        assert cache.get(cache.make_key(3, 4, MATCH_DATE, 39, (1.0, 1.0))) == {
+            "value": 2
+        }
+
+    def test_model_version_changes_key(self):
+        """Model yeniden eğitilince (yeni sürüm) eski tahmin kullanılmaz."""
+        cache = PredictionCache(max_size=10, ttl=60)
+        cache.set(cache.make_key(1, 2, MATCH_DATE, 39, (1.0, 1.0)), {"value": 1})
+        assert cache.get(cache.make_key(1, 2, MATCH_DATE, 39, (2.0, 1.0))) is None
+
+    def test_ttl_and_lru(self, monkeypatch):
+        """Süresi dolan ve en eski kullanılan kayıtlar çıkarılır."""
+        now = [1000.0]
+        monkeypatch.setattr(prediction_cache_module.time, "monotonic", lambda: now[0])
+        cache = PredictionCache(max_size=2, ttl=60)
+        keys = [cache.make_key(i, i + 1, MATCH_DATE, None, 1) for i in range(3)]
+
+        cache.set(keys[0], {"value": 0})
+        cache.set(keys[1], {"value": 1})
+        cache.get(keys[0])
+        cache.set(keys[2], {"value": 2})
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == {"value": 0}
+
+        now[0] += 61
+        assert cache.get(keys[0]) is None
+        assert cache.stats()["size"] == 1
+
+
+class TestCrossProcessSync:
+    """Diğer süreçlerin kaydettiği sonuçlarla senkronizasyon testleri."""
+
+    @pytest.fixture
+    def match(self, db_session, models):
+        """İki takım arasında planlanmış bir maç."""
+        teams = [models.Team(name=f"Team {i}") for i in range(4)]
+        db_session.add_all(teams)
+        db_session.flush()
+        match = models.Match(
+            home_team_id=teams[0].id,
+            away_team_id=teams[1].id,
+            match_date=MATCH_DATE,
+            status=models.MatchStatus.SCHEDULED,
+        )
+        db_session.add(match)
+        db_session.commit()
+        return match
+
+    def _finish_elsewhere(self, db_session, models, match):
+        """Maçı olay dinleyicilerini tetiklemeden (başka süreç gibi) kaydeder."""
+        db_session.execute(
+            sa.update(models.Match.__table__)
+            .where(models.Match.__table__.c.id == match.id)
+            .values(
+                status=models.MatchStatus.FINISHED.name,
+                home_goals=2,
+                away_goals=1,
+                updated_at=datetime.utcnow(),
+            )
+        )
+        db_session.commit()
+
+    def test_result_saved_elsewhere_invalidates(self, db_session, models, match):
+        """Başka süreçte kaydedilen sonuç takımların tahminlerini geçersiz kılar."""
+        cache = PredictionCache(max_size=10, ttl=60, sync_interval=0)
+        cache.sync(db_session)
+        key = cache.make_key(match.home_team_id, 9, MATCH_DATE, None, 1)
+        other = cache.make_key(match.away_team_id + 1, 9, MATCH_DATE, None, 1)
+        cache.set(key, {"value": 1})
+        cache.set(other, {"value": 2})
+
+        self._finish_elsewhere(db_session, models, match)
+
+        assert cache.sync(db_session) == 2
+        assert (
+            cache.get(cache.make_key(match.home_team_id, 9, MATCH_DATE, None, 1))
+            is None
+        )
+        assert cache.get(
+            cache.make_key(match.away_team_id + 1, 9, MATCH_DATE, None, 1)
+        ) == {"value": 2}
+
+    def test_sync_interval(self, db_session, models, match, monkeypatch):
+        """Veritabanına en fazla aralıkta bir gidilir."""
+        now = [1000.0]
+        monkeypatch.setattr(prediction_cache_module.time, "monotonic", lambda: now[0])
+        cache = PredictionCache(max_size=10, ttl=600, sync_interval=10)
+        cache.sync(db_session)
+        self._finish_elsewhere(db_session, models, match)
+
+        assert cache.sync(db_session) == 0
+        now[0] += 10
+        assert cache.sync(db_session) == 2
+
+    def test_processed_rows_not_invalidated_again(self, db_session, models, match):
+        """Örtüşme penceresindeki işlenmiş sonuç sonraki senkronlarda atlanır."""
+        cache = PredictionCache(max_size=10, ttl=60, sync_interval=0)
+        cache.sync(db_session)
+        self._finish_elsewhere(db_session, models, match)
+        assert cache.sync(db_session) == 2
+
+        key = cache.make_key(match.home_team_id, 9, MATCH_DATE, None, 1)
+        cache.set(key, {"value": 1})
+        for _ in range(4):
+            assert cache.sync(db_session) == 0
+        assert cache.get(key) == {"value": 1}
+
+        # Aynı maçın yeniden güncellenmesi tekrar işlenir
+        db_session.execute(
+            sa.update(models.Match.__table__)
+            .where(models.Match.__table__.c.id == match.id)
+            .values(home_goals=3, updated_at=datetime.utcnow())
+        )
+        db_session.commit()
+        assert cache.sync(db_session) == 2
+
+    def test_rows_before_start_are_skipped(self, db_session, models, match):
+        """Başlangıçtan önce kaydedilmiş sonuçlar geçersiz kılınmaz."""
+        self._finish_elsewhere(db_session, models, match)
+        cache = PredictionCache(max_size=10, ttl=60, sync_interval=0)
+        cache.sync(db_session)
+
+        assert cache.sync(db_session) == 0
@@ -0,0 +1,57 @@
+"""
+PredictionEngine için testler.
+"""
+import os
+import sys
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.model_artifacts import save_artifact
+from app.services.prediction_engine import PredictionEngine
+
+
+def _save_model(model_dir, model_type):
+    X = np.random.default_rng(0).normal(size=(40, 3))
+    model = LogisticRegression().fit(X, (X[:, 0] > 0).astype(int))
+    save_artifact(model, os.path.join(model_dir, f"{model_type}_model.joblib"))
+
+
+class TestLazyModelLoading:
+    """Modellerin ilk kullanımda yüklenmesi için test sınıfı."""
+
+    def test_models_load_on_first_use(self, tmp_path):
+        """Başlangıçta hiçbir model yüklenmemeli."""
+        _save_model(tmp_path, "result")
+        _save_model(tmp_path, "btts")
+        engine = PredictionEngine(model_dir=str(tmp_path))
+
+        assert not any(engine.models.is_loaded(t) for t in engine.MODEL_TYPES)
+
+        assert engine.models["result"] is not None
+        assert engine.models.is_loaded("result")
+        assert not engine.models.is_loaded("btts")
+        assert engine.models["corners"] is None
+
+    def test_warmup(self, tmp_path):
+        """warmup ile verilen modeller başlangıçta yüklenmeli."""
+        _save_model(tmp_path, "result")
+        engine = PredictionEngine(model_dir=str(tmp_path), warmup=["result"])
+
+        assert engine.models.is_loaded("result")
+        assert not engine.models.is_loaded("over_under")
+        assert "result" in engine.model_reports
+
+    def test_save_models_skips_unloaded(self, tmp_path):
+        """Kaydetme yüklenmemiş modelleri yüklememeli."""
+        _save_model(tmp_path, "result")
+        _save_model(tmp_path, "btts")
+        engine = PredictionEngine(model_dir=str(tmp_path))
+        engine.models["result"]
+
+        engine.save_models()
+
+        assert not engine.models.is_loaded("btts")
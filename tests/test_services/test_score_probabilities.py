@@ -0,0 +1,65 @@
+"""
+Skor olasılıkları modülü için testler.
+"""
+import os
+import sys
+import pytest
+import numpy as np
+from scipy.stats import poisson
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.score_probabilities import calculate_score_probabilities
+
+
+def _scalar_outcome_probabilities(home_goals, away_goals, max_goals=10):
+    """Eski iç içe döngülü hesaplama (referans)."""
+    home_win = draw = away_win = 0.0
+    for i in range(max_goals):
+        for j in range(max_goals):
+            prob = poisson.pmf(i, home_goals) * poisson.pmf(j, away_goals)
+            if i > j:
+                home_win += prob
+            elif i == j:
+                draw += prob
+            else:
+                away_win += prob
+    total = home_win + draw + away_win
+    return home_win / total, draw / total, away_win / total
+
+
+class TestScoreProbabilities:
+    """calculate_score_probabilities için test sınıfı."""
+
+    def test_matches_scalar_loop(self):
+        """Vektörize sonuçlar eski döngüyle aynı olmalı."""
+        home = np.array([0.4, 1.2, 1.8, 2.6, 3.5])
+        away = np.array([0.9, 1.0, 0.7, 2.2, 0.3])
+
+        probs = calculate_score_probabilities(home, away)
+
+        for n in range(len(home)):
+            expected = _scalar_outcome_probabilities(home[n], away[n])
+            assert probs["home_win"][n] == pytest.approx(expected[0])
+            assert probs["draw"][n] == pytest.approx(expected[1])
+            assert probs["away_win"][n] == pytest.approx(expected[2])
+
+            prob_under_5 = sum(poisson.pmf(i, home[n] + away[n]) for i in range(5))
+            assert probs["high_scoring"][n] == pytest.approx(1 - prob_under_5)
+
+    def test_over_under_sum_to_one(self):
+        """Alt ve üst olasılıkları toplamı 1 olmalı."""
+        probs = calculate_score_probabilities([1.5, 0.0], [1.1, 0.0])
+
+        np.testing.assert_allclose(probs["over"] + probs["under"], 1.0)
+        assert probs["under"][1] == pytest.approx(1.0)
+        assert probs["draw"][1] == pytest.approx(1.0)
+
+    def test_scalar_input(self):
+        """Skaler girdi (1,) boyutlu dizi döndürmeli."""
+        probs = calculate_score_probabilities(1.4, 1.1)
+
+        assert probs["home_win"].shape == (1,)
+        total = probs["home_win"][0] + probs["draw"][0] + probs["away_win"][0]
+        assert total == pytest.approx(1.0)
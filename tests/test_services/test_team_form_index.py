@@ -0,0 +1,218 @@
+"""
+Takım form indeksi için testler.
+"""
+import os
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services.team_form_index import TeamFormIndex
+
+
+def _match(match_id, home, away, day, home_goals, away_goals, league_id=1):
+    return SimpleNamespace(
+        id=match_id,
+        home_team_id=home,
+        away_team_id=away,
+        league_id=league_id,
+        match_date=datetime(2024, 1, 1) + timedelta(days=day),
+        home_goals=home_goals,
+        away_goals=away_goals,
+        updated_at=datetime(2024, 6, 1),
+    )
+
+
+@pytest.fixture
+def index():
+    """Örnek maçlarla doldurulmuş indeks."""
+    index = TeamFormIndex()
+    matches = [
+        _match(1, 1, 2, 0, 2, 0),
+        _match(2, 3, 1, 7, 1, 1),
+        _match(3, 1, 4, 14, 0, 3),
+        _match(4, 2, 1, 21, 0, 1, league_id=2),
+        _match(5, 1, 3, 28, 4, 2),
+    ]
+    for match in matches:
+        index.add_match(match)
+    return index
+
+
+class TestTeamFormIndex:
+    """TeamFormIndex için test sınıfı."""
+
+    def test_form_before_date(self, index):
+        """Sadece referans tarihinden önceki maçlar sayılmalı."""
+        form = index.get_form(1, datetime(2024, 1, 29), matches_back=5)
+
+        # En yeni maç başta: 21. gün (G), 14. gün (M), 7. gün (B), 0. gün (G)
+        assert form["form"] == ["W", "L", "D", "W"]
+        assert form["wins"] == 2
+        assert form["draws"] == 1
+        assert form["losses"] == 1
+        assert form["goals_for"] == 4
+        assert form["goals_against"] == 4
+        assert form["points"] == 7
+        assert form["clean_sheets"] == 2
+        assert form["failed_to_score"] == 1
+
+    def test_matches_back_and_league(self, index):
+        """Son N maç ve lig filtresi uygulanmalı."""
+        form = index.get_form(1, datetime(2024, 3, 1), matches_back=2)
+        assert form["form"] == ["W", "W"]
+
+        form = index.get_form(1, datetime(2024, 3, 1), matches_back=5, league_id=2)
+        assert form["form"] == ["W"]
+
+    def test_update_replaces_result(self, index):
+        """Aynı maçın güncel sonucu eski kaydın yerini almalı."""
+        index.add_match(_match(5, 1, 3, 28, 0, 2))
+
+        form = index.get_form(1, datetime(2024, 3, 1), matches_back=1)
+        assert form["form"] == ["L"]
+        assert index.get_form(3, datetime(2024, 3, 1))["wins"] == 1
+
+    def test_unknown_team(self, index):
+        """Maçı olmayan takım için boş form dönmeli."""
+        form = index.get_form(99, datetime(2024, 3, 1))
+        assert form["form"] == []
+        assert form["points"] == 0
+
+
+class TestTeamFormListeners:
+    """Match olay dinleyicileri için test sınıfı."""
+
+    @pytest.fixture
+    def listeners(self, models, monkeypatch):
+        from sqlalchemy import event
+
+        from app.services import team_form_index as module
+
+        monkeypatch.setattr(module, "team_form_index", TeamFormIndex())
+        module.register_team_form_listeners()
+        yield module.team_form_index
+        for event_name in ("after_insert", "after_update"):
+            event.remove(models.Match, event_name, module._on_match_saved)
+
+    def test_saved_results_update_loaded_index(self, listeners, db_session, models):
+        """Kaydedilen ve düzeltilen sonuçlar yüklü indekse yansır."""
+        home, away = models.Team(name="Home"), models.Team(name="Away")
+        db_session.add_all([home, away])
+        db_session.commit()
+        listeners.load(db_session)
+
+        match = models.Match(
+            home_team_id=home.id,
+            away_team_id=away.id,
+            match_date=datetime(2024, 1, 1),
+            status=models.MatchStatus.SCHEDULED,
+        )
+        db_session.add(match)
+        db_session.commit()
+        assert listeners.get_form(home.id, datetime(2024, 2, 1))["form"] == []
+
+        match.status = models.MatchStatus.FINISHED
+        match.home_goals, match.away_goals = 2, 1
+        db_session.commit()
+        assert listeners.get_form(home.id, datetime(2024, 2, 1))["form"] == ["W"]
+
+        match.away_goals = 3
+        db_session.commit()
+        assert listeners.get_form(home.id, datetime(2024, 2, 1))["form"] == ["L"]
+        assert listeners.get_form(away.id, datetime(2024, 2, 1))["form"] == ["W"]
+
+    def test_rolled_back_result_not_indexed(self, listeners, db_session, models):
+        """Geri alınan sonuç indekse girmez; commit edilen sonuç commit'te girer."""
+        home, away = models.Team(name="Home"), models.Team(name="Away")
+        db_session.add_all([home, away])
+        db_session.commit()
+        listeners.load(db_session)
+
+        match = models.Match(
+            home_team_id=home.id,
+            away_team_id=away.id,
+            match_date=datetime(2024, 1, 1),
+            status=models.MatchStatus.FINISHED,
+            home_goals=2,
+            away_goals=1,
+        )
+        db_session.add(match)
+        db_session.flush()
+        assert listeners.get_form(home.id, datetime(2024, 2, 1))["form"] == []
+        db_session.rollback()
+        assert listeners.get_form(home.id, datetime(2024, 2, 1))["form"] == []
+
+        db_session.add(
+            models.Match(
+                home_team_id=home.id,
+                away_team_id=away.id,
+                match_date=datetime(2024, 1, 8),
+                status=models.MatchStatus.FINISHED,
+                home_goals=0,
+                away_goals=0,
+            )
+        )
+        db_session.flush()
+        assert listeners.get_form(home.id, datetime(2024, 2, 1))["form"] == []
+        db_session.commit()
+        assert listeners.get_form(home.id, datetime(2024, 2, 1))["form"] == ["D"]
+
+
+class TestTeamFormSync:
+    """Diğer süreçlerin kaydettiği sonuçlarla senkronizasyon testleri."""
+
+    @pytest.fixture
+    def teams(self, db_session, models):
+        home, away = models.Team(name="Home"), models.Team(name="Away")
+        db_session.add_all([home, away])
+        db_session.commit()
+        return home.id, away.id
+
+    def _save_elsewhere(self, db_session, models, teams, day, home_goals):
+        """Maçı olay dinleyicilerini tetiklemeden (başka süreç gibi) kaydeder."""
+        import sqlalchemy as sa
+
+        db_session.execute(
+            sa.insert(models.Match.__table__).values(
+                home_team_id=teams[0],
+                away_team_id=teams[1],
+                match_date=datetime(2024, 1, 1) + timedelta(days=day),
+                status=models.MatchStatus.FINISHED.name,
+                home_goals=home_goals,
+                away_goals=1,
+                updated_at=datetime.utcnow(),
+            )
+        )
+        db_session.commit()
+
+    def test_sync_reads_results_saved_elsewhere(self, db_session, models, teams):
+        """İlk sync indeksi yükler; sonrakiler değişen takımları döndürür."""
+        index = TeamFormIndex(sync_interval=0)
+        self._save_elsewhere(db_session, models, teams, 0, 2)
+
+        assert index.sync(db_session) == set()
+        assert index.get_form(teams[0], datetime(2024, 2, 1))["form"] == ["W"]
+
+        self._save_elsewhere(db_session, models, teams, 7, 0)
+        assert index.sync(db_session) == set(teams)
+        assert index.get_form(teams[0], datetime(2024, 2, 1))["form"] == ["L", "W"]
+        assert index.sync(db_session) == set()
+
+    def test_sync_interval(self, db_session, models, teams, monkeypatch):
+        """Yüklemeden sonra veritabanına en fazla aralıkta bir gidilir."""
+        from app.services import team_form_index as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        index = TeamFormIndex(sync_interval=10)
+        index.sync(db_session)
+        self._save_elsewhere(db_session, models, teams, 0, 2)
+
+        assert index.sync(db_session) == set()
+        now[0] += 10
+        assert index.sync(db_session) == set(teams)
@@ -0,0 +1,188 @@
+"""
+Takım istatistikleri için testler.
+"""
+import os
+import sys
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+# Proje kök dizinini Python path'ine ekle
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+sys.path.insert(0, ROOT)
+
+from app.services.team_statistics import (
+    COUNTER_FIELDS,
+    _on_before_flush,
+    apply_result,
+    get_team_statistics,
+    register_statistics_listeners,
+    season_of,
+    summarize,
+)
+
+
+def _empty_stats():
+    return SimpleNamespace(
+        **{field: 0 for field in COUNTER_FIELDS},
+        average_goals_per_match=0.0,
+        average_goals_conceded=0.0,
+    )
+
+
+class TestSeasonOf:
+    """season_of testleri."""
+
+    def test_season_boundary(self):
+        """Temmuz'dan itibaren yeni sezon başlar."""
+        assert season_of(datetime(2024, 6, 30, 20, 0)) == "2023/2024"
+        assert season_of(date(2024, 7, 1)) == "2024/2025"
+
+
+class TestApplyResult:
+    """apply_result ve summarize testleri."""
+
+    def test_counters_and_averages(self):
+        """Sonuçlar doğru sayaçlara işlenir."""
+        stats = _empty_stats()
+        apply_result(stats, 2, 0, is_home=True)
+        apply_result(stats, 1, 1, is_home=False)
+        apply_result(stats, 0, 3, is_home=False)
+
+        assert (stats.matches_played, stats.wins, stats.draws, stats.losses) == (
+            3,
+            1,
+            1,
+            1,
+        )
+        assert (stats.home_matches, stats.home_wins, stats.home_goals_for) == (1, 1, 2)
+        assert (stats.away_draws, stats.away_losses, stats.away_goals_against) == (
+            1,
+            1,
+            4,
+        )
+        assert (stats.clean_sheets, stats.failed_to_score) == (1, 1)
+        assert stats.average_goals_per_match == 1.0
+        assert stats.average_goals_conceded == 4 / 3
+
+    def test_reverting_result(self):
+        """Düzeltilen skor eski sonucu geri alıp yenisini ekler."""
+        stats = _empty_stats()
+        apply_result(stats, 1, 0, is_home=True)
+        apply_result(stats, 1, 0, is_home=True, sign=-1)
+        apply_result(stats, 1, 2, is_home=True)
+
+        expected = _empty_stats()
+        apply_result(expected, 1, 2, is_home=True)
+        assert vars(stats) == vars(expected)
+
+    def test_summarize_across_seasons(self):
+        """Sezon satırları toplanarak görüntüleme istatistikleri üretilir."""
+        first, second = _empty_stats(), _empty_stats()
+        apply_result(first, 3, 1, is_home=True)
+        apply_result(second, 0, 0, is_home=False)
+
+        summary = summarize([first, second])
+
+        assert summary["total_matches_played"] == 2
+        assert summary["total_wins"] == 1
+        assert summary["win_percentage"] == 50.0
+        assert summary["goals_conceded_per_match"] == 0.5
+        assert summarize([])["win_percentage"] == 0
+
+
+class TestFlushListener:
+    """Flush dinleyicisinin kaydedilmiş maçlardaki değişiklikleri yansıtması."""
+
+    @pytest.fixture
+    def listener(self):
+        """Oturum flush dinleyicisini test süresince bağlar."""
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+
+        register_statistics_listeners()
+        yield
+        event.remove(Session, "before_flush", _on_before_flush)
+
+    @pytest.fixture
+    def match(self, listener, db_session, models):
+        """Kaydedilmiş (commit sonrası süresi dolmuş) planlanmış maç."""
+        home, away = models.Team(name="Home"), models.Team(name="Away")
+        db_session.add_all([home, away])
+        db_session.flush()
+        match = models.Match(
+            home_team_id=home.id,
+            away_team_id=away.id,
+            match_date=datetime(2024, 9, 1),
+            status=models.MatchStatus.SCHEDULED,
+        )
+        db_session.add(match)
+        db_session.commit()
+        return match
+
+    def test_committed_match_marked_finished(self, match, db_session, models):
+        """Süresi dolmuş maçın bitmesi istatistiklere eklenir."""
+        match.status = models.MatchStatus.FINISHED
+        match.home_goals, match.away_goals = 2, 1
+        db_session.commit()
+
+        home = get_team_statistics(db_session, match.home_team_id, "2024/2025")
+        away = get_team_statistics(db_session, match.away_team_id)
+        assert (home["total_matches_played"], home["total_wins"]) == (1, 1)
+        assert (away["total_losses"], away["total_goals_for"]) == (1, 1)
+
+    def test_score_corrected_on_expired_match(self, match, db_session, models):
+        """Süresi dolmuş maçta düzeltilen skor ve silme eski sonucu geri alır."""
+        match.status = models.MatchStatus.FINISHED
+        match.home_goals, match.away_goals = 2, 1
+        db_session.commit()
+
+        match.home_goals = 1
+        db_session.commit()
+
+        home = get_team_statistics(db_session, match.home_team_id)
+        away = get_team_statistics(db_session, match.away_team_id)
+        assert (home["total_matches_played"], home["total_draws"]) == (1, 1)
+        assert home["total_wins"] == 0
+        assert (away["total_draws"], away["total_goals_against"]) == (1, 1)
+
+        away_team_id = match.away_team_id
+        db_session.delete(match)
+        db_session.commit()
+        assert get_team_statistics(db_session, away_team_id)["total_losses"] == 0
+
+
+class TestTeamStatisticsMigration:
+    """team_statistics migration testleri."""
+
+    def test_upgrade_matches_model_and_downgrade_drops(self, models):
+        """Migration modeldeki sütunlarla tabloyu oluşturur, downgrade kaldırır."""
+        import importlib.util
+
+        path = os.path.join(
+            ROOT, "migrations", "versions", "a6d3f0b8e914_team_statistics.py"
+        )
+        spec = importlib.util.spec_from_file_location("team_statistics_rev", path)
+        migration = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(migration)
+        assert migration.down_revision == "e2a9c4d7f613"
+
+        engine = sa.create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE teams (id INTEGER PRIMARY KEY)")
+            with Operations.context(MigrationContext.configure(connection)):
+                migration.upgrade()
+                columns = {
+                    column["name"]
+                    for column in sa.inspect(connection).get_columns("team_statistics")
+                }
+                migration.downgrade()
+            tables = sa.inspect(connection).get_table_names()
+        engine.dispose()
+
+        assert columns == {column.name for column in models.TeamStatistics.__table__.c}
+        assert "team_statistics" not in tables
@@ -0,0 +1,184 @@
+"""
+Eğitim orkestratörü için testler.
+"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+# Proje kök dizinini Python path'ine ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from app.services import training_orchestrator
+from app.services.feature_store import FeatureStore
+from app.services.match_model import load_model_metadata, model_paths
+from app.services.training_orchestrator import (
+    resolve_league_ids,
+    train_all_models,
+    train_league_job,
+)
+
+
+@pytest.fixture
+def leagues(db_session, models):
+    """Premier League (120 maç) ve La Liga (20 maç) içeren veritabanı."""
+    rng = np.random.default_rng(7)
+    teams = [models.Team(name=f"Team {i}") for i in range(12)]
+    premier = models.League(name="Premier League")
+    la_liga = models.League(name="La Liga")
+    db_session.add_all(teams + [premier, la_liga])
+    db_session.flush()
+
+    for n in range(140):
+        league = premier if n < 120 else la_liga
+        home, away = rng.choice(len(teams), size=2, replace=False)
+        db_session.add(
+            models.Match(
+                home_team_id=teams[home].id,
+                away_team_id=teams[away].id,
+                league_id=league.id,
+                match_date=datetime(2023, 8, 1) + timedelta(days=n),
+                status=models.MatchStatus.FINISHED,
+                home_goals=int(rng.poisson(1.5)),
+                away_goals=int(rng.poisson(1.1)),
+            )
+        )
+    db_session.commit()
+    return {"PL": premier.id, "PD": la_liga.id}
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Geçici dizindeki özellik deposu."""
+    return FeatureStore(path=str(tmp_path / "features.npz"))
+
+
+class TestResolveLeagueIds:
+    """resolve_league_ids testleri."""
+
+    def test_codes_resolved_by_league_name(self, db_session, leagues):
+        """Kodlar Config.LEAGUES adlarıyla eşleşir; bilinmeyenler atlanır."""
+        assert resolve_league_ids(db_session, ["PL", "PD", "SA", "XX"]) == leagues
+
+
+class TestTrainLeagueJob:
+    """train_league_job testleri."""
+
+    def _job(self, store, tmp_path, league_id, min_matches=50):
+        return {
+            "name": "test",
+            "league_id": league_id,
+            "store_path": store.path,
+            "model_dir": str(tmp_path),
+            "limit": 5000,
+            "min_matches": min_matches,
+            "backend": "gbr",
+            "threads": 1,
+        }
+
+    def test_trains_and_writes_artifacts(self, db_session, leagues, store, tmp_path):
+        """Yeterli veri varsa model, scaler ve eğitim bilgisi yazılır."""
+        store.build(db_session)
+
+        result = train_league_job(self._job(store, tmp_path, leagues["PL"]))
+
+        assert result["success"]
+        assert result["matches_used"] == 120
+        model_path, scaler_path = model_paths(leagues["PL"], str(tmp_path))
+        assert os.path.exists(model_path) and os.path.exists(scaler_path)
+        assert load_model_metadata(model_path)["incremental_updates"] == 0
+
+    def test_insufficient_data(self, db_session, leagues, store, tmp_path):
+        """Yetersiz veride model yazılmaz."""
+        store.build(db_session)
+
+        result = train_league_job(self._job(store, tmp_path, leagues["PD"]))
+
+        assert not result["success"]
+        assert "Yetersiz veri" in result["message"]
+        assert not os.path.exists(model_paths(leagues["PD"], str(tmp_path))[0])
+
+    def test_errors_are_reported(self, store, tmp_path):
+        """İşçideki hata özet olarak döner."""
+        result = train_league_job(self._job(store, tmp_path, 1))
+
+        assert not result["success"]
+        assert result["message"]
+        assert "wall_time" in result
+
+
+class TestTrainAllModels:
+    """train_all_models testleri."""
+
+    def test_fans_out_global_and_league_jobs(
+        self, db_session, leagues, store, tmp_path
+    ):
+        """Global ve her çözümlenen lig için birer iş çalıştırılır."""
+        summary = train_all_models(
+            db_session,
+            league_codes=["PL", "PD", "XX"],
+            max_workers=2,
+            model_dir=str(tmp_path),
+            store=store,
+            backend="gbr",
+        )
+
+        results = summary["results"]
+        assert summary["workers"] == 2
+        assert [result["name"] for result in results] == ["global", "PD", "PL"]
+        assert [result["success"] for result in results] == [True, False, True]
+        assert results[0]["matches_used"] == 140
+        assert results[2]["league_id"] == leagues["PL"]
+        for league_id in (None, leagues["PL"]):
+            assert os.path.exists(model_paths(league_id, str(tmp_path))[0])
+
+    def test_job_exceptions_become_failed_results(
+        self, db_session, leagues, store, tmp_path, monkeypatch
+    ):
+        """Bir işin hatası diğer işlerin sonuçlarını etkilemez."""
+        jobs = []
+
+        def fake_job(job):
+            jobs.append(job)
+            if job["name"] == "PL":
+                raise RuntimeError("işçi çöktü")
+            return {
+                "name": job["name"],
+                "league_id": job["league_id"],
+                "success": True,
+                "wall_time": 0.0,
+                "matches_used": 1,
+                "test_score": 0.0,
+            }
+
+        monkeypatch.setattr(training_orchestrator, "train_league_job", fake_job)
+        monkeypatch.setattr(
+            training_orchestrator, "ProcessPoolExecutor", ThreadPoolExecutor
+        )
+
+        summary = train_all_models(
+            db_session,
+            league_codes=["PL", "PD"],
+            max_workers=4,
+            model_dir=str(tmp_path),
+            store=store,
+            limit=100,
+            min_matches=10,
+        )
+
+        assert summary["workers"] == 3
+        assert {job["store_path"] for job in jobs} == {store.path}
+        assert all(job["limit"] == 100 and job["min_matches"] == 10 for job in jobs)
+        failed = [result for result in summary["results"] if not result["success"]]
+        assert failed == [
+            {
+                "name": "PL",
+                "league_id": leagues["PL"],
+                "success": False,
+                "message": "işçi çöktü",
+            }
+        ]
+        assert len(summary["results"]) == 3
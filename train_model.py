@@ -1,9 +1,10 @@
-import os
+import argparse
 import logging
-from datetime import datetime, timedelta
-from prediction_engine import MatchPredictor
 from app import create_app, db
-from app.models import Match
+from app.services.feature_store import FEATURE_COLUMNS, TARGET_COLUMNS, FeatureStore
+from app.services.incremental_training import update_all_models
+from app.services.match_model import BACKENDS, benchmark_backends
+from app.services.training_orchestrator import train_all_models
 
 # Uygulama bağlamını oluştur
 app = create_app()
@@ -16,42 +17,99 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def train_and_save_model():
-    """Mevcut verilerle modeli eğitir ve kaydeder"""
+def train_and_save_model(max_workers=None, backend=None):
+    """Global modeli ve tüm lig modellerini paralel olarak eğitir ve kaydeder"""
     try:
         logger.info("Model eğitimi başlatılıyor...")
 
-        # Tahmin motorunu başlat
-        predictor = MatchPredictor(db.session)
+        summary = train_all_models(
+            db.session, max_workers=max_workers, backend=backend
+        )
+        trained = [result for result in summary["results"] if result["success"]]
 
-        # Son 2 yılın maçlarını getir
-        two_years_ago = datetime.utcnow() - timedelta(days=730)
-        matches = Match.query.filter(
-            Match.match_date >= two_years_ago,
-            Match.status == "FINISHED",
-            Match.home_team_score.isnot(None),
-            Match.away_team_score.isnot(None),
-        ).all()
-
-        if not matches:
+        if not trained:
             logger.warning("Eğitim için yeterli maç verisi bulunamadı.")
             return False
 
-        logger.info(f"{len(matches)} adet maç ile model eğitiliyor...")
+        logger.info(
+            f"{len(trained)}/{len(summary['results'])} model "
+            f"{summary['wall_time']} saniyede eğitildi ve kaydedildi."
+        )
+        return True
 
-        # Modeli eğit
-        predictor.train_model(matches)
+    except Exception as e:
+        logger.error(f"Model eğitilirken hata oluştu: {str(e)}", exc_info=True)
+        return False
 
-        # Modeli kaydet
-        predictor.save_model()
 
-        logger.info("Model başarıyla eğitildi ve kaydedildi.")
-        return True
+def update_models():
+    """Maç günü sonrası modelleri artımlı olarak günceller
+
+    Gerektiğinde (zamanlama veya kayma) ilgili model tam olarak yeniden eğitilir.
+    """
+    try:
+        logger.info("Artımlı model güncellemesi başlatılıyor...")
+        results = update_all_models(db.session)
+        return any(result["success"] for result in results)
 
     except Exception as e:
-        logger.error(f"Model eğitilirken hata oluştu: {str(e)}", exc_info=True)
+        logger.error(f"Modeller güncellenirken hata oluştu: {str(e)}", exc_info=True)
         return False
 
 
+def benchmark_models(backends=None):
+    """Model arka uçlarını global veri üzerinde karşılaştırır ve tablo yazdırır"""
+    frame = FeatureStore().load_or_build(db.session)
+    if frame.empty:
+        logger.warning("Karşılaştırma için maç verisi bulunamadı.")
+        return []
+
+    results = benchmark_backends(
+        frame[FEATURE_COLUMNS].to_numpy(dtype=float),
+        frame[TARGET_COLUMNS].to_numpy(dtype=float),
+        backends,
+    )
+
+    print(
+        f"{'arka uç':<10}{'eğitim (sn)':>12}{'p50 (ms)':>10}{'p99 (ms)':>10}"
+        f"{'toplu (sn)':>12}{'MAE':>8}{'test R2':>9}"
+    )
+    for result in results:
+        print(
+            f"{result['backend']:<10}{result['fit_time']:>12.3f}"
+            f"{result['predict_p50_ms']:>10.3f}{result['predict_p99_ms']:>10.3f}"
+            f"{result['batch_predict_time']:>12.4f}{result['mae']:>8.3f}"
+            f"{result['test_score']:>9.4f}"
+        )
+    return results
+
+
 if __name__ == "__main__":
-    train_and_save_model()
+    parser = argparse.ArgumentParser(description="Tahmin modellerini eğitir")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="En fazla işçi süreç sayısı"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Modelleri yeni maçlarla artımlı olarak güncelle",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=None,
+        help="Model arka ucu (varsayılan: MODEL_BACKEND ortam değişkeni)",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Arka uçları eğitim süresi, gecikme ve doğruluk açısından karşılaştır",
+    )
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark_models([args.backend] if args.backend else None)
+    elif args.incremental:
+        update_models()
+    else:
+        train_and_save_model(max_workers=args.workers, backend=args.backend)